@@ -30,6 +30,17 @@ env = environ.Env(
     DB_PASSWORD=(str, ""),
     DB_HOST=(str, ""),
     DB_PORT=(str, ""),
+    DB_CONN_MAX_AGE=(int, 60),
+    DB_CONN_HEALTH_CHECKS=(bool, True),
+    DB_TRANSACTION_POOLING=(bool, False),
+    # Cache Settings
+    CACHE_REDIS_URL=(str, ""),
+    QUIZ_RESPONSE_CACHE_TIMEOUT=(int, 3600),
+    JWT_USER_CACHE_TIMEOUT=(int, 60),
+    ANSWER_KEY_CACHE_MAX_SIZE=(int, 1024),
+    ANSWER_KEY_CACHE_TIMEOUT=(int, 300),
+    QUIZ_SCORE_DISTRIBUTION_CACHE_TIMEOUT=(int, 3600),
+    QUIZ_ACCESS_CACHE_TIMEOUT=(int, 300),
     # Application Settings
     BASE_URL=(str, ""),
     # Email Configuration
@@ -43,6 +54,12 @@ env = environ.Env(
     # Celery Configuration
     CELERY_BROKER_URL=(str, ""),
     CELERY_TASK_ALWAYS_EAGER=(bool, False),
+    CELERY_WORKER_PREFETCH_MULTIPLIER=(int, 1),
+    INVITATION_EMAIL_TASK_RATE_LIMIT=(str, "120/m"),
+    INVITATION_EMAIL_BATCH_TASK_RATE_LIMIT=(str, "6/m"),
+    INVITATION_EMAIL_BATCH_SIZE=(int, 100),
+    INVITATION_EMAIL_OUTBOX_BATCH_SIZE=(int, 500),
+    INVITATION_EMAIL_OUTBOX_RELAY_INTERVAL=(float, 5.0),
 )
 
 # Quick-start development settings - unsuitable for production
@@ -117,9 +134,49 @@ DATABASES = {
         "PASSWORD": env("DB_PASSWORD"),
         "HOST": env("DB_HOST"),
         "PORT": env("DB_PORT"),
+        # Keep connections open between requests and Celery tasks instead of reconnecting every time
+        "CONN_MAX_AGE": env("DB_CONN_MAX_AGE"),
+        "CONN_HEALTH_CHECKS": env("DB_CONN_HEALTH_CHECKS"),
+        # PgBouncer in transaction pooling mode cannot keep server-side cursors across transactions
+        "DISABLE_SERVER_SIDE_CURSORS": env("DB_TRANSACTION_POOLING"),
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+if env("CACHE_REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": env("CACHE_REDIS_URL"),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+QUIZ_RESPONSE_CACHE_TIMEOUT = env("QUIZ_RESPONSE_CACHE_TIMEOUT")
+
+# Seconds the email and active flag of a JWT-authenticated user are cached (0 reads them on every request)
+JWT_USER_CACHE_TIMEOUT = env("JWT_USER_CACHE_TIMEOUT")
+
+# In-process LRU cache of quiz answer keys used for scoring submissions (number of quizzes and seconds per entry).
+# Entries are tagged with the quiz updated_at, so question and answer edits are picked up on the next submission.
+ANSWER_KEY_CACHE_MAX_SIZE = env("ANSWER_KEY_CACHE_MAX_SIZE")
+ANSWER_KEY_CACHE_TIMEOUT = env("ANSWER_KEY_CACHE_TIMEOUT")
+
+# Seconds a quiz score distribution is cached; entries are keyed by the quiz and quiz stats versions so question
+# edits and new scores miss
+QUIZ_SCORE_DISTRIBUTION_CACHE_TIMEOUT = env("QUIZ_SCORE_DISTRIBUTION_CACHE_TIMEOUT")
+
+# Seconds a granted quiz view access is cached per user and quiz. Only granted access is cached, and it is dropped
+# when the invitation or participation that granted it is deleted.
+QUIZ_ACCESS_CACHE_TIMEOUT = env("QUIZ_ACCESS_CACHE_TIMEOUT")
+
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
 
@@ -166,7 +223,7 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # REST Framework settings
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "user.infrastructure.cached_jwt_authentication.CachedJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
@@ -175,11 +232,14 @@ REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
-        "rest_framework.renderers.BrowsableAPIRenderer",
+        "quiz.infrastructure.orjson_renderer.ORJSONRenderer",
     ],
 }
 
+# The browsable API renders an HTML page per response, so it is only served while debugging
+if DEBUG:
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"].append("rest_framework.renderers.BrowsableAPIRenderer")
+
 
 # Get the secret key for JWT signing
 JWT_SIGNING_KEY = env("DJANGO_SECRET_KEY")
@@ -227,3 +287,44 @@ CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_ALWAYS_EAGER = env("CELERY_TASK_ALWAYS_EAGER")
 CELERY_TASK_EAGER_PROPAGATES = True
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
+
+# Worker profile: no result backend, tasks are acknowledged once they finish and re-delivered if the worker dies,
+# and each worker process reserves a single message so a long email batch does not hold others back.
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_TASK_ACKS_LATE = True
+CELERY_TASK_REJECT_ON_WORKER_LOST = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = env("CELERY_WORKER_PREFETCH_MULTIPLIER")
+
+# Email tasks run on their own queue (consumed by celery-email-worker) so an email backlog never delays other tasks
+CELERY_TASK_DEFAULT_QUEUE = "default"
+CELERY_EMAIL_QUEUE = "emails"
+CELERY_TASK_ROUTES = {
+    "quiz.infrastructure.send_invitation_email_task.*": {"queue": CELERY_EMAIL_QUEUE},
+}
+
+# Celery enforces rate limits per worker instance: not per pool process, and not globally. The effective SMTP quota is
+# the limit times the number of celery-email-worker replicas. A batch task sends up to INVITATION_EMAIL_BATCH_SIZE emails.
+# Delivery is at least once: with acks_late, a batch that is re-delivered after a worker dies mid-send sends again
+# the emails that had already gone out.
+INVITATION_EMAIL_TASK_RATE_LIMIT = env("INVITATION_EMAIL_TASK_RATE_LIMIT")
+INVITATION_EMAIL_BATCH_TASK_RATE_LIMIT = env("INVITATION_EMAIL_BATCH_TASK_RATE_LIMIT")
+CELERY_TASK_ANNOTATIONS = {
+    "quiz.infrastructure.send_invitation_email_task.send_invitation_email_task": {
+        "rate_limit": INVITATION_EMAIL_TASK_RATE_LIMIT,
+    },
+    "quiz.infrastructure.send_invitation_email_task.send_invitation_emails_task": {
+        "rate_limit": INVITATION_EMAIL_BATCH_TASK_RATE_LIMIT,
+    },
+}
+
+# Number of invitation emails handed to the workers per Celery message and sent over one SMTP connection
+INVITATION_EMAIL_BATCH_SIZE = env("INVITATION_EMAIL_BATCH_SIZE")
+
+# Invitation emails are written to an outbox table in the request transaction and relayed to Celery by beat
+INVITATION_EMAIL_OUTBOX_BATCH_SIZE = env("INVITATION_EMAIL_OUTBOX_BATCH_SIZE")
+CELERY_BEAT_SCHEDULE = {
+    "relay-invitation-email-outbox": {
+        "task": "quiz.infrastructure.relay_invitation_email_outbox_task.relay_invitation_email_outbox_task",
+        "schedule": env("INVITATION_EMAIL_OUTBOX_RELAY_INTERVAL"),
+    },
+}
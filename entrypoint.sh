@@ -4,4 +4,14 @@ set -e
 echo "Collecting static files..."
 python manage.py collectstatic --noinput
 
-exec "$@" 
\ No newline at end of file
+if [ "$1" = "serve" ]; then
+    if [ "${SERVER_MODE:-production}" = "development" ]; then
+        echo "Starting development server..."
+        exec python manage.py runserver 0.0.0.0:8000
+    fi
+
+    echo "Starting gunicorn..."
+    exec gunicorn --config config/gunicorn.conf.py
+fi
+
+exec "$@"
@@ -110,15 +110,14 @@ class QuizAdmin(admin.ModelAdmin):
             .annotate(
                 avg_score=Avg("participations__score"),
                 participation_count=Count("participations"),
-                question_count=Count("questions"),
             )
         )
 
     def total_questions_display(self, obj):
-        return getattr(obj, "question_count", obj.total_questions)
+        return obj.total_questions
 
     total_questions_display.short_description = "Questions"
-    total_questions_display.admin_order_field = "question_count"
+    total_questions_display.admin_order_field = "total_questions"
 
     def total_participants_display(self, obj):
         return getattr(obj, "participation_count", obj.total_participants)
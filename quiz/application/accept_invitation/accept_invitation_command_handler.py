@@ -12,6 +12,7 @@ from quiz.domain.invitation.only_invited_user_can_accept_invitation_exception im
 )
 from quiz.domain.participation.participation import Participation
 from quiz.domain.participation.participation_repository import ParticipationRepository
+from quiz.domain.quiz.quiz_stats_repository import QuizStatsRepository
 
 
 class AcceptInvitationCommandHandler:
@@ -19,9 +20,11 @@ class AcceptInvitationCommandHandler:
         self,
         invitation_repository: InvitationRepository,
         participation_repository: ParticipationRepository,
+        quiz_stats_repository: QuizStatsRepository,
     ) -> None:
         self.__invitation_repository = invitation_repository
         self.__participation_repository = participation_repository
+        self.__quiz_stats_repository = quiz_stats_repository
         self.__logger = getLogger(__name__)
 
     def handle(self, command: AcceptInvitationCommand) -> AcceptInvitationResponse:
@@ -47,6 +50,7 @@ class AcceptInvitationCommandHandler:
         with transaction.atomic():
             self.__invitation_repository.save(invitation)
             self.__participation_repository.save(participation)
+            self.__quiz_stats_repository.record_invitation_accepted(invitation.quiz.id)
 
         self.__logger.info(
             f"Invitation accepted successfully. Invitation ID: '{command.invitation_id}', "
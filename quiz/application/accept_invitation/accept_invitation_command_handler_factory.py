@@ -1,6 +1,7 @@
 from quiz.application.accept_invitation.accept_invitation_command_handler import AcceptInvitationCommandHandler
 from quiz.infrastructure.db_invitation_repository import DbInvitationRepository
 from quiz.infrastructure.db_participation_repository import DbParticipationRepository
+from quiz.infrastructure.db_quiz_stats_repository import DbQuizStatsRepository
 
 
 class AcceptInvitationCommandHandlerFactory:
@@ -9,4 +10,5 @@ class AcceptInvitationCommandHandlerFactory:
         return AcceptInvitationCommandHandler(
             invitation_repository=DbInvitationRepository(),
             participation_repository=DbParticipationRepository(),
+            quiz_stats_repository=DbQuizStatsRepository(),
         )
@@ -14,6 +14,8 @@ from quiz.domain.quiz.question_validator import QuestionValidator
 from quiz.domain.quiz.question_validator_context import QuestionValidatorContext
 from quiz.domain.quiz.quiz import Quiz
 from quiz.domain.quiz.quiz_repository import QuizRepository
+from quiz.domain.quiz.quiz_stats import QuizStats
+from quiz.domain.quiz.quiz_stats_repository import QuizStatsRepository
 from user.domain.user_repository import UserRepository
 
 
@@ -26,6 +28,7 @@ class CreateQuizCommandHandler:
         answer_repository: AnswerRepository,
         question_mapper: QuestionMapper,
         question_validator: QuestionValidator,
+        quiz_stats_repository: QuizStatsRepository,
     ) -> None:
         self.__user_repository = user_repository
         self.__quiz_repository = quiz_repository
@@ -33,6 +36,7 @@ class CreateQuizCommandHandler:
         self.__answer_repository = answer_repository
         self.__question_mapper = question_mapper
         self.__question_validator = question_validator
+        self.__quiz_stats_repository = quiz_stats_repository
         self.__logger = getLogger(__name__)
 
     def handle(self, command: CreateQuizCommand) -> CreateQuizResponse:
@@ -53,10 +57,12 @@ class CreateQuizCommandHandler:
             questions_with_answers.append((question, answers))
 
         with transaction.atomic():
+            quiz.total_questions = len(questions_with_answers)
+            quiz.total_possible_points = sum(question.points for question, _ in questions_with_answers)
             self.__quiz_repository.save(quiz)
-            for question, answers in questions_with_answers:
-                self.__question_repository.save(question)
-                self.__answer_repository.bulk_save(answers)
+            self.__quiz_stats_repository.save(QuizStats(quiz_id=quiz.id))
+            self.__question_repository.bulk_save([question for question, _ in questions_with_answers])
+            self.__answer_repository.bulk_save([answer for _, answers in questions_with_answers for answer in answers])
 
         self.__logger.info(f"Quiz with id {quiz.id} created by user '{command.creator_id}'")
 
@@ -5,6 +5,7 @@ from ...domain.quiz.question_validator import QuestionValidator
 from ...infrastructure.db_answer_repository import DbAnswerRepository
 from ...infrastructure.db_question_repository import DbQuestionRepository
 from ...infrastructure.db_quiz_repository import DbQuizRepository
+from ...infrastructure.db_quiz_stats_repository import DbQuizStatsRepository
 
 
 class CreateQuizCommandHandlerFactory:
@@ -17,4 +18,5 @@ class CreateQuizCommandHandlerFactory:
             answer_repository=DbAnswerRepository(),
             question_mapper=QuestionMapper(),
             question_validator=QuestionValidator(),
+            quiz_stats_repository=DbQuizStatsRepository(),
         )
@@ -1,6 +1,10 @@
 from dataclasses import dataclass
 
+from quiz.domain.pagination.page import Page
+
 
 @dataclass(frozen=True)
 class GetCreatorQuizzesQuery:
     creator_id: str
+    limit: int = Page.DEFAULT_SIZE
+    cursor: str | None = None
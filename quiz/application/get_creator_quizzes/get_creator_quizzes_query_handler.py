@@ -2,38 +2,29 @@ from logging import getLogger
 from uuid import UUID
 
 from quiz.application.get_creator_quizzes.get_creator_quizzes_query import GetCreatorQuizzesQuery
-from quiz.application.get_creator_quizzes.get_creator_quizzes_response import GetCreatorQuizzesResponse, QuizSummary
-from quiz.domain.quiz.quiz_repository import QuizRepository
+from quiz.application.get_creator_quizzes.get_creator_quizzes_response import GetCreatorQuizzesResponse
+from quiz.domain.pagination.page_cursor import PageCursor
+from quiz.domain.quiz.quiz_finder import QuizFinder
 
 
 class GetCreatorQuizzesQueryHandler:
-    def __init__(self, quiz_repository: QuizRepository) -> None:
-        self.__quiz_repository = quiz_repository
+    def __init__(self, quiz_finder: QuizFinder) -> None:
+        self.__quiz_finder = quiz_finder
         self.__logger = getLogger(__name__)
 
     def handle(self, query: GetCreatorQuizzesQuery) -> GetCreatorQuizzesResponse:
         self.__logger.info(f"Getting quizzes for creator '{query.creator_id}'")
 
-        quizzes = self.__quiz_repository.find_by_creator_id(creator_id=UUID(query.creator_id))
-
-        quiz_summaries = []
-        for quiz in quizzes:
-            quiz_summaries.append(
-                QuizSummary(
-                    id=quiz.id,
-                    title=quiz.title,
-                    description=quiz.description,
-                    questions_count=quiz.total_questions,
-                    participants_count=quiz.total_participants,
-                    created_at=quiz.get_formatted_created_at(),
-                    updated_at=quiz.get_formatted_updated_at(),
-                )
-            )
+        cursor = PageCursor.decode(query.cursor) if query.cursor is not None else None
+        page = self.__quiz_finder.find_quiz_summaries_by_creator_id(
+            creator_id=UUID(query.creator_id), limit=query.limit, cursor=cursor
+        )
 
-        self.__logger.info(f"Retrieved {len(quiz_summaries)} quizzes for creator '{query.creator_id}'")
+        self.__logger.info(f"Retrieved {len(page.items)} quizzes for creator '{query.creator_id}'")
 
         return GetCreatorQuizzesResponse(
             creator_id=query.creator_id,
-            quizzes=quiz_summaries,
-            total_count=len(quiz_summaries),
+            quizzes=page.items,
+            count=len(page.items),
+            next_cursor=page.next_cursor.encode() if page.next_cursor is not None else None,
         )
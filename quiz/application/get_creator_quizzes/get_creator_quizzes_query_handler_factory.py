@@ -1,8 +1,8 @@
 from quiz.application.get_creator_quizzes.get_creator_quizzes_query_handler import GetCreatorQuizzesQueryHandler
-from quiz.infrastructure.db_quiz_repository import DbQuizRepository
+from quiz.infrastructure.db_quiz_finder import DbQuizFinder
 
 
 class GetCreatorQuizzesQueryHandlerFactory:
     @staticmethod
     def create() -> GetCreatorQuizzesQueryHandler:
-        return GetCreatorQuizzesQueryHandler(quiz_repository=DbQuizRepository())
+        return GetCreatorQuizzesQueryHandler(quiz_finder=DbQuizFinder())
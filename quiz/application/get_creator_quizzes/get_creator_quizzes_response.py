@@ -29,11 +29,13 @@ class QuizSummary:
 class GetCreatorQuizzesResponse:
     creator_id: str
     quizzes: list[QuizSummary]
-    total_count: int
+    count: int
+    next_cursor: str | None = None
 
     def as_dict(self) -> dict[str, Any]:
         return {
             "creator_id": self.creator_id,
-            "total_count": self.total_count,
+            "count": self.count,
             "quizzes": [quiz.as_dict() for quiz in self.quizzes],
+            "next_cursor": self.next_cursor,
         }
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class EncodedQuizResponse:
+    etag: str
+    body: bytes | None = None
+
+    @property
+    def is_not_modified(self) -> bool:
+        return self.body is None
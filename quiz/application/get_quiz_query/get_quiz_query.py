@@ -6,3 +6,4 @@ from uuid import UUID
 class GetQuizQuery:
     participant_id: UUID
     quiz_id: UUID
+    known_etags: tuple[str, ...] = ()
@@ -1,13 +1,15 @@
 from logging import getLogger
 from uuid import UUID
 
+from quiz.application.get_quiz_query.encoded_quiz_response import EncodedQuizResponse
 from quiz.application.get_quiz_query.get_quiz_query import GetQuizQuery
-from quiz.application.get_quiz_query.get_quiz_query_response import GetQuizQueryResponse
 from quiz.application.get_quiz_query.quiz_data_mapper import QuizDataMapper
-from quiz.domain.invitation.invitation_repository import InvitationRepository
-from quiz.domain.participation.participation_repository import ParticipationRepository
-from quiz.domain.quiz.quiz_data import QuizData
+from quiz.domain.quiz.quiz_access_cache import QuizAccessCache
+from quiz.domain.quiz.quiz_access_finder import QuizAccessFinder
 from quiz.domain.quiz.quiz_finder import QuizFinder
+from quiz.domain.quiz.quiz_response_cache import QuizResponseCache
+from quiz.domain.quiz.quiz_response_encoder import QuizResponseEncoder
+from quiz.domain.quiz.quiz_version import QuizVersion
 from quiz.domain.quiz.unauthorized_quiz_access_exception import UnauthorizedQuizAccessException
 
 
@@ -15,45 +17,60 @@ class GetQuizQueryHandler:
     def __init__(
         self,
         quiz_finder: QuizFinder,
-        participation_repository: ParticipationRepository,
-        invitation_repository: InvitationRepository,
+        quiz_access_finder: QuizAccessFinder,
+        quiz_access_cache: QuizAccessCache,
         mapper: QuizDataMapper,
+        quiz_response_cache: QuizResponseCache,
+        quiz_response_encoder: QuizResponseEncoder,
     ) -> None:
         self.__quiz_finder = quiz_finder
-        self.__participation_repository = participation_repository
-        self.__invitation_repository = invitation_repository
+        self.__quiz_access_finder = quiz_access_finder
+        self.__quiz_access_cache = quiz_access_cache
         self.__mapper = mapper
+        self.__quiz_response_cache = quiz_response_cache
+        self.__quiz_response_encoder = quiz_response_encoder
         self.__logger = getLogger(__name__)
 
-    def handle(self, query: GetQuizQuery) -> GetQuizQueryResponse:
+    def handle(self, query: GetQuizQuery) -> EncodedQuizResponse:
         self.__logger.info(f"Processing quiz retrieval query - Quiz: {query.quiz_id}, User: {query.participant_id}")
 
-        quiz_data = self.__quiz_finder.find_quiz_for_participation(
-            quiz_id=query.quiz_id, participant_id=query.participant_id
-        )
+        quiz_version = self.__quiz_finder.find_quiz_version(query.quiz_id)
 
-        self.__validate_authorization(quiz_data, query.participant_id)
+        self.__validate_authorization(quiz_version, query.participant_id)
 
-        response = self.__mapper.map_to_response(quiz_data)
+        if quiz_version.etag in query.known_etags:
+            self.__logger.info(f"Quiz {query.quiz_id} not modified for user {query.participant_id}")
+            return EncodedQuizResponse(etag=quiz_version.etag)
+
+        response = self.__quiz_response_cache.get(quiz_version)
+        if response is None:
+            self.__logger.info(f"Quiz {query.quiz_id} not cached, loading it from the database")
+            quiz_data = self.__quiz_finder.find_quiz_for_participation(
+                quiz_id=query.quiz_id, participant_id=query.participant_id
+            )
+            response = EncodedQuizResponse(
+                etag=quiz_version.etag,
+                body=self.__quiz_response_encoder.encode(self.__mapper.map_to_response(quiz_data)),
+            )
+            self.__quiz_response_cache.set(quiz_version, response)
 
         self.__logger.info(f"Successfully retrieved quiz {query.quiz_id} for user {query.participant_id}")
 
         return response
 
-    def __validate_authorization(self, quiz_data, participant_id) -> None:
-        if not self.__is_authorized_to_view_quiz(quiz_data, participant_id):
-            raise UnauthorizedQuizAccessException(quiz_id=str(quiz_data.quiz_id), user_id=str(participant_id))
+    def __validate_authorization(self, quiz_version: QuizVersion, participant_id: UUID) -> None:
+        if not self.__is_authorized_to_view_quiz(quiz_version, participant_id):
+            raise UnauthorizedQuizAccessException(quiz_id=str(quiz_version.quiz_id), user_id=str(participant_id))
 
-    def __is_authorized_to_view_quiz(self, quiz_data: QuizData, participant_id: UUID) -> bool:
-        if str(quiz_data.quiz_creator_id) == str(participant_id):
+    def __is_authorized_to_view_quiz(self, quiz_version: QuizVersion, participant_id: UUID) -> bool:
+        if str(quiz_version.quiz_creator_id) == str(participant_id):
             return True
 
-        if self.__participation_repository.exists_by_quiz_and_participant(quiz_data.quiz_id, participant_id):
+        if self.__quiz_access_cache.is_granted(quiz_version.quiz_id, participant_id):
             return True
 
-        if self.__invitation_repository.exists_by_quiz_and_invited(
-            quiz_id=quiz_data.quiz_id, invited_id=participant_id
-        ):
-            return True
+        if not self.__quiz_access_finder.can_view_quiz(quiz_id=quiz_version.quiz_id, user_id=participant_id):
+            return False
 
-        return False
+        self.__quiz_access_cache.grant(quiz_version.quiz_id, participant_id)
+        return True
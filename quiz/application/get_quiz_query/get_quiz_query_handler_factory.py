@@ -1,8 +1,10 @@
 from quiz.application.get_quiz_query.get_quiz_query_handler import GetQuizQueryHandler
 from quiz.application.get_quiz_query.quiz_data_mapper import QuizDataMapper
-from quiz.infrastructure.db_invitation_repository import DbInvitationRepository
-from quiz.infrastructure.db_participation_repository import DbParticipationRepository
+from quiz.infrastructure.db_quiz_access_finder import DbQuizAccessFinder
 from quiz.infrastructure.db_quiz_finder import DbQuizFinder
+from quiz.infrastructure.django_quiz_access_cache import DjangoQuizAccessCache
+from quiz.infrastructure.django_quiz_response_cache import DjangoQuizResponseCache
+from quiz.infrastructure.orjson_quiz_response_encoder import ORJSONQuizResponseEncoder
 
 
 class GetQuizQueryHandlerFactory:
@@ -11,7 +13,9 @@ class GetQuizQueryHandlerFactory:
     def create() -> GetQuizQueryHandler:
         return GetQuizQueryHandler(
             quiz_finder=DbQuizFinder(),
-            participation_repository=DbParticipationRepository(),
-            invitation_repository=DbInvitationRepository(),
+            quiz_access_finder=DbQuizAccessFinder(),
+            quiz_access_cache=DjangoQuizAccessCache(),
             mapper=QuizDataMapper(),
+            quiz_response_cache=DjangoQuizResponseCache(),
+            quiz_response_encoder=ORJSONQuizResponseEncoder(),
         )
@@ -17,7 +17,7 @@ class QuizDataMapper:
             questions=questions,
         )
 
-    def __map_questions(self, questions: list[QuestionData]) -> list[QuizQuestion]:
+    def __map_questions(self, questions: tuple[QuestionData, ...]) -> list[QuizQuestion]:
         return [
             QuizQuestion(
                 question_id=question_data.question_id,
@@ -28,7 +28,7 @@ class QuizDataMapper:
             for question_data in questions
         ]
 
-    def __map_answers(self, answers: list[AnswerData]) -> list[QuizAnswer]:
+    def __map_answers(self, answers: tuple[AnswerData, ...]) -> list[QuizAnswer]:
         return [
             QuizAnswer(
                 answer_id=answer_data.answer_id,
@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class GetQuizScoreDistributionQuery:
+    quiz_id: str
+    requester_id: str
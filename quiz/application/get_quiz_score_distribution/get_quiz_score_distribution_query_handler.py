@@ -0,0 +1,66 @@
+from logging import getLogger
+from uuid import UUID
+
+from quiz.application.get_quiz_score_distribution.get_quiz_score_distribution_query import (
+    GetQuizScoreDistributionQuery,
+)
+from quiz.application.get_quiz_score_distribution.get_quiz_score_distribution_response import (
+    GetQuizScoreDistributionResponse,
+)
+from quiz.domain.participation.participation_finder import ParticipationFinder
+from quiz.domain.participation.quiz_score_distribution import QuizScoreDistribution
+from quiz.domain.participation.quiz_score_distribution_cache import QuizScoreDistributionCache
+from quiz.domain.quiz.quiz import Quiz
+from quiz.domain.quiz.quiz_repository import QuizRepository
+from quiz.domain.quiz.unauthorized_quiz_access_exception import UnauthorizedQuizAccessException
+
+
+class GetQuizScoreDistributionQueryHandler:
+    BUCKET_COUNT = 10
+
+    def __init__(
+        self,
+        quiz_repository: QuizRepository,
+        participation_finder: ParticipationFinder,
+        quiz_score_distribution_cache: QuizScoreDistributionCache,
+    ) -> None:
+        self.__quiz_repository = quiz_repository
+        self.__participation_finder = participation_finder
+        self.__quiz_score_distribution_cache = quiz_score_distribution_cache
+        self.__logger = getLogger(__name__)
+
+    def handle(self, query: GetQuizScoreDistributionQuery) -> GetQuizScoreDistributionResponse:
+        self.__logger.info(
+            f"Getting score distribution for quiz '{query.quiz_id}'. Requested by user '{query.requester_id}'"
+        )
+
+        quiz = self.__quiz_repository.find_or_fail_by_id(quiz_id=UUID(query.quiz_id))
+        if str(quiz.creator_id) != str(query.requester_id):
+            raise UnauthorizedQuizAccessException(quiz_id=str(query.quiz_id), user_id=str(query.requester_id))
+
+        distribution = self.__find_distribution(quiz)
+
+        return GetQuizScoreDistributionResponse(
+            quiz_id=str(quiz.id),
+            quiz_title=quiz.title,
+            total_scored=distribution.total_scored,
+            max_possible_score=distribution.max_possible_score,
+            p50=distribution.p50,
+            p90=distribution.p90,
+            p99=distribution.p99,
+            buckets=distribution.buckets,
+        )
+
+    def __find_distribution(self, quiz: Quiz) -> QuizScoreDistribution:
+        scores_version = self.__participation_finder.find_quiz_scores_version(quiz.id)
+        if scores_version is not None:
+            distribution = self.__quiz_score_distribution_cache.get(quiz, scores_version)
+            if distribution is not None:
+                self.__logger.info(f"Score distribution cache hit for quiz '{quiz.id}'")
+                return distribution
+
+        distribution = self.__participation_finder.find_quiz_score_distribution(quiz.id, self.BUCKET_COUNT)
+        if scores_version is not None:
+            self.__quiz_score_distribution_cache.set(quiz, scores_version, distribution)
+
+        return distribution
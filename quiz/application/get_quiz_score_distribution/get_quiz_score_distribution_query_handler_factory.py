@@ -0,0 +1,16 @@
+from quiz.application.get_quiz_score_distribution.get_quiz_score_distribution_query_handler import (
+    GetQuizScoreDistributionQueryHandler,
+)
+from quiz.infrastructure.db_participation_finder import DbParticipationFinder
+from quiz.infrastructure.db_quiz_repository import DbQuizRepository
+from quiz.infrastructure.django_quiz_score_distribution_cache import DjangoQuizScoreDistributionCache
+
+
+class GetQuizScoreDistributionQueryHandlerFactory:
+    @staticmethod
+    def create() -> GetQuizScoreDistributionQueryHandler:
+        return GetQuizScoreDistributionQueryHandler(
+            quiz_repository=DbQuizRepository(),
+            participation_finder=DbParticipationFinder(),
+            quiz_score_distribution_cache=DjangoQuizScoreDistributionCache(),
+        )
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+from quiz.domain.participation.quiz_score_distribution import ScoreBucket
+
+
+@dataclass(frozen=True)
+class GetQuizScoreDistributionResponse:
+    quiz_id: str
+    quiz_title: str
+    total_scored: int
+    max_possible_score: int
+    p50: float
+    p90: float
+    p99: float
+    buckets: list[ScoreBucket]
+
+    def as_dict(self) -> dict:
+        return {
+            "quiz_id": self.quiz_id,
+            "quiz_title": self.quiz_title,
+            "total_scored": self.total_scored,
+            "max_possible_score": self.max_possible_score,
+            "percentiles": {"p50": self.p50, "p90": self.p90, "p99": self.p99},
+            "buckets": [
+                {"min_score": bucket.min_score, "max_score": bucket.max_score, "count": bucket.count}
+                for bucket in self.buckets
+            ],
+        }
@@ -26,17 +26,17 @@ class GetUserQuizProgressQueryHandler:
             f"Getting user quiz progress for quiz '{query.quiz_id}'. Requested by user '{query.requester_id}'"
         )
 
-        quiz = self.__quiz_repository.find_or_fail_by_id(quiz_id=UUID(query.quiz_id))
-
-        user_participation = self.__participation_finder.find_user_participation_for_quiz(
+        quiz_progress = self.__participation_finder.find_user_quiz_progress(
             quiz_id=UUID(query.quiz_id), user_id=UUID(query.requester_id)
         )
-        if user_participation is None:
+        if quiz_progress is None:
+            self.__quiz_repository.find_or_fail_by_id(quiz_id=UUID(query.quiz_id))
             raise ParticipationNotFoundForUserException(quiz_id=query.quiz_id, user_id=query.requester_id)
 
+        user_participation = quiz_progress.participation
         score_percentage = None
-        if user_participation.score is not None and quiz.total_possible_points > 0:
-            score_percentage = (user_participation.score / quiz.total_possible_points) * 100
+        if user_participation.score is not None and quiz_progress.total_possible_points > 0:
+            score_percentage = (user_participation.score / quiz_progress.total_possible_points) * 100
 
         participation = ParticipationData(
             status=user_participation.status,
@@ -51,11 +51,11 @@ class GetUserQuizProgressQueryHandler:
         )
 
         return GetUserQuizProgressResponse(
-            quiz_id=str(quiz.id),
-            quiz_title=quiz.title,
-            quiz_description=quiz.description,
-            total_questions=quiz.total_questions,
-            total_possible_points=quiz.total_possible_points,
-            quiz_created_at=quiz.get_formatted_created_at(),
+            quiz_id=quiz_progress.quiz_id,
+            quiz_title=quiz_progress.quiz_title,
+            quiz_description=quiz_progress.quiz_description,
+            total_questions=quiz_progress.total_questions,
+            total_possible_points=quiz_progress.total_possible_points,
+            quiz_created_at=quiz_progress.quiz_created_at,
             participation=participation,
         )
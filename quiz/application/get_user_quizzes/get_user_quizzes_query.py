@@ -1,7 +1,11 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from quiz.domain.pagination.page import Page
+
 
 @dataclass(frozen=True)
 class GetUserQuizzesQuery:
     requester_id: UUID
+    limit: int = Page.DEFAULT_SIZE
+    cursor: str | None = None
@@ -34,10 +34,12 @@ class QuizParticipationSummary:
 @dataclass(frozen=True)
 class GetUserQuizzesResponse:
     quizzes_participations: list[QuizParticipationSummary]
-    total_count: int
+    count: int
+    next_cursor: str | None = None
 
     def as_dict(self) -> dict[str, Any]:
         return {
             "user_quizzes": [participation.as_dict() for participation in self.quizzes_participations],
-            "total_count": self.total_count,
+            "count": self.count,
+            "next_cursor": self.next_cursor,
         }
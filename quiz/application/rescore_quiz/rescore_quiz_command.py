@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class RescoreQuizCommand:
+    quiz_id: UUID
+    batch_size: int = 1000
@@ -0,0 +1,85 @@
+from itertools import groupby
+from logging import getLogger
+from operator import itemgetter
+from uuid import UUID
+
+from django.db import transaction
+
+from quiz.application.rescore_quiz.rescore_quiz_command import RescoreQuizCommand
+from quiz.application.rescore_quiz.rescore_quiz_response import RescoreQuizResponse
+from quiz.domain.participation.answer_submission_repository import AnswerSubmissionRepository
+from quiz.domain.participation.participation_repository import ParticipationRepository
+from quiz.domain.quiz.answer_key_finder import AnswerKeyFinder
+from quiz.domain.quiz.quiz_repository import QuizRepository
+from quiz.domain.quiz.quiz_stats_repository import QuizStatsRepository
+
+
+class RescoreQuizCommandHandler:
+    def __init__(
+        self,
+        quiz_repository: QuizRepository,
+        answer_key_finder: AnswerKeyFinder,
+        participation_repository: ParticipationRepository,
+        answer_submission_repository: AnswerSubmissionRepository,
+        quiz_stats_repository: QuizStatsRepository,
+    ) -> None:
+        self.__quiz_repository = quiz_repository
+        self.__answer_key_finder = answer_key_finder
+        self.__participation_repository = participation_repository
+        self.__answer_submission_repository = answer_submission_repository
+        self.__quiz_stats_repository = quiz_stats_repository
+        self.__logger = getLogger(__name__)
+
+    def handle(self, command: RescoreQuizCommand) -> RescoreQuizResponse:
+        self.__logger.info(f"Rescoring participations of quiz '{command.quiz_id}'")
+
+        quiz = self.__quiz_repository.find_or_fail_by_id(command.quiz_id)
+        answer_key = self.__answer_key_finder.find_by_quiz(quiz)
+        points_by_answer_id = {
+            answer_id: answer_key.points_for(question_id, answer_id)
+            for answer_id, (question_id, _) in answer_key.answers.items()
+        }
+
+        pending_scores = self.__participation_repository.find_completed_scores_by_quiz(quiz.id)
+        rescored_participations = len(pending_scores)
+        changed_scores: dict[UUID, int] = {}
+        changed_count = 0
+
+        # The stream is ordered by participation, so a participation's score is final as soon as the next one starts
+        # and can be written without waiting for the whole quiz.
+        for participation_id, submissions in groupby(
+            self.__answer_submission_repository.stream_selected_answers_by_quiz(quiz.id), key=itemgetter(0)
+        ):
+            current_score = pending_scores.pop(participation_id, None)
+            if current_score is None:
+                continue
+
+            new_score = sum(points_by_answer_id.get(answer_id, 0) for _, answer_id in submissions)
+            if new_score != current_score:
+                changed_scores[participation_id] = new_score
+
+            if len(changed_scores) >= command.batch_size:
+                self.__write_scores(changed_scores, command.batch_size)
+                changed_count += len(changed_scores)
+                changed_scores = {}
+
+        # Completed participations left over have no submissions at all, so they score nothing.
+        changed_scores.update({participation_id: 0 for participation_id, score in pending_scores.items() if score != 0})
+        if changed_scores:
+            self.__write_scores(changed_scores, command.batch_size)
+            changed_count += len(changed_scores)
+
+        with transaction.atomic():
+            self.__quiz_stats_repository.rebuild(quiz.id)
+
+        self.__logger.info(
+            f"Quiz '{quiz.id}' rescored: {rescored_participations} participations, {changed_count} scores changed"
+        )
+
+        return RescoreQuizResponse(
+            quiz_id=quiz.id, rescored_participations=rescored_participations, changed_scores=changed_count
+        )
+
+    def __write_scores(self, changed_scores: dict[UUID, int], batch_size: int) -> None:
+        with transaction.atomic():
+            self.__participation_repository.bulk_update_scores(changed_scores, batch_size=batch_size)
@@ -0,0 +1,18 @@
+from quiz.application.rescore_quiz.rescore_quiz_command_handler import RescoreQuizCommandHandler
+from quiz.infrastructure.db_answer_key_finder import DbAnswerKeyFinder
+from quiz.infrastructure.db_answer_submission_repository import DbAnswerSubmissionRepository
+from quiz.infrastructure.db_participation_repository import DbParticipationRepository
+from quiz.infrastructure.db_quiz_repository import DbQuizRepository
+from quiz.infrastructure.db_quiz_stats_repository import DbQuizStatsRepository
+
+
+class RescoreQuizCommandHandlerFactory:
+    @staticmethod
+    def create() -> RescoreQuizCommandHandler:
+        return RescoreQuizCommandHandler(
+            quiz_repository=DbQuizRepository(),
+            answer_key_finder=DbAnswerKeyFinder(),
+            participation_repository=DbParticipationRepository(),
+            answer_submission_repository=DbAnswerSubmissionRepository(),
+            quiz_stats_repository=DbQuizStatsRepository(),
+        )
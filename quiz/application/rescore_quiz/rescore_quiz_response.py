@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class RescoreQuizResponse:
+    quiz_id: UUID
+    rescored_participations: int
+    changed_scores: int
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "quiz_id": str(self.quiz_id),
+            "rescored_participations": self.rescored_participations,
+            "changed_scores": self.changed_scores,
+        }
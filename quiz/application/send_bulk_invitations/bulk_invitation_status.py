@@ -0,0 +1,8 @@
+from enum import StrEnum
+
+
+class BulkInvitationStatus(StrEnum):
+    INVITED = "invited"
+    ALREADY_INVITED = "already_invited"
+    USER_NOT_FOUND = "user_not_found"
+    CREATOR_CANNOT_BE_INVITED = "creator_cannot_be_invited"
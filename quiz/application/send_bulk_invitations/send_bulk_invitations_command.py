@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SendBulkInvitationsCommand:
+    quiz_id: str
+    participant_emails: list[str]
+    inviter_id: str
+    inviter_email: str
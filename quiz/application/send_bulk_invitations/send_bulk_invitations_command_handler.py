@@ -0,0 +1,93 @@
+from logging import getLogger
+
+from django.conf import settings
+from django.db import transaction
+from uuid_utils.compat import uuid7
+
+from quiz.application.send_bulk_invitations.bulk_invitation_status import BulkInvitationStatus
+from quiz.application.send_bulk_invitations.send_bulk_invitations_command import SendBulkInvitationsCommand
+from quiz.application.send_bulk_invitations.send_bulk_invitations_response import (
+    BulkInvitationResult,
+    SendBulkInvitationsResponse,
+)
+from quiz.domain.invitation.invitation import Invitation
+from quiz.domain.invitation.invitation_repository import InvitationRepository
+from quiz.domain.invitation.invitation_sender import InvitationSender
+from quiz.domain.invitation.only_quiz_creator_can_send_invitation_exception import (
+    OnlyQuizCreatorCanSendInvitationException,
+)
+from quiz.domain.quiz.quiz_repository import QuizRepository
+from quiz.domain.quiz.quiz_stats_repository import QuizStatsRepository
+from user.domain.user_repository import UserRepository
+
+
+class SendBulkInvitationsCommandHandler:
+    def __init__(
+        self,
+        quiz_repository: QuizRepository,
+        invitation_repository: InvitationRepository,
+        user_repository: UserRepository,
+        invitation_sender: InvitationSender,
+        quiz_stats_repository: QuizStatsRepository,
+    ) -> None:
+        self.__quiz_repository = quiz_repository
+        self.__invitation_repository = invitation_repository
+        self.__user_repository = user_repository
+        self.__invitation_sender = invitation_sender
+        self.__quiz_stats_repository = quiz_stats_repository
+        self.__logger = getLogger(__name__)
+
+    def handle(self, command: SendBulkInvitationsCommand) -> SendBulkInvitationsResponse:
+        quiz = self.__quiz_repository.find_or_fail_by_id(command.quiz_id)
+        if str(quiz.creator.id) != command.inviter_id:
+            raise OnlyQuizCreatorCanSendInvitationException(quiz_id=quiz.id, user_id=command.inviter_id)
+
+        participant_emails = list(dict.fromkeys(command.participant_emails))
+        invitable_emails = [email for email in participant_emails if email != command.inviter_email]
+
+        users_by_email = {user.email: user for user in self.__user_repository.find_by_emails(invitable_emails)}
+        already_invited_ids = self.__invitation_repository.find_invited_ids_by_quiz(
+            quiz_id=quiz.id, invited_ids=[user.id for user in users_by_email.values()]
+        )
+        invitations = [
+            Invitation(id=uuid7(), quiz=quiz, invited=user, inviter_id=command.inviter_id)
+            for user in users_by_email.values()
+            if user.id not in already_invited_ids
+        ]
+
+        with transaction.atomic():
+            saved_invitations = self.__invitation_repository.bulk_save_skipping_existing(invitations)
+            invitation_acceptance_links = {
+                invitation.id: f"{settings.BASE_URL}/invitations/{invitation.id}/accept"
+                for invitation in saved_invitations
+            }
+            if saved_invitations:
+                self.__quiz_stats_repository.record_invitation_sent(quiz.id, count=len(saved_invitations))
+                self.__invitation_sender.send_invitation_emails(invitation_acceptance_links)
+
+        self.__logger.info(
+            f"{len(saved_invitations)} invitations created and emails queued out of {len(participant_emails)} "
+            f"requested for quiz {quiz.title}"
+        )
+
+        saved_invitations_by_email = {invitation.invited.email: invitation for invitation in saved_invitations}
+        results = []
+        for email in participant_emails:
+            if email == command.inviter_email:
+                results.append(BulkInvitationResult(email, BulkInvitationStatus.CREATOR_CANNOT_BE_INVITED))
+            elif email not in users_by_email:
+                results.append(BulkInvitationResult(email, BulkInvitationStatus.USER_NOT_FOUND))
+            elif email in saved_invitations_by_email:
+                invitation = saved_invitations_by_email[email]
+                results.append(
+                    BulkInvitationResult(
+                        participant_email=email,
+                        status=BulkInvitationStatus.INVITED,
+                        invitation_id=str(invitation.id),
+                        invitation_acceptance_link=invitation_acceptance_links[invitation.id],
+                    )
+                )
+            else:
+                results.append(BulkInvitationResult(email, BulkInvitationStatus.ALREADY_INVITED))
+
+        return SendBulkInvitationsResponse(quiz_id=str(quiz.id), quiz_title=quiz.title, results=results)
@@ -0,0 +1,20 @@
+from quiz.application.send_bulk_invitations.send_bulk_invitations_command_handler import (
+    SendBulkInvitationsCommandHandler,
+)
+from quiz.infrastructure.db_invitation_repository import DbInvitationRepository
+from quiz.infrastructure.db_quiz_repository import DbQuizRepository
+from quiz.infrastructure.db_quiz_stats_repository import DbQuizStatsRepository
+from quiz.infrastructure.outbox_invitation_sender import OutboxInvitationSender
+from user.infrastructure.db_user_repository import DbUserRepository
+
+
+class SendBulkInvitationsCommandHandlerFactory:
+    @staticmethod
+    def create() -> SendBulkInvitationsCommandHandler:
+        return SendBulkInvitationsCommandHandler(
+            quiz_repository=DbQuizRepository(),
+            invitation_repository=DbInvitationRepository(),
+            user_repository=DbUserRepository(),
+            invitation_sender=OutboxInvitationSender(),
+            quiz_stats_repository=DbQuizStatsRepository(),
+        )
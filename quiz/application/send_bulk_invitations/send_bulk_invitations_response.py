@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+
+from quiz.application.send_bulk_invitations.bulk_invitation_status import BulkInvitationStatus
+
+
+@dataclass(frozen=True)
+class BulkInvitationResult:
+    participant_email: str
+    status: BulkInvitationStatus
+    invitation_id: str | None = None
+    invitation_acceptance_link: str | None = None
+
+    def as_dict(self) -> dict:
+        return {
+            "participant_email": self.participant_email,
+            "status": self.status.value,
+            "invitation_id": self.invitation_id,
+            "invitation_acceptance_link": self.invitation_acceptance_link,
+        }
+
+
+@dataclass(frozen=True)
+class SendBulkInvitationsResponse:
+    quiz_id: str
+    quiz_title: str
+    results: list[BulkInvitationResult]
+
+    @property
+    def total_invited(self) -> int:
+        return sum(1 for result in self.results if result.status == BulkInvitationStatus.INVITED)
+
+    def as_dict(self) -> dict:
+        return {
+            "quiz_id": self.quiz_id,
+            "quiz_title": self.quiz_title,
+            "total_invited": self.total_invited,
+            "results": [result.as_dict() for result in self.results],
+        }
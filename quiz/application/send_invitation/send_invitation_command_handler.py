@@ -14,6 +14,7 @@ from quiz.domain.invitation.only_quiz_creator_can_send_invitation_exception impo
     OnlyQuizCreatorCanSendInvitationException,
 )
 from quiz.domain.quiz.quiz_repository import QuizRepository
+from quiz.domain.quiz.quiz_stats_repository import QuizStatsRepository
 from user.domain.user_repository import UserRepository
 
 
@@ -24,11 +25,13 @@ class SendInvitationCommandHandler:
         invitation_repository: InvitationRepository,
         user_repository: UserRepository,
         invitation_sender: InvitationSender,
+        quiz_stats_repository: QuizStatsRepository,
     ):
         self.__quiz_repository = quiz_repository
         self.__invitation_repository = invitation_repository
         self.__user_repository = user_repository
         self.__invitation_sender = invitation_sender
+        self.__quiz_stats_repository = quiz_stats_repository
         self.__logger = getLogger(__name__)
 
     def handle(self, command: SendInvitationCommand) -> SendInvitationResponse:
@@ -46,6 +49,7 @@ class SendInvitationCommandHandler:
 
         with transaction.atomic():
             self.__invitation_repository.save(invitation)
+            self.__quiz_stats_repository.record_invitation_sent(quiz.id)
             self.__invitation_sender.send_invitation_email(
                 invitation_id=invitation.id,
                 invitation_acceptance_link=invitation_acceptance_link,
@@ -1,7 +1,8 @@
 from quiz.application.send_invitation.send_invitation_command_handler import SendInvitationCommandHandler
-from quiz.infrastructure.celery_invitacion_sender import CeleryInvitationSender
 from quiz.infrastructure.db_invitation_repository import DbInvitationRepository
 from quiz.infrastructure.db_quiz_repository import DbQuizRepository
+from quiz.infrastructure.db_quiz_stats_repository import DbQuizStatsRepository
+from quiz.infrastructure.outbox_invitation_sender import OutboxInvitationSender
 from user.infrastructure.db_user_repository import DbUserRepository
 
 
@@ -13,5 +14,6 @@ class SendInvitationCommandHandlerFactory:
             quiz_repository=DbQuizRepository(),
             invitation_repository=DbInvitationRepository(),
             user_repository=DbUserRepository(),
-            invitation_sender=CeleryInvitationSender(),
+            invitation_sender=OutboxInvitationSender(),
+            quiz_stats_repository=DbQuizStatsRepository(),
         )
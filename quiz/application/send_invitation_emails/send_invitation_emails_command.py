@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class SendInvitationEmailsCommand:
+    invitation_acceptance_links: dict[UUID, str]
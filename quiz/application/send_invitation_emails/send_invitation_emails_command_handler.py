@@ -0,0 +1,42 @@
+from logging import getLogger
+
+from quiz.application.send_invitation_emails.send_invitation_emails_command import SendInvitationEmailsCommand
+from quiz.application.send_invitation_emails.send_invitation_emails_response import SendInvitationEmailsResponse
+from quiz.domain.invitation.email_service import EmailService
+from quiz.domain.invitation.invitation_related_attribute import InvitationRelatedAttribute
+from quiz.domain.invitation.invitation_repository import InvitationRepository
+
+
+class SendInvitationEmailsCommandHandler:
+    def __init__(self, invitation_repository: InvitationRepository, email_service: EmailService):
+        self.__invitation_repository = invitation_repository
+        self.__email_service = email_service
+        self.__logger = getLogger(__name__)
+
+    def handle(self, command: SendInvitationEmailsCommand) -> SendInvitationEmailsResponse:
+        invitation_ids = list(command.invitation_acceptance_links)
+        invitations = self.__invitation_repository.find_by_ids(
+            invitation_ids,
+            related_attributes=[
+                InvitationRelatedAttribute.QUIZ,
+                InvitationRelatedAttribute.INVITED,
+                InvitationRelatedAttribute.INVITER,
+            ],
+        )
+
+        if len(invitations) != len(invitation_ids):
+            found_ids = {invitation.id for invitation in invitations}
+            missing_ids = [str(invitation_id) for invitation_id in invitation_ids if invitation_id not in found_ids]
+            self.__logger.warning(f"Skipping emails for missing invitations: {', '.join(missing_ids)}")
+
+        failed_invitations = self.__email_service.send_invitation_emails(
+            invitations, command.invitation_acceptance_links
+        )
+        sent_count = len(invitations) - len(failed_invitations)
+
+        self.__logger.info(f"Invitation emails sent for {sent_count} of {len(invitation_ids)} invitations")
+
+        return SendInvitationEmailsResponse(
+            sent_count=sent_count,
+            failed_invitation_ids=[invitation.id for invitation in failed_invitations],
+        )
@@ -0,0 +1,14 @@
+from quiz.application.send_invitation_emails.send_invitation_emails_command_handler import (
+    SendInvitationEmailsCommandHandler,
+)
+from quiz.infrastructure.db_invitation_repository import DbInvitationRepository
+from quiz.infrastructure.django_email_service import DjangoEmailService
+
+
+class SendInvitationEmailsCommandHandlerFactory:
+    @staticmethod
+    def create() -> SendInvitationEmailsCommandHandler:
+        return SendInvitationEmailsCommandHandler(
+            invitation_repository=DbInvitationRepository(),
+            email_service=DjangoEmailService(),
+        )
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class SendInvitationEmailsResponse:
+    sent_count: int
+    failed_invitation_ids: list[UUID]
@@ -5,11 +5,14 @@ from django.db import transaction
 from quiz.application.submit_quiz_answers.submit_quiz_answers_command import SubmitQuizAnswersCommand
 from quiz.application.submit_quiz_answers.submit_quiz_answers_response import SubmitQuizAnswersResponse
 from quiz.domain.participation.answer_submission_repository import AnswerSubmissionRepository
-from quiz.domain.participation.incomplete_quiz_submission_exception import IncompleteQuizSubmissionException
+from quiz.domain.participation.participation_not_found_for_quiz_and_participant_exception import (
+    ParticipationNotFoundForQuizAndParticipantException,
+)
 from quiz.domain.participation.participation_repository import ParticipationRepository
 from quiz.domain.participation.quiz_already_completed_exception import QuizAlreadyCompletedException
 from quiz.domain.participation.quiz_score_calculator import QuizScoreCalculator, SubmittedAnswer
 from quiz.domain.quiz.quiz_repository import QuizRepository
+from quiz.domain.quiz.quiz_stats_repository import QuizStatsRepository
 
 
 class SubmitQuizAnswersCommandHandler:
@@ -19,11 +22,13 @@ class SubmitQuizAnswersCommandHandler:
         participation_repository: ParticipationRepository,
         answer_submission_repository: AnswerSubmissionRepository,
         quiz_score_calculator: QuizScoreCalculator,
+        quiz_stats_repository: QuizStatsRepository,
     ) -> None:
         self.__quiz_repository = quiz_repository
         self.__participation_repository = participation_repository
         self.__answer_submission_repository = answer_submission_repository
         self.__quiz_score_calculator = quiz_score_calculator
+        self.__quiz_stats_repository = quiz_stats_repository
         self.__logger = getLogger(__name__)
 
     def handle(self, command: SubmitQuizAnswersCommand) -> SubmitQuizAnswersResponse:
@@ -31,22 +36,18 @@ class SubmitQuizAnswersCommandHandler:
             f"Submitting quiz answers for quiz '{command.quiz_id}' by participant '{command.participant_id}'"
         )
 
-        quiz = self.__quiz_repository.find_or_fail_by_id(command.quiz_id)
-
-        participation = self.__participation_repository.find_or_fail_by_quiz_and_participant(
-            command.quiz_id, command.participant_id
-        )
+        try:
+            participation = self.__participation_repository.find_or_fail_by_quiz_and_participant(
+                command.quiz_id, command.participant_id
+            )
+        except ParticipationNotFoundForQuizAndParticipantException:
+            self.__quiz_repository.find_or_fail_by_id(command.quiz_id)
+            raise
 
         if participation.is_completed():
             raise QuizAlreadyCompletedException(quiz_id=command.quiz_id, user_id=command.participant_id)
 
-        if len(command.answers) != quiz.total_questions:
-            raise IncompleteQuizSubmissionException(
-                quiz_id=command.quiz_id,
-                expected_answers=quiz.total_questions,
-                received_answers=len(command.answers),
-            )
-
+        quiz = participation.quiz
         submitted_answers = [SubmittedAnswer(answer.question_id, answer.answer_id) for answer in command.answers]
 
         quiz_score_result = self.__quiz_score_calculator.calculate(
@@ -58,6 +59,9 @@ class SubmitQuizAnswersCommandHandler:
         with transaction.atomic():
             self.__answer_submission_repository.bulk_save(quiz_score_result.answer_submissions)
             self.__participation_repository.save(participation)
+            self.__quiz_stats_repository.record_participation_completed(
+                quiz_id=quiz.id, participant_id=command.participant_id, score=quiz_score_result.total_score
+            )
 
         self.__logger.info(
             f"Quiz '{command.quiz_id}' completed by participant '{command.participant_id}' with score {quiz_score_result.total_score}"
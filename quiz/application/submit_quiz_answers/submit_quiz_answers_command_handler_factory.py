@@ -3,6 +3,7 @@ from quiz.domain.participation.quiz_score_calculator_factory import QuizScoreCal
 from quiz.infrastructure.db_answer_submission_repository import DbAnswerSubmissionRepository
 from quiz.infrastructure.db_participation_repository import DbParticipationRepository
 from quiz.infrastructure.db_quiz_repository import DbQuizRepository
+from quiz.infrastructure.db_quiz_stats_repository import DbQuizStatsRepository
 
 
 class SubmitQuizAnswersCommandHandlerFactory:
@@ -13,4 +14,5 @@ class SubmitQuizAnswersCommandHandlerFactory:
             participation_repository=DbParticipationRepository(),
             answer_submission_repository=DbAnswerSubmissionRepository(),
             quiz_score_calculator=QuizScoreCalculatorFactory.create(),
+            quiz_stats_repository=DbQuizStatsRepository(),
         )
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class QuizConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "quiz"
+
+    def ready(self) -> None:
+        from quiz.infrastructure import quiz_access_signals, quiz_content_signals  # noqa: F401
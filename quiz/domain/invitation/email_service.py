@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from uuid import UUID
 
 from quiz.domain.invitation.invitation import Invitation
 
@@ -7,3 +8,9 @@ class EmailService(ABC):
     @abstractmethod
     def send_invitation_email(self, invitation: Invitation, invitation_acceptance_link: str) -> None:
         pass
+
+    @abstractmethod
+    def send_invitation_emails(
+        self, invitations: list[Invitation], invitation_acceptance_links: dict[UUID, str]
+    ) -> list[Invitation]:
+        pass
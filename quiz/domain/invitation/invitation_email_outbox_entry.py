@@ -0,0 +1,14 @@
+from django.db import models
+from uuid_utils.compat import uuid7
+
+from quiz.domain.invitation.invitation import Invitation
+
+
+class InvitationEmailOutboxEntry(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid7)
+    invitation = models.ForeignKey(Invitation, on_delete=models.CASCADE, related_name="+")
+    invitation_acceptance_link = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Invitation email for {self.invitation_id}"
@@ -12,6 +12,12 @@ class InvitationRepository(ABC):
     ) -> Invitation:
         pass
 
+    @abstractmethod
+    def find_by_ids(
+        self, invitation_ids: list[UUID], related_attributes: list[InvitationRelatedAttribute] | None = None
+    ) -> list[Invitation]:
+        pass
+
     @abstractmethod
     def find_active_invitation(self, quiz_id: UUID, participant_id: UUID) -> Invitation | None:
         pass
@@ -21,5 +27,9 @@ class InvitationRepository(ABC):
         pass
 
     @abstractmethod
-    def exists_by_quiz_and_invited(self, quiz_id: UUID, invited_id: UUID) -> bool:
+    def bulk_save_skipping_existing(self, invitations: list[Invitation]) -> list[Invitation]:
+        pass
+
+    @abstractmethod
+    def find_invited_ids_by_quiz(self, quiz_id: UUID, invited_ids: list[UUID]) -> set[UUID]:
         pass
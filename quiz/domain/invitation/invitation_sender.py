@@ -6,3 +6,7 @@ class InvitationSender(ABC):
     @abstractmethod
     def send_invitation_email(self, invitation_id: UUID, invitation_acceptance_link: str) -> None:
         pass
+
+    @abstractmethod
+    def send_invitation_emails(self, invitation_acceptance_links: dict[UUID, str]) -> None:
+        pass
@@ -0,0 +1,4 @@
+class InvalidPageCursorException(Exception):
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__(f"Page cursor '{cursor}' is not valid")
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import ClassVar, Generic, TypeVar
+
+from quiz.domain.pagination.page_cursor import PageCursor
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    DEFAULT_SIZE: ClassVar[int] = 20
+    MAX_SIZE: ClassVar[int] = 100
+
+    items: list[T]
+    next_cursor: PageCursor | None = None
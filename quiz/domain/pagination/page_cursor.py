@@ -0,0 +1,26 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from quiz.domain.pagination.invalid_page_cursor_exception import InvalidPageCursorException
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    __SEPARATOR = "|"
+
+    created_at: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        raw_cursor = f"{self.created_at.isoformat()}{self.__SEPARATOR}{self.id}"
+        return urlsafe_b64encode(raw_cursor.encode()).decode()
+
+    @classmethod
+    def decode(cls, cursor: str) -> "PageCursor":
+        try:
+            created_at, cursor_id = urlsafe_b64decode(cursor.encode()).decode().split(cls.__SEPARATOR)
+            return cls(created_at=datetime.fromisoformat(created_at), id=UUID(cursor_id))
+        except ValueError as e:
+            raise InvalidPageCursorException(cursor) from e
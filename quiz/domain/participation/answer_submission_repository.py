@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from uuid import UUID
 
 from quiz.domain.participation.answer_submission import AnswerSubmission
 
@@ -11,3 +13,7 @@ class AnswerSubmissionRepository(ABC):
     @abstractmethod
     def bulk_save(self, answer_submissions: list[AnswerSubmission]) -> None:
         pass
+
+    @abstractmethod
+    def stream_selected_answers_by_quiz(self, quiz_id: UUID) -> Iterator[tuple[UUID, int]]:
+        pass
@@ -23,6 +23,13 @@ class Participation(models.Model):
 
     class Meta:
         unique_together = ["quiz", "participant"]
+        indexes = [
+            models.Index(
+                fields=["quiz", "-score"],
+                condition=models.Q(completed_at__isnull=False, score__isnull=False),
+                name="participation_quiz_scored_idx",
+            ),
+        ]
 
     @property
     def status(self) -> ParticipationStatus:
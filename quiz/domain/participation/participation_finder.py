@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
+from quiz.application.get_user_quizzes.get_user_quizzes_response import QuizParticipationSummary
+from quiz.domain.pagination.page import Page
+from quiz.domain.pagination.page_cursor import PageCursor
 from quiz.domain.participation.quiz_progress_summary import QuizProgressSummary
+from quiz.domain.participation.quiz_score_distribution import QuizScoreDistribution
 from quiz.domain.participation.quiz_scores_summary import QuizScoresSummary
-from quiz.domain.participation.user_participation_data import UserParticipationData
+from quiz.domain.participation.user_quiz_progress_data import UserQuizProgressData
 
 
 class ParticipationFinder(ABC):
@@ -11,10 +16,24 @@ class ParticipationFinder(ABC):
     def find_quiz_scores_summary(self, quiz_id: UUID) -> QuizScoresSummary:
         pass
 
+    @abstractmethod
+    def find_quiz_scores_version(self, quiz_id: UUID) -> datetime | None:
+        pass
+
+    @abstractmethod
+    def find_quiz_score_distribution(self, quiz_id: UUID, bucket_count: int) -> QuizScoreDistribution:
+        pass
+
     @abstractmethod
     def find_creator_quiz_progress_summary(self, quiz_id: UUID) -> QuizProgressSummary:
         pass
 
     @abstractmethod
-    def find_user_participation_for_quiz(self, quiz_id: UUID, user_id: UUID) -> UserParticipationData | None:
+    def find_user_quiz_progress(self, quiz_id: UUID, user_id: UUID) -> UserQuizProgressData | None:
+        pass
+
+    @abstractmethod
+    def find_quiz_participation_summaries_by_user_id(
+        self, user_id: UUID, limit: int, cursor: PageCursor | None = None
+    ) -> Page[QuizParticipationSummary]:
         pass
@@ -1,7 +0,0 @@
-from enum import StrEnum
-
-
-class ParticipationRelatedAttribute(StrEnum):
-    QUIZ = "quiz"
-    PARTICIPANT = "participant"
-    INVITATION = "invitation"
@@ -2,24 +2,21 @@ from abc import ABC, abstractmethod
 from uuid import UUID
 
 from quiz.domain.participation.participation import Participation
-from quiz.domain.participation.participation_related_attribute import ParticipationRelatedAttribute
 
 
 class ParticipationRepository(ABC):
     @abstractmethod
-    def find_all_by_user_id(
-        self, user_id: UUID, related_attributes: list[ParticipationRelatedAttribute] | None = None
-    ) -> list[Participation]:
+    def find_or_fail_by_quiz_and_participant(self, quiz_id: UUID, participant_id: UUID) -> Participation:
         pass
 
     @abstractmethod
-    def find_or_fail_by_quiz_and_participant(self, quiz_id: UUID, participant_id: UUID) -> Participation:
+    def save(self, participation: Participation) -> None:
         pass
 
     @abstractmethod
-    def save(self, participation: Participation) -> None:
+    def find_completed_scores_by_quiz(self, quiz_id: UUID) -> dict[UUID, int]:
         pass
 
     @abstractmethod
-    def exists_by_quiz_and_participant(self, quiz_id: UUID, participant_id: UUID) -> bool:
+    def bulk_update_scores(self, scores: dict[UUID, int], batch_size: int) -> None:
         pass
@@ -1,12 +1,23 @@
+from functools import cache
+
+from django.conf import settings
+
 from quiz.domain.participation.quiz_score_calculator import QuizScoreCalculator
-from quiz.infrastructure.db_answer_repository import DbAnswerRepository
-from quiz.infrastructure.db_question_repository import DbQuestionRepository
+from quiz.domain.quiz.answer_key_finder import AnswerKeyFinder
+from quiz.infrastructure.cached_answer_key_finder import CachedAnswerKeyFinder
+from quiz.infrastructure.db_answer_key_finder import DbAnswerKeyFinder
+
+
+@cache
+def get_shared_answer_key_finder() -> AnswerKeyFinder:
+    return CachedAnswerKeyFinder(
+        DbAnswerKeyFinder(),
+        max_size=settings.ANSWER_KEY_CACHE_MAX_SIZE,
+        timeout=settings.ANSWER_KEY_CACHE_TIMEOUT,
+    )
 
 
 class QuizScoreCalculatorFactory:
     @staticmethod
-    def create() -> QuizScoreCalculator:
-        return QuizScoreCalculator(
-            question_repository=DbQuestionRepository(),
-            answer_repository=DbAnswerRepository(),
-        )
+    def create(answer_key_finder: AnswerKeyFinder | None = None) -> QuizScoreCalculator:
+        return QuizScoreCalculator(answer_key_finder=answer_key_finder or get_shared_answer_key_finder())
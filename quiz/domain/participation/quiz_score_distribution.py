@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ScoreBucket:
+    min_score: float
+    max_score: float
+    count: int
+
+
+@dataclass(frozen=True)
+class QuizScoreDistribution:
+    total_scored: int
+    max_possible_score: int
+    p50: float
+    p90: float
+    p99: float
+    buckets: list[ScoreBucket]
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from quiz.domain.participation.quiz_score_distribution import QuizScoreDistribution
+from quiz.domain.quiz.quiz import Quiz
+
+
+class QuizScoreDistributionCache(ABC):
+    @abstractmethod
+    def get(self, quiz: Quiz, scores_version: datetime) -> QuizScoreDistribution | None:
+        pass
+
+    @abstractmethod
+    def set(self, quiz: Quiz, scores_version: datetime, distribution: QuizScoreDistribution) -> None:
+        pass
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from quiz.domain.participation.user_participation_data import UserParticipationData
+
+
+@dataclass(frozen=True)
+class UserQuizProgressData:
+    quiz_id: str
+    quiz_title: str
+    quiz_description: str
+    total_questions: int
+    total_possible_points: int
+    quiz_created_at: str
+    participation: UserParticipationData
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class AnswerKey:
+    quiz_id: UUID
+    question_points: dict[int, int]
+    answers: dict[int, tuple[int, bool]]
+
+    @property
+    def total_questions(self) -> int:
+        return len(self.question_points)
+
+    @property
+    def total_possible_points(self) -> int:
+        return sum(self.question_points.values())
+
+    def has_question(self, question_id: int) -> bool:
+        return question_id in self.question_points
+
+    def is_answer_of_question(self, answer_id: int, question_id: int) -> bool:
+        answer = self.answers.get(answer_id)
+        return answer is not None and answer[0] == question_id
+
+    def points_for(self, question_id: int, answer_id: int) -> int:
+        _, is_correct = self.answers[answer_id]
+        return self.question_points[question_id] if is_correct else 0
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from quiz.domain.quiz.answer_key import AnswerKey
+from quiz.domain.quiz.quiz import Quiz
+
+
+class AnswerKeyFinder(ABC):
+    @abstractmethod
+    def find_by_quiz(self, quiz: Quiz) -> AnswerKey:
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict
+from typing import Optional
 
 from quiz.domain.quiz.answer import Answer
 
@@ -16,7 +16,3 @@ class AnswerRepository(ABC):
     @abstractmethod
     def find_by_id(self, answer_id: int) -> Optional[Answer]:
         pass
-
-    @abstractmethod
-    def find_by_ids(self, answer_ids: list[int]) -> Dict[int, Answer]:
-        pass
@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-from typing import Dict
 
 from .question import Question
 
@@ -10,5 +9,5 @@ class QuestionRepository(ABC):
         pass
 
     @abstractmethod
-    def find_by_ids(self, question_ids: list[int]) -> Dict[int, Question]:
+    def bulk_save(self, questions: list[Question]) -> None:
         pass
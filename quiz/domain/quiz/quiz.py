@@ -16,9 +16,14 @@ class Quiz(models.Model):
     creator = models.ForeignKey(User, on_delete=models.PROTECT, related_name="quizzes")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    total_questions = models.PositiveIntegerField(default=0)
+    total_possible_points = models.PositiveIntegerField(default=0)
 
     class Meta:
         unique_together = ["title", "creator"]
+        indexes = [
+            models.Index(fields=["creator", "-created_at", "-id"], name="quiz_creator_created_at_idx"),
+        ]
 
     def __init__(self, *args, **kwargs):
         title = kwargs.get("title")
@@ -43,14 +48,6 @@ class Quiz(models.Model):
     def get_formatted_updated_at(self) -> str:
         return self.updated_at.strftime(self.__UTC_DATETIME_FORMAT)
 
-    @property
-    def total_questions(self) -> int:
-        return self.questions.count()
-
     @property
     def total_participants(self) -> int:
         return self.participations.count() if hasattr(self, "participations") else 0
-
-    @property
-    def total_possible_points(self) -> int:
-        return sum(question.points for question in self.questions.all())
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class QuizAccessCache(ABC):
+    @abstractmethod
+    def is_granted(self, quiz_id: UUID, user_id: UUID) -> bool:
+        pass
+
+    @abstractmethod
+    def grant(self, quiz_id: UUID, user_id: UUID) -> None:
+        pass
+
+    @abstractmethod
+    def revoke(self, quiz_id: UUID, user_id: UUID) -> None:
+        pass
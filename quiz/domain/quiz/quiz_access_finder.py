@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class QuizAccessFinder(ABC):
+    @abstractmethod
+    def can_view_quiz(self, quiz_id: UUID, user_id: UUID) -> bool:
+        pass
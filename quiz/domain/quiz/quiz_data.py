@@ -15,7 +15,7 @@ class QuestionData:
     text: str
     order: int
     points: int
-    answers: list[AnswerData]
+    answers: tuple[AnswerData, ...]
 
 
 @dataclass(frozen=True)
@@ -24,4 +24,4 @@ class QuizData:
     quiz_title: str
     quiz_description: str
     quiz_creator_id: UUID
-    questions: list[QuestionData]
+    questions: tuple[QuestionData, ...]
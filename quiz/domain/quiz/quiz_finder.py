@@ -1,10 +1,24 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
 
+from quiz.application.get_creator_quizzes.get_creator_quizzes_response import QuizSummary
+from quiz.domain.pagination.page import Page
+from quiz.domain.pagination.page_cursor import PageCursor
 from quiz.domain.quiz.quiz_data import QuizData
+from quiz.domain.quiz.quiz_version import QuizVersion
 
 
 class QuizFinder(ABC):
+    @abstractmethod
+    def find_quiz_version(self, quiz_id: UUID) -> QuizVersion:
+        pass
+
     @abstractmethod
     def find_quiz_for_participation(self, quiz_id: UUID, participant_id: UUID) -> QuizData:
         pass
+
+    @abstractmethod
+    def find_quiz_summaries_by_creator_id(
+        self, creator_id: UUID, limit: int, cursor: PageCursor | None = None
+    ) -> Page[QuizSummary]:
+        pass
@@ -12,7 +12,3 @@ class QuizRepository(ABC):
     @abstractmethod
     def find_or_fail_by_id(self, quiz_id: UUID) -> Quiz:
         pass
-
-    @abstractmethod
-    def find_by_creator_id(self, creator_id: UUID) -> list[Quiz]:
-        pass
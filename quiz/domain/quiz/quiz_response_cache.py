@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+from quiz.application.get_quiz_query.encoded_quiz_response import EncodedQuizResponse
+from quiz.domain.quiz.quiz_response_cache_stats import QuizResponseCacheStats
+from quiz.domain.quiz.quiz_version import QuizVersion
+
+
+class QuizResponseCache(ABC):
+    @abstractmethod
+    def get(self, quiz_version: QuizVersion) -> EncodedQuizResponse | None:
+        pass
+
+    @abstractmethod
+    def set(self, quiz_version: QuizVersion, response: EncodedQuizResponse) -> None:
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> QuizResponseCacheStats:
+        pass
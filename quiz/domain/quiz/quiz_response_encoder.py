@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+from quiz.application.get_quiz_query.get_quiz_query_response import GetQuizQueryResponse
+
+
+class QuizResponseEncoder(ABC):
+    @abstractmethod
+    def encode(self, response: GetQuizQueryResponse) -> bytes:
+        pass
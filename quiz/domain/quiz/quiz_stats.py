@@ -0,0 +1,45 @@
+from django.db import models
+
+from quiz.domain.quiz.quiz import Quiz
+from user.domain.user import User
+
+
+class QuizStats(models.Model):
+    quiz = models.OneToOneField(Quiz, on_delete=models.CASCADE, primary_key=True, related_name="stats")
+    invitations_sent = models.PositiveIntegerField(default=0)
+    invitations_accepted = models.PositiveIntegerField(default=0)
+    participations_started = models.PositiveIntegerField(default=0)
+    participations_completed = models.PositiveIntegerField(default=0)
+    total_score = models.PositiveBigIntegerField(default=0)
+    max_score = models.PositiveIntegerField(null=True, blank=True)
+    min_score = models.PositiveIntegerField(null=True, blank=True)
+    top_scorer = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @property
+    def pending_invitations(self) -> int:
+        return self.invitations_sent - self.invitations_accepted
+
+    @property
+    def acceptance_rate(self) -> float:
+        if self.invitations_sent == 0:
+            return 0.0
+
+        return self.invitations_accepted / self.invitations_sent * 100
+
+    @property
+    def completion_rate(self) -> float:
+        if self.participations_started == 0:
+            return 0.0
+
+        return self.participations_completed / self.participations_started * 100
+
+    @property
+    def average_score(self) -> float:
+        if self.participations_completed == 0:
+            return 0.0
+
+        return self.total_score / self.participations_completed
+
+    def __str__(self):
+        return f"Stats for quiz {self.quiz_id}"
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from quiz.domain.quiz.quiz_stats import QuizStats
+
+
+class QuizStatsRepository(ABC):
+    @abstractmethod
+    def save(self, quiz_stats: QuizStats) -> None:
+        pass
+
+    @abstractmethod
+    def record_invitation_sent(self, quiz_id: UUID, count: int = 1) -> None:
+        pass
+
+    @abstractmethod
+    def record_invitation_accepted(self, quiz_id: UUID) -> None:
+        pass
+
+    @abstractmethod
+    def record_participation_completed(self, quiz_id: UUID, participant_id: UUID, score: int) -> None:
+        pass
+
+    @abstractmethod
+    def rebuild(self, quiz_id: UUID) -> None:
+        pass
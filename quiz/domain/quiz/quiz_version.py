@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class QuizVersion:
+    quiz_id: UUID
+    quiz_creator_id: UUID
+    updated_at: datetime
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.quiz_id}-{self.updated_at.timestamp()}"'
@@ -0,0 +1,51 @@
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import datetime
+from threading import Lock
+from time import monotonic
+from uuid import UUID
+
+from quiz.domain.quiz.answer_key import AnswerKey
+from quiz.domain.quiz.answer_key_finder import AnswerKeyFinder
+from quiz.domain.quiz.quiz import Quiz
+
+
+class CachedAnswerKeyFinder(AnswerKeyFinder):
+    """In-process LRU cache of answer keys, bounded by size and entry age.
+
+    Entries are tagged with the quiz `updated_at`, which is bumped whenever a question or answer changes, so a worker
+    reloads the answer key as soon as it scores a submission against the edited quiz. Unused entries still expire
+    after `timeout` seconds.
+    """
+
+    def __init__(
+        self,
+        answer_key_finder: AnswerKeyFinder,
+        max_size: int,
+        timeout: float,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.__answer_key_finder = answer_key_finder
+        self.__max_size = max_size
+        self.__timeout = timeout
+        self.__clock = clock
+        self.__entries: OrderedDict[UUID, tuple[datetime, float, AnswerKey]] = OrderedDict()
+        self.__lock = Lock()
+
+    def find_by_quiz(self, quiz: Quiz) -> AnswerKey:
+        now = self.__clock()
+        with self.__lock:
+            entry = self.__entries.get(quiz.id)
+            if entry is not None and entry[0] == quiz.updated_at and entry[1] > now:
+                self.__entries.move_to_end(quiz.id)
+                return entry[2]
+
+        answer_key = self.__answer_key_finder.find_by_quiz(quiz)
+
+        with self.__lock:
+            self.__entries[quiz.id] = (quiz.updated_at, now + self.__timeout, answer_key)
+            self.__entries.move_to_end(quiz.id)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+
+        return answer_key
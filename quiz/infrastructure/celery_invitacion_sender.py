@@ -1,15 +1,28 @@
 import logging
 from uuid import UUID
 
+from django.conf import settings
+
 from quiz.domain.invitation.invitation_sender import InvitationSender
-from quiz.infrastructure.send_invitation_email_task import send_invitation_email_task
+from quiz.infrastructure.send_invitation_email_task import send_invitation_email_task, send_invitation_emails_task
 
 logger = logging.getLogger(__name__)
 
 
 class CeleryInvitationSender(InvitationSender):
+    def __init__(self, batch_size: int | None = None) -> None:
+        self.__batch_size = batch_size or settings.INVITATION_EMAIL_BATCH_SIZE
+
     def send_invitation_email(self, invitation_id: UUID, invitation_acceptance_link: str) -> None:
         send_invitation_email_task.delay(
             invitation_id=str(invitation_id),
             invitation_acceptance_link=invitation_acceptance_link,
         )
+
+    def send_invitation_emails(self, invitation_acceptance_links: dict[UUID, str]) -> None:
+        invitations = [
+            {"invitation_id": str(invitation_id), "invitation_acceptance_link": invitation_acceptance_link}
+            for invitation_id, invitation_acceptance_link in invitation_acceptance_links.items()
+        ]
+        for start in range(0, len(invitations), self.__batch_size):
+            send_invitation_emails_task.delay(invitations=invitations[start : start + self.__batch_size])
@@ -0,0 +1,19 @@
+from quiz.domain.quiz.answer import Answer
+from quiz.domain.quiz.answer_key import AnswerKey
+from quiz.domain.quiz.answer_key_finder import AnswerKeyFinder
+from quiz.domain.quiz.quiz import Quiz
+
+
+class DbAnswerKeyFinder(AnswerKeyFinder):
+    def find_by_quiz(self, quiz: Quiz) -> AnswerKey:
+        rows = Answer.objects.filter(question__quiz_id=quiz.id).values_list(
+            "question_id", "id", "is_correct", "question__points"
+        )
+
+        question_points = {}
+        answers = {}
+        for question_id, answer_id, is_correct, points in rows:
+            question_points[question_id] = points
+            answers[answer_id] = (question_id, is_correct)
+
+        return AnswerKey(quiz_id=quiz.id, question_points=question_points, answers=answers)
@@ -1,4 +1,4 @@
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 
 from quiz.domain.quiz.answer import Answer
 from quiz.domain.quiz.answer_already_exists_exception import AnswerAlreadyExistsException
@@ -22,13 +22,31 @@ class DbAnswerRepository(AnswerRepository):
         except Answer.DoesNotExist:
             return None
 
-    def find_by_ids(self, answer_ids: list[int]) -> dict[int, Answer]:
-        answers = Answer.objects.filter(id__in=answer_ids)
-        return {answer.id: answer for answer in answers}
-
     def __is_unique_constraint_violation(self, exc: IntegrityError) -> bool:
         return self.__UNIQUE_CONSTRAINT_QUESTION_AND_ORDER in exc.__cause__.diag.constraint_name
 
     def bulk_save(self, answers: list[Answer]) -> None:
+        try:
+            with transaction.atomic():
+                Answer.objects.bulk_create(answers)
+        except IntegrityError as exc:
+            if self.__is_unique_constraint_violation(exc):
+                duplicated_answer = self.__find_duplicated_answer(answers)
+                if duplicated_answer is not None:
+                    raise AnswerAlreadyExistsException(
+                        order=duplicated_answer.order, question_id=duplicated_answer.question_id
+                    ) from exc
+            raise exc
+
+    def __find_duplicated_answer(self, answers: list[Answer]) -> Answer | None:
+        question_ids = {answer.question_id for answer in answers}
+        stored_keys = set(Answer.objects.filter(question_id__in=question_ids).values_list("question_id", "order"))
+
+        seen_keys = set()
         for answer in answers:
-            self.save(answer)
+            key = (answer.question_id, answer.order)
+            if key in seen_keys or key in stored_keys:
+                return answer
+            seen_keys.add(key)
+
+        return None
@@ -1,4 +1,7 @@
-from django.db import IntegrityError
+from collections.abc import Iterator
+from uuid import UUID
+
+from django.db import IntegrityError, transaction
 
 from quiz.domain.participation.answer_submission import AnswerSubmission
 from quiz.domain.participation.answer_submission_repository import AnswerSubmissionRepository
@@ -7,6 +10,7 @@ from quiz.domain.participation.duplicate_answer_submission_exception import Dupl
 
 class DbAnswerSubmissionRepository(AnswerSubmissionRepository):
     __UNIQUE_CONSTRAINT_PARTICIPATION_AND_QUESTION = "quiz_answersubmission_participation_id_question_id"
+    __STREAM_CHUNK_SIZE = 10000
 
     def save(self, answer_submission: AnswerSubmission) -> None:
         try:
@@ -17,8 +21,40 @@ class DbAnswerSubmissionRepository(AnswerSubmissionRepository):
             raise exc
 
     def bulk_save(self, answer_submissions: list[AnswerSubmission]) -> None:
-        for answer_submission in answer_submissions:
-            self.save(answer_submission)
+        try:
+            with transaction.atomic():
+                AnswerSubmission.objects.bulk_create(answer_submissions)
+        except IntegrityError as exc:
+            if self.__is_unique_constraint_violation(exc):
+                duplicated_submission = self.__find_duplicated_submission(answer_submissions)
+                if duplicated_submission is not None:
+                    raise DuplicateAnswerSubmissionException(question_id=duplicated_submission.question_id) from exc
+            raise exc
+
+    def stream_selected_answers_by_quiz(self, quiz_id: UUID) -> Iterator[tuple[UUID, int]]:
+        return (
+            AnswerSubmission.objects.filter(participation__quiz_id=quiz_id)
+            .order_by("participation_id")
+            .values_list("participation_id", "selected_answer_id")
+            .iterator(chunk_size=self.__STREAM_CHUNK_SIZE)
+        )
 
     def __is_unique_constraint_violation(self, exc: IntegrityError) -> bool:
         return self.__UNIQUE_CONSTRAINT_PARTICIPATION_AND_QUESTION in exc.__cause__.diag.constraint_name
+
+    def __find_duplicated_submission(self, answer_submissions: list[AnswerSubmission]) -> AnswerSubmission | None:
+        participation_ids = {submission.participation_id for submission in answer_submissions}
+        stored_keys = set(
+            AnswerSubmission.objects.filter(participation_id__in=participation_ids).values_list(
+                "participation_id", "question_id"
+            )
+        )
+
+        seen_keys = set()
+        for submission in answer_submissions:
+            key = (submission.participation_id, submission.question_id)
+            if key in seen_keys or key in stored_keys:
+                return submission
+            seen_keys.add(key)
+
+        return None
@@ -24,10 +24,19 @@ class DbInvitationRepository(InvitationRepository):
         except Invitation.DoesNotExist:
             raise InvitationNotFoundException(invitation_id)
 
+    def find_by_ids(
+        self, invitation_ids: list[UUID], related_attributes: list[InvitationRelatedAttribute] | None = None
+    ) -> list[Invitation]:
+        queryset = Invitation.objects.filter(id__in=invitation_ids)
+        if related_attributes is not None:
+            queryset = queryset.select_related(*related_attributes)
+
+        return list(queryset)
+
     def find_active_invitation(self, quiz_id: UUID, participant_id: UUID) -> Invitation | None:
         try:
             return Invitation.objects.select_related("quiz", "invited").get(
-                quiz_id=quiz_id, participant_id=participant_id, accepted_at__isnull=True
+                quiz_id=quiz_id, invited_id=participant_id, accepted_at__isnull=True
             )
         except Invitation.DoesNotExist:
             return None
@@ -42,8 +51,21 @@ class DbInvitationRepository(InvitationRepository):
                 ) from exc
             raise exc
 
-    def exists_by_quiz_and_invited(self, quiz_id: UUID, invited_id: UUID) -> bool:
-        return Invitation.objects.filter(quiz_id=quiz_id, invited_id=invited_id).exists()
+    def bulk_save_skipping_existing(self, invitations: list[Invitation]) -> list[Invitation]:
+        if not invitations:
+            return []
+
+        Invitation.objects.bulk_create(invitations, ignore_conflicts=True)
+        saved_ids = set(
+            Invitation.objects.filter(id__in=[invitation.id for invitation in invitations]).values_list("id", flat=True)
+        )
+
+        return [invitation for invitation in invitations if invitation.id in saved_ids]
+
+    def find_invited_ids_by_quiz(self, quiz_id: UUID, invited_ids: list[UUID]) -> set[UUID]:
+        return set(
+            Invitation.objects.filter(quiz_id=quiz_id, invited_id__in=invited_ids).values_list("invited_id", flat=True)
+        )
 
     def __is_unique_constraint_violation(self, exc: IntegrityError) -> bool:
         return self.__UNIQUE_CONSTRAINT_QUIZ_AND_PARTICIPANT in exc.__cause__.diag.constraint_name
@@ -1,74 +1,206 @@
+from datetime import datetime
 from uuid import UUID
 
-from django.db.models import Count, Avg, Q, Max, Min, FloatField
+from django.db import connection
+from django.db.models import Count, Avg, Q, Max, Min, FloatField, OuterRef, Subquery
 from django.db.models.functions import Coalesce
 
 from quiz.application.get_creator_quiz_progress.get_creator_quiz_progress_response import (
     InvitationStats,
     ParticipationStats,
 )
+from quiz.application.get_user_quizzes.get_user_quizzes_response import QuizParticipationSummary
 from quiz.domain.invitation.invitation import Invitation
+from quiz.domain.pagination.page import Page
+from quiz.domain.pagination.page_cursor import PageCursor
 from quiz.domain.participation.participation import Participation
 from quiz.domain.participation.participation_finder import ParticipationFinder
 from quiz.domain.participation.quiz_progress_summary import QuizProgressSummary
+from quiz.domain.participation.quiz_score_distribution import QuizScoreDistribution, ScoreBucket
 from quiz.domain.participation.quiz_scores_summary import QuizScoresSummary
 from quiz.domain.participation.user_participation_data import UserParticipationData
+from quiz.domain.participation.user_quiz_progress_data import UserQuizProgressData
+from quiz.domain.quiz.quiz import Quiz
+from quiz.domain.quiz.quiz_stats import QuizStats
+from quiz.infrastructure.keyset_paginator import KeysetPaginator
 
 
 class DbParticipationFinder(ParticipationFinder):
+    __USER_QUIZ_PROGRESS_FIELDS = (
+        "score",
+        "completed_at",
+        "created_at",
+        "quiz__title",
+        "quiz__description",
+        "quiz__total_questions",
+        "quiz__total_possible_points",
+        "quiz__created_at",
+        "invitation__invited_at",
+    )
+    __SCORE_DISTRIBUTION_SQL = f"""
+        WITH scores AS (
+            SELECT score
+            FROM {Participation._meta.db_table}
+            WHERE quiz_id = %(quiz_id)s AND completed_at IS NOT NULL AND score IS NOT NULL
+        ),
+        bounds AS (
+            SELECT total_possible_points AS max_possible_score
+            FROM {Quiz._meta.db_table}
+            WHERE id = %(quiz_id)s
+        )
+        SELECT
+            bounds.max_possible_score,
+            (SELECT COUNT(*) FROM scores),
+            (SELECT percentile_cont(ARRAY[0.5, 0.9, 0.99]) WITHIN GROUP (ORDER BY score) FROM scores),
+            (
+                SELECT json_object_agg(bucket, bucket_count)
+                FROM (
+                    SELECT
+                        LEAST(
+                            width_bucket(
+                                score::numeric, 0, GREATEST(bounds.max_possible_score, 1)::numeric, %(bucket_count)s
+                            ),
+                            %(bucket_count)s
+                        ) AS bucket,
+                        COUNT(*) AS bucket_count
+                    FROM scores
+                    GROUP BY 1
+                ) AS buckets
+            )
+        FROM bounds
+    """
+
+    def __init__(self, paginator: KeysetPaginator | None = None) -> None:
+        self.__paginator = paginator or KeysetPaginator(created_at_field="quiz__created_at", id_field="quiz_id")
 
     def find_quiz_scores_summary(self, quiz_id: UUID) -> QuizScoresSummary:
-        stats = Participation.objects.filter(quiz_id=quiz_id).aggregate(
-            total_participants=Count("id"),
-            average_score=Coalesce(
-                Avg("score", filter=Q(completed_at__isnull=False, score__isnull=False)), 0.0, output_field=FloatField()
-            ),
-            max_score=Coalesce(
-                Max("score", filter=Q(completed_at__isnull=False, score__isnull=False)), 0.0, output_field=FloatField()
-            ),
-            min_score=Coalesce(
-                Min("score", filter=Q(completed_at__isnull=False, score__isnull=False)), 0.0, output_field=FloatField()
-            ),
-        )
+        try:
+            quiz_stats = QuizStats.objects.select_related("top_scorer").get(quiz_id=quiz_id)
+        except QuizStats.DoesNotExist:
+            return self.__aggregate_quiz_scores_summary(quiz_id)
 
-        top_scorer_participation = (
-            Participation.objects.filter(quiz_id=quiz_id, completed_at__isnull=False, score__isnull=False)
-            .select_related("participant")
-            .order_by("-score")
-            .first()
+        return QuizScoresSummary(
+            total_participants=quiz_stats.participations_started,
+            average_score=round(float(quiz_stats.average_score), 2),
+            max_score=round(float(quiz_stats.max_score or 0.0), 2),
+            min_score=round(float(quiz_stats.min_score or 0.0), 2),
+            top_scorer_email=quiz_stats.top_scorer.email if quiz_stats.top_scorer else None,
         )
 
-        return QuizScoresSummary(
-            total_participants=stats["total_participants"],
-            average_score=round(float(stats["average_score"]), 2),
-            max_score=round(float(stats["max_score"]), 2),
-            min_score=round(float(stats["min_score"]), 2),
-            top_scorer_email=top_scorer_participation.participant.email if top_scorer_participation else None,
+    def find_quiz_scores_version(self, quiz_id: UUID) -> datetime | None:
+        return QuizStats.objects.filter(quiz_id=quiz_id).values_list("updated_at", flat=True).first()
+
+    def find_quiz_score_distribution(self, quiz_id: UUID, bucket_count: int) -> QuizScoreDistribution:
+        with connection.cursor() as cursor:
+            cursor.execute(self.__SCORE_DISTRIBUTION_SQL, {"quiz_id": quiz_id, "bucket_count": bucket_count})
+            max_possible_score, total_scored, percentiles, bucket_counts = cursor.fetchone()
+
+        p50, p90, p99 = percentiles or (0.0, 0.0, 0.0)
+        bucket_counts = bucket_counts or {}
+        bucket_width = max(max_possible_score, 1) / bucket_count
+
+        return QuizScoreDistribution(
+            total_scored=total_scored,
+            max_possible_score=max_possible_score,
+            p50=round(float(p50), 2),
+            p90=round(float(p90), 2),
+            p99=round(float(p99), 2),
+            buckets=[
+                ScoreBucket(
+                    min_score=round(bucket * bucket_width, 2),
+                    max_score=round((bucket + 1) * bucket_width, 2),
+                    count=bucket_counts.get(str(bucket + 1), 0),
+                )
+                for bucket in range(bucket_count)
+            ],
         )
 
-    def find_user_participation_for_quiz(self, quiz_id: UUID, user_id: UUID) -> UserParticipationData | None:
+    def find_user_quiz_progress(self, quiz_id: UUID, user_id: UUID) -> UserQuizProgressData | None:
         try:
-            participation = Participation.objects.select_related("invitation").get(
-                quiz_id=quiz_id, participant_id=user_id
+            participation = (
+                Participation.objects.select_related("quiz", "invitation")
+                .only(*self.__USER_QUIZ_PROGRESS_FIELDS)
+                .get(quiz_id=quiz_id, participant_id=user_id)
             )
+        except Participation.DoesNotExist:
+            return None
 
-            invited_at = None
-            if participation.invitation is not None:
-                invited_at = participation.invitation.get_formatted_invited_at()
-
-            started_at = participation.get_formatted_created_at()
+        quiz = participation.quiz
+        invited_at = None
+        if participation.invitation is not None:
+            invited_at = participation.invitation.get_formatted_invited_at()
 
-            return UserParticipationData(
+        return UserQuizProgressData(
+            quiz_id=str(quiz.id),
+            quiz_title=quiz.title,
+            quiz_description=quiz.description,
+            total_questions=quiz.total_questions,
+            total_possible_points=quiz.total_possible_points,
+            quiz_created_at=quiz.get_formatted_created_at(),
+            participation=UserParticipationData(
                 status=participation.status.value,
                 invited_at=invited_at,
-                started_at=started_at,
+                started_at=participation.get_formatted_created_at(),
                 completed_at=participation.get_formatted_completed_at(),
                 score=participation.score,
-            )
-        except Participation.DoesNotExist:
-            return None
+            ),
+        )
 
     def find_creator_quiz_progress_summary(self, quiz_id: UUID) -> QuizProgressSummary:
+        try:
+            quiz_stats = QuizStats.objects.get(quiz_id=quiz_id)
+        except QuizStats.DoesNotExist:
+            return self.__aggregate_creator_quiz_progress_summary(quiz_id)
+
+        return QuizProgressSummary(
+            invitation_stats=InvitationStats(
+                total_sent=quiz_stats.invitations_sent,
+                total_accepted=quiz_stats.invitations_accepted,
+                acceptance_rate=round(quiz_stats.acceptance_rate, 2),
+                pending_invitations=quiz_stats.pending_invitations,
+            ),
+            participation_stats=ParticipationStats(
+                total_participants=quiz_stats.participations_started,
+                completed_participants=quiz_stats.participations_completed,
+                completion_rate=round(quiz_stats.completion_rate, 2),
+            ),
+        )
+
+    def find_quiz_participation_summaries_by_user_id(
+        self, user_id: UUID, limit: int, cursor: PageCursor | None = None
+    ) -> Page[QuizParticipationSummary]:
+        participants_per_quiz = (
+            Participation.objects.filter(quiz_id=OuterRef("quiz_id"))
+            .order_by()
+            .values("quiz_id")
+            .annotate(total=Count("id"))
+            .values("total")
+        )
+        participations = (
+            Participation.objects.filter(participant_id=user_id)
+            .select_related("quiz")
+            .annotate(quiz_participants_count=Coalesce(Subquery(participants_per_quiz), 0))
+        )
+        page = self.__paginator.paginate(participations, limit=limit, cursor=cursor)
+
+        participation_summaries = [
+            QuizParticipationSummary(
+                quiz_id=participation.quiz.id,
+                quiz_title=participation.quiz.title,
+                quiz_description=participation.quiz.description,
+                total_questions=participation.quiz.total_questions,
+                total_participants=participation.quiz_participants_count,
+                quiz_created_at=participation.quiz.get_formatted_created_at(),
+                score=participation.score,
+                completed_at=participation.get_formatted_completed_at(),
+                participation_status=participation.status,
+                participation_created_at=participation.get_formatted_created_at(),
+            )
+            for participation in page.items
+        ]
+        return Page(items=participation_summaries, next_cursor=page.next_cursor)
+
+    def __aggregate_creator_quiz_progress_summary(self, quiz_id: UUID) -> QuizProgressSummary:
         invitation_stats = Invitation.objects.filter(quiz_id=quiz_id).aggregate(
             total_sent=Count("id"),
             total_accepted=Count("id", filter=Q(accepted_at__isnull=False)),
@@ -101,3 +233,43 @@ class DbParticipationFinder(ParticipationFinder):
                 completion_rate=round(completion_rate, 2),
             ),
         )
+
+    def __aggregate_quiz_scores_summary(self, quiz_id: UUID) -> QuizScoresSummary:
+        scored_participation = Q(participations__completed_at__isnull=False, participations__score__isnull=False)
+        top_scorer_email = (
+            Participation.objects.filter(quiz_id=OuterRef("id"), completed_at__isnull=False, score__isnull=False)
+            .order_by("-score", "completed_at")
+            .values("participant__email")[:1]
+        )
+
+        stats = (
+            Quiz.objects.filter(id=quiz_id)
+            .values("id")
+            .annotate(
+                total_participants=Count("participations"),
+                average_score=Coalesce(
+                    Avg("participations__score", filter=scored_participation), 0.0, output_field=FloatField()
+                ),
+                max_score=Coalesce(
+                    Max("participations__score", filter=scored_participation), 0.0, output_field=FloatField()
+                ),
+                min_score=Coalesce(
+                    Min("participations__score", filter=scored_participation), 0.0, output_field=FloatField()
+                ),
+                top_scorer_email=Subquery(top_scorer_email),
+            )
+            .first()
+        )
+
+        if stats is None:
+            return QuizScoresSummary(
+                total_participants=0, average_score=0.0, max_score=0.0, min_score=0.0, top_scorer_email=None
+            )
+
+        return QuizScoresSummary(
+            total_participants=stats["total_participants"],
+            average_score=round(float(stats["average_score"]), 2),
+            max_score=round(float(stats["max_score"]), 2),
+            min_score=round(float(stats["min_score"]), 2),
+            top_scorer_email=stats["top_scorer_email"],
+        )
@@ -7,22 +7,12 @@ from quiz.domain.participation.participation_already_exists_exception import Par
 from quiz.domain.participation.participation_not_found_for_quiz_and_participant_exception import (
     ParticipationNotFoundForQuizAndParticipantException,
 )
-from quiz.domain.participation.participation_related_attribute import ParticipationRelatedAttribute
 from quiz.domain.participation.participation_repository import ParticipationRepository
 
 
 class DbParticipationRepository(ParticipationRepository):
     __UNIQUE_CONSTRAINT_QUIZ_AND_PARTICIPANT = "quiz_participation_quiz_id_participant_id_ef6ab5ef_uniq"
 
-    def find_all_by_user_id(
-        self, user_id: UUID, related_attributes: list[ParticipationRelatedAttribute] | None = None
-    ) -> list[Participation]:
-        queryset = Participation.objects.filter(participant_id=user_id)
-        if related_attributes is not None:
-            queryset = queryset.select_related(*related_attributes)
-
-        return list(queryset.order_by("-quiz__created_at"))
-
     def find_or_fail_by_quiz_and_participant(self, quiz_id: UUID, participant_id: UUID) -> Participation:
         try:
             return Participation.objects.select_related("quiz", "participant", "invitation").get(
@@ -41,8 +31,14 @@ class DbParticipationRepository(ParticipationRepository):
                 ) from exc
             raise exc
 
-    def exists_by_quiz_and_participant(self, quiz_id: UUID, participant_id: UUID) -> bool:
-        return Participation.objects.filter(quiz_id=quiz_id, participant_id=participant_id).exists()
+    def find_completed_scores_by_quiz(self, quiz_id: UUID) -> dict[UUID, int]:
+        return dict(
+            Participation.objects.filter(quiz_id=quiz_id, completed_at__isnull=False).values_list("id", "score")
+        )
+
+    def bulk_update_scores(self, scores: dict[UUID, int], batch_size: int) -> None:
+        participations = [Participation(id=participation_id, score=score) for participation_id, score in scores.items()]
+        Participation.objects.bulk_update(participations, ["score"], batch_size=batch_size)
 
     def __is_unique_constraint_violation(self, exc: IntegrityError) -> bool:
         return self.__UNIQUE_CONSTRAINT_QUIZ_AND_PARTICIPANT in exc.__cause__.diag.constraint_name
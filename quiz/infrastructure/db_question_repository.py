@@ -1,6 +1,4 @@
-from typing import Dict
-
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 
 from quiz.domain.quiz.question import Question
 from quiz.domain.quiz.question_already_exists_exception import QuestionAlreadyExistsException
@@ -18,9 +16,31 @@ class DbQuestionRepository(QuestionRepository):
                 raise QuestionAlreadyExistsException(order=question.order, quiz_id=question.quiz_id) from exc
             raise exc
 
-    def find_by_ids(self, question_ids: list[int]) -> Dict[int, Question]:
-        questions = Question.objects.filter(id__in=question_ids)
-        return {question.id: question for question in questions}
+    def bulk_save(self, questions: list[Question]) -> None:
+        try:
+            with transaction.atomic():
+                Question.objects.bulk_create(questions)
+        except IntegrityError as exc:
+            if self.__is_unique_constraint_violation(exc):
+                duplicated_question = self.__find_duplicated_question(questions)
+                if duplicated_question is not None:
+                    raise QuestionAlreadyExistsException(
+                        order=duplicated_question.order, quiz_id=duplicated_question.quiz_id
+                    ) from exc
+            raise exc
 
     def __is_unique_constraint_violation(self, exc: IntegrityError) -> bool:
         return self.__UNIQUE_CONSTRAINT_TITLE_AND_CREATOR in exc.__cause__.diag.constraint_name
+
+    def __find_duplicated_question(self, questions: list[Question]) -> Question | None:
+        quiz_ids = {question.quiz_id for question in questions}
+        stored_keys = set(Question.objects.filter(quiz_id__in=quiz_ids).values_list("quiz_id", "order"))
+
+        seen_keys = set()
+        for question in questions:
+            key = (question.quiz_id, question.order)
+            if key in seen_keys or key in stored_keys:
+                return question
+            seen_keys.add(key)
+
+        return None
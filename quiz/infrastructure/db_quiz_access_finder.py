@@ -0,0 +1,21 @@
+from uuid import UUID
+
+from django.db.models import Exists, OuterRef, Q
+
+from quiz.domain.invitation.invitation import Invitation
+from quiz.domain.participation.participation import Participation
+from quiz.domain.quiz.quiz import Quiz
+from quiz.domain.quiz.quiz_access_finder import QuizAccessFinder
+
+
+class DbQuizAccessFinder(QuizAccessFinder):
+    def can_view_quiz(self, quiz_id: UUID, user_id: UUID) -> bool:
+        return (
+            Quiz.objects.filter(id=quiz_id)
+            .filter(
+                Q(creator_id=user_id)
+                | Exists(Participation.objects.filter(quiz_id=OuterRef("pk"), participant_id=user_id))
+                | Exists(Invitation.objects.filter(quiz_id=OuterRef("pk"), invited_id=user_id))
+            )
+            .exists()
+        )
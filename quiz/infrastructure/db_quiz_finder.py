@@ -1,15 +1,37 @@
 from uuid import UUID
 
+from django.db.models import Count, OuterRef, Prefetch, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+
+from quiz.application.get_creator_quizzes.get_creator_quizzes_response import QuizSummary
+from quiz.domain.pagination.page import Page
+from quiz.domain.pagination.page_cursor import PageCursor
+from quiz.domain.participation.participation import Participation
+from quiz.domain.quiz.answer import Answer
+from quiz.domain.quiz.question import Question
 from quiz.domain.quiz.quiz import Quiz
 from quiz.domain.quiz.quiz_data import QuizData, QuestionData, AnswerData
 from quiz.domain.quiz.quiz_finder import QuizFinder
 from quiz.domain.quiz.quiz_not_found_exception import QuizNotFoundException
+from quiz.domain.quiz.quiz_version import QuizVersion
+from quiz.infrastructure.keyset_paginator import KeysetPaginator
 
 
 class DbQuizFinder(QuizFinder):
+    def __init__(self, paginator: KeysetPaginator | None = None) -> None:
+        self.__paginator = paginator or KeysetPaginator()
+
+    def find_quiz_version(self, quiz_id: UUID) -> QuizVersion:
+        try:
+            creator_id, updated_at = Quiz.objects.values_list("creator_id", "updated_at").get(id=quiz_id)
+        except Quiz.DoesNotExist as e:
+            raise QuizNotFoundException(quiz_id=str(quiz_id)) from e
+
+        return QuizVersion(quiz_id=quiz_id, quiz_creator_id=creator_id, updated_at=updated_at)
+
     def find_quiz_for_participation(self, quiz_id: UUID, participant_id: UUID) -> QuizData:
         try:
-            quiz = Quiz.objects.prefetch_related("questions__answers").get(id=quiz_id)
+            quiz = Quiz.objects.prefetch_related(self.__ordered_questions_with_answers()).get(id=quiz_id)
         except Quiz.DoesNotExist as e:
             raise QuizNotFoundException(quiz_id=str(quiz_id)) from e
 
@@ -23,28 +45,58 @@ class DbQuizFinder(QuizFinder):
             questions=questions,
         )
 
-    def __build_questions_from_quiz(self, quiz: Quiz) -> list[QuestionData]:
-        questions = []
+    def find_quiz_summaries_by_creator_id(
+        self, creator_id: UUID, limit: int, cursor: PageCursor | None = None
+    ) -> Page[QuizSummary]:
+        quizzes = Quiz.objects.filter(creator_id=creator_id).annotate(
+            questions_count=self.__count_per_quiz(Question.objects.all()),
+            participants_count=self.__count_per_quiz(Participation.objects.all()),
+        )
+        page = self.__paginator.paginate(quizzes, limit=limit, cursor=cursor)
 
-        for question in quiz.questions.all().order_by("order"):
-            answers = []
-            for answer in question.answers.all().order_by("order"):
-                answers.append(
+        quiz_summaries = [
+            QuizSummary(
+                id=quiz.id,
+                title=quiz.title,
+                description=quiz.description,
+                questions_count=quiz.questions_count,
+                participants_count=quiz.participants_count,
+                created_at=quiz.get_formatted_created_at(),
+                updated_at=quiz.get_formatted_updated_at(),
+            )
+            for quiz in page.items
+        ]
+        return Page(items=quiz_summaries, next_cursor=page.next_cursor)
+
+    def __count_per_quiz(self, queryset: QuerySet) -> Coalesce:
+        counts_by_quiz = (
+            queryset.filter(quiz_id=OuterRef("id"))
+            .order_by()
+            .values("quiz_id")
+            .annotate(total=Count("id"))
+            .values("total")
+        )
+        return Coalesce(Subquery(counts_by_quiz), 0)
+
+    def __ordered_questions_with_answers(self) -> Prefetch:
+        ordered_answers = Prefetch("answers", queryset=Answer.objects.order_by("order"))
+        return Prefetch("questions", queryset=Question.objects.order_by("order").prefetch_related(ordered_answers))
+
+    def __build_questions_from_quiz(self, quiz: Quiz) -> tuple[QuestionData, ...]:
+        return tuple(
+            QuestionData(
+                question_id=question.id,
+                text=question.text,
+                order=question.order,
+                points=question.points,
+                answers=tuple(
                     AnswerData(
                         answer_id=answer.id,
                         text=answer.text,
                         order=answer.order,
                     )
-                )
-
-            questions.append(
-                QuestionData(
-                    question_id=question.id,
-                    text=question.text,
-                    order=question.order,
-                    points=question.points,
-                    answers=answers,
-                )
+                    for answer in question.answers.all()
+                ),
             )
-
-        return questions
+            for question in quiz.questions.all()
+        )
@@ -25,8 +25,5 @@ class DbQuizRepository(QuizRepository):
         except Quiz.DoesNotExist as e:
             raise QuizNotFoundException(quiz_id=str(quiz_id)) from e
 
-    def find_by_creator_id(self, creator_id: UUID) -> list[Quiz]:
-        return list(Quiz.objects.filter(creator_id=creator_id).order_by("-created_at"))
-
     def __is_unique_constraint_violation(self, exc: IntegrityError) -> bool:
         return self.__UNIQUE_CONSTRAINT_TITLE_AND_CREATOR in exc.__cause__.diag.constraint_name
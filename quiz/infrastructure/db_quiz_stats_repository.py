@@ -0,0 +1,74 @@
+from uuid import UUID
+
+from django.db.models import Case, Count, F, Max, Min, Q, Sum, UUIDField, Value, When
+from django.db.models.functions import Coalesce, Greatest, Least, Now
+
+from quiz.domain.invitation.invitation import Invitation
+from quiz.domain.participation.participation import Participation
+from quiz.domain.quiz.quiz_stats import QuizStats
+from quiz.domain.quiz.quiz_stats_repository import QuizStatsRepository
+
+
+class DbQuizStatsRepository(QuizStatsRepository):
+    __SCORED_PARTICIPATION = Q(completed_at__isnull=False, score__isnull=False)
+
+    def save(self, quiz_stats: QuizStats) -> None:
+        quiz_stats.save()
+
+    def record_invitation_sent(self, quiz_id: UUID, count: int = 1) -> None:
+        updated_rows = QuizStats.objects.filter(quiz_id=quiz_id).update(
+            invitations_sent=F("invitations_sent") + count,
+            updated_at=Now(),
+        )
+        if updated_rows == 0:
+            self.rebuild(quiz_id)
+
+    def record_invitation_accepted(self, quiz_id: UUID) -> None:
+        updated_rows = QuizStats.objects.filter(quiz_id=quiz_id).update(
+            invitations_accepted=F("invitations_accepted") + 1,
+            participations_started=F("participations_started") + 1,
+            updated_at=Now(),
+        )
+        if updated_rows == 0:
+            self.rebuild(quiz_id)
+
+    def record_participation_completed(self, quiz_id: UUID, participant_id: UUID, score: int) -> None:
+        updated_rows = QuizStats.objects.filter(quiz_id=quiz_id).update(
+            participations_completed=F("participations_completed") + 1,
+            total_score=F("total_score") + score,
+            max_score=Greatest(Coalesce("max_score", Value(score)), Value(score)),
+            min_score=Least(Coalesce("min_score", Value(score)), Value(score)),
+            top_scorer_id=Case(
+                When(Q(max_score__isnull=True) | Q(max_score__lt=score), then=Value(participant_id)),
+                default=F("top_scorer_id"),
+                output_field=UUIDField(),
+            ),
+            updated_at=Now(),
+        )
+        if updated_rows == 0:
+            self.rebuild(quiz_id)
+
+    def rebuild(self, quiz_id: UUID) -> None:
+        invitation_stats = Invitation.objects.filter(quiz_id=quiz_id).aggregate(
+            invitations_sent=Count("id"),
+            invitations_accepted=Count("id", filter=Q(accepted_at__isnull=False)),
+        )
+        participations = Participation.objects.filter(quiz_id=quiz_id)
+        participation_stats = participations.aggregate(
+            participations_started=Count("id"),
+            participations_completed=Count("id", filter=self.__SCORED_PARTICIPATION),
+            total_score=Coalesce(Sum("score", filter=self.__SCORED_PARTICIPATION), 0),
+            max_score=Max("score", filter=self.__SCORED_PARTICIPATION),
+            min_score=Min("score", filter=self.__SCORED_PARTICIPATION),
+        )
+        top_scorer_id = (
+            participations.filter(self.__SCORED_PARTICIPATION)
+            .order_by("-score", "completed_at")
+            .values_list("participant_id", flat=True)
+            .first()
+        )
+
+        QuizStats.objects.update_or_create(
+            quiz_id=quiz_id,
+            defaults={**invitation_stats, **participation_stats, "top_scorer_id": top_scorer_id},
+        )
@@ -1,51 +1,88 @@
 import smtplib
 import socket
 from logging import getLogger
+from uuid import UUID
 
 from django.conf import settings
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
+from django.core.mail import EmailMultiAlternatives, get_connection, send_mail
 
 from quiz.domain.invitation.email_service import EmailService
 from quiz.domain.invitation.invitation import Invitation
 from quiz.infrastructure.email_delivery_exception import EmailDeliveryException
+from quiz.infrastructure.invitation_email_renderer import InvitationEmailRenderer, RenderedInvitationEmail
 
 
 class DjangoEmailService(EmailService):
-    def __init__(self):
+    __DELIVERY_ERRORS = (
+        smtplib.SMTPException,
+        socket.error,
+        socket.timeout,
+        ConnectionError,
+        OSError,
+    )
+
+    def __init__(self, renderer: InvitationEmailRenderer | None = None):
+        self.__renderer = renderer or InvitationEmailRenderer()
         self.__logger = getLogger(__name__)
 
     def send_invitation_email(self, invitation: Invitation, invitation_acceptance_link: str) -> None:
         self.__logger.info(f"Sending email to {invitation.invited.email}")
 
-        context = {
-            "participant_name": invitation.invited.first_name or invitation.invited.username,
-            "quiz_title": invitation.quiz.title,
-            "quiz_description": invitation.quiz.description,
-            "inviter_name": invitation.inviter.first_name or invitation.inviter.username,
-            "invitation_acceptance_link": invitation_acceptance_link,
-        }
-
-        html_message = render_to_string("invitation_email.html", context)
-        plain_message = render_to_string("invitation_email.txt", context)
+        email = self.__renderer.render(invitation, invitation_acceptance_link)
 
         try:
             send_mail(
-                subject=f"You're invited to take the quiz: {invitation.quiz.title}",
-                message=plain_message,
+                subject=email.subject,
+                message=email.plain_message,
                 from_email=settings.DEFAULT_FROM_EMAIL,
                 recipient_list=[invitation.invited.email],
-                html_message=html_message,
+                html_message=email.html_message,
                 fail_silently=False,
             )
-        except (
-            smtplib.SMTPException,
-            socket.error,
-            socket.timeout,
-            ConnectionError,
-            OSError,
-        ) as e:
+        except self.__DELIVERY_ERRORS as e:
             self.__logger.error(f"Failed to send email to {invitation.invited.email}: {e}")
             raise EmailDeliveryException(e) from e
 
         self.__logger.info(f"Email sent successfully to {invitation.invited.email}")
+
+    def send_invitation_emails(
+        self, invitations: list[Invitation], invitation_acceptance_links: dict[UUID, str]
+    ) -> list[Invitation]:
+        self.__logger.info(f"Sending {len(invitations)} invitation emails over a single connection")
+
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except self.__DELIVERY_ERRORS as e:
+            self.__logger.error(f"Failed to open email connection: {e}")
+            raise EmailDeliveryException(e) from e
+
+        failed_invitations = []
+        try:
+            for invitation, email in self.__renderer.render_batch(invitations, invitation_acceptance_links):
+                message = self.__build_message(invitation, email, connection)
+                try:
+                    connection.send_messages([message])
+                except self.__DELIVERY_ERRORS as e:
+                    self.__logger.error(f"Failed to send email to {invitation.invited.email}: {e}")
+                    failed_invitations.append(invitation)
+        finally:
+            connection.close()
+
+        self.__logger.info(f"Sent {len(invitations) - len(failed_invitations)} of {len(invitations)} invitation emails")
+
+        return failed_invitations
+
+    def __build_message(
+        self, invitation: Invitation, email: RenderedInvitationEmail, connection
+    ) -> EmailMultiAlternatives:
+        message = EmailMultiAlternatives(
+            subject=email.subject,
+            body=email.plain_message,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[invitation.invited.email],
+            connection=connection,
+        )
+        message.attach_alternative(email.html_message, "text/html")
+
+        return message
@@ -0,0 +1,26 @@
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import BaseCache, cache
+
+from quiz.domain.quiz.quiz_access_cache import QuizAccessCache
+
+
+class DjangoQuizAccessCache(QuizAccessCache):
+    __KEY_PREFIX = "quiz_access"
+
+    def __init__(self, backend: BaseCache | None = None, timeout: int | None = None) -> None:
+        self.__backend = backend or cache
+        self.__timeout = timeout if timeout is not None else settings.QUIZ_ACCESS_CACHE_TIMEOUT
+
+    def is_granted(self, quiz_id: UUID, user_id: UUID) -> bool:
+        return self.__backend.get(self.__build_key(quiz_id, user_id), False)
+
+    def grant(self, quiz_id: UUID, user_id: UUID) -> None:
+        self.__backend.set(self.__build_key(quiz_id, user_id), True, timeout=self.__timeout)
+
+    def revoke(self, quiz_id: UUID, user_id: UUID) -> None:
+        self.__backend.delete(self.__build_key(quiz_id, user_id))
+
+    def __build_key(self, quiz_id: UUID, user_id: UUID) -> str:
+        return f"{self.__KEY_PREFIX}:{quiz_id}:{user_id}"
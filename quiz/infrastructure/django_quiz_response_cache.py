@@ -0,0 +1,42 @@
+from django.conf import settings
+from django.core.cache import BaseCache, cache
+
+from quiz.application.get_quiz_query.encoded_quiz_response import EncodedQuizResponse
+from quiz.domain.quiz.quiz_response_cache import QuizResponseCache
+from quiz.domain.quiz.quiz_response_cache_stats import QuizResponseCacheStats
+from quiz.domain.quiz.quiz_version import QuizVersion
+
+
+class DjangoQuizResponseCache(QuizResponseCache):
+    __KEY_PREFIX = "quiz_response"
+    __HITS_KEY = f"{__KEY_PREFIX}:hits"
+    __MISSES_KEY = f"{__KEY_PREFIX}:misses"
+    __ENTRY_KEY_PREFIX = f"{__KEY_PREFIX}:encoded"
+
+    def __init__(self, backend: BaseCache | None = None, timeout: int | None = None) -> None:
+        self.__backend = backend or cache
+        self.__timeout = timeout if timeout is not None else settings.QUIZ_RESPONSE_CACHE_TIMEOUT
+
+    def get(self, quiz_version: QuizVersion) -> EncodedQuizResponse | None:
+        response = self.__backend.get(self.__build_key(quiz_version))
+        self.__increment(self.__HITS_KEY if response is not None else self.__MISSES_KEY)
+        return response
+
+    def set(self, quiz_version: QuizVersion, response: EncodedQuizResponse) -> None:
+        self.__backend.set(self.__build_key(quiz_version), response, timeout=self.__timeout)
+
+    def get_stats(self) -> QuizResponseCacheStats:
+        counters = self.__backend.get_many([self.__HITS_KEY, self.__MISSES_KEY])
+        return QuizResponseCacheStats(
+            hits=counters.get(self.__HITS_KEY, 0),
+            misses=counters.get(self.__MISSES_KEY, 0),
+        )
+
+    def __build_key(self, quiz_version: QuizVersion) -> str:
+        return f"{self.__ENTRY_KEY_PREFIX}:{quiz_version.quiz_id}:{quiz_version.updated_at.timestamp()}"
+
+    def __increment(self, counter_key: str) -> None:
+        try:
+            self.__backend.incr(counter_key)
+        except ValueError:
+            self.__backend.add(counter_key, 1, timeout=None)
@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import BaseCache, cache
+
+from quiz.domain.participation.quiz_score_distribution import QuizScoreDistribution
+from quiz.domain.participation.quiz_score_distribution_cache import QuizScoreDistributionCache
+from quiz.domain.quiz.quiz import Quiz
+
+
+class DjangoQuizScoreDistributionCache(QuizScoreDistributionCache):
+    __KEY_PREFIX = "quiz_score_distribution"
+
+    def __init__(self, backend: BaseCache | None = None, timeout: int | None = None) -> None:
+        self.__backend = backend or cache
+        self.__timeout = timeout if timeout is not None else settings.QUIZ_SCORE_DISTRIBUTION_CACHE_TIMEOUT
+
+    def get(self, quiz: Quiz, scores_version: datetime) -> QuizScoreDistribution | None:
+        return self.__backend.get(self.__build_key(quiz, scores_version))
+
+    def set(self, quiz: Quiz, scores_version: datetime, distribution: QuizScoreDistribution) -> None:
+        self.__backend.set(self.__build_key(quiz, scores_version), distribution, timeout=self.__timeout)
+
+    def __build_key(self, quiz: Quiz, scores_version: datetime) -> str:
+        return f"{self.__KEY_PREFIX}:{quiz.id}:{quiz.updated_at.timestamp()}:{scores_version.timestamp()}"
@@ -0,0 +1,42 @@
+from logging import getLogger
+
+from django.conf import settings
+from django.db import transaction
+
+from quiz.domain.invitation.invitation_email_outbox_entry import InvitationEmailOutboxEntry
+from quiz.domain.invitation.invitation_sender import InvitationSender
+from quiz.infrastructure.celery_invitacion_sender import CeleryInvitationSender
+
+
+class InvitationEmailOutboxRelay:
+    def __init__(self, invitation_sender: InvitationSender | None = None, batch_size: int | None = None) -> None:
+        self.__invitation_sender = invitation_sender or CeleryInvitationSender()
+        self.__batch_size = batch_size or settings.INVITATION_EMAIL_OUTBOX_BATCH_SIZE
+        self.__logger = getLogger(__name__)
+
+    def relay(self) -> int:
+        with transaction.atomic():
+            entries = list(
+                InvitationEmailOutboxEntry.objects.select_for_update(skip_locked=True)
+                .order_by("id")
+                .values_list("id", "invitation_id", "invitation_acceptance_link")[: self.__batch_size]
+            )
+            if not entries:
+                return 0
+
+            self.__invitation_sender.send_invitation_emails(
+                {invitation_id: invitation_acceptance_link for _, invitation_id, invitation_acceptance_link in entries}
+            )
+            InvitationEmailOutboxEntry.objects.filter(id__in=[entry_id for entry_id, _, _ in entries]).delete()
+
+        self.__logger.info(f"Relayed {len(entries)} invitation emails from the outbox")
+
+        return len(entries)
+
+    def relay_all(self) -> int:
+        relayed = 0
+        while True:
+            relayed_batch = self.relay()
+            relayed += relayed_batch
+            if relayed_batch < self.__batch_size:
+                return relayed
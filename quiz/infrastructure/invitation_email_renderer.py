@@ -0,0 +1,73 @@
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from functools import cache
+from uuid import UUID
+
+from django.template import Context, Template
+from django.template.loader import get_template
+
+from quiz.domain.invitation.invitation import Invitation
+
+HTML_TEMPLATE_NAME = "invitation_email.html"
+TEXT_TEMPLATE_NAME = "invitation_email.txt"
+
+
+@dataclass(frozen=True)
+class RenderedInvitationEmail:
+    subject: str
+    plain_message: str
+    html_message: str
+
+
+@cache
+def load_invitation_email_templates() -> tuple[Template, Template]:
+    return get_template(HTML_TEMPLATE_NAME).template, get_template(TEXT_TEMPLATE_NAME).template
+
+
+class InvitationEmailRenderer:
+    """Renders invitation emails from templates loaded once per process.
+
+    Within a batch one template context is built per quiz and inviter; only the participant name and acceptance
+    link are pushed onto it for each email.
+    """
+
+    def render(self, invitation: Invitation, invitation_acceptance_link: str) -> RenderedInvitationEmail:
+        return self.__render(invitation, invitation_acceptance_link, self.__build_quiz_context(invitation))
+
+    def render_batch(
+        self, invitations: Iterable[Invitation], invitation_acceptance_links: dict[UUID, str]
+    ) -> Iterator[tuple[Invitation, RenderedInvitationEmail]]:
+        quiz_contexts = {}
+        for invitation in invitations:
+            quiz_context_key = (invitation.quiz_id, invitation.inviter_id)
+            if quiz_context_key not in quiz_contexts:
+                quiz_contexts[quiz_context_key] = self.__build_quiz_context(invitation)
+
+            yield invitation, self.__render(
+                invitation, invitation_acceptance_links[invitation.id], quiz_contexts[quiz_context_key]
+            )
+
+    def __render(
+        self, invitation: Invitation, invitation_acceptance_link: str, quiz_context: Context
+    ) -> RenderedInvitationEmail:
+        html_template, text_template = load_invitation_email_templates()
+        with quiz_context.push(
+            participant_name=invitation.invited.first_name or invitation.invited.username,
+            invitation_acceptance_link=invitation_acceptance_link,
+        ):
+            return RenderedInvitationEmail(
+                subject=f"You're invited to take the quiz: {quiz_context['quiz_title']}",
+                plain_message=text_template.render(quiz_context),
+                html_message=html_template.render(quiz_context),
+            )
+
+    def __build_quiz_context(self, invitation: Invitation) -> Context:
+        html_template, _ = load_invitation_email_templates()
+        return Context(
+            {
+                "quiz_title": invitation.quiz.title,
+                "quiz_description": invitation.quiz.description,
+                "inviter_name": invitation.inviter.first_name or invitation.inviter.username,
+            },
+            autoescape=html_template.engine.autoescape,
+        )
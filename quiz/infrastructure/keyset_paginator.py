@@ -0,0 +1,39 @@
+from operator import attrgetter
+from typing import Any
+
+from django.db.models import Model, Q, QuerySet
+
+from quiz.domain.pagination.page import Page
+from quiz.domain.pagination.page_cursor import PageCursor
+
+
+class KeysetPaginator:
+    def __init__(self, created_at_field: str = "created_at", id_field: str = "id") -> None:
+        self.__created_at_field = created_at_field
+        self.__id_field = id_field
+
+    def paginate(self, queryset: QuerySet, limit: int, cursor: PageCursor | None = None) -> Page[Model]:
+        if cursor is not None:
+            queryset = queryset.filter(self.__rows_after(cursor))
+
+        rows = list(queryset.order_by(f"-{self.__created_at_field}", f"-{self.__id_field}")[: limit + 1])
+        if len(rows) <= limit:
+            return Page(items=rows)
+
+        items = rows[:limit]
+        return Page(items=items, next_cursor=self.__cursor_for(items[-1]))
+
+    def __rows_after(self, cursor: PageCursor) -> Q:
+        return Q(**{f"{self.__created_at_field}__lt": cursor.created_at}) | Q(
+            **{self.__created_at_field: cursor.created_at, f"{self.__id_field}__lt": cursor.id}
+        )
+
+    def __cursor_for(self, row: Model) -> PageCursor:
+        return PageCursor(
+            created_at=self.__get_field_value(row, self.__created_at_field),
+            id=self.__get_field_value(row, self.__id_field),
+        )
+
+    @staticmethod
+    def __get_field_value(row: Model, field: str) -> Any:
+        return attrgetter(field.replace("__", "."))(row)
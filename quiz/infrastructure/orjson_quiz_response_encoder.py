@@ -0,0 +1,11 @@
+from quiz.application.get_quiz_query.get_quiz_query_response import GetQuizQueryResponse
+from quiz.domain.quiz.quiz_response_encoder import QuizResponseEncoder
+from quiz.infrastructure.orjson_renderer import ORJSONRenderer
+
+
+class ORJSONQuizResponseEncoder(QuizResponseEncoder):
+    def __init__(self, renderer: ORJSONRenderer | None = None) -> None:
+        self.__renderer = renderer or ORJSONRenderer()
+
+    def encode(self, response: GetQuizQueryResponse) -> bytes:
+        return self.__renderer.render(response.as_dict())
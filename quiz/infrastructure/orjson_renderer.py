@@ -0,0 +1,23 @@
+from typing import Any
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSONRenderer that serializes with orjson.
+
+    UUIDs, datetimes and dataclasses are encoded natively; anything else orjson does not know about (Decimal,
+    lazy translations, querysets...) is delegated to DRF's encoder so the output matches JSONRenderer. Unlike
+    JSONRenderer, U+2028/U+2029 are left unescaped: they are valid JSON and the API is not served as JSONP.
+    """
+
+    def render(self, data: Any, accepted_media_type: str | None = None, renderer_context: dict | None = None) -> bytes:
+        if data is None:
+            return b""
+
+        options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=self.encoder_class().default, option=options)
@@ -0,0 +1,21 @@
+from uuid import UUID
+
+from quiz.domain.invitation.invitation_email_outbox_entry import InvitationEmailOutboxEntry
+from quiz.domain.invitation.invitation_sender import InvitationSender
+
+
+class OutboxInvitationSender(InvitationSender):
+    def send_invitation_email(self, invitation_id: UUID, invitation_acceptance_link: str) -> None:
+        InvitationEmailOutboxEntry.objects.create(
+            invitation_id=invitation_id, invitation_acceptance_link=invitation_acceptance_link
+        )
+
+    def send_invitation_emails(self, invitation_acceptance_links: dict[UUID, str]) -> None:
+        InvitationEmailOutboxEntry.objects.bulk_create(
+            [
+                InvitationEmailOutboxEntry(
+                    invitation_id=invitation_id, invitation_acceptance_link=invitation_acceptance_link
+                )
+                for invitation_id, invitation_acceptance_link in invitation_acceptance_links.items()
+            ]
+        )
@@ -0,0 +1,19 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from quiz.domain.invitation.invitation import Invitation
+from quiz.domain.participation.participation import Participation
+from quiz.infrastructure.django_quiz_access_cache import DjangoQuizAccessCache
+
+
+@receiver(post_delete, sender=Invitation)
+def revoke_quiz_access_on_invitation_delete(sender, instance: Invitation, **kwargs) -> None:
+    transaction.on_commit(partial(DjangoQuizAccessCache().revoke, instance.quiz_id, instance.invited_id))
+
+
+@receiver(post_delete, sender=Participation)
+def revoke_quiz_access_on_participation_delete(sender, instance: Participation, **kwargs) -> None:
+    transaction.on_commit(partial(DjangoQuizAccessCache().revoke, instance.quiz_id, instance.participant_id))
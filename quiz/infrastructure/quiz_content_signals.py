@@ -0,0 +1,35 @@
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from quiz.domain.quiz.answer import Answer
+from quiz.domain.quiz.question import Question
+from quiz.domain.quiz.quiz import Quiz
+
+
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+def touch_quiz_on_question_change(sender, instance: Question, **kwargs) -> None:
+    Quiz.objects.filter(id=instance.quiz_id).update(
+        updated_at=timezone.now(),
+        total_questions=_aggregate_quiz_questions(Count("id")),
+        total_possible_points=_aggregate_quiz_questions(Sum("points")),
+    )
+
+
+@receiver(post_save, sender=Answer)
+@receiver(post_delete, sender=Answer)
+def touch_quiz_on_answer_change(sender, instance: Answer, **kwargs) -> None:
+    Quiz.objects.filter(questions__id=instance.question_id).update(updated_at=timezone.now())
+
+
+def _aggregate_quiz_questions(aggregate) -> Coalesce:
+    return Coalesce(
+        Subquery(
+            Question.objects.filter(quiz_id=OuterRef("id")).values("quiz_id").annotate(total=aggregate).values("total"),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
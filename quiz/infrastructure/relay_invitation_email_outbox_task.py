@@ -0,0 +1,14 @@
+from logging import getLogger
+
+from celery import shared_task
+
+from quiz.infrastructure.invitation_email_outbox_relay import InvitationEmailOutboxRelay
+
+logger = getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def relay_invitation_email_outbox_task() -> None:
+    relayed = InvitationEmailOutboxRelay().relay_all()
+    if relayed:
+        logger.info(f"Invitation email outbox drained: {relayed} emails handed to the workers")
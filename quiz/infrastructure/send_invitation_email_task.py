@@ -7,6 +7,10 @@ from quiz.application.send_invitation_email.send_invitation_email_command import
 from quiz.application.send_invitation_email.send_invitation_email_command_handler_factory import (
     SendInvitationEmailCommandHandlerFactory,
 )
+from quiz.application.send_invitation_emails.send_invitation_emails_command import SendInvitationEmailsCommand
+from quiz.application.send_invitation_emails.send_invitation_emails_command_handler_factory import (
+    SendInvitationEmailsCommandHandlerFactory,
+)
 from quiz.infrastructure.django_email_service import EmailDeliveryException
 
 logger = getLogger(__name__)
@@ -22,3 +26,24 @@ def send_invitation_email_task(invitation_id: str, invitation_acceptance_link: s
     command_handler.handle(command)
 
     logger.info(f"Invitation email task completed for invitation {invitation_id}")
+
+
+@shared_task(autoretry_for=(EmailDeliveryException,), retry_kwargs={"countdown": 60, "max_retries": 3})
+def send_invitation_emails_task(invitations: list[dict]) -> None:
+    logger.info(f"Invitation emails batch task initiated for {len(invitations)} invitations")
+    invitation_acceptance_links = {
+        UUID(invitation["invitation_id"]): invitation["invitation_acceptance_link"] for invitation in invitations
+    }
+    command_handler = SendInvitationEmailsCommandHandlerFactory.create()
+    response = command_handler.handle(SendInvitationEmailsCommand(invitation_acceptance_links))
+
+    for invitation_id in response.failed_invitation_ids:
+        send_invitation_email_task.delay(
+            invitation_id=str(invitation_id),
+            invitation_acceptance_link=invitation_acceptance_links[invitation_id],
+        )
+
+    logger.info(
+        f"Invitation emails batch task completed: {response.sent_count} sent, "
+        f"{len(response.failed_invitation_ids)} queued for individual retry"
+    )
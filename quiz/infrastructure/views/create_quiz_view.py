@@ -17,11 +17,13 @@ from quiz.domain.quiz.invalid_number_of_answers_exception import InvalidNumberOf
 from quiz.domain.quiz.invalid_number_of_correct_answers_exception import InvalidNumberOfCorrectAnswersException
 from quiz.domain.quiz.question_already_exists_exception import QuestionAlreadyExistsException
 from quiz.domain.quiz.quiz_already_exists_exception import QuizAlreadyExistsException
+from quiz.infrastructure.orjson_parser import ORJSONParser
 from quiz.infrastructure.views.create_quiz_view_schema import create_quiz_view_schema
 
 
 class CreateQuizView(APIView):
     permission_classes = (IsAuthenticated,)
+    parser_classes = (ORJSONParser,)
 
     def __init__(
         self,
@@ -2,18 +2,22 @@ from logging import getLogger, Logger
 from typing import Optional
 from uuid import UUID
 
+from django.http import QueryDict
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework.status import HTTP_500_INTERNAL_SERVER_ERROR
+from rest_framework.status import HTTP_400_BAD_REQUEST, HTTP_500_INTERNAL_SERVER_ERROR
 from rest_framework.views import APIView
+from voluptuous import MultipleInvalid, Schema
 
 from quiz.application.get_creator_quizzes.get_creator_quizzes_query import GetCreatorQuizzesQuery
 from quiz.application.get_creator_quizzes.get_creator_quizzes_query_handler import GetCreatorQuizzesQueryHandler
 from quiz.application.get_creator_quizzes.get_creator_quizzes_query_handler_factory import (
     GetCreatorQuizzesQueryHandlerFactory,
 )
+from quiz.domain.pagination.invalid_page_cursor_exception import InvalidPageCursorException
+from quiz.infrastructure.views.page_query_params_schema import page_query_params_schema
 
 
 class GetCreatorQuizzesView(APIView):
@@ -22,25 +26,46 @@ class GetCreatorQuizzesView(APIView):
     def __init__(
         self,
         query_handler: Optional[GetCreatorQuizzesQueryHandler] = None,
+        schema: Optional[Schema] = None,
         logger: Optional[Logger] = None,
         *args,
         **kwargs,
     ) -> None:
         super().__init__(*args, **kwargs)
         self.__query_handler = query_handler or GetCreatorQuizzesQueryHandlerFactory.create()
+        self.__schema = schema or page_query_params_schema
         self.__logger = logger or getLogger(__name__)
 
     def get(self, request: Request, creator_id: UUID) -> Response:
+        try:
+            validated_query_params = self.__get_validated_query_params(request.query_params)
+        except MultipleInvalid as error:
+            return Response(
+                {"message": f"The query parameters are invalid: {error}"},
+                status=HTTP_400_BAD_REQUEST,
+            )
+
         try:
             query = GetCreatorQuizzesQuery(
                 creator_id=str(creator_id),
+                limit=validated_query_params["limit"],
+                cursor=validated_query_params["cursor"],
             )
             get_creator_quizzes_response = self.__query_handler.handle(query)
 
             return Response(get_creator_quizzes_response.as_dict(), status=status.HTTP_200_OK)
 
+        except InvalidPageCursorException as error:
+            return Response(
+                {"message": f"{error}"},
+                status=HTTP_400_BAD_REQUEST,
+            )
+
         except Exception as error:
             self.__logger.exception(f"Error getting user's quizzes: '{error}'")
             return Response(
                 {"message": "Internal server error when getting user's quizzes"}, status=HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+    def __get_validated_query_params(self, query_params: QueryDict) -> dict:
+        return self.__schema(query_params.dict())
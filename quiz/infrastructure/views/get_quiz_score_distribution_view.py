@@ -0,0 +1,62 @@
+from logging import getLogger, Logger
+from typing import Optional
+from uuid import UUID
+
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.status import HTTP_500_INTERNAL_SERVER_ERROR, HTTP_404_NOT_FOUND, HTTP_403_FORBIDDEN
+from rest_framework.views import APIView
+
+from quiz.application.get_quiz_score_distribution.get_quiz_score_distribution_query import GetQuizScoreDistributionQuery
+from quiz.application.get_quiz_score_distribution.get_quiz_score_distribution_query_handler import (
+    GetQuizScoreDistributionQueryHandler,
+)
+from quiz.application.get_quiz_score_distribution.get_quiz_score_distribution_query_handler_factory import (
+    GetQuizScoreDistributionQueryHandlerFactory,
+)
+from quiz.domain.quiz.quiz_not_found_exception import QuizNotFoundException
+from quiz.domain.quiz.unauthorized_quiz_access_exception import UnauthorizedQuizAccessException
+
+
+class GetQuizScoreDistributionView(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    def __init__(
+        self,
+        query_handler: Optional[GetQuizScoreDistributionQueryHandler] = None,
+        logger: Optional[Logger] = None,
+        *args,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.__query_handler = query_handler or GetQuizScoreDistributionQueryHandlerFactory.create()
+        self.__logger = logger or getLogger(__name__)
+
+    def get(self, request: Request, quiz_id: UUID) -> Response:
+        try:
+            query = GetQuizScoreDistributionQuery(
+                quiz_id=str(quiz_id),
+                requester_id=str(request.user.id),
+            )
+            get_quiz_score_distribution_response = self.__query_handler.handle(query)
+
+            return Response(get_quiz_score_distribution_response.as_dict(), status=status.HTTP_200_OK)
+
+        except QuizNotFoundException as error:
+            return Response(
+                {"message": f"{error}"},
+                status=HTTP_404_NOT_FOUND,
+            )
+        except UnauthorizedQuizAccessException as error:
+            return Response(
+                {"message": f"{error}"},
+                status=HTTP_403_FORBIDDEN,
+            )
+        except Exception as error:
+            self.__logger.exception(f"Error getting quiz score distribution: '{error}'")
+            return Response(
+                {"message": "Internal server error when getting quiz score distribution"},
+                status=HTTP_500_INTERNAL_SERVER_ERROR,
+            )
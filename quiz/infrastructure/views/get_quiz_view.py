@@ -3,6 +3,8 @@ from logging import Logger
 from typing import Optional
 from uuid import UUID
 
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
@@ -17,6 +19,8 @@ from quiz.domain.quiz.unauthorized_quiz_access_exception import UnauthorizedQuiz
 
 class GetQuizView(APIView):
     permission_classes = (IsAuthenticated,)
+    # The quiz body is shared by every participant, but access is checked per user on each request
+    __CACHE_CONTROL = "private, no-cache"
 
     def __init__(
         self, query_handler: Optional[GetQuizQueryHandler] = None, logger: Optional[Logger] = None, *args, **kwargs
@@ -25,17 +29,27 @@ class GetQuizView(APIView):
         self.__query_handler = query_handler or GetQuizQueryHandlerFactory.create()
         self.__logger = logger or logging.getLogger(__name__)
 
-    def get(self, request: Request, quiz_id: UUID) -> Response:
+    def get(self, request: Request, quiz_id: UUID) -> HttpResponse | Response:
         try:
             query = GetQuizQuery(
                 participant_id=request.user.id,
                 quiz_id=quiz_id,
+                known_etags=self.__parse_if_none_match(request),
             )
             response = self.__query_handler.handle(query)
 
-            return Response(response.as_dict(), status=status.HTTP_200_OK)
+            headers = {"ETag": response.etag, "Cache-Control": self.__CACHE_CONTROL}
+            if response.is_not_modified:
+                return HttpResponseNotModified(headers=headers)
+
+            return HttpResponse(response.body, content_type="application/json", headers=headers)
         except UnauthorizedQuizAccessException as exc:
             return Response({"error": str(exc)}, status=status.HTTP_403_FORBIDDEN)
         except Exception as error:
             self.__logger.exception(f"Error getting user's quiz: '{error}'")
             return Response({"error": "An unexpected error occurred"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    @staticmethod
+    def __parse_if_none_match(request: Request) -> tuple[str, ...]:
+        # If-None-Match uses weak comparison, so W/"x" matches the strong ETag "x"
+        return tuple(etag.removeprefix("W/") for etag in parse_etags(request.headers.get("If-None-Match", "")))
@@ -1,16 +1,20 @@
 from logging import getLogger, Logger
 from typing import Optional
 
+from django.http import QueryDict
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework.status import HTTP_500_INTERNAL_SERVER_ERROR
+from rest_framework.status import HTTP_400_BAD_REQUEST, HTTP_500_INTERNAL_SERVER_ERROR
 from rest_framework.views import APIView
+from voluptuous import MultipleInvalid, Schema
 
 from quiz.application.get_user_quizzes.get_user_quizzes_query import GetUserQuizzesQuery
 from quiz.application.get_user_quizzes.get_user_quizzes_query_handler import GetUserQuizzesQueryHandler
 from quiz.application.get_user_quizzes.get_user_quizzes_query_handler_factory import GetUserQuizzesQueryHandlerFactory
+from quiz.domain.pagination.invalid_page_cursor_exception import InvalidPageCursorException
+from quiz.infrastructure.views.page_query_params_schema import page_query_params_schema
 from user.domain.user_not_found_exception import UserNotFoundException
 
 
@@ -20,23 +24,41 @@ class GetUserQuizzesView(APIView):
     def __init__(
         self,
         query_handler: Optional[GetUserQuizzesQueryHandler] = None,
+        schema: Optional[Schema] = None,
         logger: Optional[Logger] = None,
         *args,
         **kwargs,
     ) -> None:
         super().__init__(*args, **kwargs)
         self.__query_handler = query_handler or GetUserQuizzesQueryHandlerFactory.create()
+        self.__schema = schema or page_query_params_schema
         self.__logger = logger or getLogger(__name__)
 
     def get(self, request: Request) -> Response:
+        try:
+            validated_query_params = self.__get_validated_query_params(request.query_params)
+        except MultipleInvalid as error:
+            return Response(
+                {"message": f"The query parameters are invalid: {error}"},
+                status=HTTP_400_BAD_REQUEST,
+            )
+
         try:
             query = GetUserQuizzesQuery(
                 requester_id=request.user.id,
+                limit=validated_query_params["limit"],
+                cursor=validated_query_params["cursor"],
             )
             get_user_quizzes_response = self.__query_handler.handle(query)
 
             return Response(get_user_quizzes_response.as_dict(), status=status.HTTP_200_OK)
 
+        except InvalidPageCursorException as error:
+            return Response(
+                {"message": f"{error}"},
+                status=HTTP_400_BAD_REQUEST,
+            )
+
         except UserNotFoundException as error:
             self.__logger.warning(f"User not found when getting user's quizzes: '{error}'")
             return Response(
@@ -50,3 +72,6 @@ class GetUserQuizzesView(APIView):
                 {"message": "Internal server error when getting user's quizzes"},
                 status=HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+    def __get_validated_query_params(self, query_params: QueryDict) -> dict:
+        return self.__schema(query_params.dict())
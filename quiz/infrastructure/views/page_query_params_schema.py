@@ -0,0 +1,11 @@
+from voluptuous import REMOVE_EXTRA, All, Any, Coerce, Length, Optional, Range, Schema
+
+from quiz.domain.pagination.page import Page
+
+page_query_params_schema = Schema(
+    {
+        Optional("limit", default=Page.DEFAULT_SIZE): All(Coerce(int), Range(min=1, max=Page.MAX_SIZE)),
+        Optional("cursor", default=None): Any(None, All(str, Length(min=1))),
+    },
+    extra=REMOVE_EXTRA,
+)
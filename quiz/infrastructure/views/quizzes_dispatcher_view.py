@@ -5,12 +5,15 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from quiz.infrastructure.orjson_parser import ORJSONParser
+
 from .create_quiz_view import CreateQuizView
 from .get_user_quizzes_view import GetUserQuizzesView
 
 
 class QuizzesDispatcherView(APIView):
     permission_classes = (IsAuthenticated,)
+    parser_classes = (ORJSONParser,)
 
     def __init__(
         self, get_view: Optional[GetUserQuizzesView] = None, post_view: Optional[CreateQuizView] = None, *args, **kwargs
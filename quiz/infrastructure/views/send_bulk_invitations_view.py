@@ -0,0 +1,84 @@
+from logging import getLogger, Logger
+from typing import Optional
+
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.status import (
+    HTTP_500_INTERNAL_SERVER_ERROR,
+    HTTP_400_BAD_REQUEST,
+    HTTP_200_OK,
+    HTTP_403_FORBIDDEN,
+)
+from rest_framework.views import APIView
+from voluptuous import MultipleInvalid, Schema
+
+from quiz.application.send_bulk_invitations.send_bulk_invitations_command import SendBulkInvitationsCommand
+from quiz.application.send_bulk_invitations.send_bulk_invitations_command_handler import (
+    SendBulkInvitationsCommandHandler,
+)
+from quiz.application.send_bulk_invitations.send_bulk_invitations_command_handler_factory import (
+    SendBulkInvitationsCommandHandlerFactory,
+)
+from quiz.domain.invitation.only_quiz_creator_can_send_invitation_exception import (
+    OnlyQuizCreatorCanSendInvitationException,
+)
+from quiz.domain.quiz.quiz_not_found_exception import QuizNotFoundException
+from quiz.infrastructure.views.send_bulk_invitations_view_schema import send_bulk_invitations_view_schema
+
+
+class SendBulkInvitationsView(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    def __init__(
+        self,
+        command_handler: Optional[SendBulkInvitationsCommandHandler] = None,
+        schema: Optional[Schema] = None,
+        logger: Optional[Logger] = None,
+        *args,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.__command_handler = command_handler or SendBulkInvitationsCommandHandlerFactory.create()
+        self.__schema = schema or send_bulk_invitations_view_schema
+        self.__logger = logger or getLogger(__name__)
+
+    def post(self, request: Request, quiz_id: str) -> Response:
+        try:
+            validated_body = self.__get_validated_request_body(request.data)
+        except MultipleInvalid as error:
+            return Response(
+                {"message": f"The request body is invalid: {error}"},
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            command = SendBulkInvitationsCommand(
+                quiz_id=quiz_id,
+                participant_emails=validated_body["participant_emails"],
+                inviter_id=str(request.user.id),
+                inviter_email=request.user.email,
+            )
+
+            send_bulk_invitations_response = self.__command_handler.handle(command)
+
+            return Response(send_bulk_invitations_response.as_dict(), status=HTTP_200_OK)
+
+        except QuizNotFoundException as error:
+            return Response(
+                {"message": f"{error}"},
+                status=HTTP_400_BAD_REQUEST,
+            )
+        except OnlyQuizCreatorCanSendInvitationException as error:
+            return Response(
+                {"message": f"{error}"},
+                status=HTTP_403_FORBIDDEN,
+            )
+        except Exception as error:
+            self.__logger.exception(f"Error sending bulk invitations: '{error}'")
+            return Response(
+                {"message": "Internal server error when sending invitations"}, status=HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    def __get_validated_request_body(self, request_body: dict) -> dict:
+        return self.__schema(request_body)
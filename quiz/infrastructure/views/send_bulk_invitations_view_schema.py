@@ -0,0 +1,14 @@
+from voluptuous import All, Length, Required, Schema
+
+from quiz.infrastructure.views.send_invitation_view_schema import validate_email
+
+MAX_BULK_INVITATIONS = 5000
+
+send_bulk_invitations_view_schema = Schema(
+    {
+        Required("participant_emails"): All(
+            [All(str, validate_email)],
+            Length(min=1, max=MAX_BULK_INVITATIONS),
+        ),
+    }
+)
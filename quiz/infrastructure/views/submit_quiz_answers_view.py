@@ -32,12 +32,14 @@ from quiz.domain.participation.quiz_already_completed_exception import QuizAlrea
 from quiz.domain.quiz.invalid_answer_for_question_exception import InvalidAnswerForQuestionException
 from quiz.domain.quiz.invalid_question_for_quiz_exception import InvalidQuestionForQuizException
 from quiz.domain.quiz.quiz_not_found_exception import QuizNotFoundException
+from quiz.infrastructure.orjson_parser import ORJSONParser
 from quiz.infrastructure.views.submit_quiz_answers_view_schema import submit_quiz_answers_view_schema
 from user.domain.user_not_found_exception import UserNotFoundException
 
 
 class SubmitQuizAnswersView(APIView):
     permission_classes = (IsAuthenticated,)
+    parser_classes = (ORJSONParser,)
 
     def __init__(
         self,
@@ -0,0 +1,89 @@
+from time import perf_counter
+
+from django.conf import settings
+
+from django.core.management.base import BaseCommand
+from django.template.loader import render_to_string
+
+from quiz.domain.invitation.invitation import Invitation
+from quiz.domain.quiz.quiz import Quiz
+from quiz.infrastructure.invitation_email_renderer import (
+    HTML_TEMPLATE_NAME,
+    TEXT_TEMPLATE_NAME,
+    InvitationEmailRenderer,
+)
+from user.domain.user import User
+
+
+class Command(BaseCommand):
+    help = "Compare invitation email renders per second of render_to_string against the precompiled renderer"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--emails", type=int, default=2000, help="Number of invitation emails to render.")
+        parser.add_argument("--quizzes", type=int, default=1, help="Number of distinct quizzes in the batch.")
+        parser.add_argument("--repeat", type=int, default=7, help="Timed runs per approach; the fastest one is kept.")
+
+    def handle(self, *args, **options) -> None:
+        invitations = self.__build_invitations(options["emails"], max(options["quizzes"], 1))
+        links = {invitation.id: f"https://quiz.app/accept/{invitation.id}" for invitation in invitations}
+
+        repeat = max(options["repeat"], 1)
+
+        before, after = self.__measure(
+            lambda: self.__render_with_render_to_string(invitations, links),
+            lambda: self.__render_with_renderer(invitations, links),
+            len(invitations),
+            repeat,
+        )
+
+        self.stdout.write(f"DEBUG={settings.DEBUG}, best of {repeat} runs over {len(invitations)} emails")
+        self.stdout.write(f"render_to_string:          {before:,.0f} renders/sec")
+        self.stdout.write(f"InvitationEmailRenderer:   {after:,.0f} renders/sec")
+        self.stdout.write(self.style.SUCCESS(f"Speedup: {after / before:.2f}x"))
+
+    def __measure(self, render_before, render_after, emails: int, repeat: int) -> tuple[float, float]:
+        # Runs alternate between both approaches so drift on a shared machine affects them equally
+        render_before()
+        render_after()
+        fastest_before = fastest_after = float("inf")
+        for _ in range(repeat):
+            fastest_before = min(fastest_before, self.__time(render_before))
+            fastest_after = min(fastest_after, self.__time(render_after))
+        return emails / fastest_before, emails / fastest_after
+
+    def __time(self, render) -> float:
+        started_at = perf_counter()
+        render()
+        return perf_counter() - started_at
+
+    def __render_with_render_to_string(self, invitations: list[Invitation], links: dict) -> None:
+        for invitation in invitations:
+            context = {
+                "participant_name": invitation.invited.first_name or invitation.invited.username,
+                "quiz_title": invitation.quiz.title,
+                "quiz_description": invitation.quiz.description,
+                "inviter_name": invitation.inviter.first_name or invitation.inviter.username,
+                "invitation_acceptance_link": links[invitation.id],
+            }
+            render_to_string(HTML_TEMPLATE_NAME, context)
+            render_to_string(TEXT_TEMPLATE_NAME, context)
+
+    def __render_with_renderer(self, invitations: list[Invitation], links: dict) -> None:
+        for _ in InvitationEmailRenderer().render_batch(invitations, links):
+            pass
+
+    def __build_invitations(self, emails: int, quizzes: int) -> list[Invitation]:
+        inviter = User(username="benchmark_creator", first_name="Benchmark", email="creator@benchmark.test")
+        quiz_list = [
+            Quiz(title=f"Benchmark quiz {i}", description="Rendering benchmark", creator=inviter)
+            for i in range(quizzes)
+        ]
+
+        return [
+            Invitation(
+                quiz=quiz_list[i % quizzes],
+                inviter=inviter,
+                invited=User(username=f"participant{i}", email=f"participant{i}@benchmark.test"),
+            )
+            for i in range(emails)
+        ]
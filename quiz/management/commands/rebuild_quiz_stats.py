@@ -0,0 +1,36 @@
+from uuid import UUID
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from quiz.domain.quiz.quiz import Quiz
+from quiz.domain.quiz.quiz_stats_repository import QuizStatsRepository
+from quiz.infrastructure.db_quiz_stats_repository import DbQuizStatsRepository
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-quiz stats counters from invitations and participations"
+
+    def __init__(self, *args, quiz_stats_repository: QuizStatsRepository | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__quiz_stats_repository = quiz_stats_repository or DbQuizStatsRepository()
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--quiz-id",
+            action="append",
+            type=UUID,
+            dest="quiz_ids",
+            help="Only rebuild the stats of this quiz. Can be repeated. Rebuilds every quiz when omitted.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        quiz_ids = options["quiz_ids"] or Quiz.objects.order_by("id").values_list("id", flat=True).iterator()
+
+        rebuilt = 0
+        for quiz_id in quiz_ids:
+            with transaction.atomic():
+                self.__quiz_stats_repository.rebuild(quiz_id)
+            rebuilt += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt stats for {rebuilt} quizzes"))
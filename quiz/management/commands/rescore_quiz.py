@@ -0,0 +1,47 @@
+from time import perf_counter
+from uuid import UUID
+
+from django.core.management.base import BaseCommand, CommandError
+
+from quiz.application.rescore_quiz.rescore_quiz_command import RescoreQuizCommand
+from quiz.application.rescore_quiz.rescore_quiz_command_handler import RescoreQuizCommandHandler
+from quiz.application.rescore_quiz.rescore_quiz_command_handler_factory import RescoreQuizCommandHandlerFactory
+from quiz.domain.quiz.quiz_not_found_exception import QuizNotFoundException
+
+
+class Command(BaseCommand):
+    help = "Recompute the score of every completed participation of a quiz from its current answer key"
+
+    def __init__(self, *args, command_handler: RescoreQuizCommandHandler | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__command_handler = command_handler
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--quiz-id",
+            action="append",
+            type=UUID,
+            dest="quiz_ids",
+            required=True,
+            help="Quiz to rescore. Can be repeated.",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="Number of participations written per UPDATE statement."
+        )
+
+    def handle(self, *args, **options) -> None:
+        command_handler = self.__command_handler or RescoreQuizCommandHandlerFactory.create()
+
+        for quiz_id in options["quiz_ids"]:
+            started_at = perf_counter()
+            try:
+                response = command_handler.handle(RescoreQuizCommand(quiz_id=quiz_id, batch_size=options["batch_size"]))
+            except QuizNotFoundException as error:
+                raise CommandError(f"{error}") from error
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Rescored {response.rescored_participations} participations of quiz {quiz_id} "
+                    f"({response.changed_scores} scores changed) in {perf_counter() - started_at:.2f}s"
+                )
+            )
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.22 on 2026-10-17 06:34
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("quiz", "0002_initial"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="participation",
+            index=models.Index(
+                condition=models.Q(("completed_at__isnull", False), ("score__isnull", False)),
+                fields=["quiz", "-score"],
+                name="participation_quiz_scored_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="quiz",
+            index=models.Index(fields=["creator", "-created_at", "-id"], name="quiz_creator_created_at_idx"),
+        ),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 4.2.22 on 2026-10-17 06:36
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+import django.db.models.deletion
+
+BATCH_SIZE = 1000
+
+
+def backfill_quiz_stats(apps, schema_editor):
+    Quiz = apps.get_model("quiz", "Quiz")
+    Participation = apps.get_model("quiz", "Participation")
+    QuizStats = apps.get_model("quiz", "QuizStats")
+
+    scored = Q(participations__completed_at__isnull=False, participations__score__isnull=False)
+    top_scorer_id = (
+        Participation.objects.filter(quiz_id=OuterRef("id"), completed_at__isnull=False, score__isnull=False)
+        .order_by("-score", "completed_at")
+        .values("participant_id")[:1]
+    )
+    quizzes = Quiz.objects.values("id").annotate(
+        participations_started=Count("participations"),
+        participations_completed=Count("participations", filter=scored),
+        total_score=Coalesce(Sum("participations__score", filter=scored), 0),
+        max_score=Max("participations__score", filter=scored),
+        min_score=Min("participations__score", filter=scored),
+        top_scorer_id=Subquery(top_scorer_id),
+    )
+
+    batch = []
+    for quiz in quizzes.iterator(chunk_size=BATCH_SIZE):
+        batch.append(QuizStats(quiz_id=quiz.pop("id"), **quiz))
+        if len(batch) == BATCH_SIZE:
+            QuizStats.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+
+    if batch:
+        QuizStats.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("quiz", "0003_hot_path_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QuizStats",
+            fields=[
+                (
+                    "quiz",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="quiz.quiz",
+                    ),
+                ),
+                ("participations_started", models.PositiveIntegerField(default=0)),
+                ("participations_completed", models.PositiveIntegerField(default=0)),
+                ("total_score", models.PositiveBigIntegerField(default=0)),
+                ("max_score", models.PositiveIntegerField(blank=True, null=True)),
+                ("min_score", models.PositiveIntegerField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "top_scorer",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(backfill_quiz_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.22 on 2026-10-17 06:39
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_invitation_counters(apps, schema_editor):
+    Invitation = apps.get_model("quiz", "Invitation")
+    QuizStats = apps.get_model("quiz", "QuizStats")
+
+    def count_invitations(condition):
+        return Coalesce(
+            Subquery(
+                Invitation.objects.filter(condition, quiz_id=OuterRef("quiz_id"))
+                .values("quiz_id")
+                .annotate(total=Count("id"))
+                .values("total"),
+                output_field=IntegerField(),
+            ),
+            0,
+        )
+
+    QuizStats.objects.update(
+        invitations_sent=count_invitations(Q()),
+        invitations_accepted=count_invitations(Q(accepted_at__isnull=False)),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0004_quiz_stats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="quizstats",
+            name="invitations_accepted",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="quizstats",
+            name="invitations_sent",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_invitation_counters, migrations.RunPython.noop),
+    ]
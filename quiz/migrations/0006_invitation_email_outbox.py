@@ -0,0 +1,29 @@
+# Generated by Django 4.2.22 on 2026-10-17 06:43
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid_utils.compat
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0005_quiz_stats_invitation_counters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="InvitationEmailOutboxEntry",
+            fields=[
+                ("id", models.UUIDField(default=uuid_utils.compat.uuid7, primary_key=True, serialize=False)),
+                ("invitation_acceptance_link", models.TextField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "invitation",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="quiz.invitation"
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.22 on 2026-10-17 07:20
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_question_totals(apps, schema_editor):
+    Question = apps.get_model("quiz", "Question")
+    Quiz = apps.get_model("quiz", "Quiz")
+
+    def aggregate_questions(aggregate):
+        return Coalesce(
+            Subquery(
+                Question.objects.filter(quiz_id=OuterRef("id"))
+                .values("quiz_id")
+                .annotate(total=aggregate)
+                .values("total"),
+                output_field=IntegerField(),
+            ),
+            0,
+        )
+
+    Quiz.objects.update(
+        total_questions=aggregate_questions(Count("id")),
+        total_possible_points=aggregate_questions(Sum("points")),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0006_invitation_email_outbox"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="quiz",
+            name="total_possible_points",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="quiz",
+            name="total_questions",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_question_totals, migrations.RunPython.noop),
+    ]
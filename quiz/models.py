@@ -1,6 +1,8 @@
 from quiz.domain.invitation.invitation import Invitation
+from quiz.domain.invitation.invitation_email_outbox_entry import InvitationEmailOutboxEntry
 from quiz.domain.participation.answer_submission import AnswerSubmission
 from quiz.domain.participation.participation import Participation
 from quiz.domain.quiz.answer import Answer
 from quiz.domain.quiz.question import Question
 from quiz.domain.quiz.quiz import Quiz
+from quiz.domain.quiz.quiz_stats import QuizStats
@@ -1,3 +1,4 @@
-from quiz.infrastructure.send_invitation_email_task import send_invitation_email_task
+from quiz.infrastructure.relay_invitation_email_outbox_task import relay_invitation_email_outbox_task
+from quiz.infrastructure.send_invitation_email_task import send_invitation_email_task, send_invitation_emails_task
 
-__all__ = ["send_invitation_email_task"]
+__all__ = ["relay_invitation_email_outbox_task", "send_invitation_email_task", "send_invitation_emails_task"]
@@ -13,6 +13,7 @@ from quiz.domain.invitation.only_invited_user_can_accept_invitation_exception im
 )
 from quiz.domain.participation.participation import Participation
 from quiz.domain.participation.participation_repository import ParticipationRepository
+from quiz.domain.quiz.quiz_stats_repository import QuizStatsRepository
 from quiz.domain.quiz.quiz import Quiz
 from user.domain.user import User
 
@@ -21,10 +22,12 @@ class TestAcceptInvitationCommandHandler(unittest.TestCase):
     def setUp(self):
         self.invitation_repository_mock = Mock(spec=InvitationRepository)
         self.participation_repository_mock = Mock(spec=ParticipationRepository)
+        self.quiz_stats_repository_mock = Mock(spec=QuizStatsRepository)
 
         self.handler = AcceptInvitationCommandHandler(
             invitation_repository=self.invitation_repository_mock,
             participation_repository=self.participation_repository_mock,
+            quiz_stats_repository=self.quiz_stats_repository_mock,
         )
 
         self.invitation_id = UUID("12345678-1234-5678-9abc-123456789abc")
@@ -78,6 +81,7 @@ class TestAcceptInvitationCommandHandler(unittest.TestCase):
             id=self.participation_id, quiz=mock_quiz, participant=mock_participant, invitation=mock_invitation
         )
         self.participation_repository_mock.save.assert_called_once_with(mock_participation_instance)
+        self.quiz_stats_repository_mock.record_invitation_accepted.assert_called_once_with(self.quiz_id)
         mock_uuid7.assert_called_once()
 
     def test_handle_invitation_already_accepted_raises_exception(self):
@@ -16,6 +16,7 @@ from quiz.domain.quiz.question_repository import QuestionRepository
 from quiz.domain.quiz.question_validator import QuestionValidator
 from quiz.domain.quiz.quiz import Quiz
 from quiz.domain.quiz.quiz_repository import QuizRepository
+from quiz.domain.quiz.quiz_stats_repository import QuizStatsRepository
 from user.domain.user import User
 from user.domain.user_not_found_exception import UserNotFoundException
 from user.domain.user_repository import UserRepository
@@ -29,6 +30,7 @@ class TestCreateQuizCommandHandler(unittest.TestCase):
         self.answer_repository_mock = Mock(spec=AnswerRepository)
         self.question_mapper_mock = Mock(spec=QuestionMapper)
         self.question_validator_mock = Mock(spec=QuestionValidator)
+        self.quiz_stats_repository_mock = Mock(spec=QuizStatsRepository)
 
         self.handler = CreateQuizCommandHandler(
             user_repository=self.user_repository_mock,
@@ -37,6 +39,7 @@ class TestCreateQuizCommandHandler(unittest.TestCase):
             answer_repository=self.answer_repository_mock,
             question_mapper=self.question_mapper_mock,
             question_validator=self.question_validator_mock,
+            quiz_stats_repository=self.quiz_stats_repository_mock,
         )
 
         self.creator_id = UUID("12345678-1234-5678-9abc-123456789abc")
@@ -63,6 +66,7 @@ class TestCreateQuizCommandHandler(unittest.TestCase):
         mock_quiz.id = self.quiz_id
         mock_question = Mock(spec=Question)
         mock_question.id = self.question_id
+        mock_question.points = 10
         mock_answer = Mock(spec=Answer)
         mock_answer.id = self.answer_id
         self.user_repository_mock.find_or_fail_by_id.return_value = mock_creator
@@ -80,8 +84,47 @@ class TestCreateQuizCommandHandler(unittest.TestCase):
         self.question_mapper_mock.map_to_domain.assert_called_once_with(mock_quiz, self.question_data)
         self.question_validator_mock.validate.assert_called_once()
         self.quiz_repository_mock.save.assert_called_once_with(mock_quiz)
-        self.question_repository_mock.save.assert_called_once_with(mock_question)
+        self.assertEqual(mock_quiz.total_questions, 1)
+        self.assertEqual(mock_quiz.total_possible_points, 10)
+        self.question_repository_mock.bulk_save.assert_called_once_with([mock_question])
         self.answer_repository_mock.bulk_save.assert_called_once_with([mock_answer])
+        self.quiz_stats_repository_mock.save.assert_called_once()
+        self.assertEqual(self.quiz_stats_repository_mock.save.call_args.args[0].quiz_id, self.quiz_id)
+
+    @patch("quiz.application.create_quiz.create_quiz_command_handler.transaction")
+    @patch("quiz.application.create_quiz.create_quiz_command_handler.uuid7")
+    def test_handle_saves_all_questions_and_answers_in_one_batch_each(self, mock_uuid7, mock_transaction):
+        mock_quiz = Mock(spec=Quiz)
+        mock_quiz.id = self.quiz_id
+        mock_question_1 = Mock(spec=Question)
+        mock_question_1.points = 10
+        mock_question_2 = Mock(spec=Question)
+        mock_question_2.points = 5
+        mock_answers_1 = [Mock(spec=Answer), Mock(spec=Answer)]
+        mock_answers_2 = [Mock(spec=Answer), Mock(spec=Answer)]
+        self.user_repository_mock.find_or_fail_by_id.return_value = Mock(spec=User)
+        mock_uuid7.return_value = self.quiz_id
+        mock_transaction.atomic.return_value.__enter__ = Mock()
+        mock_transaction.atomic.return_value.__exit__ = Mock()
+        self.question_mapper_mock.map_to_domain.side_effect = [
+            (mock_question_1, mock_answers_1),
+            (mock_question_2, mock_answers_2),
+        ]
+        command = CreateQuizCommand(
+            title="Test Quiz",
+            description="Test Description",
+            creator_id=self.creator_id,
+            questions=[self.question_data, self.question_data],
+        )
+
+        with patch("quiz.application.create_quiz.create_quiz_command_handler.Quiz", return_value=mock_quiz):
+            self.handler.handle(command)
+
+        self.question_repository_mock.bulk_save.assert_called_once_with([mock_question_1, mock_question_2])
+        self.answer_repository_mock.bulk_save.assert_called_once_with(mock_answers_1 + mock_answers_2)
+        self.question_repository_mock.save.assert_not_called()
+        self.assertEqual(mock_quiz.total_questions, 2)
+        self.assertEqual(mock_quiz.total_possible_points, 15)
 
     def test_handle_user_not_found_raises_exception(self):
         self.user_repository_mock.find_or_fail_by_id.side_effect = UserNotFoundException(str(self.creator_id))
@@ -90,7 +133,7 @@ class TestCreateQuizCommandHandler(unittest.TestCase):
             self.handler.handle(self.command)
 
         self.quiz_repository_mock.save.assert_not_called()
-        self.question_repository_mock.save.assert_not_called()
+        self.question_repository_mock.bulk_save.assert_not_called()
 
     @patch("quiz.application.create_quiz.create_quiz_command_handler.uuid7")
     def test_handle_validation_error_raises_exception(self, mock_uuid7):
@@ -113,4 +156,4 @@ class TestCreateQuizCommandHandler(unittest.TestCase):
                 self.handler.handle(self.command)
 
         self.quiz_repository_mock.save.assert_not_called()
-        self.question_repository_mock.save.assert_not_called()
+        self.question_repository_mock.bulk_save.assert_not_called()
@@ -1,30 +1,44 @@
 import unittest
 from unittest.mock import Mock
+from datetime import datetime, timezone
 from uuid import UUID
 
+from quiz.application.get_quiz_query.encoded_quiz_response import EncodedQuizResponse
 from quiz.application.get_quiz_query.get_quiz_query import GetQuizQuery
 from quiz.application.get_quiz_query.get_quiz_query_handler import GetQuizQueryHandler
 from quiz.application.get_quiz_query.get_quiz_query_response import GetQuizQueryResponse
 from quiz.application.get_quiz_query.quiz_data_mapper import QuizDataMapper
-from quiz.domain.invitation.invitation_repository import InvitationRepository
-from quiz.domain.participation.participation_repository import ParticipationRepository
 from quiz.domain.quiz.quiz_data import QuizData, QuestionData, AnswerData
+from quiz.domain.quiz.quiz_access_cache import QuizAccessCache
+from quiz.domain.quiz.quiz_access_finder import QuizAccessFinder
 from quiz.domain.quiz.quiz_finder import QuizFinder
+from quiz.domain.quiz.quiz_not_found_exception import QuizNotFoundException
+from quiz.domain.quiz.quiz_response_cache import QuizResponseCache
+from quiz.domain.quiz.quiz_response_encoder import QuizResponseEncoder
+from quiz.domain.quiz.quiz_version import QuizVersion
 from quiz.domain.quiz.unauthorized_quiz_access_exception import UnauthorizedQuizAccessException
 
 
 class TestGetQuizQueryHandler(unittest.TestCase):
     def setUp(self):
         self.quiz_finder_mock = Mock(spec=QuizFinder)
-        self.participation_repository_mock = Mock(spec=ParticipationRepository)
-        self.invitation_repository_mock = Mock(spec=InvitationRepository)
+        self.quiz_access_finder_mock = Mock(spec=QuizAccessFinder)
+        self.quiz_access_cache_mock = Mock(spec=QuizAccessCache)
+        self.quiz_access_cache_mock.is_granted.return_value = False
         self.mapper_mock = Mock(spec=QuizDataMapper)
+        self.quiz_response_cache_mock = Mock(spec=QuizResponseCache)
+        self.quiz_response_cache_mock.get.return_value = None
+        self.quiz_response_encoder_mock = Mock(spec=QuizResponseEncoder)
+        self.encoded_body = b'{"quiz_id":"encoded"}'
+        self.quiz_response_encoder_mock.encode.return_value = self.encoded_body
 
         self.handler = GetQuizQueryHandler(
             quiz_finder=self.quiz_finder_mock,
-            participation_repository=self.participation_repository_mock,
-            invitation_repository=self.invitation_repository_mock,
+            quiz_access_finder=self.quiz_access_finder_mock,
+            quiz_access_cache=self.quiz_access_cache_mock,
             mapper=self.mapper_mock,
+            quiz_response_cache=self.quiz_response_cache_mock,
+            quiz_response_encoder=self.quiz_response_encoder_mock,
         )
 
         self.quiz_id = UUID("12345678-1234-5678-9abc-123456789abc")
@@ -32,6 +46,16 @@ class TestGetQuizQueryHandler(unittest.TestCase):
         self.creator_id = UUID("11111111-2222-3333-4444-555555555555")
 
         self.query = GetQuizQuery(participant_id=self.participant_id, quiz_id=self.quiz_id)
+        self.etag = f'"{self.quiz_id}-{datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc).timestamp()}"'
+        self.encoded_response = EncodedQuizResponse(etag=self.etag, body=self.encoded_body)
+
+    @staticmethod
+    def __build_quiz_version(quiz_data: QuizData) -> QuizVersion:
+        return QuizVersion(
+            quiz_id=quiz_data.quiz_id,
+            quiz_creator_id=quiz_data.quiz_creator_id,
+            updated_at=datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc),
+        )
 
     def test_handle_success_for_creator(self):
         answer_data = AnswerData(answer_id=UUID("cccccccc-cccc-cccc-cccc-cccccccccccc"), text="Correct answer", order=1)
@@ -55,19 +79,21 @@ class TestGetQuizQueryHandler(unittest.TestCase):
         mock_response = Mock(spec=GetQuizQueryResponse)
 
         self.quiz_finder_mock.find_quiz_for_participation.return_value = quiz_data
+        self.quiz_finder_mock.find_quiz_version.return_value = self.__build_quiz_version(quiz_data)
         self.mapper_mock.map_to_response.return_value = mock_response
 
         result = self.handler.handle(self.query)
 
-        self.assertEqual(result, mock_response)
+        self.assertEqual(result, self.encoded_response)
         self.quiz_finder_mock.find_quiz_for_participation.assert_called_once_with(
             quiz_id=self.quiz_id, participant_id=self.participant_id
         )
         self.mapper_mock.map_to_response.assert_called_once_with(quiz_data)
-        self.participation_repository_mock.exists_by_quiz_and_participant.assert_not_called()
-        self.invitation_repository_mock.exists_by_quiz_and_invited.assert_not_called()
+        self.quiz_response_encoder_mock.encode.assert_called_once_with(mock_response)
+        self.quiz_access_cache_mock.is_granted.assert_not_called()
+        self.quiz_access_finder_mock.can_view_quiz.assert_not_called()
 
-    def test_handle_success_with_participation(self):
+    def test_handle_success_when_access_finder_grants_access(self):
         quiz_data = QuizData(
             quiz_id=self.quiz_id,
             quiz_title="Science Quiz",
@@ -79,18 +105,19 @@ class TestGetQuizQueryHandler(unittest.TestCase):
         mock_response = Mock(spec=GetQuizQueryResponse)
 
         self.quiz_finder_mock.find_quiz_for_participation.return_value = quiz_data
-        self.participation_repository_mock.exists_by_quiz_and_participant.return_value = True
+        self.quiz_finder_mock.find_quiz_version.return_value = self.__build_quiz_version(quiz_data)
+        self.quiz_access_finder_mock.can_view_quiz.return_value = True
         self.mapper_mock.map_to_response.return_value = mock_response
 
         result = self.handler.handle(self.query)
 
-        self.assertEqual(result, mock_response)
-        self.participation_repository_mock.exists_by_quiz_and_participant.assert_called_once_with(
-            self.quiz_id, self.participant_id
+        self.assertEqual(result, self.encoded_response)
+        self.quiz_access_finder_mock.can_view_quiz.assert_called_once_with(
+            quiz_id=self.quiz_id, user_id=self.participant_id
         )
-        self.invitation_repository_mock.exists_by_quiz_and_invited.assert_not_called()
+        self.quiz_access_cache_mock.grant.assert_called_once_with(self.quiz_id, self.participant_id)
 
-    def test_handle_success_with_invitation(self):
+    def test_handle_success_with_cached_access(self):
         quiz_data = QuizData(
             quiz_id=self.quiz_id,
             quiz_title="History Quiz",
@@ -102,19 +129,16 @@ class TestGetQuizQueryHandler(unittest.TestCase):
         mock_response = Mock(spec=GetQuizQueryResponse)
 
         self.quiz_finder_mock.find_quiz_for_participation.return_value = quiz_data
-        self.participation_repository_mock.exists_by_quiz_and_participant.return_value = False
-        self.invitation_repository_mock.exists_by_quiz_and_invited.return_value = True
+        self.quiz_finder_mock.find_quiz_version.return_value = self.__build_quiz_version(quiz_data)
+        self.quiz_access_cache_mock.is_granted.return_value = True
         self.mapper_mock.map_to_response.return_value = mock_response
 
         result = self.handler.handle(self.query)
 
-        self.assertEqual(result, mock_response)
-        self.participation_repository_mock.exists_by_quiz_and_participant.assert_called_once_with(
-            self.quiz_id, self.participant_id
-        )
-        self.invitation_repository_mock.exists_by_quiz_and_invited.assert_called_once_with(
-            quiz_id=self.quiz_id, invited_id=self.participant_id
-        )
+        self.assertEqual(result, self.encoded_response)
+        self.quiz_access_cache_mock.is_granted.assert_called_once_with(self.quiz_id, self.participant_id)
+        self.quiz_access_finder_mock.can_view_quiz.assert_not_called()
+        self.quiz_access_cache_mock.grant.assert_not_called()
 
     def test_handle_unauthorized_access_raises_exception(self):
         quiz_data = QuizData(
@@ -126,8 +150,8 @@ class TestGetQuizQueryHandler(unittest.TestCase):
         )
 
         self.quiz_finder_mock.find_quiz_for_participation.return_value = quiz_data
-        self.participation_repository_mock.exists_by_quiz_and_participant.return_value = False
-        self.invitation_repository_mock.exists_by_quiz_and_invited.return_value = False
+        self.quiz_finder_mock.find_quiz_version.return_value = self.__build_quiz_version(quiz_data)
+        self.quiz_access_finder_mock.can_view_quiz.return_value = False
 
         with self.assertRaises(UnauthorizedQuizAccessException) as context:
             self.handler.handle(self.query)
@@ -135,12 +159,10 @@ class TestGetQuizQueryHandler(unittest.TestCase):
         self.assertEqual(context.exception.quiz_id, "12345678-1234-5678-9abc-123456789abc")
         self.assertEqual(context.exception.user_id, "87654321-4321-8765-cba9-987654321098")
 
-        self.participation_repository_mock.exists_by_quiz_and_participant.assert_called_once_with(
-            self.quiz_id, self.participant_id
-        )
-        self.invitation_repository_mock.exists_by_quiz_and_invited.assert_called_once_with(
-            quiz_id=self.quiz_id, invited_id=self.participant_id
+        self.quiz_access_finder_mock.can_view_quiz.assert_called_once_with(
+            quiz_id=self.quiz_id, user_id=self.participant_id
         )
+        self.quiz_access_cache_mock.grant.assert_not_called()
         self.mapper_mock.map_to_response.assert_not_called()
 
     def test_handle_authorization_check_priority(self):
@@ -155,13 +177,14 @@ class TestGetQuizQueryHandler(unittest.TestCase):
         mock_response = Mock(spec=GetQuizQueryResponse)
 
         self.quiz_finder_mock.find_quiz_for_participation.return_value = quiz_data
+        self.quiz_finder_mock.find_quiz_version.return_value = self.__build_quiz_version(quiz_data)
         self.mapper_mock.map_to_response.return_value = mock_response
 
         result = self.handler.handle(self.query)
 
-        self.assertEqual(result, mock_response)
-        self.participation_repository_mock.exists_by_quiz_and_participant.assert_not_called()
-        self.invitation_repository_mock.exists_by_quiz_and_invited.assert_not_called()
+        self.assertEqual(result, self.encoded_response)
+        self.quiz_access_cache_mock.is_granted.assert_not_called()
+        self.quiz_access_finder_mock.can_view_quiz.assert_not_called()
 
     def test_handle_complex_quiz_with_multiple_questions(self):
         answer1 = AnswerData(answer_id=UUID("11111111-1111-1111-1111-111111111111"), text="Option A", order=1)
@@ -194,18 +217,19 @@ class TestGetQuizQueryHandler(unittest.TestCase):
         mock_response = Mock(spec=GetQuizQueryResponse)
 
         self.quiz_finder_mock.find_quiz_for_participation.return_value = quiz_data
+        self.quiz_finder_mock.find_quiz_version.return_value = self.__build_quiz_version(quiz_data)
         self.mapper_mock.map_to_response.return_value = mock_response
 
         result = self.handler.handle(self.query)
 
-        self.assertEqual(result, mock_response)
+        self.assertEqual(result, self.encoded_response)
         self.mapper_mock.map_to_response.assert_called_once_with(quiz_data)
 
-    def test_handle_participation_exists_but_no_invitation(self):
+    def test_handle_caches_granted_access(self):
         quiz_data = QuizData(
             quiz_id=self.quiz_id,
-            quiz_title="Participation Only Quiz",
-            quiz_description="Has participation but no invitation",
+            quiz_title="Invited Quiz",
+            quiz_description="Access granted through an invitation",
             quiz_creator_id=self.creator_id,
             questions=[],
         )
@@ -213,18 +237,19 @@ class TestGetQuizQueryHandler(unittest.TestCase):
         mock_response = Mock(spec=GetQuizQueryResponse)
 
         self.quiz_finder_mock.find_quiz_for_participation.return_value = quiz_data
-        self.participation_repository_mock.exists_by_quiz_and_participant.return_value = True
+        self.quiz_finder_mock.find_quiz_version.return_value = self.__build_quiz_version(quiz_data)
+        self.quiz_access_finder_mock.can_view_quiz.return_value = True
         self.mapper_mock.map_to_response.return_value = mock_response
 
         result = self.handler.handle(self.query)
 
-        self.assertEqual(result, mock_response)
-        self.participation_repository_mock.exists_by_quiz_and_participant.assert_called_once_with(
-            self.quiz_id, self.participant_id
+        self.assertEqual(result, self.encoded_response)
+        self.quiz_access_finder_mock.can_view_quiz.assert_called_once_with(
+            quiz_id=self.quiz_id, user_id=self.participant_id
         )
-        self.invitation_repository_mock.exists_by_quiz_and_invited.assert_not_called()
+        self.quiz_access_cache_mock.grant.assert_called_once_with(self.quiz_id, self.participant_id)
 
-    def test_handle_neither_participation_nor_invitation_exists(self):
+    def test_handle_does_not_cache_denied_access(self):
         quiz_data = QuizData(
             quiz_id=self.quiz_id,
             quiz_title="Restricted Quiz",
@@ -234,18 +259,16 @@ class TestGetQuizQueryHandler(unittest.TestCase):
         )
 
         self.quiz_finder_mock.find_quiz_for_participation.return_value = quiz_data
-        self.participation_repository_mock.exists_by_quiz_and_participant.return_value = False
-        self.invitation_repository_mock.exists_by_quiz_and_invited.return_value = False
+        self.quiz_finder_mock.find_quiz_version.return_value = self.__build_quiz_version(quiz_data)
+        self.quiz_access_finder_mock.can_view_quiz.return_value = False
 
         with self.assertRaises(UnauthorizedQuizAccessException):
             self.handler.handle(self.query)
 
-        self.participation_repository_mock.exists_by_quiz_and_participant.assert_called_once_with(
-            self.quiz_id, self.participant_id
-        )
-        self.invitation_repository_mock.exists_by_quiz_and_invited.assert_called_once_with(
-            quiz_id=self.quiz_id, invited_id=self.participant_id
+        self.quiz_access_finder_mock.can_view_quiz.assert_called_once_with(
+            quiz_id=self.quiz_id, user_id=self.participant_id
         )
+        self.quiz_access_cache_mock.grant.assert_not_called()
 
     def test_handle_different_participant_id(self):
         different_participant_id = UUID("aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee")
@@ -262,11 +285,122 @@ class TestGetQuizQueryHandler(unittest.TestCase):
         mock_response = Mock(spec=GetQuizQueryResponse)
 
         self.quiz_finder_mock.find_quiz_for_participation.return_value = quiz_data
+        self.quiz_finder_mock.find_quiz_version.return_value = self.__build_quiz_version(quiz_data)
         self.mapper_mock.map_to_response.return_value = mock_response
 
         result = self.handler.handle(different_query)
 
-        self.assertEqual(result, mock_response)
+        self.assertEqual(result, self.encoded_response)
         self.quiz_finder_mock.find_quiz_for_participation.assert_called_once_with(
             quiz_id=self.quiz_id, participant_id=different_participant_id
         )
+
+    def test_handle_returns_cached_response_without_loading_quiz(self):
+        quiz_version = QuizVersion(
+            quiz_id=self.quiz_id,
+            quiz_creator_id=self.participant_id,
+            updated_at=datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc),
+        )
+        cached_response = EncodedQuizResponse(etag=quiz_version.etag, body=b'{"quiz_id":"cached"}')
+        self.quiz_finder_mock.find_quiz_version.return_value = quiz_version
+        self.quiz_response_cache_mock.get.return_value = cached_response
+
+        result = self.handler.handle(self.query)
+
+        self.assertEqual(result, cached_response)
+        self.quiz_response_cache_mock.get.assert_called_once_with(quiz_version)
+        self.quiz_finder_mock.find_quiz_for_participation.assert_not_called()
+        self.mapper_mock.map_to_response.assert_not_called()
+        self.quiz_response_encoder_mock.encode.assert_not_called()
+        self.quiz_response_cache_mock.set.assert_not_called()
+
+    def test_handle_stores_response_in_cache_on_miss(self):
+        quiz_data = QuizData(
+            quiz_id=self.quiz_id,
+            quiz_title="Cached Quiz",
+            quiz_description="Stored after first load",
+            quiz_creator_id=self.participant_id,
+            questions=(),
+        )
+        quiz_version = self.__build_quiz_version(quiz_data)
+        mock_response = Mock(spec=GetQuizQueryResponse)
+        self.quiz_finder_mock.find_quiz_version.return_value = quiz_version
+        self.quiz_finder_mock.find_quiz_for_participation.return_value = quiz_data
+        self.mapper_mock.map_to_response.return_value = mock_response
+
+        result = self.handler.handle(self.query)
+
+        self.assertEqual(result, self.encoded_response)
+        self.quiz_response_cache_mock.set.assert_called_once_with(quiz_version, self.encoded_response)
+
+    def test_handle_does_not_read_cache_when_unauthorized(self):
+        self.quiz_finder_mock.find_quiz_version.return_value = QuizVersion(
+            quiz_id=self.quiz_id,
+            quiz_creator_id=self.creator_id,
+            updated_at=datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc),
+        )
+        self.quiz_access_finder_mock.can_view_quiz.return_value = False
+
+        with self.assertRaises(UnauthorizedQuizAccessException):
+            self.handler.handle(self.query)
+
+        self.quiz_response_cache_mock.get.assert_not_called()
+        self.quiz_finder_mock.find_quiz_for_participation.assert_not_called()
+
+    def test_handle_raises_exception_when_quiz_does_not_exist(self):
+        self.quiz_finder_mock.find_quiz_version.side_effect = QuizNotFoundException(quiz_id=str(self.quiz_id))
+
+        with self.assertRaises(QuizNotFoundException):
+            self.handler.handle(self.query)
+
+        self.quiz_response_cache_mock.get.assert_not_called()
+
+    def test_handle_returns_not_modified_when_etag_is_known(self):
+        self.quiz_finder_mock.find_quiz_version.return_value = QuizVersion(
+            quiz_id=self.quiz_id,
+            quiz_creator_id=self.creator_id,
+            updated_at=datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc),
+        )
+        self.quiz_access_finder_mock.can_view_quiz.return_value = True
+        query = GetQuizQuery(
+            participant_id=self.participant_id, quiz_id=self.quiz_id, known_etags=('"stale"', self.etag)
+        )
+
+        result = self.handler.handle(query)
+
+        self.assertEqual(result, EncodedQuizResponse(etag=self.etag))
+        self.assertTrue(result.is_not_modified)
+        self.quiz_access_finder_mock.can_view_quiz.assert_called_once_with(
+            quiz_id=self.quiz_id, user_id=self.participant_id
+        )
+        self.quiz_response_cache_mock.get.assert_not_called()
+        self.quiz_finder_mock.find_quiz_for_participation.assert_not_called()
+
+    def test_handle_ignores_stale_etags(self):
+        quiz_data = QuizData(
+            quiz_id=self.quiz_id,
+            quiz_title="Updated Quiz",
+            quiz_description="Changed since the client last fetched it",
+            quiz_creator_id=self.participant_id,
+            questions=(),
+        )
+        self.quiz_finder_mock.find_quiz_version.return_value = self.__build_quiz_version(quiz_data)
+        self.quiz_finder_mock.find_quiz_for_participation.return_value = quiz_data
+        query = GetQuizQuery(participant_id=self.participant_id, quiz_id=self.quiz_id, known_etags=('"stale"',))
+
+        result = self.handler.handle(query)
+
+        self.assertEqual(result, self.encoded_response)
+        self.assertFalse(result.is_not_modified)
+
+    def test_handle_raises_exception_when_unauthorized_even_with_known_etag(self):
+        self.quiz_finder_mock.find_quiz_version.return_value = QuizVersion(
+            quiz_id=self.quiz_id,
+            quiz_creator_id=self.creator_id,
+            updated_at=datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc),
+        )
+        self.quiz_access_finder_mock.can_view_quiz.return_value = False
+        query = GetQuizQuery(participant_id=self.participant_id, quiz_id=self.quiz_id, known_etags=(self.etag,))
+
+        with self.assertRaises(UnauthorizedQuizAccessException):
+            self.handler.handle(query)
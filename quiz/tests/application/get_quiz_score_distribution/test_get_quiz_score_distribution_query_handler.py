@@ -0,0 +1,119 @@
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import Mock
+from uuid import UUID
+
+from quiz.application.get_quiz_score_distribution.get_quiz_score_distribution_query import (
+    GetQuizScoreDistributionQuery,
+)
+from quiz.application.get_quiz_score_distribution.get_quiz_score_distribution_query_handler import (
+    GetQuizScoreDistributionQueryHandler,
+)
+from quiz.domain.participation.participation_finder import ParticipationFinder
+from quiz.domain.participation.quiz_score_distribution import QuizScoreDistribution, ScoreBucket
+from quiz.domain.participation.quiz_score_distribution_cache import QuizScoreDistributionCache
+from quiz.domain.quiz.quiz import Quiz
+from quiz.domain.quiz.quiz_not_found_exception import QuizNotFoundException
+from quiz.domain.quiz.quiz_repository import QuizRepository
+from quiz.domain.quiz.unauthorized_quiz_access_exception import UnauthorizedQuizAccessException
+
+
+class TestGetQuizScoreDistributionQueryHandler(unittest.TestCase):
+    def setUp(self):
+        self.quiz_repository_mock = Mock(spec=QuizRepository)
+        self.participation_finder_mock = Mock(spec=ParticipationFinder)
+        self.cache_mock = Mock(spec=QuizScoreDistributionCache)
+
+        self.handler = GetQuizScoreDistributionQueryHandler(
+            quiz_repository=self.quiz_repository_mock,
+            participation_finder=self.participation_finder_mock,
+            quiz_score_distribution_cache=self.cache_mock,
+        )
+
+        self.quiz_id = UUID("12345678-1234-5678-9abc-123456789abc")
+        self.creator_id = UUID("87654321-4321-8765-cba9-987654321098")
+        self.scores_version = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+
+        self.mock_quiz = Mock(spec=Quiz)
+        self.mock_quiz.id = self.quiz_id
+        self.mock_quiz.title = "JavaScript Quiz"
+        self.mock_quiz.creator_id = self.creator_id
+        self.quiz_repository_mock.find_or_fail_by_id.return_value = self.mock_quiz
+
+        self.distribution = QuizScoreDistribution(
+            total_scored=3,
+            max_possible_score=20,
+            p50=10.0,
+            p90=18.4,
+            p99=19.84,
+            buckets=[
+                ScoreBucket(min_score=0.0, max_score=10.0, count=1),
+                ScoreBucket(min_score=10.0, max_score=20.0, count=2),
+            ],
+        )
+        self.query = GetQuizScoreDistributionQuery(quiz_id=str(self.quiz_id), requester_id=str(self.creator_id))
+
+    def test_handle_computes_and_caches_distribution_on_cache_miss(self):
+        self.participation_finder_mock.find_quiz_scores_version.return_value = self.scores_version
+        self.cache_mock.get.return_value = None
+        self.participation_finder_mock.find_quiz_score_distribution.return_value = self.distribution
+
+        result = self.handler.handle(self.query)
+
+        self.assertEqual(
+            result.as_dict(),
+            {
+                "quiz_id": str(self.quiz_id),
+                "quiz_title": "JavaScript Quiz",
+                "total_scored": 3,
+                "max_possible_score": 20,
+                "percentiles": {"p50": 10.0, "p90": 18.4, "p99": 19.84},
+                "buckets": [
+                    {"min_score": 0.0, "max_score": 10.0, "count": 1},
+                    {"min_score": 10.0, "max_score": 20.0, "count": 2},
+                ],
+            },
+        )
+        self.participation_finder_mock.find_quiz_score_distribution.assert_called_once_with(self.quiz_id, 10)
+        self.cache_mock.set.assert_called_once_with(self.mock_quiz, self.scores_version, self.distribution)
+
+    def test_handle_returns_cached_distribution_without_querying_scores(self):
+        self.participation_finder_mock.find_quiz_scores_version.return_value = self.scores_version
+        self.cache_mock.get.return_value = self.distribution
+
+        result = self.handler.handle(self.query)
+
+        self.assertEqual(result.total_scored, 3)
+        self.assertEqual(result.buckets, self.distribution.buckets)
+        self.cache_mock.get.assert_called_once_with(self.mock_quiz, self.scores_version)
+        self.participation_finder_mock.find_quiz_score_distribution.assert_not_called()
+        self.cache_mock.set.assert_not_called()
+
+    def test_handle_skips_cache_when_quiz_has_no_stats(self):
+        self.participation_finder_mock.find_quiz_scores_version.return_value = None
+        self.participation_finder_mock.find_quiz_score_distribution.return_value = self.distribution
+
+        result = self.handler.handle(self.query)
+
+        self.assertEqual(result.p50, 10.0)
+        self.cache_mock.get.assert_not_called()
+        self.cache_mock.set.assert_not_called()
+
+    def test_handle_raises_unauthorized_when_requester_is_not_creator(self):
+        query = GetQuizScoreDistributionQuery(
+            quiz_id=str(self.quiz_id), requester_id="11111111-2222-3333-4444-555555555555"
+        )
+
+        with self.assertRaises(UnauthorizedQuizAccessException):
+            self.handler.handle(query)
+
+        self.participation_finder_mock.find_quiz_scores_version.assert_not_called()
+        self.participation_finder_mock.find_quiz_score_distribution.assert_not_called()
+
+    def test_handle_raises_quiz_not_found(self):
+        self.quiz_repository_mock.find_or_fail_by_id.side_effect = QuizNotFoundException(str(self.quiz_id))
+
+        with self.assertRaises(QuizNotFoundException):
+            self.handler.handle(self.query)
+
+        self.participation_finder_mock.find_quiz_score_distribution.assert_not_called()
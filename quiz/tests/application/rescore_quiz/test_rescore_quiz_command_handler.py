@@ -0,0 +1,143 @@
+import unittest
+from unittest.mock import Mock, patch
+from uuid import UUID
+
+from quiz.application.rescore_quiz.rescore_quiz_command import RescoreQuizCommand
+from quiz.application.rescore_quiz.rescore_quiz_command_handler import RescoreQuizCommandHandler
+from quiz.application.rescore_quiz.rescore_quiz_response import RescoreQuizResponse
+from quiz.domain.participation.answer_submission_repository import AnswerSubmissionRepository
+from quiz.domain.participation.participation_repository import ParticipationRepository
+from quiz.domain.quiz.answer_key import AnswerKey
+from quiz.domain.quiz.answer_key_finder import AnswerKeyFinder
+from quiz.domain.quiz.quiz import Quiz
+from quiz.domain.quiz.quiz_not_found_exception import QuizNotFoundException
+from quiz.domain.quiz.quiz_repository import QuizRepository
+from quiz.domain.quiz.quiz_stats_repository import QuizStatsRepository
+
+
+@patch("quiz.application.rescore_quiz.rescore_quiz_command_handler.transaction")
+class TestRescoreQuizCommandHandler(unittest.TestCase):
+    def setUp(self):
+        self.quiz_repository_mock = Mock(spec=QuizRepository)
+        self.answer_key_finder_mock = Mock(spec=AnswerKeyFinder)
+        self.participation_repository_mock = Mock(spec=ParticipationRepository)
+        self.answer_submission_repository_mock = Mock(spec=AnswerSubmissionRepository)
+        self.quiz_stats_repository_mock = Mock(spec=QuizStatsRepository)
+
+        self.handler = RescoreQuizCommandHandler(
+            quiz_repository=self.quiz_repository_mock,
+            answer_key_finder=self.answer_key_finder_mock,
+            participation_repository=self.participation_repository_mock,
+            answer_submission_repository=self.answer_submission_repository_mock,
+            quiz_stats_repository=self.quiz_stats_repository_mock,
+        )
+
+        self.quiz_id = UUID("12345678-1234-5678-9abc-123456789abc")
+        self.participation_id_1 = UUID("11111111-1111-1111-1111-111111111111")
+        self.participation_id_2 = UUID("22222222-2222-2222-2222-222222222222")
+        self.participation_id_3 = UUID("33333333-3333-3333-3333-333333333333")
+
+        mock_quiz = Mock(spec=Quiz)
+        mock_quiz.id = self.quiz_id
+        self.quiz_repository_mock.find_or_fail_by_id.return_value = mock_quiz
+        self.answer_key_finder_mock.find_by_quiz.return_value = AnswerKey(
+            quiz_id=self.quiz_id,
+            question_points={1: 2, 2: 5},
+            answers={101: (1, True), 102: (1, False), 201: (2, False), 202: (2, True)},
+        )
+
+    def test_handle_recomputes_scores_and_updates_only_changed_ones(self, mock_transaction):
+        self.participation_repository_mock.find_completed_scores_by_quiz.return_value = {
+            self.participation_id_1: 7,
+            self.participation_id_2: 2,
+            self.participation_id_3: 0,
+        }
+        self.answer_submission_repository_mock.stream_selected_answers_by_quiz.return_value = iter(
+            [
+                (self.participation_id_1, 101),
+                (self.participation_id_1, 202),
+                (self.participation_id_2, 101),
+                (self.participation_id_2, 202),
+                (self.participation_id_3, 102),
+                (self.participation_id_3, 201),
+            ]
+        )
+
+        response = self.handler.handle(RescoreQuizCommand(quiz_id=self.quiz_id, batch_size=500))
+
+        self.assertEqual(
+            response, RescoreQuizResponse(quiz_id=self.quiz_id, rescored_participations=3, changed_scores=1)
+        )
+        self.participation_repository_mock.bulk_update_scores.assert_called_once_with(
+            {self.participation_id_2: 7}, batch_size=500
+        )
+        self.quiz_stats_repository_mock.rebuild.assert_called_once_with(self.quiz_id)
+        self.assertEqual(mock_transaction.atomic.call_count, 2)
+
+    def test_handle_writes_changed_scores_in_batches_while_streaming(self, mock_transaction):
+        self.participation_repository_mock.find_completed_scores_by_quiz.return_value = {
+            self.participation_id_1: 0,
+            self.participation_id_2: 0,
+            self.participation_id_3: 0,
+        }
+        self.answer_submission_repository_mock.stream_selected_answers_by_quiz.return_value = iter(
+            [
+                (self.participation_id_1, 101),
+                (self.participation_id_2, 202),
+                (self.participation_id_3, 101),
+                (self.participation_id_3, 202),
+            ]
+        )
+        written_batches = []
+        self.participation_repository_mock.bulk_update_scores.side_effect = (
+            lambda scores, batch_size: written_batches.append(scores)
+        )
+
+        response = self.handler.handle(RescoreQuizCommand(quiz_id=self.quiz_id, batch_size=2))
+
+        self.assertEqual(response.changed_scores, 3)
+        self.assertEqual(
+            written_batches,
+            [{self.participation_id_1: 2, self.participation_id_2: 5}, {self.participation_id_3: 7}],
+        )
+        self.assertEqual(mock_transaction.atomic.call_count, 3)
+
+    def test_handle_resets_score_of_completed_participations_without_submissions(self, mock_transaction):
+        self.participation_repository_mock.find_completed_scores_by_quiz.return_value = {
+            self.participation_id_1: 2,
+            self.participation_id_2: 4,
+        }
+        self.answer_submission_repository_mock.stream_selected_answers_by_quiz.return_value = iter(
+            [(self.participation_id_1, 101)]
+        )
+
+        response = self.handler.handle(RescoreQuizCommand(quiz_id=self.quiz_id))
+
+        self.assertEqual(
+            response, RescoreQuizResponse(quiz_id=self.quiz_id, rescored_participations=2, changed_scores=1)
+        )
+        self.participation_repository_mock.bulk_update_scores.assert_called_once_with(
+            {self.participation_id_2: 0}, batch_size=1000
+        )
+
+    def test_handle_ignores_submissions_of_uncompleted_participations(self, mock_transaction):
+        self.participation_repository_mock.find_completed_scores_by_quiz.return_value = {self.participation_id_1: 0}
+        self.answer_submission_repository_mock.stream_selected_answers_by_quiz.return_value = iter(
+            [(self.participation_id_2, 101)]
+        )
+
+        response = self.handler.handle(RescoreQuizCommand(quiz_id=self.quiz_id))
+
+        self.assertEqual(response.rescored_participations, 1)
+        self.assertEqual(response.changed_scores, 0)
+        self.participation_repository_mock.bulk_update_scores.assert_not_called()
+        self.quiz_stats_repository_mock.rebuild.assert_called_once_with(self.quiz_id)
+
+    def test_handle_raises_exception_when_quiz_does_not_exist(self, mock_transaction):
+        self.quiz_repository_mock.find_or_fail_by_id.side_effect = QuizNotFoundException(str(self.quiz_id))
+
+        with self.assertRaises(QuizNotFoundException):
+            self.handler.handle(RescoreQuizCommand(quiz_id=self.quiz_id))
+
+        self.participation_repository_mock.bulk_update_scores.assert_not_called()
+        self.quiz_stats_repository_mock.rebuild.assert_not_called()
@@ -0,0 +1,189 @@
+import unittest
+from unittest.mock import Mock, patch
+from uuid import UUID
+
+from quiz.application.send_bulk_invitations.bulk_invitation_status import BulkInvitationStatus
+from quiz.application.send_bulk_invitations.send_bulk_invitations_command import SendBulkInvitationsCommand
+from quiz.application.send_bulk_invitations.send_bulk_invitations_command_handler import (
+    SendBulkInvitationsCommandHandler,
+)
+from quiz.application.send_bulk_invitations.send_bulk_invitations_response import SendBulkInvitationsResponse
+from quiz.domain.invitation.invitation import Invitation
+from quiz.domain.invitation.invitation_repository import InvitationRepository
+from quiz.domain.invitation.invitation_sender import InvitationSender
+from quiz.domain.invitation.only_quiz_creator_can_send_invitation_exception import (
+    OnlyQuizCreatorCanSendInvitationException,
+)
+from quiz.domain.quiz.quiz import Quiz
+from quiz.domain.quiz.quiz_not_found_exception import QuizNotFoundException
+from quiz.domain.quiz.quiz_repository import QuizRepository
+from quiz.domain.quiz.quiz_stats_repository import QuizStatsRepository
+from user.domain.user import User
+from user.domain.user_repository import UserRepository
+
+
+@patch("quiz.application.send_bulk_invitations.send_bulk_invitations_command_handler.settings")
+@patch("quiz.application.send_bulk_invitations.send_bulk_invitations_command_handler.transaction")
+@patch("quiz.application.send_bulk_invitations.send_bulk_invitations_command_handler.uuid7")
+@patch("quiz.application.send_bulk_invitations.send_bulk_invitations_command_handler.Invitation")
+class TestSendBulkInvitationsCommandHandler(unittest.TestCase):
+    def setUp(self):
+        self.quiz_repository_mock = Mock(spec=QuizRepository)
+        self.invitation_repository_mock = Mock(spec=InvitationRepository)
+        self.user_repository_mock = Mock(spec=UserRepository)
+        self.invitation_sender_mock = Mock(spec=InvitationSender)
+        self.quiz_stats_repository_mock = Mock(spec=QuizStatsRepository)
+
+        self.handler = SendBulkInvitationsCommandHandler(
+            quiz_repository=self.quiz_repository_mock,
+            invitation_repository=self.invitation_repository_mock,
+            user_repository=self.user_repository_mock,
+            invitation_sender=self.invitation_sender_mock,
+            quiz_stats_repository=self.quiz_stats_repository_mock,
+        )
+
+        self.quiz_id = UUID("12345678-1234-5678-9abc-123456789abc")
+        self.inviter_id = UUID("87654321-4321-8765-cba9-987654321098")
+
+        mock_creator = Mock(spec=User)
+        mock_creator.id = self.inviter_id
+        self.mock_quiz = Mock(spec=Quiz)
+        self.mock_quiz.id = self.quiz_id
+        self.mock_quiz.title = "JavaScript Fundamentals"
+        self.mock_quiz.creator = mock_creator
+        self.quiz_repository_mock.find_or_fail_by_id.return_value = self.mock_quiz
+
+        self.alice = self.__create_user(UUID("11111111-1111-1111-1111-111111111111"), "alice@example.com")
+        self.bob = self.__create_user(UUID("22222222-2222-2222-2222-222222222222"), "bob@example.com")
+        self.carol = self.__create_user(UUID("33333333-3333-3333-3333-333333333333"), "carol@example.com")
+
+    def __create_user(self, user_id: UUID, email: str) -> Mock:
+        user = Mock(spec=User)
+        user.id = user_id
+        user.email = email
+        return user
+
+    def __create_invitation(self, invitation_id: UUID, invited: Mock) -> Mock:
+        invitation = Mock(spec=Invitation)
+        invitation.id = invitation_id
+        invitation.invited = invited
+        return invitation
+
+    def __command(self, participant_emails: list[str]) -> SendBulkInvitationsCommand:
+        return SendBulkInvitationsCommand(
+            quiz_id=str(self.quiz_id),
+            participant_emails=participant_emails,
+            inviter_id=str(self.inviter_id),
+            inviter_email="creator@example.com",
+        )
+
+    def test_handle_reports_status_per_email(self, mock_invitation_class, mock_uuid7, mock_transaction, mock_settings):
+        mock_settings.BASE_URL = "https://example.com"
+        alice_invitation_id = UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa")
+        carol_invitation_id = UUID("cccccccc-cccc-cccc-cccc-cccccccccccc")
+        alice_invitation = self.__create_invitation(alice_invitation_id, self.alice)
+        carol_invitation = self.__create_invitation(carol_invitation_id, self.carol)
+        mock_invitation_class.side_effect = [alice_invitation, carol_invitation]
+
+        self.user_repository_mock.find_by_emails.return_value = [self.alice, self.bob, self.carol]
+        self.invitation_repository_mock.find_invited_ids_by_quiz.return_value = {self.bob.id}
+        self.invitation_repository_mock.bulk_save_skipping_existing.return_value = [alice_invitation, carol_invitation]
+
+        result = self.handler.handle(
+            self.__command(
+                [
+                    "alice@example.com",
+                    "bob@example.com",
+                    "unknown@example.com",
+                    "creator@example.com",
+                    "carol@example.com",
+                    "alice@example.com",
+                ]
+            )
+        )
+
+        self.assertIsInstance(result, SendBulkInvitationsResponse)
+        self.assertEqual(result.quiz_id, str(self.quiz_id))
+        self.assertEqual(result.quiz_title, "JavaScript Fundamentals")
+        self.assertEqual(result.total_invited, 2)
+        self.assertEqual(
+            [(item.participant_email, item.status) for item in result.results],
+            [
+                ("alice@example.com", BulkInvitationStatus.INVITED),
+                ("bob@example.com", BulkInvitationStatus.ALREADY_INVITED),
+                ("unknown@example.com", BulkInvitationStatus.USER_NOT_FOUND),
+                ("creator@example.com", BulkInvitationStatus.CREATOR_CANNOT_BE_INVITED),
+                ("carol@example.com", BulkInvitationStatus.INVITED),
+            ],
+        )
+        self.assertEqual(result.results[0].invitation_id, str(alice_invitation_id))
+        self.assertEqual(
+            result.results[0].invitation_acceptance_link,
+            f"https://example.com/invitations/{alice_invitation_id}/accept",
+        )
+        self.assertIsNone(result.results[1].invitation_id)
+
+        self.user_repository_mock.find_by_emails.assert_called_once_with(
+            ["alice@example.com", "bob@example.com", "unknown@example.com", "carol@example.com"]
+        )
+        self.invitation_repository_mock.find_invited_ids_by_quiz.assert_called_once_with(
+            quiz_id=self.quiz_id, invited_ids=[self.alice.id, self.bob.id, self.carol.id]
+        )
+        self.assertEqual(mock_invitation_class.call_count, 2)
+        self.invitation_repository_mock.bulk_save_skipping_existing.assert_called_once_with(
+            [alice_invitation, carol_invitation]
+        )
+        self.quiz_stats_repository_mock.record_invitation_sent.assert_called_once_with(self.quiz_id, count=2)
+        self.invitation_sender_mock.send_invitation_emails.assert_called_once_with(
+            {
+                alice_invitation_id: f"https://example.com/invitations/{alice_invitation_id}/accept",
+                carol_invitation_id: f"https://example.com/invitations/{carol_invitation_id}/accept",
+            }
+        )
+        self.invitation_sender_mock.send_invitation_email.assert_not_called()
+
+    def test_handle_reports_invitations_lost_to_concurrent_requests_as_already_invited(
+        self, mock_invitation_class, mock_uuid7, mock_transaction, mock_settings
+    ):
+        mock_settings.BASE_URL = "https://example.com"
+        mock_invitation_class.return_value = self.__create_invitation(
+            UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"), self.alice
+        )
+        self.user_repository_mock.find_by_emails.return_value = [self.alice]
+        self.invitation_repository_mock.find_invited_ids_by_quiz.return_value = set()
+        self.invitation_repository_mock.bulk_save_skipping_existing.return_value = []
+
+        result = self.handler.handle(self.__command(["alice@example.com"]))
+
+        self.assertEqual(result.results[0].status, BulkInvitationStatus.ALREADY_INVITED)
+        self.assertEqual(result.total_invited, 0)
+        self.quiz_stats_repository_mock.record_invitation_sent.assert_not_called()
+        self.invitation_sender_mock.send_invitation_emails.assert_not_called()
+
+    def test_handle_quiz_not_found_raises_exception(
+        self, mock_invitation_class, mock_uuid7, mock_transaction, mock_settings
+    ):
+        self.quiz_repository_mock.find_or_fail_by_id.side_effect = QuizNotFoundException(quiz_id=str(self.quiz_id))
+
+        with self.assertRaises(QuizNotFoundException):
+            self.handler.handle(self.__command(["alice@example.com"]))
+
+        self.user_repository_mock.find_by_emails.assert_not_called()
+        self.invitation_repository_mock.bulk_save_skipping_existing.assert_not_called()
+
+    def test_handle_only_quiz_creator_can_send_invitations(
+        self, mock_invitation_class, mock_uuid7, mock_transaction, mock_settings
+    ):
+        command = SendBulkInvitationsCommand(
+            quiz_id=str(self.quiz_id),
+            participant_emails=["alice@example.com"],
+            inviter_id="99999999-9999-9999-9999-999999999999",
+            inviter_email="someone@example.com",
+        )
+
+        with self.assertRaises(OnlyQuizCreatorCanSendInvitationException):
+            self.handler.handle(command)
+
+        self.user_repository_mock.find_by_emails.assert_not_called()
+        self.invitation_repository_mock.bulk_save_skipping_existing.assert_not_called()
+        self.invitation_sender_mock.send_invitation_emails.assert_not_called()
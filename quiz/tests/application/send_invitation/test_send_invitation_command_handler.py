@@ -16,6 +16,7 @@ from quiz.domain.invitation.only_quiz_creator_can_send_invitation_exception impo
 from quiz.domain.quiz.quiz import Quiz
 from quiz.domain.quiz.quiz_not_found_exception import QuizNotFoundException
 from quiz.domain.quiz.quiz_repository import QuizRepository
+from quiz.domain.quiz.quiz_stats_repository import QuizStatsRepository
 from user.domain.user import User
 from user.domain.user_not_found_exception import UserNotFoundException
 from user.domain.user_repository import UserRepository
@@ -27,12 +28,14 @@ class TestSendInvitationCommandHandler(unittest.TestCase):
         self.invitation_repository_mock = Mock(spec=InvitationRepository)
         self.user_repository_mock = Mock(spec=UserRepository)
         self.invitation_sender_mock = Mock(spec=InvitationSender)
+        self.quiz_stats_repository_mock = Mock(spec=QuizStatsRepository)
 
         self.handler = SendInvitationCommandHandler(
             quiz_repository=self.quiz_repository_mock,
             invitation_repository=self.invitation_repository_mock,
             user_repository=self.user_repository_mock,
             invitation_sender=self.invitation_sender_mock,
+            quiz_stats_repository=self.quiz_stats_repository_mock,
         )
 
         self.quiz_id = UUID("12345678-1234-5678-9abc-123456789abc")
@@ -96,6 +99,7 @@ class TestSendInvitationCommandHandler(unittest.TestCase):
             id=self.invitation_id, quiz=mock_quiz, invited=mock_participant, inviter_id=str(self.inviter_id)
         )
         self.invitation_repository_mock.save.assert_called_once_with(mock_invitation)
+        self.quiz_stats_repository_mock.record_invitation_sent.assert_called_once_with(mock_quiz.id)
         self.invitation_sender_mock.send_invitation_email.assert_called_once_with(
             invitation_id=self.invitation_id,
             invitation_acceptance_link=f"https://example.com/invitations/{self.invitation_id}/accept",
@@ -157,6 +161,7 @@ class TestSendInvitationCommandHandler(unittest.TestCase):
         self.user_repository_mock.find_or_fail_by_email.assert_not_called()
         self.invitation_repository_mock.save.assert_not_called()
         self.invitation_sender_mock.send_invitation_email.assert_not_called()
+        self.quiz_stats_repository_mock.record_invitation_sent.assert_not_called()
 
     @patch("quiz.application.send_invitation.send_invitation_command_handler.transaction")
     def test_handle_participant_not_found_raises_exception(self, mock_transaction):
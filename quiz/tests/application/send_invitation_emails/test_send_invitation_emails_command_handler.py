@@ -0,0 +1,73 @@
+import unittest
+from unittest.mock import Mock
+from uuid import UUID
+
+from quiz.application.send_invitation_emails.send_invitation_emails_command import SendInvitationEmailsCommand
+from quiz.application.send_invitation_emails.send_invitation_emails_command_handler import (
+    SendInvitationEmailsCommandHandler,
+)
+from quiz.domain.invitation.email_service import EmailService
+from quiz.domain.invitation.invitation import Invitation
+from quiz.domain.invitation.invitation_related_attribute import InvitationRelatedAttribute
+from quiz.domain.invitation.invitation_repository import InvitationRepository
+
+
+class TestSendInvitationEmailsCommandHandler(unittest.TestCase):
+    def setUp(self):
+        self.invitation_repository_mock = Mock(spec=InvitationRepository)
+        self.email_service_mock = Mock(spec=EmailService)
+        self.handler = SendInvitationEmailsCommandHandler(
+            invitation_repository=self.invitation_repository_mock, email_service=self.email_service_mock
+        )
+
+        self.invitation_id_1 = UUID("11111111-1111-1111-1111-111111111111")
+        self.invitation_id_2 = UUID("22222222-2222-2222-2222-222222222222")
+        self.links = {
+            self.invitation_id_1: "https://quiz.app/invitations/1/accept",
+            self.invitation_id_2: "https://quiz.app/invitations/2/accept",
+        }
+
+    def __create_invitation(self, invitation_id: UUID) -> Mock:
+        invitation = Mock(spec=Invitation)
+        invitation.id = invitation_id
+        return invitation
+
+    def test_handle_loads_invitations_in_one_query_and_sends_them_in_one_batch(self):
+        invitations = [self.__create_invitation(self.invitation_id_1), self.__create_invitation(self.invitation_id_2)]
+        self.invitation_repository_mock.find_by_ids.return_value = invitations
+        self.email_service_mock.send_invitation_emails.return_value = []
+
+        response = self.handler.handle(SendInvitationEmailsCommand(invitation_acceptance_links=self.links))
+
+        self.assertEqual(response.sent_count, 2)
+        self.assertEqual(response.failed_invitation_ids, [])
+        self.invitation_repository_mock.find_by_ids.assert_called_once_with(
+            [self.invitation_id_1, self.invitation_id_2],
+            related_attributes=[
+                InvitationRelatedAttribute.QUIZ,
+                InvitationRelatedAttribute.INVITED,
+                InvitationRelatedAttribute.INVITER,
+            ],
+        )
+        self.email_service_mock.send_invitation_emails.assert_called_once_with(invitations, self.links)
+
+    def test_handle_reports_failed_invitations(self):
+        invitations = [self.__create_invitation(self.invitation_id_1), self.__create_invitation(self.invitation_id_2)]
+        self.invitation_repository_mock.find_by_ids.return_value = invitations
+        self.email_service_mock.send_invitation_emails.return_value = [invitations[1]]
+
+        response = self.handler.handle(SendInvitationEmailsCommand(invitation_acceptance_links=self.links))
+
+        self.assertEqual(response.sent_count, 1)
+        self.assertEqual(response.failed_invitation_ids, [self.invitation_id_2])
+
+    def test_handle_skips_missing_invitations(self):
+        invitations = [self.__create_invitation(self.invitation_id_1)]
+        self.invitation_repository_mock.find_by_ids.return_value = invitations
+        self.email_service_mock.send_invitation_emails.return_value = []
+
+        response = self.handler.handle(SendInvitationEmailsCommand(invitation_acceptance_links=self.links))
+
+        self.assertEqual(response.sent_count, 1)
+        self.assertEqual(response.failed_invitation_ids, [])
+        self.email_service_mock.send_invitation_emails.assert_called_once_with(invitations, self.links)
@@ -8,11 +8,15 @@ from quiz.application.submit_quiz_answers.submit_quiz_answers_response import Su
 from quiz.domain.participation.answer_submission_repository import AnswerSubmissionRepository
 from quiz.domain.participation.incomplete_quiz_submission_exception import IncompleteQuizSubmissionException
 from quiz.domain.participation.participation import Participation
+from quiz.domain.participation.participation_not_found_for_quiz_and_participant_exception import (
+    ParticipationNotFoundForQuizAndParticipantException,
+)
 from quiz.domain.participation.participation_repository import ParticipationRepository
 from quiz.domain.participation.quiz_already_completed_exception import QuizAlreadyCompletedException
 from quiz.domain.participation.quiz_score_calculator import QuizScoreCalculator, QuizScoreResult
 from quiz.domain.quiz.quiz import Quiz
 from quiz.domain.quiz.quiz_repository import QuizRepository
+from quiz.domain.quiz.quiz_stats_repository import QuizStatsRepository
 
 
 class TestSubmitQuizAnswersCommandHandler(unittest.TestCase):
@@ -21,12 +25,14 @@ class TestSubmitQuizAnswersCommandHandler(unittest.TestCase):
         self.participation_repository_mock = Mock(spec=ParticipationRepository)
         self.answer_submission_repository_mock = Mock(spec=AnswerSubmissionRepository)
         self.quiz_score_calculator_mock = Mock(spec=QuizScoreCalculator)
+        self.quiz_stats_repository_mock = Mock(spec=QuizStatsRepository)
 
         self.handler = SubmitQuizAnswersCommandHandler(
             quiz_repository=self.quiz_repository_mock,
             participation_repository=self.participation_repository_mock,
             answer_submission_repository=self.answer_submission_repository_mock,
             quiz_score_calculator=self.quiz_score_calculator_mock,
+            quiz_stats_repository=self.quiz_stats_repository_mock,
         )
 
         self.quiz_id = UUID("12345678-1234-5678-9abc-123456789abc")
@@ -47,7 +53,6 @@ class TestSubmitQuizAnswersCommandHandler(unittest.TestCase):
         mock_quiz = Mock(spec=Quiz)
         mock_quiz.id = self.quiz_id
         mock_quiz.title = "JavaScript Fundamentals"
-        mock_quiz.total_questions = 2
 
         mock_participation = Mock(spec=Participation)
         mock_participation.id = self.participation_id
@@ -62,7 +67,7 @@ class TestSubmitQuizAnswersCommandHandler(unittest.TestCase):
         mock_transaction.atomic.return_value.__enter__ = Mock()
         mock_transaction.atomic.return_value.__exit__ = Mock()
 
-        self.quiz_repository_mock.find_or_fail_by_id.return_value = mock_quiz
+        mock_participation.quiz = mock_quiz
         self.participation_repository_mock.find_or_fail_by_quiz_and_participant.return_value = mock_participation
         self.quiz_score_calculator_mock.calculate.return_value = mock_score_result
 
@@ -77,15 +82,18 @@ class TestSubmitQuizAnswersCommandHandler(unittest.TestCase):
         self.assertEqual(result.total_possible_score, 100)
         self.assertEqual(result.completed_at, "2024-01-15T14:30:00Z")
 
-        self.quiz_repository_mock.find_or_fail_by_id.assert_called_once_with(
-            UUID("12345678-1234-5678-9abc-123456789abc")
-        )
+        self.quiz_repository_mock.find_or_fail_by_id.assert_not_called()
+        self.quiz_score_calculator_mock.calculate.assert_called_once()
+        self.assertEqual(self.quiz_score_calculator_mock.calculate.call_args.kwargs["quiz"], mock_quiz)
         self.participation_repository_mock.find_or_fail_by_quiz_and_participant.assert_called_once_with(
             self.quiz_id, self.participant_id
         )
         mock_participation.complete.assert_called_once_with(score=85)
         self.answer_submission_repository_mock.bulk_save.assert_called_once_with([])
         self.participation_repository_mock.save.assert_called_once_with(mock_participation)
+        self.quiz_stats_repository_mock.record_participation_completed.assert_called_once_with(
+            quiz_id=self.quiz_id, participant_id=self.participant_id, score=85
+        )
 
     @patch("quiz.application.submit_quiz_answers.submit_quiz_answers_command_handler.transaction")
     def test_handle_quiz_not_found_raises_exception(self, mock_transaction):
@@ -94,6 +102,9 @@ class TestSubmitQuizAnswersCommandHandler(unittest.TestCase):
         mock_transaction.atomic.return_value.__enter__ = Mock()
         mock_transaction.atomic.return_value.__exit__ = Mock()
 
+        self.participation_repository_mock.find_or_fail_by_quiz_and_participant.side_effect = (
+            ParticipationNotFoundForQuizAndParticipantException(self.quiz_id, self.participant_id)
+        )
         self.quiz_repository_mock.find_or_fail_by_id.side_effect = QuizNotFoundException(
             "12345678-1234-5678-9abc-123456789abc"
         )
@@ -101,22 +112,15 @@ class TestSubmitQuizAnswersCommandHandler(unittest.TestCase):
         with self.assertRaises(QuizNotFoundException):
             self.handler.handle(self.command)
 
-        self.participation_repository_mock.find_or_fail_by_quiz_and_participant.assert_not_called()
+        self.quiz_repository_mock.find_or_fail_by_id.assert_called_once_with(self.quiz_id)
         self.participation_repository_mock.save.assert_not_called()
 
     @patch("quiz.application.submit_quiz_answers.submit_quiz_answers_command_handler.transaction")
     def test_handle_participation_not_found_raises_exception(self, mock_transaction):
-        from quiz.domain.participation.participation_not_found_for_quiz_and_participant_exception import (
-            ParticipationNotFoundForQuizAndParticipantException,
-        )
-
-        mock_quiz = Mock(spec=Quiz)
-        mock_quiz.total_questions = 2
-
         mock_transaction.atomic.return_value.__enter__ = Mock()
         mock_transaction.atomic.return_value.__exit__ = Mock()
 
-        self.quiz_repository_mock.find_or_fail_by_id.return_value = mock_quiz
+        self.quiz_repository_mock.find_or_fail_by_id.return_value = Mock(spec=Quiz)
         self.participation_repository_mock.find_or_fail_by_quiz_and_participant.side_effect = (
             ParticipationNotFoundForQuizAndParticipantException(self.quiz_id, self.participant_id)
         )
@@ -129,7 +133,6 @@ class TestSubmitQuizAnswersCommandHandler(unittest.TestCase):
     @patch("quiz.application.submit_quiz_answers.submit_quiz_answers_command_handler.transaction")
     def test_handle_quiz_already_completed_raises_exception(self, mock_transaction):
         mock_quiz = Mock(spec=Quiz)
-        mock_quiz.total_questions = 2
 
         mock_participation = Mock(spec=Participation)
         mock_participation.is_completed.return_value = True
@@ -137,31 +140,36 @@ class TestSubmitQuizAnswersCommandHandler(unittest.TestCase):
         mock_transaction.atomic.return_value.__enter__ = Mock()
         mock_transaction.atomic.return_value.__exit__ = Mock()
 
-        self.quiz_repository_mock.find_or_fail_by_id.return_value = mock_quiz
+        mock_participation.quiz = mock_quiz
         self.participation_repository_mock.find_or_fail_by_quiz_and_participant.return_value = mock_participation
 
         with self.assertRaises(QuizAlreadyCompletedException):
             self.handler.handle(self.command)
 
         self.participation_repository_mock.save.assert_not_called()
+        self.quiz_stats_repository_mock.record_participation_completed.assert_not_called()
 
     @patch("quiz.application.submit_quiz_answers.submit_quiz_answers_command_handler.transaction")
     def test_handle_incomplete_quiz_submission_raises_exception(self, mock_transaction):
         mock_quiz = Mock(spec=Quiz)
-        mock_quiz.total_questions = 3  # Expecting 3 answers but command has only 2
+        mock_quiz.id = self.quiz_id
 
         mock_participation = Mock(spec=Participation)
         mock_participation.is_completed.return_value = False
+        self.quiz_score_calculator_mock.calculate.side_effect = IncompleteQuizSubmissionException(
+            quiz_id=self.quiz_id, expected_answers=3, received_answers=2
+        )
 
         mock_transaction.atomic.return_value.__enter__ = Mock()
         mock_transaction.atomic.return_value.__exit__ = Mock()
 
-        self.quiz_repository_mock.find_or_fail_by_id.return_value = mock_quiz
+        mock_participation.quiz = mock_quiz
         self.participation_repository_mock.find_or_fail_by_quiz_and_participant.return_value = mock_participation
 
         with self.assertRaises(IncompleteQuizSubmissionException):
             self.handler.handle(self.command)
 
+        mock_participation.complete.assert_not_called()
         self.participation_repository_mock.save.assert_not_called()
 
     @patch("quiz.application.submit_quiz_answers.submit_quiz_answers_command_handler.transaction")
@@ -173,7 +181,6 @@ class TestSubmitQuizAnswersCommandHandler(unittest.TestCase):
         mock_quiz = Mock(spec=Quiz)
         mock_quiz.id = self.quiz_id
         mock_quiz.title = "Single Question Quiz"
-        mock_quiz.total_questions = 1
 
         mock_participation = Mock(spec=Participation)
         mock_participation.id = self.participation_id
@@ -188,7 +195,7 @@ class TestSubmitQuizAnswersCommandHandler(unittest.TestCase):
         mock_transaction.atomic.return_value.__enter__ = Mock()
         mock_transaction.atomic.return_value.__exit__ = Mock()
 
-        self.quiz_repository_mock.find_or_fail_by_id.return_value = mock_quiz
+        mock_participation.quiz = mock_quiz
         self.participation_repository_mock.find_or_fail_by_quiz_and_participant.return_value = mock_participation
         self.quiz_score_calculator_mock.calculate.return_value = mock_score_result
 
@@ -203,7 +210,6 @@ class TestSubmitQuizAnswersCommandHandler(unittest.TestCase):
         mock_quiz = Mock(spec=Quiz)
         mock_quiz.id = self.quiz_id
         mock_quiz.title = "Failed Quiz"
-        mock_quiz.total_questions = 2
 
         mock_participation = Mock(spec=Participation)
         mock_participation.id = self.participation_id
@@ -218,7 +224,7 @@ class TestSubmitQuizAnswersCommandHandler(unittest.TestCase):
         mock_transaction.atomic.return_value.__enter__ = Mock()
         mock_transaction.atomic.return_value.__exit__ = Mock()
 
-        self.quiz_repository_mock.find_or_fail_by_id.return_value = mock_quiz
+        mock_participation.quiz = mock_quiz
         self.participation_repository_mock.find_or_fail_by_quiz_and_participant.return_value = mock_participation
         self.quiz_score_calculator_mock.calculate.return_value = mock_score_result
 
@@ -0,0 +1,31 @@
+import unittest
+from uuid import UUID
+
+from quiz.domain.quiz.answer_key import AnswerKey
+
+
+class TestAnswerKey(unittest.TestCase):
+    def setUp(self):
+        self.answer_key = AnswerKey(
+            quiz_id=UUID("12345678-1234-5678-9abc-123456789abc"),
+            question_points={1: 2, 2: 3},
+            answers={101: (1, True), 102: (1, False), 201: (2, True)},
+        )
+
+    def test_totals(self):
+        self.assertEqual(self.answer_key.total_questions, 2)
+        self.assertEqual(self.answer_key.total_possible_points, 5)
+
+    def test_has_question(self):
+        self.assertTrue(self.answer_key.has_question(1))
+        self.assertFalse(self.answer_key.has_question(3))
+
+    def test_is_answer_of_question(self):
+        self.assertTrue(self.answer_key.is_answer_of_question(102, 1))
+        self.assertFalse(self.answer_key.is_answer_of_question(201, 1))
+        self.assertFalse(self.answer_key.is_answer_of_question(999, 1))
+
+    def test_points_for_awards_question_points_only_for_correct_answers(self):
+        self.assertEqual(self.answer_key.points_for(1, 101), 2)
+        self.assertEqual(self.answer_key.points_for(1, 102), 0)
+        self.assertEqual(self.answer_key.points_for(2, 201), 3)
@@ -0,0 +1,39 @@
+import unittest
+from datetime import datetime, timezone
+from uuid import UUID
+
+from quiz.domain.pagination.invalid_page_cursor_exception import InvalidPageCursorException
+from quiz.domain.pagination.page_cursor import PageCursor
+
+
+class TestPageCursor(unittest.TestCase):
+    def setUp(self):
+        self.cursor = PageCursor(
+            created_at=datetime(2024, 1, 15, 10, 30, 0, 123456, tzinfo=timezone.utc),
+            id=UUID("01890a5d-ac96-774b-bcce-b302099a8057"),
+        )
+
+    def test_encode_and_decode_round_trip(self):
+        decoded_cursor = PageCursor.decode(self.cursor.encode())
+
+        self.assertEqual(decoded_cursor, self.cursor)
+
+    def test_encode_produces_url_safe_string(self):
+        encoded_cursor = self.cursor.encode()
+
+        self.assertNotIn("+", encoded_cursor)
+        self.assertNotIn("/", encoded_cursor)
+
+    def test_decode_raises_exception_for_non_base64_cursor(self):
+        with self.assertRaises(InvalidPageCursorException) as context:
+            PageCursor.decode("not a cursor!")
+
+        self.assertEqual(context.exception.cursor, "not a cursor!")
+
+    def test_decode_raises_exception_for_malformed_payload(self):
+        with self.assertRaises(InvalidPageCursorException):
+            PageCursor.decode("aW52YWxpZA==")
+
+    def test_decode_raises_exception_for_invalid_uuid(self):
+        with self.assertRaises(InvalidPageCursorException):
+            PageCursor.decode("MjAyNC0wMS0xNVQxMDozMDowMHxub3QtYS11dWlk")
@@ -0,0 +1,26 @@
+import unittest
+
+from quiz.domain.quiz.quiz_stats import QuizStats
+
+
+class TestQuizStats(unittest.TestCase):
+    def test_average_score_without_completed_participations(self):
+        self.assertEqual(QuizStats(participations_completed=0, total_score=0).average_score, 0.0)
+
+    def test_average_score(self):
+        self.assertEqual(QuizStats(participations_completed=4, total_score=330).average_score, 82.5)
+
+    def test_invitation_rates(self):
+        quiz_stats = QuizStats(invitations_sent=8, invitations_accepted=6)
+
+        self.assertEqual(quiz_stats.acceptance_rate, 75.0)
+        self.assertEqual(quiz_stats.pending_invitations, 2)
+
+    def test_rates_without_invitations_or_participations(self):
+        quiz_stats = QuizStats()
+
+        self.assertEqual(quiz_stats.acceptance_rate, 0.0)
+        self.assertEqual(quiz_stats.completion_rate, 0.0)
+
+    def test_completion_rate(self):
+        self.assertEqual(QuizStats(participations_started=4, participations_completed=3).completion_rate, 75.0)
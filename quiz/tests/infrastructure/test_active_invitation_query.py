@@ -0,0 +1,30 @@
+from django.test import TestCase, tag
+from django.utils import timezone
+
+from quiz.domain.invitation.invitation import Invitation
+from quiz.domain.quiz.quiz import Quiz
+from quiz.infrastructure.db_invitation_repository import DbInvitationRepository
+from user.domain.user import User
+
+
+@tag("postgres")
+class TestActiveInvitationQuery(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.creator = User.objects.create_user(username="creator", email="creator@test.com", password="password")
+        cls.invited = User.objects.create_user(username="invited", email="invited@test.com", password="password")
+        cls.quiz = Quiz.objects.create(title="Quiz", description="", creator=cls.creator)
+        cls.invitation = Invitation.objects.create(quiz=cls.quiz, inviter=cls.creator, invited=cls.invited)
+
+    def setUp(self):
+        self.repository = DbInvitationRepository()
+
+    def test_find_active_invitation_returns_pending_invitation_of_invited_user(self):
+        result = self.repository.find_active_invitation(self.quiz.id, self.invited.id)
+
+        self.assertEqual(result, self.invitation)
+
+    def test_find_active_invitation_returns_none_once_accepted(self):
+        Invitation.objects.filter(id=self.invitation.id).update(accepted_at=timezone.now())
+
+        self.assertIsNone(self.repository.find_active_invitation(self.quiz.id, self.invited.id))
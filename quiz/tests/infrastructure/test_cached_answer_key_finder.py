@@ -0,0 +1,79 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+from uuid import UUID
+
+from quiz.domain.quiz.answer_key import AnswerKey
+from quiz.domain.quiz.answer_key_finder import AnswerKeyFinder
+from quiz.domain.quiz.quiz import Quiz
+from quiz.infrastructure.cached_answer_key_finder import CachedAnswerKeyFinder
+
+
+class TestCachedAnswerKeyFinder(unittest.TestCase):
+    def setUp(self):
+        self.answer_key_finder_mock = Mock(spec=AnswerKeyFinder)
+        self.answer_key_finder_mock.find_by_quiz.side_effect = lambda quiz: AnswerKey(
+            quiz_id=quiz.id, question_points={1: 1}, answers={101: (1, True)}
+        )
+        self.now = 1000.0
+        self.finder = CachedAnswerKeyFinder(self.answer_key_finder_mock, max_size=2, timeout=60, clock=lambda: self.now)
+        self.updated_at = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        self.quiz_1 = self.__create_quiz(UUID("11111111-1111-1111-1111-111111111111"))
+        self.quiz_2 = self.__create_quiz(UUID("22222222-2222-2222-2222-222222222222"))
+        self.quiz_3 = self.__create_quiz(UUID("33333333-3333-3333-3333-333333333333"))
+
+    def test_find_by_quiz_loads_answer_key_once_while_fresh(self):
+        first = self.finder.find_by_quiz(self.quiz_1)
+        self.now += 59
+        second = self.finder.find_by_quiz(self.quiz_1)
+
+        self.assertIs(first, second)
+        self.answer_key_finder_mock.find_by_quiz.assert_called_once_with(self.quiz_1)
+
+    def test_find_by_quiz_reloads_expired_answer_key(self):
+        self.finder.find_by_quiz(self.quiz_1)
+        self.now += 60
+        self.finder.find_by_quiz(self.quiz_1)
+
+        self.assertEqual(self.answer_key_finder_mock.find_by_quiz.call_count, 2)
+
+    def test_find_by_quiz_reloads_answer_key_when_quiz_was_updated(self):
+        self.finder.find_by_quiz(self.quiz_1)
+        edited_quiz = self.__create_quiz(self.quiz_1.id, updated_at=self.updated_at + timedelta(seconds=1))
+
+        self.finder.find_by_quiz(edited_quiz)
+        self.finder.find_by_quiz(edited_quiz)
+
+        self.assertEqual(self.answer_key_finder_mock.find_by_quiz.call_count, 2)
+        self.answer_key_finder_mock.find_by_quiz.assert_called_with(edited_quiz)
+
+    def test_find_by_quiz_evicts_least_recently_used_answer_key(self):
+        self.finder.find_by_quiz(self.quiz_1)
+        self.finder.find_by_quiz(self.quiz_2)
+        self.finder.find_by_quiz(self.quiz_1)
+        self.finder.find_by_quiz(self.quiz_3)
+        self.answer_key_finder_mock.find_by_quiz.reset_mock()
+
+        self.finder.find_by_quiz(self.quiz_1)
+        self.finder.find_by_quiz(self.quiz_3)
+        self.answer_key_finder_mock.find_by_quiz.assert_not_called()
+
+        self.finder.find_by_quiz(self.quiz_2)
+        self.answer_key_finder_mock.find_by_quiz.assert_called_once_with(self.quiz_2)
+
+    def test_find_by_quiz_does_not_cache_failed_lookups(self):
+        self.answer_key_finder_mock.find_by_quiz.side_effect = [
+            RuntimeError("db down"),
+            AnswerKey(quiz_id=self.quiz_1.id, question_points={}, answers={}),
+        ]
+
+        with self.assertRaises(RuntimeError):
+            self.finder.find_by_quiz(self.quiz_1)
+
+        self.assertEqual(self.finder.find_by_quiz(self.quiz_1).quiz_id, self.quiz_1.id)
+
+    def __create_quiz(self, quiz_id: UUID, updated_at: datetime | None = None) -> Mock:
+        quiz = Mock(spec=Quiz)
+        quiz.id = quiz_id
+        quiz.updated_at = updated_at or self.updated_at
+        return quiz
@@ -121,3 +121,40 @@ class TestCeleryInvitationSender(unittest.TestCase):
             invitation_id=str(self.invitation_id),
             invitation_acceptance_link=complex_link,
         )
+
+    @patch("quiz.infrastructure.celery_invitacion_sender.send_invitation_emails_task")
+    def test_send_invitation_emails_enqueues_one_task_per_batch(self, mock_task):
+        sender = CeleryInvitationSender(batch_size=2)
+        invitation_ids = [
+            UUID("11111111-2222-3333-4444-555555555555"),
+            UUID("66666666-7777-8888-9999-aaaaaaaaaaaa"),
+            UUID("bbbbbbbb-cccc-dddd-eeee-ffffffffffff"),
+        ]
+
+        sender.send_invitation_emails({invitation_id: f"link-{invitation_id}" for invitation_id in invitation_ids})
+
+        self.assertEqual(mock_task.delay.call_count, 2)
+        mock_task.delay.assert_has_calls(
+            [
+                unittest.mock.call(
+                    invitations=[
+                        {"invitation_id": str(invitation_id), "invitation_acceptance_link": f"link-{invitation_id}"}
+                        for invitation_id in invitation_ids[:2]
+                    ]
+                ),
+                unittest.mock.call(
+                    invitations=[
+                        {
+                            "invitation_id": str(invitation_ids[2]),
+                            "invitation_acceptance_link": f"link-{invitation_ids[2]}",
+                        }
+                    ]
+                ),
+            ]
+        )
+
+    @patch("quiz.infrastructure.celery_invitacion_sender.send_invitation_emails_task")
+    def test_send_invitation_emails_with_no_invitations(self, mock_task):
+        self.sender.send_invitation_emails({})
+
+        mock_task.delay.assert_not_called()
@@ -0,0 +1,48 @@
+import unittest
+from unittest.mock import Mock, patch
+from uuid import UUID
+
+from quiz.domain.quiz.answer_key import AnswerKey
+from quiz.domain.quiz.quiz import Quiz
+from quiz.infrastructure.db_answer_key_finder import DbAnswerKeyFinder
+
+
+class TestDbAnswerKeyFinder(unittest.TestCase):
+    def setUp(self):
+        self.finder = DbAnswerKeyFinder()
+        self.quiz_id = UUID("12345678-1234-5678-9abc-123456789abc")
+        self.quiz = Mock(spec=Quiz)
+        self.quiz.id = self.quiz_id
+
+    @patch("quiz.domain.quiz.answer.Answer.objects")
+    def test_find_by_quiz_loads_answer_key_in_one_query(self, mock_objects):
+        mock_objects.filter.return_value.values_list.return_value = [
+            (1, 101, True, 2),
+            (1, 102, False, 2),
+            (2, 201, False, 3),
+            (2, 202, True, 3),
+        ]
+
+        result = self.finder.find_by_quiz(self.quiz)
+
+        self.assertEqual(
+            result,
+            AnswerKey(
+                quiz_id=self.quiz_id,
+                question_points={1: 2, 2: 3},
+                answers={101: (1, True), 102: (1, False), 201: (2, False), 202: (2, True)},
+            ),
+        )
+        mock_objects.filter.assert_called_once_with(question__quiz_id=self.quiz_id)
+        mock_objects.filter.return_value.values_list.assert_called_once_with(
+            "question_id", "id", "is_correct", "question__points"
+        )
+
+    @patch("quiz.domain.quiz.answer.Answer.objects")
+    def test_find_by_quiz_returns_empty_answer_key_for_quiz_without_questions(self, mock_objects):
+        mock_objects.filter.return_value.values_list.return_value = []
+
+        result = self.finder.find_by_quiz(self.quiz)
+
+        self.assertEqual(result.total_questions, 0)
+        self.assertEqual(result.answers, {})
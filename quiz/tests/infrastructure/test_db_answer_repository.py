@@ -95,109 +95,67 @@ class TestDbAnswerRepository(unittest.TestCase):
 
         self.assertIsNone(result)
 
-    @patch("quiz.domain.quiz.answer.Answer.objects")
-    def test_find_by_ids_success_with_multiple_answers(self, mock_objects):
-        answer1 = Mock(spec=Answer)
-        answer1.id = 1
-        answer1.text = "Answer 1"
-
-        answer2 = Mock(spec=Answer)
-        answer2.id = 2
-        answer2.text = "Answer 2"
-
-        answer3 = Mock(spec=Answer)
-        answer3.id = 3
-        answer3.text = "Answer 3"
-
-        mock_objects.filter.return_value = [answer1, answer2, answer3]
-        answer_ids = [1, 2, 3]
-
-        result = self.repository.find_by_ids(answer_ids)
+    def __build_integrity_error(self, constraint_name: str) -> IntegrityError:
+        class MockCause(Exception):
+            def __init__(self):
+                super().__init__("Database constraint violation")
+                self.diag = Mock(constraint_name=constraint_name)
 
-        expected_result = {1: answer1, 2: answer2, 3: answer3}
-        self.assertEqual(result, expected_result)
-        mock_objects.filter.assert_called_once_with(id__in=answer_ids)
+        integrity_error = IntegrityError("UNIQUE constraint failed")
+        integrity_error.__cause__ = MockCause()
+        return integrity_error
 
+    @patch("quiz.infrastructure.db_answer_repository.transaction")
     @patch("quiz.domain.quiz.answer.Answer.objects")
-    def test_find_by_ids_success_with_single_answer(self, mock_objects):
-        answer = Mock(spec=Answer)
-        answer.id = 1
-        answer.text = "Single Answer"
+    def test_bulk_save_inserts_all_answers_in_one_query(self, mock_objects, mock_transaction):
+        answers = [Mock(spec=Answer), Mock(spec=Answer), Mock(spec=Answer)]
 
-        mock_objects.filter.return_value = [answer]
-        answer_ids = [1]
-
-        result = self.repository.find_by_ids(answer_ids)
+        self.repository.bulk_save(answers)
 
-        expected_result = {1: answer}
-        self.assertEqual(result, expected_result)
+        mock_objects.bulk_create.assert_called_once_with(answers)
+        mock_transaction.atomic.assert_called_once()
+        for answer in answers:
+            answer.save.assert_not_called()
 
+    @patch("quiz.infrastructure.db_answer_repository.transaction")
     @patch("quiz.domain.quiz.answer.Answer.objects")
-    def test_find_by_ids_returns_empty_dict_when_no_answers_found(self, mock_objects):
-        mock_objects.filter.return_value = []
-        answer_ids = [1, 2, 3]
+    def test_bulk_save_raises_answer_already_exists_exception_for_duplicate_in_batch(
+        self, mock_objects, mock_transaction
+    ):
+        answer1 = Mock(spec=Answer, question_id=self.question_id, order=1)
+        answer2 = Mock(spec=Answer, question_id=self.question_id, order=2)
+        answer3 = Mock(spec=Answer, question_id=self.question_id, order=2)
+        mock_objects.bulk_create.side_effect = self.__build_integrity_error("quiz_answer_question_id_order_uniq")
+        mock_objects.filter.return_value.values_list.return_value = []
 
-        result = self.repository.find_by_ids(answer_ids)
+        with self.assertRaises(AnswerAlreadyExistsException) as context:
+            self.repository.bulk_save([answer1, answer2, answer3])
 
-        self.assertEqual(result, {})
+        self.assertEqual(context.exception.order, 2)
+        self.assertEqual(context.exception.question_id, self.question_id)
 
+    @patch("quiz.infrastructure.db_answer_repository.transaction")
     @patch("quiz.domain.quiz.answer.Answer.objects")
-    def test_find_by_ids_with_empty_list(self, mock_objects):
-        mock_objects.filter.return_value = []
-        answer_ids = []
-
-        result = self.repository.find_by_ids(answer_ids)
-
-        self.assertEqual(result, {})
-        mock_objects.filter.assert_called_once_with(id__in=[])
-
-    @patch.object(DbAnswerRepository, "save")
-    def test_bulk_save_success_with_multiple_answers(self, mock_save):
-        answer1 = Mock(spec=Answer)
-        answer1.id = 1
-
-        answer2 = Mock(spec=Answer)
-        answer2.id = 2
-
-        answer3 = Mock(spec=Answer)
-        answer3.id = 3
+    def test_bulk_save_raises_answer_already_exists_exception_for_stored_answer(self, mock_objects, mock_transaction):
+        answer1 = Mock(spec=Answer, question_id=self.question_id, order=1)
+        answer2 = Mock(spec=Answer, question_id=self.question_id, order=2)
+        mock_objects.bulk_create.side_effect = self.__build_integrity_error("quiz_answer_question_id_order_uniq")
+        mock_objects.filter.return_value.values_list.return_value = [(self.question_id, 2)]
 
-        answers = [answer1, answer2, answer3]
-
-        self.repository.bulk_save(answers)
-
-        self.assertEqual(mock_save.call_count, 3)
-        mock_save.assert_any_call(answer1)
-        mock_save.assert_any_call(answer2)
-        mock_save.assert_any_call(answer3)
-
-    @patch.object(DbAnswerRepository, "save")
-    def test_bulk_save_success_with_single_answer(self, mock_save):
-        answer = Mock(spec=Answer)
-        answer.id = 1
-
-        answers = [answer]
-
-        self.repository.bulk_save(answers)
-
-        mock_save.assert_called_once_with(answer)
-
-    @patch.object(DbAnswerRepository, "save")
-    def test_bulk_save_with_empty_list(self, mock_save):
-        answers = []
-
-        self.repository.bulk_save(answers)
+        with self.assertRaises(AnswerAlreadyExistsException) as context:
+            self.repository.bulk_save([answer1, answer2])
 
-        mock_save.assert_not_called()
+        self.assertEqual(context.exception.order, 2)
+        mock_objects.filter.assert_called_once_with(question_id__in={self.question_id})
 
-    @patch.object(DbAnswerRepository, "save")
-    def test_bulk_save_propagates_exception_from_save(self, mock_save):
-        answer = Mock(spec=Answer)
-        answer.order = self.answer_order
-        answer.question_id = self.question_id
+    @patch("quiz.infrastructure.db_answer_repository.transaction")
+    @patch("quiz.domain.quiz.answer.Answer.objects")
+    def test_bulk_save_raises_original_integrity_error_on_other_constraint_violation(
+        self, mock_objects, mock_transaction
+    ):
+        mock_objects.bulk_create.side_effect = self.__build_integrity_error("some_other_constraint")
 
-        mock_save.side_effect = AnswerAlreadyExistsException(order=self.answer_order, question_id=self.question_id)
-        answers = [answer]
+        with self.assertRaises(IntegrityError):
+            self.repository.bulk_save([Mock(spec=Answer)])
 
-        with self.assertRaises(AnswerAlreadyExistsException):
-            self.repository.bulk_save(answers)
+        mock_objects.filter.assert_not_called()
@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import Mock, patch
+from uuid import UUID
 
 from django.db import IntegrityError
 
@@ -71,77 +72,6 @@ class TestDbAnswerSubmissionRepository(unittest.TestCase):
         with self.assertRaises(IntegrityError):
             self.repository.save(answer_submission)
 
-    @patch.object(DbAnswerSubmissionRepository, "save")
-    def test_bulk_save_success_with_multiple_submissions(self, mock_save):
-        submission1 = Mock(spec=AnswerSubmission)
-        submission1.question = self.mock_question
-
-        submission2 = Mock(spec=AnswerSubmission)
-        submission2.question = self.mock_question
-
-        submission3 = Mock(spec=AnswerSubmission)
-        submission3.question = self.mock_question
-
-        submissions = [submission1, submission2, submission3]
-
-        self.repository.bulk_save(submissions)
-
-        self.assertEqual(mock_save.call_count, 3)
-        mock_save.assert_any_call(submission1)
-        mock_save.assert_any_call(submission2)
-        mock_save.assert_any_call(submission3)
-
-    @patch.object(DbAnswerSubmissionRepository, "save")
-    def test_bulk_save_success_with_single_submission(self, mock_save):
-        submission = Mock(spec=AnswerSubmission)
-        submission.question = self.mock_question
-
-        submissions = [submission]
-
-        self.repository.bulk_save(submissions)
-
-        mock_save.assert_called_once_with(submission)
-
-    @patch.object(DbAnswerSubmissionRepository, "save")
-    def test_bulk_save_with_empty_list(self, mock_save):
-        submissions = []
-
-        self.repository.bulk_save(submissions)
-
-        mock_save.assert_not_called()
-
-    @patch.object(DbAnswerSubmissionRepository, "save")
-    def test_bulk_save_propagates_exception_from_save(self, mock_save):
-        submission = Mock(spec=AnswerSubmission)
-        submission.question = self.mock_question
-
-        mock_save.side_effect = DuplicateAnswerSubmissionException(question_id=self.question_id)
-        submissions = [submission]
-
-        with self.assertRaises(DuplicateAnswerSubmissionException):
-            self.repository.bulk_save(submissions)
-
-    @patch.object(DbAnswerSubmissionRepository, "save")
-    def test_bulk_save_stops_on_first_exception(self, mock_save):
-        submission1 = Mock(spec=AnswerSubmission)
-        submission1.question = self.mock_question
-
-        submission2 = Mock(spec=AnswerSubmission)
-        submission2.question = self.mock_question
-
-        submission3 = Mock(spec=AnswerSubmission)
-        submission3.question = self.mock_question
-
-        mock_save.side_effect = [None, DuplicateAnswerSubmissionException(question_id=self.question_id), None]
-        submissions = [submission1, submission2, submission3]
-
-        with self.assertRaises(DuplicateAnswerSubmissionException):
-            self.repository.bulk_save(submissions)
-
-        self.assertEqual(mock_save.call_count, 2)
-        mock_save.assert_any_call(submission1)
-        mock_save.assert_any_call(submission2)
-
     def test_save_with_different_question_ids(self):
         different_question = Mock(spec=Question)
         different_question.id = 99
@@ -168,3 +98,86 @@ class TestDbAnswerSubmissionRepository(unittest.TestCase):
             self.repository.save(answer_submission)
 
         self.assertEqual(context.exception.question_id, 99)
+
+    def __build_integrity_error(self, constraint_name: str) -> IntegrityError:
+        class MockCause(Exception):
+            def __init__(self):
+                super().__init__("Database constraint violation")
+                self.diag = Mock(constraint_name=constraint_name)
+
+        integrity_error = IntegrityError("UNIQUE constraint failed")
+        integrity_error.__cause__ = MockCause()
+        return integrity_error
+
+    @patch("quiz.infrastructure.db_answer_submission_repository.transaction")
+    @patch("quiz.domain.participation.answer_submission.AnswerSubmission.objects")
+    def test_bulk_save_inserts_all_submissions_in_one_query(self, mock_objects, mock_transaction):
+        submissions = [Mock(spec=AnswerSubmission), Mock(spec=AnswerSubmission)]
+
+        self.repository.bulk_save(submissions)
+
+        mock_objects.bulk_create.assert_called_once_with(submissions)
+        mock_transaction.atomic.assert_called_once()
+        for submission in submissions:
+            submission.save.assert_not_called()
+
+    @patch("quiz.infrastructure.db_answer_submission_repository.transaction")
+    @patch("quiz.domain.participation.answer_submission.AnswerSubmission.objects")
+    def test_bulk_save_raises_duplicate_answer_submission_exception_for_duplicate_in_batch(
+        self, mock_objects, mock_transaction
+    ):
+        submission1 = Mock(spec=AnswerSubmission, participation_id=7, question_id=1)
+        submission2 = Mock(spec=AnswerSubmission, participation_id=7, question_id=1)
+        mock_objects.bulk_create.side_effect = self.__build_integrity_error(
+            "quiz_answersubmission_participation_id_question_id_uniq"
+        )
+        mock_objects.filter.return_value.values_list.return_value = []
+
+        with self.assertRaises(DuplicateAnswerSubmissionException) as context:
+            self.repository.bulk_save([submission1, submission2])
+
+        self.assertEqual(context.exception.question_id, 1)
+
+    @patch("quiz.infrastructure.db_answer_submission_repository.transaction")
+    @patch("quiz.domain.participation.answer_submission.AnswerSubmission.objects")
+    def test_bulk_save_raises_duplicate_answer_submission_exception_for_stored_submission(
+        self, mock_objects, mock_transaction
+    ):
+        submission1 = Mock(spec=AnswerSubmission, participation_id=7, question_id=1)
+        submission2 = Mock(spec=AnswerSubmission, participation_id=7, question_id=2)
+        mock_objects.bulk_create.side_effect = self.__build_integrity_error(
+            "quiz_answersubmission_participation_id_question_id_uniq"
+        )
+        mock_objects.filter.return_value.values_list.return_value = [(7, 2)]
+
+        with self.assertRaises(DuplicateAnswerSubmissionException) as context:
+            self.repository.bulk_save([submission1, submission2])
+
+        self.assertEqual(context.exception.question_id, 2)
+        mock_objects.filter.assert_called_once_with(participation_id__in={7})
+
+    @patch("quiz.infrastructure.db_answer_submission_repository.transaction")
+    @patch("quiz.domain.participation.answer_submission.AnswerSubmission.objects")
+    def test_bulk_save_raises_original_integrity_error_on_other_constraint_violation(
+        self, mock_objects, mock_transaction
+    ):
+        mock_objects.bulk_create.side_effect = self.__build_integrity_error("some_other_constraint")
+
+        with self.assertRaises(IntegrityError):
+            self.repository.bulk_save([Mock(spec=AnswerSubmission)])
+
+    @patch("quiz.domain.participation.answer_submission.AnswerSubmission.objects")
+    def test_stream_selected_answers_by_quiz(self, mock_objects):
+        quiz_id = UUID("12345678-1234-5678-9abc-123456789abc")
+        participation_id = UUID("87654321-4321-8765-cba9-987654321098")
+        mock_ordered = mock_objects.filter.return_value.order_by.return_value
+        mock_values_list = mock_ordered.values_list.return_value
+        mock_values_list.iterator.return_value = iter([(participation_id, 101)])
+
+        result = list(self.repository.stream_selected_answers_by_quiz(quiz_id))
+
+        self.assertEqual(result, [(participation_id, 101)])
+        mock_objects.filter.assert_called_once_with(participation__quiz_id=quiz_id)
+        mock_objects.filter.return_value.order_by.assert_called_once_with("participation_id")
+        mock_ordered.values_list.assert_called_once_with("participation_id", "selected_answer_id")
+        mock_values_list.iterator.assert_called_once_with(chunk_size=10000)
@@ -81,7 +81,7 @@ class TestDbInvitationRepository(unittest.TestCase):
         self.assertEqual(result, expected_invitation)
         mock_objects.select_related.assert_called_once_with("quiz", "invited")
         mock_select_related_queryset.get.assert_called_once_with(
-            quiz_id=self.quiz_id, participant_id=self.participant_id, accepted_at__isnull=True
+            quiz_id=self.quiz_id, invited_id=self.participant_id, accepted_at__isnull=True
         )
 
     @patch("quiz.domain.invitation.invitation.Invitation.objects")
@@ -94,6 +94,19 @@ class TestDbInvitationRepository(unittest.TestCase):
 
         self.assertIsNone(result)
 
+    @patch("django.db.models.query.QuerySet._fetch_all", autospec=True)
+    def test_find_active_invitation_filters_on_invited_field(self, mock_fetch_all):
+        def fetch_nothing(queryset):
+            queryset._result_cache = []
+
+        mock_fetch_all.side_effect = fetch_nothing
+
+        result = self.repository.find_active_invitation(self.quiz_id, self.participant_id)
+
+        self.assertIsNone(result)
+        where = str(mock_fetch_all.call_args.args[0].query.where)
+        self.assertIn("quiz.Invitation.invited)", where)
+
     def test_save_success(self):
         invitation = Mock(spec=Invitation)
         invitation.quiz = Mock(spec=Quiz)
@@ -154,24 +167,6 @@ class TestDbInvitationRepository(unittest.TestCase):
         with self.assertRaises(IntegrityError):
             self.repository.save(invitation)
 
-    @patch("quiz.domain.invitation.invitation.Invitation.objects")
-    def test_exists_by_quiz_and_participant_returns_true_when_exists(self, mock_objects):
-        mock_objects.filter.return_value.exists.return_value = True
-
-        result = self.repository.exists_by_quiz_and_invited(self.quiz_id, self.participant_id)
-
-        self.assertTrue(result)
-        mock_objects.filter.assert_called_once_with(quiz_id=self.quiz_id, invited_id=self.participant_id)
-
-    @patch("quiz.domain.invitation.invitation.Invitation.objects")
-    def test_exists_by_quiz_and_participant_returns_false_when_not_exists(self, mock_objects):
-        mock_objects.filter.return_value.exists.return_value = False
-
-        result = self.repository.exists_by_quiz_and_invited(self.quiz_id, self.participant_id)
-
-        self.assertFalse(result)
-        mock_objects.filter.assert_called_once_with(quiz_id=self.quiz_id, invited_id=self.participant_id)
-
     @patch("quiz.domain.invitation.invitation.Invitation.objects")
     def test_find_or_fail_by_id_with_empty_related_attributes_list(self, mock_objects):
         expected_invitation = Mock(spec=Invitation)
@@ -187,3 +182,66 @@ class TestDbInvitationRepository(unittest.TestCase):
 
         self.assertEqual(result, expected_invitation)
         mock_queryset.select_related.assert_called_once_with()
+
+    @patch("quiz.domain.invitation.invitation.Invitation.objects")
+    def test_bulk_save_skipping_existing_returns_only_inserted_invitations(self, mock_objects):
+        inserted_invitation = Mock(spec=Invitation)
+        inserted_invitation.id = UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa")
+        conflicting_invitation = Mock(spec=Invitation)
+        conflicting_invitation.id = UUID("bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb")
+        mock_objects.filter.return_value.values_list.return_value = [inserted_invitation.id]
+
+        result = self.repository.bulk_save_skipping_existing([inserted_invitation, conflicting_invitation])
+
+        self.assertEqual(result, [inserted_invitation])
+        mock_objects.bulk_create.assert_called_once_with(
+            [inserted_invitation, conflicting_invitation], ignore_conflicts=True
+        )
+        mock_objects.filter.assert_called_once_with(id__in=[inserted_invitation.id, conflicting_invitation.id])
+
+    @patch("quiz.domain.invitation.invitation.Invitation.objects")
+    def test_bulk_save_skipping_existing_with_no_invitations(self, mock_objects):
+        result = self.repository.bulk_save_skipping_existing([])
+
+        self.assertEqual(result, [])
+        mock_objects.bulk_create.assert_not_called()
+
+    @patch("quiz.domain.invitation.invitation.Invitation.objects")
+    def test_find_invited_ids_by_quiz(self, mock_objects):
+        other_participant_id = UUID("22222222-3333-4444-5555-666666666666")
+        mock_objects.filter.return_value.values_list.return_value = [self.participant_id]
+
+        result = self.repository.find_invited_ids_by_quiz(
+            quiz_id=self.quiz_id, invited_ids=[self.participant_id, other_participant_id]
+        )
+
+        self.assertEqual(result, {self.participant_id})
+        mock_objects.filter.assert_called_once_with(
+            quiz_id=self.quiz_id, invited_id__in=[self.participant_id, other_participant_id]
+        )
+        mock_objects.filter.return_value.values_list.assert_called_once_with("invited_id", flat=True)
+
+    @patch("quiz.domain.invitation.invitation.Invitation.objects")
+    def test_find_by_ids_loads_related_attributes_in_one_query(self, mock_objects):
+        expected_invitation = Mock(spec=Invitation)
+        mock_objects.filter.return_value.select_related.return_value = [expected_invitation]
+
+        result = self.repository.find_by_ids(
+            [self.invitation_id],
+            related_attributes=[InvitationRelatedAttribute.QUIZ, InvitationRelatedAttribute.INVITED],
+        )
+
+        self.assertEqual(result, [expected_invitation])
+        mock_objects.filter.assert_called_once_with(id__in=[self.invitation_id])
+        mock_objects.filter.return_value.select_related.assert_called_once_with(
+            InvitationRelatedAttribute.QUIZ, InvitationRelatedAttribute.INVITED
+        )
+
+    @patch("quiz.domain.invitation.invitation.Invitation.objects")
+    def test_find_by_ids_without_related_attributes(self, mock_objects):
+        mock_objects.filter.return_value = []
+
+        result = self.repository.find_by_ids([self.invitation_id])
+
+        self.assertEqual(result, [])
+        mock_objects.filter.assert_called_once_with(id__in=[self.invitation_id])
@@ -1,42 +1,44 @@
 import unittest
-from unittest.mock import Mock, patch
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock, Mock, patch
 from uuid import UUID
 
+from quiz.application.get_user_quizzes.get_user_quizzes_response import QuizParticipationSummary
 from quiz.domain.invitation.invitation import Invitation
+from quiz.domain.pagination.page import Page
+from quiz.domain.pagination.page_cursor import PageCursor
 from quiz.domain.participation.participation import Participation
+from quiz.domain.participation.participation_status import ParticipationStatus
 from quiz.domain.participation.quiz_progress_summary import QuizProgressSummary
+from quiz.domain.participation.quiz_score_distribution import QuizScoreDistribution, ScoreBucket
 from quiz.domain.participation.quiz_scores_summary import QuizScoresSummary
 from quiz.domain.participation.user_participation_data import UserParticipationData
+from quiz.domain.participation.user_quiz_progress_data import UserQuizProgressData
+from quiz.domain.quiz.quiz import Quiz
+from quiz.domain.quiz.quiz_stats import QuizStats
 from quiz.infrastructure.db_participation_finder import DbParticipationFinder
+from quiz.infrastructure.keyset_paginator import KeysetPaginator
 from user.domain.user import User
 
 
 class TestDbParticipationFinder(unittest.TestCase):
     def setUp(self):
-        self.finder = DbParticipationFinder()
+        self.paginator_mock = Mock(spec=KeysetPaginator)
+        self.finder = DbParticipationFinder(paginator=self.paginator_mock)
         self.quiz_id = UUID("12345678-1234-5678-9abc-123456789abc")
 
-    @patch("quiz.domain.participation.participation.Participation.objects")
-    def test_find_quiz_scores_summary_with_participants_and_scores(self, mock_objects):
-        mock_stats_data = {
-            "total_participants": 5,
-            "average_score": 78.5,
-            "max_score": 95.0,
-            "min_score": 45.0,
-        }
-
-        mock_top_scorer_participation = Mock(spec=Participation)
-        mock_participant = Mock(spec=User)
-        mock_participant.email = "top@student.com"
-        mock_top_scorer_participation.participant = mock_participant
-
-        mock_filter_queryset = Mock()
-        mock_filter_queryset.aggregate.return_value = mock_stats_data
-        mock_filter_queryset.select_related.return_value.order_by.return_value.first.return_value = (
-            mock_top_scorer_participation
-        )
-
-        mock_objects.filter.return_value = mock_filter_queryset
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
+    def test_find_quiz_scores_summary_reads_quiz_stats(self, mock_objects):
+        mock_top_scorer = Mock(spec=User)
+        mock_top_scorer.email = "top@student.com"
+        mock_quiz_stats = Mock(spec=QuizStats)
+        mock_quiz_stats.participations_started = 5
+        mock_quiz_stats.average_score = 78.5
+        mock_quiz_stats.max_score = 95
+        mock_quiz_stats.min_score = 45
+        mock_quiz_stats.top_scorer = mock_top_scorer
+        mock_objects.select_related.return_value.get.return_value = mock_quiz_stats
 
         result = self.finder.find_quiz_scores_summary(self.quiz_id)
 
@@ -46,118 +48,56 @@ class TestDbParticipationFinder(unittest.TestCase):
         self.assertEqual(result.max_score, 95.0)
         self.assertEqual(result.min_score, 45.0)
         self.assertEqual(result.top_scorer_email, "top@student.com")
-
-        self.assertEqual(mock_objects.filter.call_count, 2)
-        mock_objects.filter.assert_any_call(quiz_id=self.quiz_id)
-
-    @patch("quiz.domain.participation.participation.Participation.objects")
-    def test_find_quiz_scores_summary_with_no_participants(self, mock_objects):
-        mock_stats_data = {
-            "total_participants": 0,
-            "average_score": 0.0,
-            "max_score": 0.0,
-            "min_score": 0.0,
-        }
-
-        mock_filter_queryset = Mock()
-        mock_filter_queryset.aggregate.return_value = mock_stats_data
-        mock_filter_queryset.select_related.return_value.order_by.return_value.first.return_value = None
-
-        mock_objects.filter.return_value = mock_filter_queryset
+        mock_objects.select_related.assert_called_once_with("top_scorer")
+        mock_objects.select_related.return_value.get.assert_called_once_with(quiz_id=self.quiz_id)
+
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
+    def test_find_quiz_scores_summary_reads_quiz_stats_without_completed_scores(self, mock_objects):
+        mock_quiz_stats = Mock(spec=QuizStats)
+        mock_quiz_stats.participations_started = 3
+        mock_quiz_stats.average_score = 0.0
+        mock_quiz_stats.max_score = None
+        mock_quiz_stats.min_score = None
+        mock_quiz_stats.top_scorer = None
+        mock_objects.select_related.return_value.get.return_value = mock_quiz_stats
 
         result = self.finder.find_quiz_scores_summary(self.quiz_id)
 
-        self.assertIsInstance(result, QuizScoresSummary)
-        self.assertEqual(result.total_participants, 0)
+        self.assertEqual(result.total_participants, 3)
         self.assertEqual(result.average_score, 0.0)
         self.assertEqual(result.max_score, 0.0)
         self.assertEqual(result.min_score, 0.0)
         self.assertIsNone(result.top_scorer_email)
 
-    @patch("quiz.domain.participation.participation.Participation.objects")
-    def test_find_quiz_scores_summary_with_single_participant(self, mock_objects):
-        mock_stats_data = {
-            "total_participants": 1,
-            "average_score": 87.3,
-            "max_score": 87.3,
-            "min_score": 87.3,
-        }
-
-        mock_top_scorer_participation = Mock(spec=Participation)
-        mock_participant = Mock(spec=User)
-        mock_participant.email = "solo@student.com"
-        mock_top_scorer_participation.participant = mock_participant
-
-        mock_filter_queryset = Mock()
-        mock_filter_queryset.aggregate.return_value = mock_stats_data
-        mock_filter_queryset.select_related.return_value.order_by.return_value.first.return_value = (
-            mock_top_scorer_participation
-        )
-
-        mock_objects.filter.return_value = mock_filter_queryset
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
+    def test_find_quiz_scores_summary_rounds_quiz_stats_average(self, mock_objects):
+        mock_quiz_stats = Mock(spec=QuizStats)
+        mock_quiz_stats.participations_started = 7
+        mock_quiz_stats.average_score = 67.85714285714286
+        mock_quiz_stats.max_score = 96
+        mock_quiz_stats.min_score = 33
+        mock_quiz_stats.top_scorer = None
+        mock_objects.select_related.return_value.get.return_value = mock_quiz_stats
 
         result = self.finder.find_quiz_scores_summary(self.quiz_id)
 
-        self.assertIsInstance(result, QuizScoresSummary)
-        self.assertEqual(result.total_participants, 1)
-        self.assertEqual(result.average_score, 87.3)
-        self.assertEqual(result.max_score, 87.3)
-        self.assertEqual(result.min_score, 87.3)
-        self.assertEqual(result.top_scorer_email, "solo@student.com")
-
-    @patch("quiz.domain.participation.participation.Participation.objects")
-    def test_find_quiz_scores_summary_with_perfect_scores(self, mock_objects):
-        mock_stats_data = {
-            "total_participants": 3,
-            "average_score": 100.0,
-            "max_score": 100.0,
-            "min_score": 100.0,
-        }
-
-        mock_top_scorer_participation = Mock(spec=Participation)
-        mock_participant = Mock(spec=User)
-        mock_participant.email = "perfect@student.com"
-        mock_top_scorer_participation.participant = mock_participant
-
-        mock_filter_queryset = Mock()
-        mock_filter_queryset.aggregate.return_value = mock_stats_data
-        mock_filter_queryset.select_related.return_value.order_by.return_value.first.return_value = (
-            mock_top_scorer_participation
-        )
-
-        mock_objects.filter.return_value = mock_filter_queryset
-
-        result = self.finder.find_quiz_scores_summary(self.quiz_id)
-
-        self.assertIsInstance(result, QuizScoresSummary)
-        self.assertEqual(result.total_participants, 3)
-        self.assertEqual(result.average_score, 100.0)
-        self.assertEqual(result.max_score, 100.0)
-        self.assertEqual(result.min_score, 100.0)
-        self.assertEqual(result.top_scorer_email, "perfect@student.com")
+        self.assertEqual(result.average_score, 67.86)
 
-    @patch("quiz.domain.participation.participation.Participation.objects")
-    def test_find_quiz_scores_summary_rounds_fractional_scores(self, mock_objects):
-        mock_stats_data = {
+    @patch("quiz.domain.quiz.quiz.Quiz.objects")
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
+    def test_find_quiz_scores_summary_falls_back_to_single_aggregate_query(
+        self, mock_quiz_stats_objects, mock_quiz_objects
+    ):
+        mock_quiz_stats_objects.select_related.return_value.get.side_effect = QuizStats.DoesNotExist
+        mock_quiz_objects.filter.return_value.values.return_value.annotate.return_value.first.return_value = {
+            "id": self.quiz_id,
             "total_participants": 7,
             "average_score": 67.85714285714286,
             "max_score": 95.666666666666,
             "min_score": 33.33333333333333,
+            "top_scorer_email": "math@student.com",
         }
 
-        mock_top_scorer_participation = Mock(spec=Participation)
-        mock_participant = Mock(spec=User)
-        mock_participant.email = "math@student.com"
-        mock_top_scorer_participation.participant = mock_participant
-
-        mock_filter_queryset = Mock()
-        mock_filter_queryset.aggregate.return_value = mock_stats_data
-        mock_filter_queryset.select_related.return_value.order_by.return_value.first.return_value = (
-            mock_top_scorer_participation
-        )
-
-        mock_objects.filter.return_value = mock_filter_queryset
-
         result = self.finder.find_quiz_scores_summary(self.quiz_id)
 
         self.assertIsInstance(result, QuizScoresSummary)
@@ -166,155 +106,198 @@ class TestDbParticipationFinder(unittest.TestCase):
         self.assertEqual(result.max_score, 95.67)
         self.assertEqual(result.min_score, 33.33)
         self.assertEqual(result.top_scorer_email, "math@student.com")
-
-    @patch("quiz.domain.participation.participation.Participation.objects")
-    def test_find_quiz_scores_summary_with_participants_but_no_completed_scores(self, mock_objects):
-        mock_stats_data = {
-            "total_participants": 3,
+        mock_quiz_objects.filter.assert_called_once_with(id=self.quiz_id)
+        mock_quiz_objects.filter.return_value.values.return_value.annotate.return_value.first.assert_called_once()
+
+    @patch("quiz.domain.quiz.quiz.Quiz.objects")
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
+    def test_find_quiz_scores_summary_fallback_with_no_participants(self, mock_quiz_stats_objects, mock_quiz_objects):
+        mock_quiz_stats_objects.select_related.return_value.get.side_effect = QuizStats.DoesNotExist
+        mock_quiz_objects.filter.return_value.values.return_value.annotate.return_value.first.return_value = {
+            "id": self.quiz_id,
+            "total_participants": 0,
             "average_score": 0.0,
             "max_score": 0.0,
             "min_score": 0.0,
+            "top_scorer_email": None,
         }
 
-        mock_filter_queryset = Mock()
-        mock_filter_queryset.aggregate.return_value = mock_stats_data
-        mock_filter_queryset.select_related.return_value.order_by.return_value.first.return_value = None
-
-        mock_objects.filter.return_value = mock_filter_queryset
-
         result = self.finder.find_quiz_scores_summary(self.quiz_id)
 
-        self.assertIsInstance(result, QuizScoresSummary)
-        self.assertEqual(result.total_participants, 3)
+        self.assertEqual(result.total_participants, 0)
         self.assertEqual(result.average_score, 0.0)
-        self.assertEqual(result.max_score, 0.0)
-        self.assertEqual(result.min_score, 0.0)
         self.assertIsNone(result.top_scorer_email)
 
-    @patch("quiz.domain.participation.participation.Participation.objects")
-    def test_find_quiz_scores_summary_different_quiz_id(self, mock_objects):
-        different_quiz_id = UUID("aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee")
-
-        mock_stats_data = {
-            "total_participants": 2,
-            "average_score": 90.5,
-            "max_score": 98.0,
-            "min_score": 83.0,
-        }
+    @patch("quiz.domain.quiz.quiz.Quiz.objects")
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
+    def test_find_quiz_scores_summary_fallback_when_quiz_does_not_exist(
+        self, mock_quiz_stats_objects, mock_quiz_objects
+    ):
+        mock_quiz_stats_objects.select_related.return_value.get.side_effect = QuizStats.DoesNotExist
+        mock_quiz_objects.filter.return_value.values.return_value.annotate.return_value.first.return_value = None
 
-        mock_top_scorer_participation = Mock(spec=Participation)
-        mock_participant = Mock(spec=User)
-        mock_participant.email = "different@student.com"
-        mock_top_scorer_participation.participant = mock_participant
+        result = self.finder.find_quiz_scores_summary(self.quiz_id)
 
-        mock_filter_queryset = Mock()
-        mock_filter_queryset.aggregate.return_value = mock_stats_data
-        mock_filter_queryset.select_related.return_value.order_by.return_value.first.return_value = (
-            mock_top_scorer_participation
+        self.assertEqual(
+            result,
+            QuizScoresSummary(
+                total_participants=0, average_score=0.0, max_score=0.0, min_score=0.0, top_scorer_email=None
+            ),
         )
 
-        mock_objects.filter.return_value = mock_filter_queryset
-
-        result = self.finder.find_quiz_scores_summary(different_quiz_id)
-
-        self.assertIsInstance(result, QuizScoresSummary)
-        self.assertEqual(result.total_participants, 2)
-        self.assertEqual(result.average_score, 90.5)
-        self.assertEqual(result.max_score, 98.0)
-        self.assertEqual(result.min_score, 83.0)
-        self.assertEqual(result.top_scorer_email, "different@student.com")
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
+    def test_find_quiz_scores_version_reads_quiz_stats_updated_at(self, mock_objects):
+        updated_at = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        mock_objects.filter.return_value.values_list.return_value.first.return_value = updated_at
+
+        result = self.finder.find_quiz_scores_version(self.quiz_id)
+
+        self.assertEqual(result, updated_at)
+        mock_objects.filter.assert_called_once_with(quiz_id=self.quiz_id)
+        mock_objects.filter.return_value.values_list.assert_called_once_with("updated_at", flat=True)
+
+    @patch("quiz.infrastructure.db_participation_finder.connection")
+    def test_find_quiz_score_distribution_runs_single_query(self, mock_connection):
+        mock_cursor = MagicMock()
+        mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_cursor.fetchone.return_value = (
+            20,
+            5,
+            [Decimal("12.0"), Decimal("18.6"), Decimal("19.86")],
+            {"2": 1, "4": 4},
+        )
 
-        self.assertEqual(mock_objects.filter.call_count, 2)
-        mock_objects.filter.assert_any_call(quiz_id=different_quiz_id)
+        result = self.finder.find_quiz_score_distribution(self.quiz_id, bucket_count=4)
+
+        self.assertEqual(
+            result,
+            QuizScoreDistribution(
+                total_scored=5,
+                max_possible_score=20,
+                p50=12.0,
+                p90=18.6,
+                p99=19.86,
+                buckets=[
+                    ScoreBucket(min_score=0.0, max_score=5.0, count=0),
+                    ScoreBucket(min_score=5.0, max_score=10.0, count=1),
+                    ScoreBucket(min_score=10.0, max_score=15.0, count=0),
+                    ScoreBucket(min_score=15.0, max_score=20.0, count=4),
+                ],
+            ),
+        )
+        mock_cursor.execute.assert_called_once()
+        self.assertEqual(mock_cursor.execute.call_args[0][1], {"quiz_id": self.quiz_id, "bucket_count": 4})
+
+    @patch("quiz.infrastructure.db_participation_finder.connection")
+    def test_find_quiz_score_distribution_without_scores(self, mock_connection):
+        mock_cursor = MagicMock()
+        mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_cursor.fetchone.return_value = (0, 0, None, None)
+
+        result = self.finder.find_quiz_score_distribution(self.quiz_id, bucket_count=2)
+
+        self.assertEqual(result.total_scored, 0)
+        self.assertEqual((result.p50, result.p90, result.p99), (0.0, 0.0, 0.0))
+        self.assertEqual(
+            result.buckets,
+            [ScoreBucket(min_score=0.0, max_score=0.5, count=0), ScoreBucket(min_score=0.5, max_score=1.0, count=0)],
+        )
 
     @patch("quiz.domain.participation.participation.Participation.objects")
-    def test_find_user_participation_for_quiz_success_completed(self, mock_objects):
+    def test_find_user_quiz_progress_success_completed(self, mock_objects):
         user_id = UUID("87654321-4321-8765-cba9-987654321098")
 
+        mock_quiz = Mock(spec=Quiz)
+        mock_quiz.id = self.quiz_id
+        mock_quiz.title = "JavaScript Fundamentals"
+        mock_quiz.description = "Learn the basics of JavaScript"
+        mock_quiz.total_questions = 10
+        mock_quiz.total_possible_points = 100
+        mock_quiz.get_formatted_created_at.return_value = "2024-01-15T09:00:00.000000Z"
+
         mock_invitation = Mock(spec=Invitation)
         mock_invitation.get_formatted_invited_at.return_value = "2024-01-15T10:30:00.000000Z"
 
         mock_participation = Mock(spec=Participation)
+        mock_participation.quiz = mock_quiz
         mock_participation.status.value = "completed"
         mock_participation.invitation = mock_invitation
         mock_participation.score = 85
         mock_participation.get_formatted_created_at.return_value = "2024-01-15T11:00:00.000000Z"
         mock_participation.get_formatted_completed_at.return_value = "2024-01-16T14:20:00.000000Z"
 
-        mock_objects.select_related.return_value.get.return_value = mock_participation
-
-        result = self.finder.find_user_participation_for_quiz(self.quiz_id, user_id)
-
-        self.assertIsInstance(result, UserParticipationData)
-        self.assertEqual(result.status, "completed")
-        self.assertEqual(result.invited_at, "2024-01-15T10:30:00.000000Z")
-        self.assertEqual(result.started_at, "2024-01-15T11:00:00.000000Z")
-        self.assertEqual(result.completed_at, "2024-01-16T14:20:00.000000Z")
-        self.assertEqual(result.score, 85)
-
-        mock_objects.select_related.assert_called_once_with("invitation")
-        mock_objects.select_related.return_value.get.assert_called_once_with(
-            quiz_id=self.quiz_id, participant_id=user_id
+        mock_queryset = mock_objects.select_related.return_value.only.return_value
+        mock_queryset.get.return_value = mock_participation
+
+        result = self.finder.find_user_quiz_progress(self.quiz_id, user_id)
+
+        self.assertEqual(
+            result,
+            UserQuizProgressData(
+                quiz_id=str(self.quiz_id),
+                quiz_title="JavaScript Fundamentals",
+                quiz_description="Learn the basics of JavaScript",
+                total_questions=10,
+                total_possible_points=100,
+                quiz_created_at="2024-01-15T09:00:00.000000Z",
+                participation=UserParticipationData(
+                    status="completed",
+                    invited_at="2024-01-15T10:30:00.000000Z",
+                    started_at="2024-01-15T11:00:00.000000Z",
+                    completed_at="2024-01-16T14:20:00.000000Z",
+                    score=85,
+                ),
+            ),
         )
 
+        mock_objects.select_related.assert_called_once_with("quiz", "invitation")
+        self.assertIn("quiz__total_possible_points", mock_objects.select_related.return_value.only.call_args.args)
+        mock_queryset.get.assert_called_once_with(quiz_id=self.quiz_id, participant_id=user_id)
+
     @patch("quiz.domain.participation.participation.Participation.objects")
-    def test_find_user_participation_for_quiz_success_invited_no_invitation(self, mock_objects):
+    def test_find_user_quiz_progress_success_invited_no_invitation(self, mock_objects):
         user_id = UUID("87654321-4321-8765-cba9-987654321098")
 
         mock_participation = Mock(spec=Participation)
+        mock_participation.quiz = Mock(spec=Quiz)
         mock_participation.status.value = "invited"
         mock_participation.invitation = None
         mock_participation.score = None
         mock_participation.get_formatted_created_at.return_value = "2024-01-20T11:00:00.000000Z"
         mock_participation.get_formatted_completed_at.return_value = None
 
-        mock_objects.select_related.return_value.get.return_value = mock_participation
+        mock_objects.select_related.return_value.only.return_value.get.return_value = mock_participation
 
-        result = self.finder.find_user_participation_for_quiz(self.quiz_id, user_id)
+        result = self.finder.find_user_quiz_progress(self.quiz_id, user_id)
 
-        self.assertIsInstance(result, UserParticipationData)
-        self.assertEqual(result.status, "invited")
-        self.assertEqual(result.invited_at, None)
-        self.assertEqual(result.started_at, "2024-01-20T11:00:00.000000Z")
-        self.assertEqual(result.completed_at, None)
-        self.assertEqual(result.score, None)
+        self.assertEqual(
+            result.participation,
+            UserParticipationData(
+                status="invited",
+                invited_at=None,
+                started_at="2024-01-20T11:00:00.000000Z",
+                completed_at=None,
+                score=None,
+            ),
+        )
 
     @patch("quiz.domain.participation.participation.Participation.objects")
-    def test_find_user_participation_for_quiz_not_found(self, mock_objects):
+    def test_find_user_quiz_progress_not_found(self, mock_objects):
         user_id = UUID("87654321-4321-8765-cba9-987654321098")
 
-        mock_objects.select_related.return_value.get.side_effect = Participation.DoesNotExist
+        mock_objects.select_related.return_value.only.return_value.get.side_effect = Participation.DoesNotExist
 
-        result = self.finder.find_user_participation_for_quiz(self.quiz_id, user_id)
+        result = self.finder.find_user_quiz_progress(self.quiz_id, user_id)
 
         self.assertIsNone(result)
 
-    @patch("quiz.domain.participation.participation.Participation.objects")
-    def test_find_user_participation_for_quiz_different_ids(self, mock_objects):
-        different_quiz_id = UUID("99999999-8888-7777-6666-555555555555")
-        different_user_id = UUID("77777777-6666-5555-4444-333333333333")
-
-        mock_participation = Mock(spec=Participation)
-        mock_participation.status.value = "in_progress"
-        mock_participation.invitation = None
-        mock_participation.score = None
-        mock_participation.get_formatted_created_at.return_value = "2024-03-01T10:00:00.000000Z"
-        mock_participation.get_formatted_completed_at.return_value = None
-
-        mock_objects.select_related.return_value.get.return_value = mock_participation
-
-        result = self.finder.find_user_participation_for_quiz(different_quiz_id, different_user_id)
-
-        self.assertIsInstance(result, UserParticipationData)
-        self.assertEqual(result.status, "in_progress")
-
-        mock_objects.select_related.return_value.get.assert_called_once_with(
-            quiz_id=different_quiz_id, participant_id=different_user_id
-        )
-
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
     @patch("quiz.domain.participation.participation.Participation.objects")
     @patch("quiz.domain.invitation.invitation.Invitation.objects")
-    def test_find_creator_quiz_progress_summary_active_quiz(self, mock_invitation_objects, mock_participation_objects):
+    def test_find_creator_quiz_progress_summary_active_quiz(
+        self, mock_invitation_objects, mock_participation_objects, mock_quiz_stats_objects
+    ):
+        mock_quiz_stats_objects.get.side_effect = QuizStats.DoesNotExist
         mock_invitation_stats = {
             "total_sent": 10,
             "total_accepted": 8,
@@ -344,11 +327,13 @@ class TestDbParticipationFinder(unittest.TestCase):
         mock_invitation_objects.filter.assert_called_once_with(quiz_id=self.quiz_id)
         mock_participation_objects.filter.assert_called_once_with(quiz_id=self.quiz_id)
 
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
     @patch("quiz.domain.participation.participation.Participation.objects")
     @patch("quiz.domain.invitation.invitation.Invitation.objects")
     def test_find_creator_quiz_progress_summary_new_quiz_no_invitations(
-        self, mock_invitation_objects, mock_participation_objects
+        self, mock_invitation_objects, mock_participation_objects, mock_quiz_stats_objects
     ):
+        mock_quiz_stats_objects.get.side_effect = QuizStats.DoesNotExist
         mock_invitation_stats = {
             "total_sent": 0,
             "total_accepted": 0,
@@ -375,11 +360,13 @@ class TestDbParticipationFinder(unittest.TestCase):
         self.assertEqual(result.participation_stats.completed_participants, 0)
         self.assertEqual(result.participation_stats.completion_rate, 0.0)
 
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
     @patch("quiz.domain.participation.participation.Participation.objects")
     @patch("quiz.domain.invitation.invitation.Invitation.objects")
     def test_find_creator_quiz_progress_summary_perfect_rates(
-        self, mock_invitation_objects, mock_participation_objects
+        self, mock_invitation_objects, mock_participation_objects, mock_quiz_stats_objects
     ):
+        mock_quiz_stats_objects.get.side_effect = QuizStats.DoesNotExist
         mock_invitation_stats = {
             "total_sent": 5,
             "total_accepted": 5,
@@ -398,11 +385,13 @@ class TestDbParticipationFinder(unittest.TestCase):
         self.assertEqual(result.invitation_stats.acceptance_rate, 100.0)
         self.assertEqual(result.participation_stats.completion_rate, 100.0)
 
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
     @patch("quiz.domain.participation.participation.Participation.objects")
     @patch("quiz.domain.invitation.invitation.Invitation.objects")
     def test_find_creator_quiz_progress_summary_low_engagement(
-        self, mock_invitation_objects, mock_participation_objects
+        self, mock_invitation_objects, mock_participation_objects, mock_quiz_stats_objects
     ):
+        mock_quiz_stats_objects.get.side_effect = QuizStats.DoesNotExist
         mock_invitation_stats = {
             "total_sent": 20,
             "total_accepted": 3,
@@ -422,11 +411,13 @@ class TestDbParticipationFinder(unittest.TestCase):
         self.assertEqual(result.invitation_stats.pending_invitations, 17)
         self.assertEqual(result.participation_stats.completion_rate, 33.33)
 
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
     @patch("quiz.domain.participation.participation.Participation.objects")
     @patch("quiz.domain.invitation.invitation.Invitation.objects")
     def test_find_creator_quiz_progress_summary_with_different_quiz_id(
-        self, mock_invitation_objects, mock_participation_objects
+        self, mock_invitation_objects, mock_participation_objects, mock_quiz_stats_objects
     ):
+        mock_quiz_stats_objects.get.side_effect = QuizStats.DoesNotExist
         different_quiz_id = UUID("99999999-8888-7777-6666-555555555555")
 
         mock_invitation_stats = {
@@ -452,11 +443,13 @@ class TestDbParticipationFinder(unittest.TestCase):
         mock_invitation_objects.filter.assert_called_once_with(quiz_id=different_quiz_id)
         mock_participation_objects.filter.assert_called_once_with(quiz_id=different_quiz_id)
 
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
     @patch("quiz.domain.participation.participation.Participation.objects")
     @patch("quiz.domain.invitation.invitation.Invitation.objects")
     def test_find_creator_quiz_progress_summary_partial_acceptance_partial_completion(
-        self, mock_invitation_objects, mock_participation_objects
+        self, mock_invitation_objects, mock_participation_objects, mock_quiz_stats_objects
     ):
+        mock_quiz_stats_objects.get.side_effect = QuizStats.DoesNotExist
         mock_invitation_stats = {
             "total_sent": 13,
             "total_accepted": 7,
@@ -475,3 +468,99 @@ class TestDbParticipationFinder(unittest.TestCase):
         self.assertEqual(result.invitation_stats.acceptance_rate, 53.85)
         self.assertEqual(result.invitation_stats.pending_invitations, 6)
         self.assertEqual(result.participation_stats.completion_rate, 71.43)
+
+    @patch("quiz.domain.participation.participation.Participation.objects")
+    @patch("quiz.domain.invitation.invitation.Invitation.objects")
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
+    def test_find_creator_quiz_progress_summary_reads_quiz_stats(
+        self, mock_quiz_stats_objects, mock_invitation_objects, mock_participation_objects
+    ):
+        mock_quiz_stats_objects.get.return_value = QuizStats(
+            quiz_id=self.quiz_id,
+            invitations_sent=30000,
+            invitations_accepted=12000,
+            participations_started=12000,
+            participations_completed=9000,
+        )
+
+        result = self.finder.find_creator_quiz_progress_summary(self.quiz_id)
+
+        self.assertEqual(result.invitation_stats.total_sent, 30000)
+        self.assertEqual(result.invitation_stats.total_accepted, 12000)
+        self.assertEqual(result.invitation_stats.acceptance_rate, 40.0)
+        self.assertEqual(result.invitation_stats.pending_invitations, 18000)
+        self.assertEqual(result.participation_stats.total_participants, 12000)
+        self.assertEqual(result.participation_stats.completed_participants, 9000)
+        self.assertEqual(result.participation_stats.completion_rate, 75.0)
+
+        mock_quiz_stats_objects.get.assert_called_once_with(quiz_id=self.quiz_id)
+        mock_invitation_objects.filter.assert_not_called()
+        mock_participation_objects.filter.assert_not_called()
+
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
+    def test_find_creator_quiz_progress_summary_reads_empty_quiz_stats(self, mock_quiz_stats_objects):
+        mock_quiz_stats_objects.get.return_value = QuizStats(quiz_id=self.quiz_id)
+
+        result = self.finder.find_creator_quiz_progress_summary(self.quiz_id)
+
+        self.assertEqual(result.invitation_stats.acceptance_rate, 0.0)
+        self.assertEqual(result.invitation_stats.pending_invitations, 0)
+        self.assertEqual(result.participation_stats.completion_rate, 0.0)
+
+    @patch("quiz.domain.participation.participation.Participation.objects")
+    def test_find_quiz_participation_summaries_by_user_id_uses_annotated_participant_counts(self, mock_objects):
+        user_id = UUID("87654321-4321-8765-cba9-987654321098")
+
+        mock_quiz = Mock(spec=Quiz)
+        mock_quiz.id = self.quiz_id
+        mock_quiz.title = "JavaScript Fundamentals"
+        mock_quiz.description = "Learn JavaScript basics"
+        mock_quiz.total_questions = 10
+        mock_quiz.get_formatted_created_at.return_value = "2024-01-01T12:00:00.000000Z"
+
+        mock_participation = Mock(spec=Participation)
+        mock_participation.quiz = mock_quiz
+        mock_participation.quiz_participants_count = 25
+        mock_participation.score = 85
+        mock_participation.status = ParticipationStatus.COMPLETED
+        mock_participation.get_formatted_completed_at.return_value = "2024-01-02T10:15:00.000000Z"
+        mock_participation.get_formatted_created_at.return_value = "2024-01-01T13:00:00.000000Z"
+
+        next_cursor = PageCursor(created_at=datetime(2024, 1, 1, tzinfo=timezone.utc), id=self.quiz_id)
+        self.paginator_mock.paginate.return_value = Page(items=[mock_participation], next_cursor=next_cursor)
+
+        result = self.finder.find_quiz_participation_summaries_by_user_id(user_id, limit=1)
+
+        self.assertEqual(
+            result.items,
+            [
+                QuizParticipationSummary(
+                    quiz_id=self.quiz_id,
+                    quiz_title="JavaScript Fundamentals",
+                    quiz_description="Learn JavaScript basics",
+                    total_questions=10,
+                    total_participants=25,
+                    quiz_created_at="2024-01-01T12:00:00.000000Z",
+                    participation_status=ParticipationStatus.COMPLETED,
+                    score=85,
+                    completed_at="2024-01-02T10:15:00.000000Z",
+                    participation_created_at="2024-01-01T13:00:00.000000Z",
+                )
+            ],
+        )
+        self.assertEqual(result.next_cursor, next_cursor)
+
+        mock_objects.filter.assert_any_call(participant_id=user_id)
+        mock_queryset = mock_objects.filter.return_value.select_related.return_value
+        mock_objects.filter.return_value.select_related.assert_called_once_with("quiz")
+        self.assertEqual(set(mock_queryset.annotate.call_args.kwargs), {"quiz_participants_count"})
+        self.paginator_mock.paginate.assert_called_once_with(mock_queryset.annotate.return_value, limit=1, cursor=None)
+
+    @patch("quiz.domain.participation.participation.Participation.objects")
+    def test_find_quiz_participation_summaries_by_user_id_returns_empty_page(self, mock_objects):
+        self.paginator_mock.paginate.return_value = Page(items=[])
+
+        result = self.finder.find_quiz_participation_summaries_by_user_id(self.quiz_id, limit=20)
+
+        self.assertEqual(result.items, [])
+        self.assertIsNone(result.next_cursor)
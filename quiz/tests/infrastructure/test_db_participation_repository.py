@@ -9,7 +9,6 @@ from quiz.domain.participation.participation_already_exists_exception import Par
 from quiz.domain.participation.participation_not_found_for_quiz_and_participant_exception import (
     ParticipationNotFoundForQuizAndParticipantException,
 )
-from quiz.domain.participation.participation_related_attribute import ParticipationRelatedAttribute
 from quiz.domain.quiz.quiz import Quiz
 from quiz.infrastructure.db_participation_repository import DbParticipationRepository
 from user.domain.user import User
@@ -30,54 +29,6 @@ class TestDbParticipationRepository(unittest.TestCase):
         self.mock_participant.id = self.participant_id
         self.mock_participant.email = "participant@test.com"
 
-    @patch("quiz.domain.participation.participation.Participation.objects")
-    def test_find_all_by_user_id_without_related_attributes(self, mock_objects):
-        participation1 = Mock(spec=Participation)
-        participation1.id = UUID("aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee")
-
-        participation2 = Mock(spec=Participation)
-        participation2.id = UUID("bbbbbbbb-cccc-dddd-eeee-ffffffffffff")
-
-        mock_queryset = Mock()
-        mock_queryset.order_by.return_value = [participation1, participation2]
-        mock_objects.filter.return_value = mock_queryset
-
-        result = self.repository.find_all_by_user_id(self.user_id)
-
-        self.assertEqual(result, [participation1, participation2])
-        mock_objects.filter.assert_called_once_with(participant_id=self.user_id)
-        mock_queryset.order_by.assert_called_once_with("-quiz__created_at")
-
-    @patch("quiz.domain.participation.participation.Participation.objects")
-    def test_find_all_by_user_id_with_related_attributes(self, mock_objects):
-        participation1 = Mock(spec=Participation)
-        participation1.id = UUID("aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee")
-
-        related_attributes = [ParticipationRelatedAttribute.QUIZ, ParticipationRelatedAttribute.PARTICIPANT]
-
-        mock_queryset = Mock()
-        mock_select_related_queryset = Mock()
-        mock_queryset.select_related.return_value = mock_select_related_queryset
-        mock_select_related_queryset.order_by.return_value = [participation1]
-        mock_objects.filter.return_value = mock_queryset
-
-        result = self.repository.find_all_by_user_id(self.user_id, related_attributes)
-
-        self.assertEqual(result, [participation1])
-        mock_objects.filter.assert_called_once_with(participant_id=self.user_id)
-        mock_queryset.select_related.assert_called_once_with(*related_attributes)
-        mock_select_related_queryset.order_by.assert_called_once_with("-quiz__created_at")
-
-    @patch("quiz.domain.participation.participation.Participation.objects")
-    def test_find_all_by_user_id_returns_empty_list_when_no_participations(self, mock_objects):
-        mock_queryset = Mock()
-        mock_queryset.order_by.return_value = []
-        mock_objects.filter.return_value = mock_queryset
-
-        result = self.repository.find_all_by_user_id(self.user_id)
-
-        self.assertEqual(result, [])
-
     @patch("quiz.domain.participation.participation.Participation.objects")
     def test_find_or_fail_by_quiz_and_participant_success(self, mock_objects):
         expected_participation = Mock(spec=Participation)
@@ -162,35 +113,20 @@ class TestDbParticipationRepository(unittest.TestCase):
             self.repository.save(participation)
 
     @patch("quiz.domain.participation.participation.Participation.objects")
-    def test_exists_by_quiz_and_participant_returns_true_when_exists(self, mock_objects):
-        mock_objects.filter.return_value.exists.return_value = True
-
-        result = self.repository.exists_by_quiz_and_participant(self.quiz_id, self.participant_id)
-
-        self.assertTrue(result)
-        mock_objects.filter.assert_called_once_with(quiz_id=self.quiz_id, participant_id=self.participant_id)
-
-    @patch("quiz.domain.participation.participation.Participation.objects")
-    def test_exists_by_quiz_and_participant_returns_false_when_not_exists(self, mock_objects):
-        mock_objects.filter.return_value.exists.return_value = False
+    def test_find_completed_scores_by_quiz(self, mock_objects):
+        mock_objects.filter.return_value.values_list.return_value = [(self.participant_id, 7)]
 
-        result = self.repository.exists_by_quiz_and_participant(self.quiz_id, self.participant_id)
+        result = self.repository.find_completed_scores_by_quiz(self.quiz_id)
 
-        self.assertFalse(result)
-        mock_objects.filter.assert_called_once_with(quiz_id=self.quiz_id, participant_id=self.participant_id)
+        self.assertEqual(result, {self.participant_id: 7})
+        mock_objects.filter.assert_called_once_with(quiz_id=self.quiz_id, completed_at__isnull=False)
+        mock_objects.filter.return_value.values_list.assert_called_once_with("id", "score")
 
     @patch("quiz.domain.participation.participation.Participation.objects")
-    def test_find_all_by_user_id_with_empty_related_attributes_list(self, mock_objects):
-        participation1 = Mock(spec=Participation)
-        participation1.id = UUID("aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee")
-
-        mock_queryset = Mock()
-        mock_select_related_queryset = Mock()
-        mock_queryset.select_related.return_value = mock_select_related_queryset
-        mock_select_related_queryset.order_by.return_value = [participation1]
-        mock_objects.filter.return_value = mock_queryset
-
-        result = self.repository.find_all_by_user_id(self.user_id, [])
+    def test_bulk_update_scores(self, mock_objects):
+        self.repository.bulk_update_scores({self.participant_id: 9}, batch_size=500)
 
-        self.assertEqual(result, [participation1])
-        mock_queryset.select_related.assert_called_once_with()
+        participations, fields = mock_objects.bulk_update.call_args.args
+        self.assertEqual([(p.id, p.score) for p in participations], [(self.participant_id, 9)])
+        self.assertEqual(fields, ["score"])
+        self.assertEqual(mock_objects.bulk_update.call_args.kwargs, {"batch_size": 500})
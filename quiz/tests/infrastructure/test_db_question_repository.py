@@ -74,92 +74,51 @@ class TestDbQuestionRepository(unittest.TestCase):
         with self.assertRaises(IntegrityError):
             self.repository.save(question)
 
-    @patch("quiz.domain.quiz.question.Question.objects")
-    def test_find_by_ids_success_with_multiple_questions(self, mock_objects):
-        question1 = Mock(spec=Question)
-        question1.id = 1
-        question1.text = "Question 1"
-
-        question2 = Mock(spec=Question)
-        question2.id = 2
-        question2.text = "Question 2"
-
-        question3 = Mock(spec=Question)
-        question3.id = 3
-        question3.text = "Question 3"
-
-        mock_objects.filter.return_value = [question1, question2, question3]
-        question_ids = [1, 2, 3]
-
-        result = self.repository.find_by_ids(question_ids)
-
-        expected_result = {1: question1, 2: question2, 3: question3}
-        self.assertEqual(result, expected_result)
-        mock_objects.filter.assert_called_once_with(id__in=question_ids)
-
-    @patch("quiz.domain.quiz.question.Question.objects")
-    def test_find_by_ids_success_with_single_question(self, mock_objects):
-        question = Mock(spec=Question)
-        question.id = 1
-        question.text = "Single Question"
-
-        mock_objects.filter.return_value = [question]
-        question_ids = [1]
-
-        result = self.repository.find_by_ids(question_ids)
-
-        expected_result = {1: question}
-        self.assertEqual(result, expected_result)
-
-    @patch("quiz.domain.quiz.question.Question.objects")
-    def test_find_by_ids_returns_empty_dict_when_no_questions_found(self, mock_objects):
-        mock_objects.filter.return_value = []
-        question_ids = [1, 2, 3]
-
-        result = self.repository.find_by_ids(question_ids)
+    def __build_integrity_error(self, constraint_name: str) -> IntegrityError:
+        class MockCause(Exception):
+            def __init__(self):
+                super().__init__("Database constraint violation")
+                self.diag = Mock(constraint_name=constraint_name)
 
-        self.assertEqual(result, {})
+        integrity_error = IntegrityError("UNIQUE constraint failed")
+        integrity_error.__cause__ = MockCause()
+        return integrity_error
 
+    @patch("quiz.infrastructure.db_question_repository.transaction")
     @patch("quiz.domain.quiz.question.Question.objects")
-    def test_find_by_ids_with_empty_list(self, mock_objects):
-        mock_objects.filter.return_value = []
-        question_ids = []
+    def test_bulk_save_inserts_all_questions_in_one_query(self, mock_objects, mock_transaction):
+        questions = [Mock(spec=Question), Mock(spec=Question)]
 
-        result = self.repository.find_by_ids(question_ids)
+        self.repository.bulk_save(questions)
 
-        self.assertEqual(result, {})
-        mock_objects.filter.assert_called_once_with(id__in=[])
+        mock_objects.bulk_create.assert_called_once_with(questions)
+        mock_transaction.atomic.assert_called_once()
 
+    @patch("quiz.infrastructure.db_question_repository.transaction")
     @patch("quiz.domain.quiz.question.Question.objects")
-    def test_find_by_ids_with_partial_results(self, mock_objects):
-        question1 = Mock(spec=Question)
-        question1.id = 1
-        question1.text = "Found Question"
+    def test_bulk_save_raises_question_already_exists_exception_for_duplicate_in_batch(
+        self, mock_objects, mock_transaction
+    ):
+        quiz_id = UUID("87654321-4321-8765-cba9-987654321098")
+        question1 = Mock(spec=Question, quiz_id=quiz_id, order=1)
+        question2 = Mock(spec=Question, quiz_id=quiz_id, order=1)
+        mock_objects.bulk_create.side_effect = self.__build_integrity_error("quiz_question_quiz_id_order_uniq")
+        mock_objects.filter.return_value.values_list.return_value = []
 
-        mock_objects.filter.return_value = [question1]
-        question_ids = [1, 2, 3]
-
-        result = self.repository.find_by_ids(question_ids)
+        with self.assertRaises(QuestionAlreadyExistsException) as context:
+            self.repository.bulk_save([question1, question2])
 
-        expected_result = {1: question1}
-        self.assertEqual(result, expected_result)
-        self.assertEqual(len(result), 1)
+        self.assertEqual(context.exception.order, 1)
+        self.assertEqual(context.exception.quiz_id, quiz_id)
 
+    @patch("quiz.infrastructure.db_question_repository.transaction")
     @patch("quiz.domain.quiz.question.Question.objects")
-    def test_find_by_ids_maintains_question_mapping_correctly(self, mock_objects):
-        question_a = Mock(spec=Question)
-        question_a.id = 10
-        question_a.text = "Question A"
-
-        question_b = Mock(spec=Question)
-        question_b.id = 20
-        question_b.text = "Question B"
+    def test_bulk_save_raises_original_integrity_error_when_duplicate_cannot_be_found(
+        self, mock_objects, mock_transaction
+    ):
+        question = Mock(spec=Question, quiz_id=UUID("87654321-4321-8765-cba9-987654321098"), order=1)
+        mock_objects.bulk_create.side_effect = self.__build_integrity_error("quiz_question_quiz_id_order_uniq")
+        mock_objects.filter.return_value.values_list.return_value = []
 
-        mock_objects.filter.return_value = [question_a, question_b]
-        question_ids = [10, 20]
-
-        result = self.repository.find_by_ids(question_ids)
-
-        self.assertEqual(result[10], question_a)
-        self.assertEqual(result[20], question_b)
-        self.assertEqual(len(result), 2)
+        with self.assertRaises(IntegrityError):
+            self.repository.bulk_save([question])
@@ -0,0 +1,41 @@
+from uuid import UUID
+
+from django.test import TestCase, tag
+
+from quiz.domain.invitation.invitation import Invitation
+from quiz.domain.participation.participation import Participation
+from quiz.domain.quiz.quiz import Quiz
+from quiz.infrastructure.db_quiz_access_finder import DbQuizAccessFinder
+from user.domain.user import User
+
+
+@tag("postgres")
+class TestDbQuizAccessFinder(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.creator = User.objects.create_user(username="creator", email="creator@test.com", password="password")
+        cls.participant = User.objects.create_user(
+            username="participant", email="participant@test.com", password="password"
+        )
+        cls.invited = User.objects.create_user(username="invited", email="invited@test.com", password="password")
+        cls.stranger = User.objects.create_user(username="stranger", email="stranger@test.com", password="password")
+        cls.quiz = Quiz.objects.create(title="Quiz", description="", creator=cls.creator)
+        Participation.objects.create(quiz=cls.quiz, participant=cls.participant)
+        Invitation.objects.create(quiz=cls.quiz, inviter=cls.creator, invited=cls.invited)
+
+    def setUp(self):
+        self.finder = DbQuizAccessFinder()
+
+    def test_can_view_quiz_grants_creator_participant_and_invited_in_a_single_query(self):
+        for user in (self.creator, self.participant, self.invited):
+            with self.assertNumQueries(1):
+                self.assertTrue(self.finder.can_view_quiz(quiz_id=self.quiz.id, user_id=user.id))
+
+    def test_can_view_quiz_denies_unrelated_user(self):
+        with self.assertNumQueries(1):
+            self.assertFalse(self.finder.can_view_quiz(quiz_id=self.quiz.id, user_id=self.stranger.id))
+
+    def test_can_view_quiz_denies_unknown_quiz(self):
+        unknown_quiz_id = UUID("12345678-1234-5678-9abc-123456789abc")
+
+        self.assertFalse(self.finder.can_view_quiz(quiz_id=unknown_quiz_id, user_id=self.creator.id))
@@ -1,22 +1,53 @@
 import unittest
 from unittest.mock import Mock, patch
+from datetime import datetime, timezone
 from uuid import UUID
 
+from django.db.models import Prefetch
+
+from quiz.application.get_creator_quizzes.get_creator_quizzes_response import QuizSummary
+from quiz.domain.pagination.page import Page
+from quiz.domain.pagination.page_cursor import PageCursor
 from quiz.domain.quiz.answer import Answer
 from quiz.domain.quiz.question import Question
 from quiz.domain.quiz.quiz import Quiz
 from quiz.domain.quiz.quiz_data import QuizData
 from quiz.domain.quiz.quiz_not_found_exception import QuizNotFoundException
+from quiz.domain.quiz.quiz_version import QuizVersion
 from quiz.infrastructure.db_quiz_finder import DbQuizFinder
+from quiz.infrastructure.keyset_paginator import KeysetPaginator
 
 
 class TestDbQuizFinder(unittest.TestCase):
     def setUp(self):
-        self.finder = DbQuizFinder()
+        self.paginator_mock = Mock(spec=KeysetPaginator)
+        self.finder = DbQuizFinder(paginator=self.paginator_mock)
         self.quiz_id = UUID("12345678-1234-5678-9abc-123456789abc")
         self.participant_id = UUID("87654321-4321-8765-cba9-987654321098")
         self.creator_id = UUID("11111111-2222-3333-4444-555555555555")
 
+    @patch("quiz.domain.quiz.quiz.Quiz.objects")
+    def test_find_quiz_version_returns_creator_and_updated_at(self, mock_objects):
+        updated_at = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        mock_objects.values_list.return_value.get.return_value = (self.creator_id, updated_at)
+
+        result = self.finder.find_quiz_version(self.quiz_id)
+
+        self.assertEqual(
+            result, QuizVersion(quiz_id=self.quiz_id, quiz_creator_id=self.creator_id, updated_at=updated_at)
+        )
+        mock_objects.values_list.assert_called_once_with("creator_id", "updated_at")
+        mock_objects.values_list.return_value.get.assert_called_once_with(id=self.quiz_id)
+
+    @patch("quiz.domain.quiz.quiz.Quiz.objects")
+    def test_find_quiz_version_raises_quiz_not_found_exception(self, mock_objects):
+        mock_objects.values_list.return_value.get.side_effect = Quiz.DoesNotExist
+
+        with self.assertRaises(QuizNotFoundException) as context:
+            self.finder.find_quiz_version(self.quiz_id)
+
+        self.assertEqual(context.exception.quiz_id, str(self.quiz_id))
+
     @patch("quiz.domain.quiz.quiz.Quiz.objects")
     def test_find_quiz_for_participation_success_with_questions_and_answers(self, mock_objects):
         mock_answer1 = Mock(spec=Answer)
@@ -40,10 +71,10 @@ class TestDbQuizFinder(unittest.TestCase):
         mock_answer4.order = 2
 
         mock_answers_queryset1 = Mock()
-        mock_answers_queryset1.all.return_value.order_by.return_value = [mock_answer1, mock_answer2]
+        mock_answers_queryset1.all.return_value = [mock_answer1, mock_answer2]
 
         mock_answers_queryset2 = Mock()
-        mock_answers_queryset2.all.return_value.order_by.return_value = [mock_answer3, mock_answer4]
+        mock_answers_queryset2.all.return_value = [mock_answer3, mock_answer4]
 
         mock_question1 = Mock(spec=Question)
         mock_question1.id = UUID("eeeeeeee-ffff-0000-1111-222222222222")
@@ -60,7 +91,7 @@ class TestDbQuizFinder(unittest.TestCase):
         mock_question2.answers = mock_answers_queryset2
 
         mock_questions_queryset = Mock()
-        mock_questions_queryset.all.return_value.order_by.return_value = [mock_question1, mock_question2]
+        mock_questions_queryset.all.return_value = [mock_question1, mock_question2]
 
         mock_quiz = Mock(spec=Quiz)
         mock_quiz.id = self.quiz_id
@@ -100,14 +131,22 @@ class TestDbQuizFinder(unittest.TestCase):
         self.assertEqual(question2.order, 2)
         self.assertEqual(question2.points, 5)
         self.assertEqual(len(question2.answers), 2)
-
-        mock_objects.prefetch_related.assert_called_once_with("questions__answers")
+        self.assertIsInstance(result.questions, tuple)
+        self.assertIsInstance(question1.answers, tuple)
+
+        prefetch = mock_objects.prefetch_related.call_args.args[0]
+        self.assertIsInstance(prefetch, Prefetch)
+        self.assertEqual(prefetch.prefetch_to, "questions")
+        self.assertEqual(prefetch.queryset.query.order_by, ("order",))
+        answers_prefetch = prefetch.queryset._prefetch_related_lookups[0]
+        self.assertEqual(answers_prefetch.prefetch_to, "answers")
+        self.assertEqual(answers_prefetch.queryset.query.order_by, ("order",))
         mock_prefetch_queryset.get.assert_called_once_with(id=self.quiz_id)
 
     @patch("quiz.domain.quiz.quiz.Quiz.objects")
     def test_find_quiz_for_participation_success_with_empty_quiz(self, mock_objects):
         mock_questions_queryset = Mock()
-        mock_questions_queryset.all.return_value.order_by.return_value = []
+        mock_questions_queryset.all.return_value = []
 
         mock_quiz = Mock(spec=Quiz)
         mock_quiz.id = self.quiz_id
@@ -132,7 +171,7 @@ class TestDbQuizFinder(unittest.TestCase):
     @patch("quiz.domain.quiz.quiz.Quiz.objects")
     def test_find_quiz_for_participation_success_with_questions_without_answers(self, mock_objects):
         mock_answers_queryset = Mock()
-        mock_answers_queryset.all.return_value.order_by.return_value = []
+        mock_answers_queryset.all.return_value = []
 
         mock_question = Mock(spec=Question)
         mock_question.id = UUID("eeeeeeee-ffff-0000-1111-222222222222")
@@ -142,7 +181,7 @@ class TestDbQuizFinder(unittest.TestCase):
         mock_question.answers = mock_answers_queryset
 
         mock_questions_queryset = Mock()
-        mock_questions_queryset.all.return_value.order_by.return_value = [mock_question]
+        mock_questions_queryset.all.return_value = [mock_question]
 
         mock_quiz = Mock(spec=Quiz)
         mock_quiz.id = self.quiz_id
@@ -177,7 +216,7 @@ class TestDbQuizFinder(unittest.TestCase):
         different_quiz_id = UUID("aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee")
 
         mock_questions_queryset = Mock()
-        mock_questions_queryset.all.return_value.order_by.return_value = []
+        mock_questions_queryset.all.return_value = []
 
         mock_quiz = Mock(spec=Quiz)
         mock_quiz.id = different_quiz_id
@@ -204,7 +243,7 @@ class TestDbQuizFinder(unittest.TestCase):
         mock_answer.order = 1
 
         mock_answers_queryset = Mock()
-        mock_answers_queryset.all.return_value.order_by.return_value = [mock_answer]
+        mock_answers_queryset.all.return_value = [mock_answer]
 
         mock_question = Mock(spec=Question)
         mock_question.id = UUID("eeeeeeee-ffff-0000-1111-222222222222")
@@ -214,7 +253,7 @@ class TestDbQuizFinder(unittest.TestCase):
         mock_question.answers = mock_answers_queryset
 
         mock_questions_queryset = Mock()
-        mock_questions_queryset.all.return_value.order_by.return_value = [mock_question]
+        mock_questions_queryset.all.return_value = [mock_question]
 
         mock_quiz = Mock(spec=Quiz)
         mock_quiz.id = self.quiz_id
@@ -232,3 +271,45 @@ class TestDbQuizFinder(unittest.TestCase):
         self.assertEqual(len(result.questions), 1)
         self.assertEqual(len(result.questions[0].answers), 1)
         self.assertEqual(result.questions[0].answers[0].text, "Single Answer")
+
+    @patch("quiz.domain.quiz.quiz.Quiz.objects")
+    def test_find_quiz_summaries_by_creator_id_uses_annotated_counts(self, mock_objects):
+        mock_quiz = Mock(spec=Quiz)
+        mock_quiz.id = self.quiz_id
+        mock_quiz.title = "Programming Quiz"
+        mock_quiz.description = "Test your programming knowledge"
+        mock_quiz.questions_count = 10
+        mock_quiz.participants_count = 25
+        mock_quiz.get_formatted_created_at.return_value = "2023-01-15T10:30:00.123456Z"
+        mock_quiz.get_formatted_updated_at.return_value = "2023-01-16T14:45:00.654321Z"
+
+        next_cursor = PageCursor(created_at=datetime(2023, 1, 15, tzinfo=timezone.utc), id=self.quiz_id)
+        self.paginator_mock.paginate.return_value = Page(items=[mock_quiz], next_cursor=next_cursor)
+
+        result = self.finder.find_quiz_summaries_by_creator_id(self.creator_id, limit=1)
+
+        self.assertEqual(len(result.items), 1)
+        self.assertIsInstance(result.items[0], QuizSummary)
+        self.assertEqual(result.items[0].id, self.quiz_id)
+        self.assertEqual(result.items[0].title, "Programming Quiz")
+        self.assertEqual(result.items[0].questions_count, 10)
+        self.assertEqual(result.items[0].participants_count, 25)
+        self.assertEqual(result.items[0].created_at, "2023-01-15T10:30:00.123456Z")
+        self.assertEqual(result.items[0].updated_at, "2023-01-16T14:45:00.654321Z")
+        self.assertEqual(result.next_cursor, next_cursor)
+
+        mock_objects.filter.assert_called_once_with(creator_id=self.creator_id)
+        annotations = mock_objects.filter.return_value.annotate.call_args.kwargs
+        self.assertEqual(set(annotations), {"questions_count", "participants_count"})
+        self.paginator_mock.paginate.assert_called_once_with(
+            mock_objects.filter.return_value.annotate.return_value, limit=1, cursor=None
+        )
+
+    @patch("quiz.domain.quiz.quiz.Quiz.objects")
+    def test_find_quiz_summaries_by_creator_id_returns_empty_page(self, mock_objects):
+        self.paginator_mock.paginate.return_value = Page(items=[])
+
+        result = self.finder.find_quiz_summaries_by_creator_id(self.creator_id, limit=20)
+
+        self.assertEqual(result.items, [])
+        self.assertIsNone(result.next_cursor)
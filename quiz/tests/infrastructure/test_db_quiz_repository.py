@@ -89,33 +89,3 @@ class TestDbQuizRepository(unittest.TestCase):
             self.repository.find_or_fail_by_id(self.quiz_id)
 
         self.assertEqual(context.exception.quiz_id, str(self.quiz_id))
-
-    @patch("quiz.domain.quiz.quiz.Quiz.objects")
-    def test_find_by_creator_id_returns_ordered_list(self, mock_objects):
-        quiz1 = Mock(spec=Quiz)
-        quiz1.id = UUID("aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee")
-        quiz1.title = "First Quiz"
-
-        quiz2 = Mock(spec=Quiz)
-        quiz2.id = UUID("bbbbbbbb-cccc-dddd-eeee-ffffffffffff")
-        quiz2.title = "Second Quiz"
-
-        mock_queryset = Mock()
-        mock_queryset.order_by.return_value = [quiz1, quiz2]
-        mock_objects.filter.return_value = mock_queryset
-
-        result = self.repository.find_by_creator_id(self.creator_id)
-
-        self.assertEqual(result, [quiz1, quiz2])
-        mock_objects.filter.assert_called_once_with(creator_id=self.creator_id)
-        mock_queryset.order_by.assert_called_once_with("-created_at")
-
-    @patch("quiz.domain.quiz.quiz.Quiz.objects")
-    def test_find_by_creator_id_returns_empty_list_when_no_quizzes(self, mock_objects):
-        mock_queryset = Mock()
-        mock_queryset.order_by.return_value = []
-        mock_objects.filter.return_value = mock_queryset
-
-        result = self.repository.find_by_creator_id(self.creator_id)
-
-        self.assertEqual(result, [])
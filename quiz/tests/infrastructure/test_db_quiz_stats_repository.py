@@ -0,0 +1,146 @@
+import unittest
+from unittest.mock import Mock, patch
+from uuid import UUID
+
+from quiz.domain.quiz.quiz_stats import QuizStats
+from quiz.infrastructure.db_quiz_stats_repository import DbQuizStatsRepository
+
+
+class TestDbQuizStatsRepository(unittest.TestCase):
+    def setUp(self):
+        self.repository = DbQuizStatsRepository()
+        self.quiz_id = UUID("12345678-1234-5678-9abc-123456789abc")
+        self.participant_id = UUID("87654321-4321-8765-cba9-987654321098")
+
+    def test_save_success(self):
+        quiz_stats = Mock(spec=QuizStats)
+
+        self.repository.save(quiz_stats)
+
+        quiz_stats.save.assert_called_once()
+
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
+    def test_record_invitation_sent_increments_counter(self, mock_objects):
+        mock_objects.filter.return_value.update.return_value = 1
+
+        self.repository.record_invitation_sent(self.quiz_id)
+
+        mock_objects.filter.assert_called_once_with(quiz_id=self.quiz_id)
+        update_kwargs = mock_objects.filter.return_value.update.call_args.kwargs
+        self.assertEqual(set(update_kwargs), {"invitations_sent", "updated_at"})
+        mock_objects.update_or_create.assert_not_called()
+
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
+    def test_record_invitation_accepted_increments_counters(self, mock_objects):
+        mock_objects.filter.return_value.update.return_value = 1
+
+        self.repository.record_invitation_accepted(self.quiz_id)
+
+        mock_objects.filter.assert_called_once_with(quiz_id=self.quiz_id)
+        update_kwargs = mock_objects.filter.return_value.update.call_args.kwargs
+        self.assertEqual(set(update_kwargs), {"invitations_accepted", "participations_started", "updated_at"})
+        mock_objects.update_or_create.assert_not_called()
+
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
+    def test_record_participation_completed_updates_row_in_a_single_statement(self, mock_objects):
+        mock_objects.filter.return_value.update.return_value = 1
+
+        self.repository.record_participation_completed(
+            quiz_id=self.quiz_id, participant_id=self.participant_id, score=85
+        )
+
+        mock_objects.filter.assert_called_once_with(quiz_id=self.quiz_id)
+        mock_objects.filter.return_value.update.assert_called_once()
+        update_kwargs = mock_objects.filter.return_value.update.call_args.kwargs
+        self.assertEqual(
+            set(update_kwargs),
+            {
+                "participations_completed",
+                "total_score",
+                "max_score",
+                "min_score",
+                "top_scorer_id",
+                "updated_at",
+            },
+        )
+        mock_objects.update_or_create.assert_not_called()
+
+    @patch("quiz.domain.invitation.invitation.Invitation.objects")
+    @patch("quiz.domain.participation.participation.Participation.objects")
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
+    def test_record_participation_completed_rebuilds_missing_row(
+        self, mock_objects, mock_participation_objects, mock_invitation_objects
+    ):
+        mock_objects.filter.return_value.update.return_value = 0
+        mock_invitation_objects.filter.return_value.aggregate.return_value = {
+            "invitations_sent": 3,
+            "invitations_accepted": 2,
+        }
+        mock_participations = mock_participation_objects.filter.return_value
+        mock_participations.aggregate.return_value = {
+            "participations_started": 2,
+            "participations_completed": 1,
+            "total_score": 85,
+            "max_score": 85,
+            "min_score": 85,
+        }
+        mock_participations.filter.return_value.order_by.return_value.values_list.return_value.first.return_value = (
+            self.participant_id
+        )
+
+        self.repository.record_participation_completed(
+            quiz_id=self.quiz_id, participant_id=self.participant_id, score=85
+        )
+
+        mock_invitation_objects.filter.assert_called_once_with(quiz_id=self.quiz_id)
+        mock_participation_objects.filter.assert_called_once_with(quiz_id=self.quiz_id)
+        mock_participations.filter.return_value.order_by.assert_called_once_with("-score", "completed_at")
+        mock_objects.update_or_create.assert_called_once_with(
+            quiz_id=self.quiz_id,
+            defaults={
+                "invitations_sent": 3,
+                "invitations_accepted": 2,
+                "participations_started": 2,
+                "participations_completed": 1,
+                "total_score": 85,
+                "max_score": 85,
+                "min_score": 85,
+                "top_scorer_id": self.participant_id,
+            },
+        )
+
+    @patch("quiz.domain.invitation.invitation.Invitation.objects")
+    @patch("quiz.domain.participation.participation.Participation.objects")
+    @patch("quiz.domain.quiz.quiz_stats.QuizStats.objects")
+    def test_rebuild_quiz_without_participations(
+        self, mock_objects, mock_participation_objects, mock_invitation_objects
+    ):
+        mock_invitation_objects.filter.return_value.aggregate.return_value = {
+            "invitations_sent": 0,
+            "invitations_accepted": 0,
+        }
+        mock_participations = mock_participation_objects.filter.return_value
+        mock_participations.aggregate.return_value = {
+            "participations_started": 0,
+            "participations_completed": 0,
+            "total_score": 0,
+            "max_score": None,
+            "min_score": None,
+        }
+        mock_participations.filter.return_value.order_by.return_value.values_list.return_value.first.return_value = None
+
+        self.repository.rebuild(self.quiz_id)
+
+        mock_objects.update_or_create.assert_called_once_with(
+            quiz_id=self.quiz_id,
+            defaults={
+                "invitations_sent": 0,
+                "invitations_accepted": 0,
+                "participations_started": 0,
+                "participations_completed": 0,
+                "total_score": 0,
+                "max_score": None,
+                "min_score": None,
+                "top_scorer_id": None,
+            },
+        )
@@ -5,59 +5,41 @@ from logging import Logger
 from unittest.mock import Mock, patch
 
 from quiz.domain.invitation.invitation import Invitation
-from quiz.domain.quiz.quiz import Quiz
 from quiz.infrastructure.django_email_service import DjangoEmailService
 from quiz.infrastructure.email_delivery_exception import EmailDeliveryException
+from quiz.infrastructure.invitation_email_renderer import InvitationEmailRenderer, RenderedInvitationEmail
 from user.domain.user import User
 
 
 class TestDjangoEmailService(unittest.TestCase):
     def setUp(self):
         self.mock_logger = Mock(spec=Logger)
+        self.mock_renderer = Mock(spec=InvitationEmailRenderer)
         with patch("quiz.infrastructure.django_email_service.getLogger", return_value=self.mock_logger):
-            self.email_service = DjangoEmailService()
-
-        self.mock_quiz = Mock(spec=Quiz)
-        self.mock_quiz.title = "JavaScript Fundamentals"
-        self.mock_quiz.description = "Learn the basics of JavaScript programming"
-
-        self.mock_inviter = Mock(spec=User)
-        self.mock_inviter.first_name = "John"
-        self.mock_inviter.username = "john_teacher"
+            self.email_service = DjangoEmailService(renderer=self.mock_renderer)
 
         self.mock_invited = Mock(spec=User)
-        self.mock_invited.first_name = "Alice"
-        self.mock_invited.username = "alice_student"
         self.mock_invited.email = "alice@student.com"
 
         self.mock_invitation = Mock(spec=Invitation)
-        self.mock_invitation.quiz = self.mock_quiz
-        self.mock_invitation.inviter = self.mock_inviter
         self.mock_invitation.invited = self.mock_invited
 
         self.invitation_link = "https://quiz.app/accept/12345678-abcd-efgh"
+        self.rendered_email = RenderedInvitationEmail(
+            subject="You're invited to take the quiz: JavaScript Fundamentals",
+            plain_message="Plain text email content",
+            html_message="<html>HTML Email Content</html>",
+        )
+        self.mock_renderer.render.return_value = self.rendered_email
 
     @patch("quiz.infrastructure.django_email_service.send_mail")
-    @patch("quiz.infrastructure.django_email_service.render_to_string")
     @patch("quiz.infrastructure.django_email_service.settings")
-    def test_send_invitation_email_success_with_first_names(self, mock_settings, mock_render, mock_send_mail):
+    def test_send_invitation_email_success(self, mock_settings, mock_send_mail):
         mock_settings.DEFAULT_FROM_EMAIL = "noreply@quiz.app"
-        mock_render.side_effect = ["<html>HTML Email Content</html>", "Plain text email content"]
 
         self.email_service.send_invitation_email(self.mock_invitation, self.invitation_link)
 
-        expected_context = {
-            "participant_name": "Alice",
-            "quiz_title": "JavaScript Fundamentals",
-            "quiz_description": "Learn the basics of JavaScript programming",
-            "inviter_name": "John",
-            "invitation_acceptance_link": self.invitation_link,
-        }
-
-        self.assertEqual(mock_render.call_count, 2)
-        mock_render.assert_any_call("invitation_email.html", expected_context)
-        mock_render.assert_any_call("invitation_email.txt", expected_context)
-
+        self.mock_renderer.render.assert_called_once_with(self.mock_invitation, self.invitation_link)
         mock_send_mail.assert_called_once_with(
             subject="You're invited to take the quiz: JavaScript Fundamentals",
             message="Plain text email content",
@@ -68,61 +50,11 @@ class TestDjangoEmailService(unittest.TestCase):
         )
 
     @patch("quiz.infrastructure.django_email_service.send_mail")
-    @patch("quiz.infrastructure.django_email_service.render_to_string")
-    @patch("quiz.infrastructure.django_email_service.settings")
-    def test_send_invitation_email_success_with_usernames_when_no_first_names(
-        self, mock_settings, mock_render, mock_send_mail
-    ):
-        self.mock_inviter.first_name = None
-        self.mock_invited.first_name = None
-
-        mock_settings.DEFAULT_FROM_EMAIL = "noreply@quiz.app"
-        mock_render.side_effect = ["<html>HTML Email Content</html>", "Plain text email content"]
-
-        self.email_service.send_invitation_email(self.mock_invitation, self.invitation_link)
-
-        expected_context = {
-            "participant_name": "alice_student",
-            "quiz_title": "JavaScript Fundamentals",
-            "quiz_description": "Learn the basics of JavaScript programming",
-            "inviter_name": "john_teacher",
-            "invitation_acceptance_link": self.invitation_link,
-        }
-
-        mock_render.assert_any_call("invitation_email.html", expected_context)
-        mock_render.assert_any_call("invitation_email.txt", expected_context)
-
-    @patch("quiz.infrastructure.django_email_service.send_mail")
-    @patch("quiz.infrastructure.django_email_service.render_to_string")
-    @patch("quiz.infrastructure.django_email_service.settings")
-    def test_send_invitation_email_success_with_empty_first_names(self, mock_settings, mock_render, mock_send_mail):
-        self.mock_inviter.first_name = ""
-        self.mock_invited.first_name = ""
-
-        mock_settings.DEFAULT_FROM_EMAIL = "noreply@quiz.app"
-        mock_render.side_effect = ["<html>HTML Email Content</html>", "Plain text email content"]
-
-        self.email_service.send_invitation_email(self.mock_invitation, self.invitation_link)
-
-        expected_context = {
-            "participant_name": "alice_student",
-            "quiz_title": "JavaScript Fundamentals",
-            "quiz_description": "Learn the basics of JavaScript programming",
-            "inviter_name": "john_teacher",
-            "invitation_acceptance_link": self.invitation_link,
-        }
-
-        mock_render.assert_any_call("invitation_email.html", expected_context)
-        mock_render.assert_any_call("invitation_email.txt", expected_context)
-
-    @patch("quiz.infrastructure.django_email_service.send_mail")
-    @patch("quiz.infrastructure.django_email_service.render_to_string")
     @patch("quiz.infrastructure.django_email_service.settings")
     def test_send_invitation_email_raises_email_delivery_exception_on_smtp_exception(
-        self, mock_settings, mock_render, mock_send_mail
+        self, mock_settings, mock_send_mail
     ):
         mock_settings.DEFAULT_FROM_EMAIL = "noreply@quiz.app"
-        mock_render.side_effect = ["<html>HTML Email Content</html>", "Plain text email content"]
 
         smtp_error = smtplib.SMTPException("SMTP server error")
         mock_send_mail.side_effect = smtp_error
@@ -134,13 +66,9 @@ class TestDjangoEmailService(unittest.TestCase):
         self.mock_logger.error.assert_called_once_with("Failed to send email to alice@student.com: SMTP server error")
 
     @patch("quiz.infrastructure.django_email_service.send_mail")
-    @patch("quiz.infrastructure.django_email_service.render_to_string")
     @patch("quiz.infrastructure.django_email_service.settings")
-    def test_send_invitation_email_raises_email_delivery_exception_on_socket_error(
-        self, mock_settings, mock_render, mock_send_mail
-    ):
+    def test_send_invitation_email_raises_email_delivery_exception_on_socket_error(self, mock_settings, mock_send_mail):
         mock_settings.DEFAULT_FROM_EMAIL = "noreply@quiz.app"
-        mock_render.side_effect = ["<html>HTML Email Content</html>", "Plain text email content"]
 
         socket_error = socket.error("Connection failed")
         mock_send_mail.side_effect = socket_error
@@ -152,13 +80,11 @@ class TestDjangoEmailService(unittest.TestCase):
         self.mock_logger.error.assert_called_once_with("Failed to send email to alice@student.com: Connection failed")
 
     @patch("quiz.infrastructure.django_email_service.send_mail")
-    @patch("quiz.infrastructure.django_email_service.render_to_string")
     @patch("quiz.infrastructure.django_email_service.settings")
     def test_send_invitation_email_raises_email_delivery_exception_on_socket_timeout(
-        self, mock_settings, mock_render, mock_send_mail
+        self, mock_settings, mock_send_mail
     ):
         mock_settings.DEFAULT_FROM_EMAIL = "noreply@quiz.app"
-        mock_render.side_effect = ["<html>HTML Email Content</html>", "Plain text email content"]
 
         timeout_error = socket.timeout("Timeout occurred")
         mock_send_mail.side_effect = timeout_error
@@ -170,13 +96,11 @@ class TestDjangoEmailService(unittest.TestCase):
         self.mock_logger.error.assert_called_once_with("Failed to send email to alice@student.com: Timeout occurred")
 
     @patch("quiz.infrastructure.django_email_service.send_mail")
-    @patch("quiz.infrastructure.django_email_service.render_to_string")
     @patch("quiz.infrastructure.django_email_service.settings")
     def test_send_invitation_email_raises_email_delivery_exception_on_connection_error(
-        self, mock_settings, mock_render, mock_send_mail
+        self, mock_settings, mock_send_mail
     ):
         mock_settings.DEFAULT_FROM_EMAIL = "noreply@quiz.app"
-        mock_render.side_effect = ["<html>HTML Email Content</html>", "Plain text email content"]
 
         connection_error = ConnectionError("Connection refused")
         mock_send_mail.side_effect = connection_error
@@ -188,13 +112,9 @@ class TestDjangoEmailService(unittest.TestCase):
         self.mock_logger.error.assert_called_once_with("Failed to send email to alice@student.com: Connection refused")
 
     @patch("quiz.infrastructure.django_email_service.send_mail")
-    @patch("quiz.infrastructure.django_email_service.render_to_string")
     @patch("quiz.infrastructure.django_email_service.settings")
-    def test_send_invitation_email_raises_email_delivery_exception_on_os_error(
-        self, mock_settings, mock_render, mock_send_mail
-    ):
+    def test_send_invitation_email_raises_email_delivery_exception_on_os_error(self, mock_settings, mock_send_mail):
         mock_settings.DEFAULT_FROM_EMAIL = "noreply@quiz.app"
-        mock_render.side_effect = ["<html>HTML Email Content</html>", "Plain text email content"]
 
         os_error = OSError("OS level error")
         mock_send_mail.side_effect = os_error
@@ -205,51 +125,55 @@ class TestDjangoEmailService(unittest.TestCase):
         self.assertEqual(context.exception.__cause__, os_error)
         self.mock_logger.error.assert_called_once_with("Failed to send email to alice@student.com: OS level error")
 
-    @patch("quiz.infrastructure.django_email_service.send_mail")
-    @patch("quiz.infrastructure.django_email_service.render_to_string")
+    @patch("quiz.infrastructure.django_email_service.EmailMultiAlternatives")
+    @patch("quiz.infrastructure.django_email_service.get_connection")
     @patch("quiz.infrastructure.django_email_service.settings")
-    def test_send_invitation_email_different_quiz_and_user_data(self, mock_settings, mock_render, mock_send_mail):
-        different_quiz = Mock(spec=Quiz)
-        different_quiz.title = "Python Advanced"
-        different_quiz.description = "Advanced Python concepts"
-
-        different_inviter = Mock(spec=User)
-        different_inviter.first_name = "Bob"
-        different_inviter.username = "bob_instructor"
-
-        different_invited = Mock(spec=User)
-        different_invited.first_name = "Charlie"
-        different_invited.username = "charlie_dev"
-        different_invited.email = "charlie@developer.com"
+    def test_send_invitation_emails_reuses_one_connection_and_reports_failures(
+        self, mock_settings, mock_get_connection, mock_message_class
+    ):
+        mock_settings.DEFAULT_FROM_EMAIL = "noreply@quiz.app"
+        mock_connection = mock_get_connection.return_value
+        mock_connection.send_messages.side_effect = [1, smtplib.SMTPRecipientsRefused({}), 1]
+        invitations = [self.__create_invitation(i) for i in range(3)]
+        links = {invitation.id: f"https://quiz.app/accept/{invitation.id}" for invitation in invitations}
+        self.mock_renderer.render_batch.return_value = iter(
+            [(invitation, self.rendered_email) for invitation in invitations]
+        )
 
-        different_invitation = Mock(spec=Invitation)
-        different_invitation.quiz = different_quiz
-        different_invitation.inviter = different_inviter
-        different_invitation.invited = different_invited
+        failed = self.email_service.send_invitation_emails(invitations, links)
 
-        different_link = "https://quiz.app/accept/different-link"
+        self.assertEqual(failed, [invitations[1]])
+        self.mock_renderer.render_batch.assert_called_once_with(invitations, links)
+        mock_get_connection.assert_called_once_with(fail_silently=False)
+        mock_connection.open.assert_called_once()
+        self.assertEqual(mock_connection.send_messages.call_count, 3)
+        mock_connection.close.assert_called_once()
+        mock_message_class.assert_any_call(
+            subject="You're invited to take the quiz: JavaScript Fundamentals",
+            body="Plain text email content",
+            from_email="noreply@quiz.app",
+            to=["participant1@student.com"],
+            connection=mock_connection,
+        )
+        mock_message_class.return_value.attach_alternative.assert_called_with(
+            "<html>HTML Email Content</html>", "text/html"
+        )
 
-        mock_settings.DEFAULT_FROM_EMAIL = "system@quiz.app"
-        mock_render.side_effect = ["<html>Different HTML Content</html>", "Different plain text content"]
+    @patch("quiz.infrastructure.django_email_service.get_connection")
+    def test_send_invitation_emails_raises_when_connection_cannot_be_opened(self, mock_get_connection):
+        mock_get_connection.return_value.open.side_effect = socket.timeout("timed out")
+        invitation = self.__create_invitation(0)
 
-        self.email_service.send_invitation_email(different_invitation, different_link)
+        with self.assertRaises(EmailDeliveryException):
+            self.email_service.send_invitation_emails([invitation], {invitation.id: self.invitation_link})
 
-        expected_context = {
-            "participant_name": "Charlie",
-            "quiz_title": "Python Advanced",
-            "quiz_description": "Advanced Python concepts",
-            "inviter_name": "Bob",
-            "invitation_acceptance_link": different_link,
-        }
+        mock_get_connection.return_value.send_messages.assert_not_called()
 
-        mock_render.assert_any_call("invitation_email.html", expected_context)
-        mock_render.assert_any_call("invitation_email.txt", expected_context)
+    def __create_invitation(self, index: int) -> Mock:
+        invited = Mock(spec=User)
+        invited.email = f"participant{index}@student.com"
 
-        mock_send_mail.assert_called_once_with(
-            subject="You're invited to take the quiz: Python Advanced",
-            message="Different plain text content",
-            from_email="system@quiz.app",
-            recipient_list=["charlie@developer.com"],
-            html_message="<html>Different HTML Content</html>",
-            fail_silently=False,
-        )
+        invitation = Mock(spec=Invitation)
+        invitation.id = f"invitation-{index}"
+        invitation.invited = invited
+        return invitation
@@ -0,0 +1,44 @@
+import unittest
+from uuid import UUID
+
+from django.core.cache.backends.locmem import LocMemCache
+
+from quiz.infrastructure.django_quiz_access_cache import DjangoQuizAccessCache
+
+
+class TestDjangoQuizAccessCache(unittest.TestCase):
+    def setUp(self):
+        self.backend = LocMemCache("test-quiz-access-cache", {})
+        self.backend.clear()
+        self.cache = DjangoQuizAccessCache(backend=self.backend, timeout=60)
+
+        self.quiz_id = UUID("12345678-1234-5678-9abc-123456789abc")
+        self.user_id = UUID("87654321-4321-8765-cba9-987654321098")
+
+    def test_is_granted_returns_false_when_access_is_not_cached(self):
+        self.assertFalse(self.cache.is_granted(self.quiz_id, self.user_id))
+
+    def test_is_granted_returns_true_after_grant(self):
+        self.cache.grant(self.quiz_id, self.user_id)
+
+        self.assertTrue(self.cache.is_granted(self.quiz_id, self.user_id))
+
+    def test_grant_is_scoped_to_user_and_quiz(self):
+        self.cache.grant(self.quiz_id, self.user_id)
+
+        self.assertFalse(self.cache.is_granted(self.quiz_id, UUID("11111111-2222-3333-4444-555555555555")))
+        self.assertFalse(self.cache.is_granted(UUID("aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee"), self.user_id))
+
+    def test_grant_expires_after_timeout(self):
+        cache = DjangoQuizAccessCache(backend=self.backend, timeout=0)
+
+        cache.grant(self.quiz_id, self.user_id)
+
+        self.assertFalse(cache.is_granted(self.quiz_id, self.user_id))
+
+    def test_revoke_drops_granted_access(self):
+        self.cache.grant(self.quiz_id, self.user_id)
+
+        self.cache.revoke(self.quiz_id, self.user_id)
+
+        self.assertFalse(self.cache.is_granted(self.quiz_id, self.user_id))
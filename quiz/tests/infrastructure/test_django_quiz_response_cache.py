@@ -0,0 +1,56 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from django.core.cache.backends.locmem import LocMemCache
+
+from quiz.application.get_quiz_query.encoded_quiz_response import EncodedQuizResponse
+from quiz.domain.quiz.quiz_response_cache_stats import QuizResponseCacheStats
+from quiz.domain.quiz.quiz_version import QuizVersion
+from quiz.infrastructure.django_quiz_response_cache import DjangoQuizResponseCache
+
+
+class TestDjangoQuizResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.backend = LocMemCache("test-quiz-response-cache", {})
+        self.backend.clear()
+        self.cache = DjangoQuizResponseCache(backend=self.backend, timeout=60)
+
+        self.quiz_version = QuizVersion(
+            quiz_id=UUID("12345678-1234-5678-9abc-123456789abc"),
+            quiz_creator_id=UUID("11111111-2222-3333-4444-555555555555"),
+            updated_at=datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc),
+        )
+        self.response = EncodedQuizResponse(
+            etag=self.quiz_version.etag,
+            body=b'{"quiz_id":"12345678-1234-5678-9abc-123456789abc","title":"Math Quiz"}',
+        )
+
+    def test_get_returns_none_when_response_is_not_cached(self):
+        self.assertIsNone(self.cache.get(self.quiz_version))
+
+    def test_get_returns_cached_response(self):
+        self.cache.set(self.quiz_version, self.response)
+
+        self.assertEqual(self.cache.get(self.quiz_version), self.response)
+
+    def test_get_misses_after_quiz_is_updated(self):
+        self.cache.set(self.quiz_version, self.response)
+        updated_version = QuizVersion(
+            quiz_id=self.quiz_version.quiz_id,
+            quiz_creator_id=self.quiz_version.quiz_creator_id,
+            updated_at=self.quiz_version.updated_at + timedelta(seconds=1),
+        )
+
+        self.assertIsNone(self.cache.get(updated_version))
+
+    def test_get_stats_counts_hits_and_misses(self):
+        self.cache.get(self.quiz_version)
+        self.cache.set(self.quiz_version, self.response)
+        self.cache.get(self.quiz_version)
+        self.cache.get(self.quiz_version)
+
+        self.assertEqual(self.cache.get_stats(), QuizResponseCacheStats(hits=2, misses=1))
+
+    def test_get_stats_returns_zero_when_cache_was_never_read(self):
+        self.assertEqual(self.cache.get_stats(), QuizResponseCacheStats(hits=0, misses=0))
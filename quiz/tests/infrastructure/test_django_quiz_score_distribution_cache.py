@@ -0,0 +1,49 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+from uuid import UUID
+
+from django.core.cache.backends.locmem import LocMemCache
+
+from quiz.domain.participation.quiz_score_distribution import QuizScoreDistribution, ScoreBucket
+from quiz.domain.quiz.quiz import Quiz
+from quiz.infrastructure.django_quiz_score_distribution_cache import DjangoQuizScoreDistributionCache
+
+
+class TestDjangoQuizScoreDistributionCache(unittest.TestCase):
+    def setUp(self):
+        self.backend = LocMemCache("test-quiz-score-distribution-cache", {})
+        self.backend.clear()
+        self.cache = DjangoQuizScoreDistributionCache(backend=self.backend, timeout=60)
+
+        self.quiz = Mock(spec=Quiz)
+        self.quiz.id = UUID("12345678-1234-5678-9abc-123456789abc")
+        self.quiz.updated_at = datetime(2024, 1, 10, 9, 0, tzinfo=timezone.utc)
+        self.scores_version = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        self.distribution = QuizScoreDistribution(
+            total_scored=1,
+            max_possible_score=10,
+            p50=7.0,
+            p90=7.0,
+            p99=7.0,
+            buckets=[ScoreBucket(min_score=5.0, max_score=10.0, count=1)],
+        )
+
+    def test_get_returns_none_when_distribution_is_not_cached(self):
+        self.assertIsNone(self.cache.get(self.quiz, self.scores_version))
+
+    def test_get_returns_cached_distribution(self):
+        self.cache.set(self.quiz, self.scores_version, self.distribution)
+
+        self.assertEqual(self.cache.get(self.quiz, self.scores_version), self.distribution)
+
+    def test_get_misses_after_scores_change(self):
+        self.cache.set(self.quiz, self.scores_version, self.distribution)
+
+        self.assertIsNone(self.cache.get(self.quiz, self.scores_version + timedelta(seconds=1)))
+
+    def test_get_misses_after_quiz_changes(self):
+        self.cache.set(self.quiz, self.scores_version, self.distribution)
+        self.quiz.updated_at += timedelta(seconds=1)
+
+        self.assertIsNone(self.cache.get(self.quiz, self.scores_version))
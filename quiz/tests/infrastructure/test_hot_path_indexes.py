@@ -0,0 +1,52 @@
+from django.db import connection
+from django.test import TestCase, tag
+from django.utils import timezone
+
+from quiz.domain.invitation.invitation import Invitation
+from quiz.domain.participation.participation import Participation
+from quiz.domain.quiz.quiz import Quiz
+from user.domain.user import User
+
+
+@tag("postgres")
+class TestHotPathIndexes(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.creator = User.objects.create_user(username="creator", email="creator@test.com", password="password")
+        cls.participant = User.objects.create_user(
+            username="participant", email="participant@test.com", password="password"
+        )
+        cls.quiz = Quiz.objects.create(title="Indexed Quiz", description="", creator=cls.creator)
+        cls.invitation = Invitation.objects.create(quiz=cls.quiz, invited=cls.participant, inviter=cls.creator)
+        Participation.objects.create(
+            quiz=cls.quiz,
+            participant=cls.participant,
+            invitation=cls.invitation,
+            score=10,
+            completed_at=timezone.now(),
+        )
+
+    def setUp(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def test_quiz_scores_summary_uses_scored_participations_index(self):
+        plan = (
+            Participation.objects.filter(quiz_id=self.quiz.id, completed_at__isnull=False, score__isnull=False)
+            .order_by("-score")[:1]
+            .explain()
+        )
+
+        self.assertIn("participation_quiz_scored_idx", plan)
+
+    def test_creator_quizzes_page_uses_creator_created_at_index(self):
+        plan = Quiz.objects.filter(creator_id=self.creator.id).order_by("-created_at", "-id")[:21].explain()
+
+        self.assertIn("quiz_creator_created_at_idx", plan)
+
+    def test_pending_invitation_lookup_uses_unique_quiz_invited_index(self):
+        plan = Invitation.objects.filter(
+            quiz_id=self.quiz.id, invited_id=self.participant.id, accepted_at__isnull=True
+        ).explain()
+
+        self.assertIn("quiz_invitation_quiz_id_invited_id", plan)
@@ -0,0 +1,72 @@
+import unittest
+from unittest.mock import Mock, patch
+from uuid import UUID
+
+from quiz.domain.invitation.invitation_sender import InvitationSender
+from quiz.infrastructure.invitation_email_outbox_relay import InvitationEmailOutboxRelay
+
+
+@patch("quiz.infrastructure.invitation_email_outbox_relay.transaction")
+@patch("quiz.domain.invitation.invitation_email_outbox_entry.InvitationEmailOutboxEntry.objects")
+class TestInvitationEmailOutboxRelay(unittest.TestCase):
+    def setUp(self):
+        self.invitation_sender_mock = Mock(spec=InvitationSender)
+        self.relay = InvitationEmailOutboxRelay(invitation_sender=self.invitation_sender_mock, batch_size=2)
+
+        self.entry_1 = (
+            UUID("11111111-1111-1111-1111-111111111111"),
+            UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"),
+            "https://quiz.app/invitations/a/accept",
+        )
+        self.entry_2 = (
+            UUID("22222222-2222-2222-2222-222222222222"),
+            UUID("bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb"),
+            "https://quiz.app/invitations/b/accept",
+        )
+
+    def __pending_entries(self, mock_objects) -> Mock:
+        return mock_objects.select_for_update.return_value.order_by.return_value.values_list.return_value
+
+    def test_relay_hands_locked_batch_to_sender_and_deletes_it(self, mock_objects, mock_transaction):
+        self.__pending_entries(mock_objects).__getitem__ = Mock(return_value=[self.entry_1, self.entry_2])
+
+        relayed = self.relay.relay()
+
+        self.assertEqual(relayed, 2)
+        mock_transaction.atomic.assert_called_once()
+        mock_objects.select_for_update.assert_called_once_with(skip_locked=True)
+        mock_objects.select_for_update.return_value.order_by.assert_called_once_with("id")
+        self.__pending_entries(mock_objects).__getitem__.assert_called_once_with(slice(None, 2, None))
+        self.invitation_sender_mock.send_invitation_emails.assert_called_once_with(
+            {self.entry_1[1]: self.entry_1[2], self.entry_2[1]: self.entry_2[2]}
+        )
+        mock_objects.filter.assert_called_once_with(id__in=[self.entry_1[0], self.entry_2[0]])
+        mock_objects.filter.return_value.delete.assert_called_once()
+
+    def test_relay_with_empty_outbox(self, mock_objects, mock_transaction):
+        self.__pending_entries(mock_objects).__getitem__ = Mock(return_value=[])
+
+        relayed = self.relay.relay()
+
+        self.assertEqual(relayed, 0)
+        self.invitation_sender_mock.send_invitation_emails.assert_not_called()
+        mock_objects.filter.assert_not_called()
+
+    def test_relay_keeps_entries_when_sender_fails(self, mock_objects, mock_transaction):
+        self.__pending_entries(mock_objects).__getitem__ = Mock(return_value=[self.entry_1])
+        self.invitation_sender_mock.send_invitation_emails.side_effect = ConnectionError("Redis unavailable")
+
+        with self.assertRaises(ConnectionError):
+            self.relay.relay()
+
+        mock_objects.filter.assert_not_called()
+
+    def test_relay_all_drains_outbox_in_batches(self, mock_objects, mock_transaction):
+        self.__pending_entries(mock_objects).__getitem__ = Mock(
+            side_effect=[[self.entry_1, self.entry_2], [self.entry_1, self.entry_2], [self.entry_1]]
+        )
+
+        relayed = self.relay.relay_all()
+
+        self.assertEqual(relayed, 5)
+        self.assertEqual(self.invitation_sender_mock.send_invitation_emails.call_count, 3)
@@ -0,0 +1,124 @@
+import unittest
+from unittest.mock import Mock, PropertyMock, patch
+from uuid import UUID
+
+from django.template.loader import render_to_string
+
+from quiz.domain.invitation.invitation import Invitation
+from quiz.domain.quiz.quiz import Quiz
+from quiz.infrastructure.invitation_email_renderer import (
+    InvitationEmailRenderer,
+    RenderedInvitationEmail,
+    load_invitation_email_templates,
+)
+from user.domain.user import User
+
+
+class TestInvitationEmailRenderer(unittest.TestCase):
+    def setUp(self):
+        self.renderer = InvitationEmailRenderer()
+        self.quiz_id = UUID("12345678-1234-5678-9abc-123456789abc")
+        self.inviter_id = UUID("87654321-4321-8765-cba9-987654321098")
+
+        self.mock_quiz = Mock(spec=Quiz)
+        self.mock_quiz.title = "JavaScript Fundamentals"
+        self.mock_quiz.description = "Learn the basics of JavaScript programming"
+
+        self.mock_inviter = Mock(spec=User)
+        self.mock_inviter.first_name = "John"
+        self.mock_inviter.username = "john_teacher"
+
+        self.invitation_link = "https://quiz.app/accept/12345678-abcd-efgh"
+
+    def test_render_matches_render_to_string_output(self):
+        invitation = self.__create_invitation(0)
+
+        email = self.renderer.render(invitation, self.invitation_link)
+
+        expected_context = {
+            "participant_name": "Participant 0",
+            "quiz_title": "JavaScript Fundamentals",
+            "quiz_description": "Learn the basics of JavaScript programming",
+            "inviter_name": "John",
+            "invitation_acceptance_link": self.invitation_link,
+        }
+        self.assertEqual(
+            email,
+            RenderedInvitationEmail(
+                subject="You're invited to take the quiz: JavaScript Fundamentals",
+                plain_message=render_to_string("invitation_email.txt", expected_context),
+                html_message=render_to_string("invitation_email.html", expected_context),
+            ),
+        )
+
+    def test_render_batch_matches_render_to_string_output_for_each_participant(self):
+        invitations = [self.__create_invitation(i) for i in range(2)]
+        invitations[1].invited.first_name = "<b>Participant</b>"
+        links = {invitation.id: f"https://quiz.app/accept/{invitation.id}" for invitation in invitations}
+
+        rendered = dict(self.renderer.render_batch(invitations, links))
+
+        for invitation in invitations:
+            expected_context = {
+                "participant_name": invitation.invited.first_name,
+                "quiz_title": "JavaScript Fundamentals",
+                "quiz_description": "Learn the basics of JavaScript programming",
+                "inviter_name": "John",
+                "invitation_acceptance_link": links[invitation.id],
+            }
+            self.assertEqual(
+                rendered[invitation].plain_message, render_to_string("invitation_email.txt", expected_context)
+            )
+            self.assertEqual(
+                rendered[invitation].html_message, render_to_string("invitation_email.html", expected_context)
+            )
+
+    def test_render_falls_back_to_usernames_when_first_names_are_empty(self):
+        self.mock_inviter.first_name = ""
+        invitation = self.__create_invitation(0)
+        invitation.invited.first_name = None
+
+        email = self.renderer.render(invitation, self.invitation_link)
+
+        self.assertIn("Hello participant0!", email.plain_message)
+        self.assertIn("john_teacher has invited you", email.plain_message)
+
+    def test_render_batch_builds_quiz_context_once_per_quiz_and_inviter(self):
+        title = PropertyMock(return_value="JavaScript Fundamentals")
+        type(self.mock_quiz).title = title
+        invitations = [self.__create_invitation(i) for i in range(3)]
+        links = {invitation.id: f"https://quiz.app/accept/{invitation.id}" for invitation in invitations}
+
+        rendered = list(self.renderer.render_batch(invitations, links))
+
+        self.assertEqual([invitation for invitation, _ in rendered], invitations)
+        self.assertEqual(title.call_count, 1)
+        self.assertIn("Hello Participant 2!", rendered[2][1].plain_message)
+        self.assertIn("https://quiz.app/accept/invitation-2", rendered[2][1].html_message)
+
+    @patch("quiz.infrastructure.invitation_email_renderer.get_template")
+    def test_templates_are_loaded_once_per_process(self, mock_get_template):
+        load_invitation_email_templates.cache_clear()
+        self.addCleanup(load_invitation_email_templates.cache_clear)
+        invitations = [self.__create_invitation(i) for i in range(3)]
+
+        for invitation in invitations:
+            self.renderer.render(invitation, self.invitation_link)
+
+        self.assertEqual(mock_get_template.call_count, 2)
+        mock_get_template.assert_any_call("invitation_email.html")
+        mock_get_template.assert_any_call("invitation_email.txt")
+
+    def __create_invitation(self, index: int) -> Mock:
+        invited = Mock(spec=User)
+        invited.first_name = f"Participant {index}"
+        invited.username = f"participant{index}"
+
+        invitation = Mock(spec=Invitation)
+        invitation.id = f"invitation-{index}"
+        invitation.quiz_id = self.quiz_id
+        invitation.inviter_id = self.inviter_id
+        invitation.quiz = self.mock_quiz
+        invitation.inviter = self.mock_inviter
+        invitation.invited = invited
+        return invitation
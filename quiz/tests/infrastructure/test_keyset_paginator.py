@@ -0,0 +1,64 @@
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, Mock
+from uuid import UUID
+
+from django.db.models import Q
+
+from quiz.domain.pagination.page_cursor import PageCursor
+from quiz.infrastructure.keyset_paginator import KeysetPaginator
+
+
+class TestKeysetPaginator(unittest.TestCase):
+    def setUp(self):
+        self.paginator = KeysetPaginator()
+        self.created_at = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        self.rows = [
+            Mock(created_at=self.created_at, id=UUID(f"00000000-0000-0000-0000-00000000000{i}"))
+            for i in range(3, 0, -1)
+        ]
+
+    def __build_queryset(self, rows: list) -> MagicMock:
+        queryset = MagicMock()
+        queryset.filter.return_value = queryset
+        queryset.order_by.return_value.__getitem__.return_value = rows
+        return queryset
+
+    def test_paginate_returns_all_rows_without_next_cursor_on_last_page(self):
+        queryset = self.__build_queryset(self.rows)
+
+        page = self.paginator.paginate(queryset, limit=3)
+
+        self.assertEqual(page.items, self.rows)
+        self.assertIsNone(page.next_cursor)
+        queryset.filter.assert_not_called()
+        queryset.order_by.assert_called_once_with("-created_at", "-id")
+        queryset.order_by.return_value.__getitem__.assert_called_once_with(slice(None, 4))
+
+    def test_paginate_fetches_one_extra_row_to_build_next_cursor(self):
+        queryset = self.__build_queryset(self.rows)
+
+        page = self.paginator.paginate(queryset, limit=2)
+
+        self.assertEqual(page.items, self.rows[:2])
+        self.assertEqual(page.next_cursor, PageCursor(created_at=self.created_at, id=self.rows[1].id))
+
+    def test_paginate_filters_rows_after_cursor(self):
+        queryset = self.__build_queryset([])
+        cursor = PageCursor(created_at=self.created_at, id=self.rows[0].id)
+
+        self.paginator.paginate(queryset, limit=2, cursor=cursor)
+
+        queryset.filter.assert_called_once_with(
+            Q(created_at__lt=self.created_at) | Q(created_at=self.created_at, id__lt=self.rows[0].id)
+        )
+
+    def test_paginate_reads_cursor_from_related_fields(self):
+        paginator = KeysetPaginator(created_at_field="quiz__created_at", id_field="quiz_id")
+        rows = [Mock(quiz=Mock(created_at=self.created_at), quiz_id=row.id) for row in self.rows]
+        queryset = self.__build_queryset(rows)
+
+        page = paginator.paginate(queryset, limit=1)
+
+        self.assertEqual(page.next_cursor, PageCursor(created_at=self.created_at, id=rows[0].quiz_id))
+        queryset.order_by.assert_called_once_with("-quiz__created_at", "-quiz_id")
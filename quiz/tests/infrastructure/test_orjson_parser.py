@@ -0,0 +1,26 @@
+import unittest
+from io import BytesIO
+
+from rest_framework.exceptions import ParseError
+
+from quiz.infrastructure.orjson_parser import ORJSONParser
+
+
+class TestORJSONParser(unittest.TestCase):
+    def setUp(self):
+        self.parser = ORJSONParser()
+
+    def test_parse_returns_decoded_body(self):
+        body = b'{"answers": [{"question_id": "q1", "answer_id": "a1"}], "title": "Caf\xc3\xa9"}'
+
+        result = self.parser.parse(BytesIO(body))
+
+        self.assertEqual(result, {"answers": [{"question_id": "q1", "answer_id": "a1"}], "title": "Café"})
+
+    def test_parse_raises_parse_error_for_malformed_json(self):
+        with self.assertRaises(ParseError):
+            self.parser.parse(BytesIO(b'{"answers": ['))
+
+    def test_parse_rejects_non_finite_numbers(self):
+        with self.assertRaises(ParseError):
+            self.parser.parse(BytesIO(b'{"score": NaN}'))
@@ -0,0 +1,34 @@
+import json
+import unittest
+from uuid import UUID
+
+from rest_framework.renderers import JSONRenderer
+
+from quiz.application.get_quiz_query.get_quiz_query_response import GetQuizQueryResponse, QuizAnswer, QuizQuestion
+from quiz.infrastructure.orjson_quiz_response_encoder import ORJSONQuizResponseEncoder
+
+
+class TestORJSONQuizResponseEncoder(unittest.TestCase):
+    def setUp(self):
+        self.encoder = ORJSONQuizResponseEncoder()
+        self.response = GetQuizQueryResponse(
+            quiz_id=UUID("12345678-1234-5678-9abc-123456789abc"),
+            title="Math Quiz",
+            description="Basic math questions",
+            questions=[
+                QuizQuestion(
+                    question_id=UUID("dddddddd-dddd-dddd-dddd-dddddddddddd"),
+                    text="What is 2 + 2?",
+                    order=1,
+                    answers=[QuizAnswer(answer_id=UUID("cccccccc-cccc-cccc-cccc-cccccccccccc"), text="4", order=1)],
+                )
+            ],
+        )
+
+    def test_encode_returns_bytes(self):
+        self.assertIsInstance(self.encoder.encode(self.response), bytes)
+
+    def test_encode_matches_json_renderer_output(self):
+        encoded = self.encoder.encode(self.response)
+
+        self.assertEqual(json.loads(encoded), json.loads(JSONRenderer().render(self.response.as_dict())))
@@ -0,0 +1,65 @@
+import json
+import unittest
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+
+from rest_framework.renderers import JSONRenderer
+
+from quiz.application.get_quiz_scores.get_quiz_scores_response import GetQuizScoresResponse
+from quiz.infrastructure.orjson_renderer import ORJSONRenderer
+
+
+class TestORJSONRenderer(unittest.TestCase):
+    def setUp(self):
+        self.renderer = ORJSONRenderer()
+        self.quiz_id = UUID("12345678-1234-5678-9abc-123456789abc")
+
+    def test_render_matches_json_renderer_for_response_dicts(self):
+        data = GetQuizScoresResponse(
+            quiz_id=str(self.quiz_id),
+            quiz_title="JavaScript Fundamentals ✓",
+            total_participants=25,
+            average_score=78.5,
+            max_score=95.0,
+            min_score=45.0,
+            top_scorer_email=None,
+        ).as_dict()
+
+        rendered = self.renderer.render(data)
+
+        self.assertEqual(json.loads(rendered), json.loads(JSONRenderer().render(data)))
+
+    def test_render_encodes_uuids_datetimes_and_dataclasses_natively(self):
+        data = {
+            "quiz_id": self.quiz_id,
+            "created_at": datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc),
+            "response": GetQuizScoresResponse(
+                quiz_id=str(self.quiz_id),
+                quiz_title="Quiz",
+                total_participants=1,
+                average_score=1.0,
+                max_score=1.0,
+                min_score=1.0,
+                top_scorer_email="top@student.com",
+            ),
+        }
+
+        rendered = json.loads(self.renderer.render(data))
+
+        self.assertEqual(rendered["quiz_id"], str(self.quiz_id))
+        self.assertEqual(rendered["created_at"], "2024-01-15T10:30:00Z")
+        self.assertEqual(rendered["response"]["top_scorer_email"], "top@student.com")
+
+    def test_render_falls_back_to_drf_encoder_for_unsupported_types(self):
+        rendered = self.renderer.render({"average_score": Decimal("78.50")})
+
+        self.assertEqual(json.loads(rendered), {"average_score": 78.5})
+
+    def test_render_returns_empty_bytes_for_none(self):
+        self.assertEqual(self.renderer.render(None), b"")
+
+    def test_render_indents_when_requested(self):
+        rendered = self.renderer.render({"quiz_id": str(self.quiz_id)}, "application/json; indent=4")
+
+        self.assertIn(b'\n  "quiz_id"', rendered)
@@ -0,0 +1,35 @@
+import unittest
+from unittest.mock import patch
+from uuid import UUID
+
+from quiz.infrastructure.outbox_invitation_sender import OutboxInvitationSender
+
+
+class TestOutboxInvitationSender(unittest.TestCase):
+    def setUp(self):
+        self.sender = OutboxInvitationSender()
+        self.invitation_id = UUID("12345678-1234-5678-9abc-123456789abc")
+        self.invitation_link = "https://quiz.app/invitations/12345678-1234-5678-9abc-123456789abc/accept"
+
+    @patch("quiz.domain.invitation.invitation_email_outbox_entry.InvitationEmailOutboxEntry.objects")
+    def test_send_invitation_email_writes_outbox_entry(self, mock_objects):
+        self.sender.send_invitation_email(self.invitation_id, self.invitation_link)
+
+        mock_objects.create.assert_called_once_with(
+            invitation_id=self.invitation_id, invitation_acceptance_link=self.invitation_link
+        )
+
+    @patch("quiz.domain.invitation.invitation_email_outbox_entry.InvitationEmailOutboxEntry.objects")
+    def test_send_invitation_emails_writes_all_entries_in_one_insert(self, mock_objects):
+        other_invitation_id = UUID("aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee")
+
+        self.sender.send_invitation_emails(
+            {self.invitation_id: self.invitation_link, other_invitation_id: "https://quiz.app/other"}
+        )
+
+        mock_objects.bulk_create.assert_called_once()
+        entries = mock_objects.bulk_create.call_args[0][0]
+        self.assertEqual(
+            [(entry.invitation_id, entry.invitation_acceptance_link) for entry in entries],
+            [(self.invitation_id, self.invitation_link), (other_invitation_id, "https://quiz.app/other")],
+        )
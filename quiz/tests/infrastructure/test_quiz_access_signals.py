@@ -0,0 +1,38 @@
+import unittest
+from unittest.mock import Mock, patch
+from uuid import UUID
+
+from quiz.domain.invitation.invitation import Invitation
+from quiz.domain.participation.participation import Participation
+from quiz.infrastructure.quiz_access_signals import (
+    revoke_quiz_access_on_invitation_delete,
+    revoke_quiz_access_on_participation_delete,
+)
+
+
+@patch("quiz.infrastructure.quiz_access_signals.transaction.on_commit", side_effect=lambda callback: callback())
+@patch("quiz.infrastructure.quiz_access_signals.DjangoQuizAccessCache")
+class TestQuizAccessSignals(unittest.TestCase):
+    def setUp(self):
+        self.quiz_id = UUID("12345678-1234-5678-9abc-123456789abc")
+        self.user_id = UUID("87654321-4321-8765-cba9-987654321098")
+
+    def test_revoke_quiz_access_on_invitation_delete(self, mock_cache_class, mock_on_commit):
+        invitation = Mock(spec=Invitation)
+        invitation.quiz_id = self.quiz_id
+        invitation.invited_id = self.user_id
+
+        revoke_quiz_access_on_invitation_delete(sender=Invitation, instance=invitation)
+
+        mock_on_commit.assert_called_once()
+        mock_cache_class.return_value.revoke.assert_called_once_with(self.quiz_id, self.user_id)
+
+    def test_revoke_quiz_access_on_participation_delete(self, mock_cache_class, mock_on_commit):
+        participation = Mock(spec=Participation)
+        participation.quiz_id = self.quiz_id
+        participation.participant_id = self.user_id
+
+        revoke_quiz_access_on_participation_delete(sender=Participation, instance=participation)
+
+        mock_on_commit.assert_called_once()
+        mock_cache_class.return_value.revoke.assert_called_once_with(self.quiz_id, self.user_id)
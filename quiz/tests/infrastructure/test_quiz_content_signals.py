@@ -0,0 +1,44 @@
+import unittest
+from unittest.mock import Mock, patch
+from uuid import UUID
+
+from quiz.domain.quiz.answer import Answer
+from quiz.domain.quiz.question import Question
+from quiz.infrastructure.quiz_content_signals import touch_quiz_on_answer_change, touch_quiz_on_question_change
+
+
+class TestQuizContentSignals(unittest.TestCase):
+    def setUp(self):
+        self.quiz_id = UUID("12345678-1234-5678-9abc-123456789abc")
+        self.question_id = UUID("dddddddd-dddd-dddd-dddd-dddddddddddd")
+
+    @patch("quiz.domain.quiz.quiz.Quiz.objects")
+    def test_touch_quiz_on_question_change_updates_quiz_timestamp(self, mock_objects):
+        question = Mock(spec=Question)
+        question.quiz_id = self.quiz_id
+
+        touch_quiz_on_question_change(sender=Question, instance=question)
+
+        mock_objects.filter.assert_called_once_with(id=self.quiz_id)
+        self.assertIn("updated_at", mock_objects.filter.return_value.update.call_args.kwargs)
+
+    @patch("quiz.domain.quiz.quiz.Quiz.objects")
+    def test_touch_quiz_on_question_change_refreshes_question_totals(self, mock_objects):
+        question = Mock(spec=Question)
+        question.quiz_id = self.quiz_id
+
+        touch_quiz_on_question_change(sender=Question, instance=question)
+
+        update_kwargs = mock_objects.filter.return_value.update.call_args.kwargs
+        self.assertIn("total_questions", update_kwargs)
+        self.assertIn("total_possible_points", update_kwargs)
+
+    @patch("quiz.domain.quiz.quiz.Quiz.objects")
+    def test_touch_quiz_on_answer_change_updates_quiz_timestamp(self, mock_objects):
+        answer = Mock(spec=Answer)
+        answer.question_id = self.question_id
+
+        touch_quiz_on_answer_change(sender=Answer, instance=answer)
+
+        mock_objects.filter.assert_called_once_with(questions__id=self.question_id)
+        self.assertIn("updated_at", mock_objects.filter.return_value.update.call_args.kwargs)
@@ -0,0 +1,40 @@
+from django.test import TestCase, tag
+from django.utils import timezone
+
+from quiz.domain.invitation.invitation import Invitation
+from quiz.domain.participation.participation import Participation
+from quiz.domain.quiz.question import Question
+from quiz.domain.quiz.quiz import Quiz
+from quiz.infrastructure.db_participation_finder import DbParticipationFinder
+from user.domain.user import User
+
+
+@tag("postgres")
+class TestQuizScoreDistributionQuery(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.creator = User.objects.create_user(username="creator", email="creator@test.com", password="password")
+        cls.quiz = Quiz.objects.create(title="Distribution Quiz", description="", creator=cls.creator)
+        Question.objects.create(quiz=cls.quiz, text="Q1", order=1, points=6)
+        Question.objects.create(quiz=cls.quiz, text="Q2", order=2, points=4)
+
+        for index, score in enumerate([0, 4, 6, 10, None]):
+            participant = User.objects.create_user(
+                username=f"participant{index}", email=f"participant{index}@test.com", password="password"
+            )
+            invitation = Invitation.objects.create(quiz=cls.quiz, invited=participant, inviter=cls.creator)
+            Participation.objects.create(
+                quiz=cls.quiz,
+                participant=participant,
+                invitation=invitation,
+                score=score,
+                completed_at=timezone.now() if score is not None else None,
+            )
+
+    def test_find_quiz_score_distribution_computes_percentiles_and_buckets(self):
+        result = DbParticipationFinder().find_quiz_score_distribution(self.quiz.id, bucket_count=2)
+
+        self.assertEqual(result.total_scored, 4)
+        self.assertEqual(result.max_possible_score, 10)
+        self.assertEqual(result.p50, 5.0)
+        self.assertEqual([bucket.count for bucket in result.buckets], [2, 2])
@@ -2,8 +2,14 @@ import unittest
 from unittest.mock import Mock, patch
 from uuid import UUID
 
+from django.conf import settings
+
+from config.celery import app as celery_app
 from quiz.application.send_invitation_email.send_invitation_email_command import SendInvitationEmailCommand
-from quiz.infrastructure.send_invitation_email_task import send_invitation_email_task
+from quiz.application.send_invitation_emails.send_invitation_emails_command import SendInvitationEmailsCommand
+from quiz.application.send_invitation_emails.send_invitation_emails_response import SendInvitationEmailsResponse
+from quiz.infrastructure.relay_invitation_email_outbox_task import relay_invitation_email_outbox_task
+from quiz.infrastructure.send_invitation_email_task import send_invitation_email_task, send_invitation_emails_task
 
 
 class TestSendInvitationEmailTask(unittest.TestCase):
@@ -133,3 +139,69 @@ class TestSendInvitationEmailTask(unittest.TestCase):
         self.assertTrue(hasattr(call_args, "invitation_id"))
         self.assertTrue(hasattr(call_args, "invitation_acceptance_link"))
         self.assertEqual(len(call_args.__dict__), 2)
+
+    @patch("quiz.infrastructure.send_invitation_email_task.send_invitation_email_task")
+    @patch("quiz.infrastructure.send_invitation_email_task.SendInvitationEmailsCommandHandlerFactory")
+    def test_send_invitation_emails_task_sends_batch_and_requeues_failures_individually(
+        self, mock_factory, mock_single_task
+    ):
+        failed_id_str = "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee"
+        invitations = [
+            {"invitation_id": self.invitation_id_str, "invitation_acceptance_link": self.invitation_link},
+            {"invitation_id": failed_id_str, "invitation_acceptance_link": "https://quiz.app/accept/failed"},
+        ]
+        mock_handler = Mock()
+        mock_handler.handle.return_value = SendInvitationEmailsResponse(
+            sent_count=1, failed_invitation_ids=[UUID(failed_id_str)]
+        )
+        mock_factory.create.return_value = mock_handler
+
+        send_invitation_emails_task(invitations)
+
+        command = mock_handler.handle.call_args[0][0]
+        self.assertIsInstance(command, SendInvitationEmailsCommand)
+        self.assertEqual(
+            command.invitation_acceptance_links,
+            {
+                self.invitation_id_uuid: self.invitation_link,
+                UUID(failed_id_str): "https://quiz.app/accept/failed",
+            },
+        )
+        mock_single_task.delay.assert_called_once_with(
+            invitation_id=failed_id_str, invitation_acceptance_link="https://quiz.app/accept/failed"
+        )
+
+    @patch("quiz.infrastructure.send_invitation_email_task.send_invitation_email_task")
+    @patch("quiz.infrastructure.send_invitation_email_task.SendInvitationEmailsCommandHandlerFactory")
+    def test_send_invitation_emails_task_without_failures(self, mock_factory, mock_single_task):
+        mock_handler = Mock()
+        mock_handler.handle.return_value = SendInvitationEmailsResponse(sent_count=1, failed_invitation_ids=[])
+        mock_factory.create.return_value = mock_handler
+
+        send_invitation_emails_task(
+            [{"invitation_id": self.invitation_id_str, "invitation_acceptance_link": self.invitation_link}]
+        )
+
+        mock_handler.handle.assert_called_once()
+        mock_single_task.delay.assert_not_called()
+
+
+class TestSendInvitationEmailTaskRouting(unittest.TestCase):
+    def test_email_tasks_are_routed_to_the_emails_queue(self):
+        for task in (send_invitation_email_task, send_invitation_emails_task):
+            route = celery_app.amqp.router.route({}, task.name)
+
+            self.assertEqual(route["queue"].name, settings.CELERY_EMAIL_QUEUE)
+
+    def test_other_tasks_are_routed_to_the_default_queue(self):
+        route = celery_app.amqp.router.route({}, relay_invitation_email_outbox_task.name)
+
+        self.assertEqual(route["queue"].name, settings.CELERY_TASK_DEFAULT_QUEUE)
+
+    def test_email_tasks_are_rate_limited_acknowledged_late_and_result_less(self):
+        self.assertEqual(send_invitation_email_task.rate_limit, settings.INVITATION_EMAIL_TASK_RATE_LIMIT)
+        self.assertEqual(send_invitation_emails_task.rate_limit, settings.INVITATION_EMAIL_BATCH_TASK_RATE_LIMIT)
+        for task in (send_invitation_email_task, send_invitation_emails_task):
+            self.assertTrue(task.acks_late)
+            self.assertTrue(task.reject_on_worker_lost)
+            self.assertTrue(task.ignore_result)
@@ -0,0 +1,31 @@
+from django.test import TestCase, tag
+
+from quiz.domain.participation.participation import Participation
+from quiz.domain.quiz.quiz import Quiz
+from quiz.infrastructure.db_participation_finder import DbParticipationFinder
+from user.domain.user import User
+
+
+@tag("postgres")
+class TestUserQuizzesQueryCount(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.creator = User.objects.create_user(username="creator", email="creator@test.com", password="password")
+        cls.participant = User.objects.create_user(
+            username="participant", email="participant@test.com", password="password"
+        )
+        cls.other_participant = User.objects.create_user(username="other", email="other@test.com", password="password")
+        for index in range(5):
+            quiz = Quiz.objects.create(
+                title=f"Quiz {index}", description="", creator=cls.creator, total_questions=index
+            )
+            Participation.objects.create(quiz=quiz, participant=cls.participant)
+            if index % 2 == 0:
+                Participation.objects.create(quiz=quiz, participant=cls.other_participant)
+
+    def test_find_quiz_participation_summaries_by_user_id_runs_a_single_query(self):
+        with self.assertNumQueries(1):
+            page = DbParticipationFinder().find_quiz_participation_summaries_by_user_id(self.participant.id, limit=20)
+
+        self.assertEqual([summary.total_questions for summary in page.items], [4, 3, 2, 1, 0])
+        self.assertEqual([summary.total_participants for summary in page.items], [2, 1, 2, 1, 2])
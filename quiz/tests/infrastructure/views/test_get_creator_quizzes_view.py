@@ -2,9 +2,11 @@ import unittest
 from unittest.mock import Mock
 from uuid import UUID
 
+from django.http import QueryDict
 from rest_framework import status
 
 from quiz.application.get_creator_quizzes.get_creator_quizzes_response import GetCreatorQuizzesResponse, QuizSummary
+from quiz.domain.pagination.invalid_page_cursor_exception import InvalidPageCursorException
 from quiz.infrastructure.views.get_creator_quizzes_view import GetCreatorQuizzesView
 from user.domain.user import User
 
@@ -19,6 +21,7 @@ class TestGetCreatorQuizzesView(unittest.TestCase):
 
         self.mock_request = Mock()
         self.mock_request.user = self.mock_user
+        self.mock_request.query_params = QueryDict()
 
         self.mock_query_handler = Mock()
         self.mock_logger = Mock()
@@ -45,7 +48,7 @@ class TestGetCreatorQuizzesView(unittest.TestCase):
         )
 
         mock_response = GetCreatorQuizzesResponse(
-            creator_id=str(self.creator_id), quizzes=[quiz_summary_1, quiz_summary_2], total_count=2
+            creator_id=str(self.creator_id), quizzes=[quiz_summary_1, quiz_summary_2], count=2
         )
 
         self.mock_query_handler.handle.return_value = mock_response
@@ -54,7 +57,7 @@ class TestGetCreatorQuizzesView(unittest.TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["creator_id"], str(self.creator_id))
-        self.assertEqual(response.data["total_count"], 2)
+        self.assertEqual(response.data["count"], 2)
         self.assertEqual(len(response.data["quizzes"]), 2)
         self.assertEqual(response.data["quizzes"][0]["title"], "JavaScript Fundamentals")
         self.assertEqual(response.data["quizzes"][1]["title"], "Python Advanced")
@@ -66,7 +69,7 @@ class TestGetCreatorQuizzesView(unittest.TestCase):
         self.assertEqual(query_arg.creator_id, str(self.creator_id))
 
     def test_get_success_with_empty_quizzes(self):
-        mock_response = GetCreatorQuizzesResponse(creator_id=str(self.creator_id), quizzes=[], total_count=0)
+        mock_response = GetCreatorQuizzesResponse(creator_id=str(self.creator_id), quizzes=[], count=0)
 
         self.mock_query_handler.handle.return_value = mock_response
 
@@ -74,7 +77,7 @@ class TestGetCreatorQuizzesView(unittest.TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["creator_id"], str(self.creator_id))
-        self.assertEqual(response.data["total_count"], 0)
+        self.assertEqual(response.data["count"], 0)
         self.assertEqual(len(response.data["quizzes"]), 0)
         self.assertEqual(response.data["quizzes"], [])
 
@@ -98,9 +101,7 @@ class TestGetCreatorQuizzesView(unittest.TestCase):
             updated_at="2024-01-25T09:00:00.000000Z",
         )
 
-        mock_response = GetCreatorQuizzesResponse(
-            creator_id=str(different_creator_id), quizzes=[quiz_summary], total_count=1
-        )
+        mock_response = GetCreatorQuizzesResponse(creator_id=str(different_creator_id), quizzes=[quiz_summary], count=1)
 
         self.mock_query_handler.handle.return_value = mock_response
 
@@ -123,16 +124,14 @@ class TestGetCreatorQuizzesView(unittest.TestCase):
             updated_at="2024-02-01T16:45:00.000000Z",
         )
 
-        mock_response = GetCreatorQuizzesResponse(
-            creator_id=str(self.creator_id), quizzes=[quiz_summary], total_count=1
-        )
+        mock_response = GetCreatorQuizzesResponse(creator_id=str(self.creator_id), quizzes=[quiz_summary], count=1)
 
         self.mock_query_handler.handle.return_value = mock_response
 
         response = self.view.get(self.mock_request, self.creator_id)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["total_count"], 1)
+        self.assertEqual(response.data["count"], 1)
         self.assertEqual(len(response.data["quizzes"]), 1)
         self.assertEqual(response.data["quizzes"][0]["id"], str(UUID("dddddddd-eeee-ffff-0000-111111111111")))
         self.assertEqual(response.data["quizzes"][0]["questions_count"], 12)
@@ -168,7 +167,7 @@ class TestGetCreatorQuizzesView(unittest.TestCase):
         )
 
         mock_response = GetCreatorQuizzesResponse(
-            creator_id=str(self.creator_id), quizzes=[quiz_1, quiz_2, quiz_3], total_count=3
+            creator_id=str(self.creator_id), quizzes=[quiz_1, quiz_2, quiz_3], count=3
         )
 
         self.mock_query_handler.handle.return_value = mock_response
@@ -176,7 +175,7 @@ class TestGetCreatorQuizzesView(unittest.TestCase):
         response = self.view.get(self.mock_request, self.creator_id)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["total_count"], 3)
+        self.assertEqual(response.data["count"], 3)
         self.assertEqual(len(response.data["quizzes"]), 3)
 
         quiz_ids = [quiz["id"] for quiz in response.data["quizzes"]]
@@ -189,3 +188,47 @@ class TestGetCreatorQuizzesView(unittest.TestCase):
 
         quiz_titles = [quiz["title"] for quiz in response.data["quizzes"]]
         self.assertEqual(quiz_titles, ["First Quiz", "Second Quiz", "Third Quiz"])
+
+    def test_get_uses_default_page_size_without_query_params(self):
+        self.mock_query_handler.handle.return_value = GetCreatorQuizzesResponse(
+            creator_id=str(self.creator_id), quizzes=[], count=0, next_cursor="next-page"
+        )
+
+        response = self.view.get(self.mock_request, self.creator_id)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["next_cursor"], "next-page")
+        query_arg = self.mock_query_handler.handle.call_args[0][0]
+        self.assertEqual(query_arg.limit, 20)
+        self.assertIsNone(query_arg.cursor)
+
+    def test_get_passes_limit_and_cursor_to_query(self):
+        self.mock_request.query_params = QueryDict("limit=5&cursor=some-cursor")
+        self.mock_query_handler.handle.return_value = GetCreatorQuizzesResponse(
+            creator_id=str(self.creator_id), quizzes=[], count=0, next_cursor="next-page"
+        )
+
+        response = self.view.get(self.mock_request, self.creator_id)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        query_arg = self.mock_query_handler.handle.call_args[0][0]
+        self.assertEqual(query_arg.limit, 5)
+        self.assertEqual(query_arg.cursor, "some-cursor")
+
+    def test_get_returns_bad_request_when_limit_is_out_of_range(self):
+        self.mock_request.query_params = QueryDict("limit=101")
+
+        response = self.view.get(self.mock_request, self.creator_id)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("The query parameters are invalid", response.data["message"])
+        self.mock_query_handler.handle.assert_not_called()
+
+    def test_get_returns_bad_request_when_cursor_is_invalid(self):
+        self.mock_request.query_params = QueryDict("cursor=not-a-cursor")
+        self.mock_query_handler.handle.side_effect = InvalidPageCursorException("not-a-cursor")
+
+        response = self.view.get(self.mock_request, self.creator_id)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["message"], "Page cursor 'not-a-cursor' is not valid")
@@ -0,0 +1,80 @@
+import unittest
+from unittest.mock import Mock
+from uuid import UUID
+
+from rest_framework import status
+
+from quiz.application.get_quiz_score_distribution.get_quiz_score_distribution_response import (
+    GetQuizScoreDistributionResponse,
+)
+from quiz.domain.participation.quiz_score_distribution import ScoreBucket
+from quiz.domain.quiz.quiz_not_found_exception import QuizNotFoundException
+from quiz.domain.quiz.unauthorized_quiz_access_exception import UnauthorizedQuizAccessException
+from quiz.infrastructure.views.get_quiz_score_distribution_view import GetQuizScoreDistributionView
+from user.domain.user import User
+
+
+class TestGetQuizScoreDistributionView(unittest.TestCase):
+    def setUp(self):
+        self.quiz_id = UUID("12345678-1234-5678-9abc-123456789abc")
+        self.user_id = UUID("87654321-4321-8765-cba9-987654321098")
+
+        self.mock_user = Mock(spec=User)
+        self.mock_user.id = self.user_id
+
+        self.mock_request = Mock()
+        self.mock_request.user = self.mock_user
+
+        self.mock_query_handler = Mock()
+        self.mock_logger = Mock()
+        self.view = GetQuizScoreDistributionView(query_handler=self.mock_query_handler, logger=self.mock_logger)
+
+    def test_get_success(self):
+        self.mock_query_handler.handle.return_value = GetQuizScoreDistributionResponse(
+            quiz_id=str(self.quiz_id),
+            quiz_title="JavaScript Fundamentals",
+            total_scored=4,
+            max_possible_score=10,
+            p50=6.5,
+            p90=9.1,
+            p99=9.91,
+            buckets=[
+                ScoreBucket(min_score=0.0, max_score=5.0, count=1),
+                ScoreBucket(min_score=5.0, max_score=10.0, count=3),
+            ],
+        )
+
+        response = self.view.get(self.mock_request, self.quiz_id)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total_scored"], 4)
+        self.assertEqual(response.data["percentiles"], {"p50": 6.5, "p90": 9.1, "p99": 9.91})
+        self.assertEqual(response.data["buckets"][1], {"min_score": 5.0, "max_score": 10.0, "count": 3})
+
+        query_arg = self.mock_query_handler.handle.call_args[0][0]
+        self.assertEqual(query_arg.quiz_id, str(self.quiz_id))
+        self.assertEqual(query_arg.requester_id, str(self.user_id))
+
+    def test_get_handles_quiz_not_found_exception(self):
+        self.mock_query_handler.handle.side_effect = QuizNotFoundException(str(self.quiz_id))
+
+        response = self.view.get(self.mock_request, self.quiz_id)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_get_handles_unauthorized_quiz_access_exception(self):
+        self.mock_query_handler.handle.side_effect = UnauthorizedQuizAccessException(
+            quiz_id=str(self.quiz_id), user_id=str(self.user_id)
+        )
+
+        response = self.view.get(self.mock_request, self.quiz_id)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_get_handles_unexpected_exception(self):
+        self.mock_query_handler.handle.side_effect = Exception("Unexpected error")
+
+        response = self.view.get(self.mock_request, self.quiz_id)
+
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertEqual(response.data["message"], "Internal server error when getting quiz score distribution")
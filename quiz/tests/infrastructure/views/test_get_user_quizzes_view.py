@@ -2,9 +2,11 @@ import unittest
 from unittest.mock import Mock
 from uuid import UUID
 
+from django.http import QueryDict
 from rest_framework import status
 
 from quiz.application.get_user_quizzes.get_user_quizzes_response import GetUserQuizzesResponse, QuizParticipationSummary
+from quiz.domain.pagination.invalid_page_cursor_exception import InvalidPageCursorException
 from quiz.infrastructure.views.get_user_quizzes_view import GetUserQuizzesView
 from user.domain.user import User
 from user.domain.user_not_found_exception import UserNotFoundException
@@ -20,6 +22,7 @@ class TestGetUserQuizzesView(unittest.TestCase):
 
         self.mock_request = Mock()
         self.mock_request.user = self.mock_user
+        self.mock_request.query_params = QueryDict()
 
         self.mock_query_handler = Mock()
         self.mock_logger = Mock()
@@ -51,7 +54,7 @@ class TestGetUserQuizzesView(unittest.TestCase):
         )
 
         mock_response = GetUserQuizzesResponse(
-            quizzes_participations=[quiz_participation_1, quiz_participation_2], total_count=2
+            quizzes_participations=[quiz_participation_1, quiz_participation_2], count=2
         )
 
         self.mock_query_handler.handle.return_value = mock_response
@@ -59,7 +62,7 @@ class TestGetUserQuizzesView(unittest.TestCase):
         response = self.view.get(self.mock_request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["total_count"], 2)
+        self.assertEqual(response.data["count"], 2)
         self.assertEqual(len(response.data["user_quizzes"]), 2)
         self.assertEqual(response.data["user_quizzes"][0]["quiz_title"], "JavaScript Fundamentals")
         self.assertEqual(response.data["user_quizzes"][0]["status"], "completed")
@@ -72,14 +75,14 @@ class TestGetUserQuizzesView(unittest.TestCase):
         self.assertEqual(query_arg.requester_id, self.user_id)
 
     def test_get_success_with_empty_quizzes(self):
-        mock_response = GetUserQuizzesResponse(quizzes_participations=[], total_count=0)
+        mock_response = GetUserQuizzesResponse(quizzes_participations=[], count=0)
 
         self.mock_query_handler.handle.return_value = mock_response
 
         response = self.view.get(self.mock_request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["total_count"], 0)
+        self.assertEqual(response.data["count"], 0)
         self.assertEqual(len(response.data["user_quizzes"]), 0)
         self.assertEqual(response.data["user_quizzes"], [])
 
@@ -104,6 +107,7 @@ class TestGetUserQuizzesView(unittest.TestCase):
         different_user.id = different_user_id
 
         different_request = Mock()
+        different_request.query_params = QueryDict()
         different_request.user = different_user
 
         quiz_participation = QuizParticipationSummary(
@@ -117,7 +121,7 @@ class TestGetUserQuizzesView(unittest.TestCase):
             participation_created_at="2024-01-25T09:00:00.000000Z",
         )
 
-        mock_response = GetUserQuizzesResponse(quizzes_participations=[quiz_participation], total_count=1)
+        mock_response = GetUserQuizzesResponse(quizzes_participations=[quiz_participation], count=1)
 
         self.mock_query_handler.handle.return_value = mock_response
 
@@ -141,14 +145,14 @@ class TestGetUserQuizzesView(unittest.TestCase):
             participation_created_at="2024-02-01T17:00:00.000000Z",
         )
 
-        mock_response = GetUserQuizzesResponse(quizzes_participations=[quiz_participation], total_count=1)
+        mock_response = GetUserQuizzesResponse(quizzes_participations=[quiz_participation], count=1)
 
         self.mock_query_handler.handle.return_value = mock_response
 
         response = self.view.get(self.mock_request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["total_count"], 1)
+        self.assertEqual(response.data["count"], 1)
         self.assertEqual(len(response.data["user_quizzes"]), 1)
         self.assertEqual(response.data["user_quizzes"][0]["quiz_title"], "React Components")
         self.assertEqual(response.data["user_quizzes"][0]["score"], 95)
@@ -166,7 +170,7 @@ class TestGetUserQuizzesView(unittest.TestCase):
             participation_created_at="2024-02-05T13:00:00.000000Z",
         )
 
-        mock_response = GetUserQuizzesResponse(quizzes_participations=[quiz_participation], total_count=1)
+        mock_response = GetUserQuizzesResponse(quizzes_participations=[quiz_participation], count=1)
 
         self.mock_query_handler.handle.return_value = mock_response
 
@@ -214,7 +218,7 @@ class TestGetUserQuizzesView(unittest.TestCase):
         )
 
         mock_response = GetUserQuizzesResponse(
-            quizzes_participations=[completed_quiz, in_progress_quiz, not_started_quiz], total_count=3
+            quizzes_participations=[completed_quiz, in_progress_quiz, not_started_quiz], count=3
         )
 
         self.mock_query_handler.handle.return_value = mock_response
@@ -222,7 +226,7 @@ class TestGetUserQuizzesView(unittest.TestCase):
         response = self.view.get(self.mock_request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["total_count"], 3)
+        self.assertEqual(response.data["count"], 3)
         self.assertEqual(len(response.data["user_quizzes"]), 3)
 
         quiz_statuses = [quiz["status"] for quiz in response.data["user_quizzes"]]
@@ -230,3 +234,47 @@ class TestGetUserQuizzesView(unittest.TestCase):
 
         quiz_scores = [quiz["score"] for quiz in response.data["user_quizzes"]]
         self.assertEqual(quiz_scores, [75, None, None])
+
+    def test_get_uses_default_page_size_without_query_params(self):
+        self.mock_query_handler.handle.return_value = GetUserQuizzesResponse(
+            quizzes_participations=[], count=0, next_cursor="next-page"
+        )
+
+        response = self.view.get(self.mock_request)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["next_cursor"], "next-page")
+        query_arg = self.mock_query_handler.handle.call_args[0][0]
+        self.assertEqual(query_arg.limit, 20)
+        self.assertIsNone(query_arg.cursor)
+
+    def test_get_passes_limit_and_cursor_to_query(self):
+        self.mock_request.query_params = QueryDict("limit=5&cursor=some-cursor")
+        self.mock_query_handler.handle.return_value = GetUserQuizzesResponse(
+            quizzes_participations=[], count=0, next_cursor="next-page"
+        )
+
+        response = self.view.get(self.mock_request)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        query_arg = self.mock_query_handler.handle.call_args[0][0]
+        self.assertEqual(query_arg.limit, 5)
+        self.assertEqual(query_arg.cursor, "some-cursor")
+
+    def test_get_returns_bad_request_when_limit_is_out_of_range(self):
+        self.mock_request.query_params = QueryDict("limit=101")
+
+        response = self.view.get(self.mock_request)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("The query parameters are invalid", response.data["message"])
+        self.mock_query_handler.handle.assert_not_called()
+
+    def test_get_returns_bad_request_when_cursor_is_invalid(self):
+        self.mock_request.query_params = QueryDict("cursor=not-a-cursor")
+        self.mock_query_handler.handle.side_effect = InvalidPageCursorException("not-a-cursor")
+
+        response = self.view.get(self.mock_request)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["message"], "Page cursor 'not-a-cursor' is not valid")
@@ -25,7 +25,7 @@ class TestQuizzesDispatcherView(unittest.TestCase):
     def test_get_delegates_to_get_view(self):
         mock_get_response = Mock()
         mock_get_response.status_code = status.HTTP_200_OK
-        mock_get_response.data = {"user_quizzes": [], "total_count": 0}
+        mock_get_response.data = {"user_quizzes": [], "count": 0}
 
         self.mock_get_view.get.return_value = mock_get_response
 
@@ -33,7 +33,7 @@ class TestQuizzesDispatcherView(unittest.TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["user_quizzes"], [])
-        self.assertEqual(response.data["total_count"], 0)
+        self.assertEqual(response.data["count"], 0)
 
         self.mock_get_view.get.assert_called_once_with(self.mock_request)
 
@@ -0,0 +1,132 @@
+import unittest
+from unittest.mock import Mock
+from uuid import UUID
+
+from rest_framework import status
+from voluptuous import MultipleInvalid
+
+from quiz.application.send_bulk_invitations.bulk_invitation_status import BulkInvitationStatus
+from quiz.application.send_bulk_invitations.send_bulk_invitations_response import (
+    BulkInvitationResult,
+    SendBulkInvitationsResponse,
+)
+from quiz.domain.invitation.only_quiz_creator_can_send_invitation_exception import (
+    OnlyQuizCreatorCanSendInvitationException,
+)
+from quiz.domain.quiz.quiz_not_found_exception import QuizNotFoundException
+from quiz.infrastructure.views.send_bulk_invitations_view import SendBulkInvitationsView
+from quiz.infrastructure.views.send_bulk_invitations_view_schema import (
+    MAX_BULK_INVITATIONS,
+    send_bulk_invitations_view_schema,
+)
+from user.domain.user import User
+
+
+class TestSendBulkInvitationsView(unittest.TestCase):
+    def setUp(self):
+        self.quiz_id = "12345678-1234-5678-9abc-123456789abc"
+        self.user_id = UUID("87654321-4321-8765-cba9-987654321098")
+        self.participant_emails = ["alice@example.com", "bob@example.com"]
+
+        self.mock_user = Mock(spec=User)
+        self.mock_user.id = self.user_id
+        self.mock_user.email = "creator@example.com"
+
+        self.mock_request = Mock()
+        self.mock_request.user = self.mock_user
+        self.mock_request.data = {"participant_emails": self.participant_emails}
+
+        self.mock_command_handler = Mock()
+        self.mock_schema = Mock()
+        self.mock_logger = Mock()
+        self.view = SendBulkInvitationsView(
+            command_handler=self.mock_command_handler, schema=self.mock_schema, logger=self.mock_logger
+        )
+
+    def test_post_success(self):
+        self.mock_schema.return_value = {"participant_emails": self.participant_emails}
+        self.mock_command_handler.handle.return_value = SendBulkInvitationsResponse(
+            quiz_id=self.quiz_id,
+            quiz_title="JavaScript Fundamentals",
+            results=[
+                BulkInvitationResult(
+                    participant_email="alice@example.com",
+                    status=BulkInvitationStatus.INVITED,
+                    invitation_id="invitation-123",
+                    invitation_acceptance_link="https://example.com/invitations/invitation-123/accept",
+                ),
+                BulkInvitationResult(participant_email="bob@example.com", status=BulkInvitationStatus.USER_NOT_FOUND),
+            ],
+        )
+
+        response = self.view.post(self.mock_request, self.quiz_id)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total_invited"], 1)
+        self.assertEqual(response.data["results"][0]["status"], "invited")
+        self.assertEqual(response.data["results"][0]["invitation_id"], "invitation-123")
+        self.assertEqual(response.data["results"][1]["status"], "user_not_found")
+        self.assertIsNone(response.data["results"][1]["invitation_id"])
+
+        command_arg = self.mock_command_handler.handle.call_args[0][0]
+        self.assertEqual(command_arg.quiz_id, self.quiz_id)
+        self.assertEqual(command_arg.participant_emails, self.participant_emails)
+        self.assertEqual(command_arg.inviter_id, str(self.user_id))
+        self.assertEqual(command_arg.inviter_email, "creator@example.com")
+
+    def test_post_handles_validation_error(self):
+        self.mock_schema.side_effect = MultipleInvalid("Invalid email format")
+
+        response = self.view.post(self.mock_request, self.quiz_id)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("The request body is invalid", response.data["message"])
+        self.mock_command_handler.handle.assert_not_called()
+
+    def test_post_handles_quiz_not_found_exception(self):
+        self.mock_schema.return_value = {"participant_emails": self.participant_emails}
+        self.mock_command_handler.handle.side_effect = QuizNotFoundException(self.quiz_id)
+
+        response = self.view.post(self.mock_request, self.quiz_id)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_post_handles_only_quiz_creator_can_send_invitation_exception(self):
+        self.mock_schema.return_value = {"participant_emails": self.participant_emails}
+        self.mock_command_handler.handle.side_effect = OnlyQuizCreatorCanSendInvitationException(
+            quiz_id=self.quiz_id, user_id=str(self.user_id)
+        )
+
+        response = self.view.post(self.mock_request, self.quiz_id)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_post_handles_unexpected_exception(self):
+        self.mock_schema.return_value = {"participant_emails": self.participant_emails}
+        self.mock_command_handler.handle.side_effect = Exception("Broker unavailable")
+
+        response = self.view.post(self.mock_request, self.quiz_id)
+
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.mock_logger.exception.assert_called_once()
+
+
+class TestSendBulkInvitationsViewSchema(unittest.TestCase):
+    def test_accepts_list_of_emails(self):
+        result = send_bulk_invitations_view_schema({"participant_emails": [" alice@example.com ", "bob@example.com"]})
+
+        self.assertEqual(result["participant_emails"], ["alice@example.com", "bob@example.com"])
+
+    def test_rejects_empty_list(self):
+        with self.assertRaises(MultipleInvalid):
+            send_bulk_invitations_view_schema({"participant_emails": []})
+
+    def test_rejects_invalid_email(self):
+        with self.assertRaises(MultipleInvalid):
+            send_bulk_invitations_view_schema({"participant_emails": ["alice@example.com", "not-an-email"]})
+
+    def test_rejects_too_many_emails(self):
+        emails = [f"user{i}@example.com" for i in range(MAX_BULK_INVITATIONS + 1)]
+
+        with self.assertRaises(MultipleInvalid):
+            send_bulk_invitations_view_schema({"participant_emails": emails})
@@ -0,0 +1,16 @@
+import unittest
+from io import StringIO
+
+from django.core.management import call_command
+
+
+class TestBenchmarkInvitationEmailRenderingCommand(unittest.TestCase):
+    def test_reports_renders_per_second_before_and_after(self):
+        stdout = StringIO()
+
+        call_command("benchmark_invitation_email_rendering", emails=10, quizzes=2, repeat=2, stdout=stdout)
+
+        output = stdout.getvalue()
+        self.assertRegex(output, r"render_to_string:\s+[\d,]+ renders/sec")
+        self.assertRegex(output, r"InvitationEmailRenderer:\s+[\d,]+ renders/sec")
+        self.assertRegex(output, r"Speedup: \d+\.\d{2}x")
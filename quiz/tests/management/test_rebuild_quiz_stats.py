@@ -0,0 +1,45 @@
+import unittest
+from io import StringIO
+from unittest.mock import Mock, patch
+from uuid import UUID
+
+from django.core.management import call_command
+
+from quiz.domain.quiz.quiz_stats_repository import QuizStatsRepository
+from quiz.management.commands.rebuild_quiz_stats import Command
+
+
+class TestRebuildQuizStatsCommand(unittest.TestCase):
+    def setUp(self):
+        self.quiz_stats_repository_mock = Mock(spec=QuizStatsRepository)
+        self.command = Command(quiz_stats_repository=self.quiz_stats_repository_mock)
+        self.quiz_id_1 = UUID("12345678-1234-5678-9abc-123456789abc")
+        self.quiz_id_2 = UUID("87654321-4321-8765-cba9-987654321098")
+
+    @patch("quiz.management.commands.rebuild_quiz_stats.transaction")
+    @patch("quiz.domain.quiz.quiz.Quiz.objects")
+    def test_rebuilds_every_quiz(self, mock_quiz_objects, mock_transaction):
+        mock_quiz_objects.order_by.return_value.values_list.return_value.iterator.return_value = iter(
+            [self.quiz_id_1, self.quiz_id_2]
+        )
+        stdout = StringIO()
+
+        call_command(self.command, stdout=stdout)
+
+        self.assertEqual(
+            [call.args[0] for call in self.quiz_stats_repository_mock.rebuild.call_args_list],
+            [self.quiz_id_1, self.quiz_id_2],
+        )
+        self.assertEqual(mock_transaction.atomic.call_count, 2)
+        self.assertIn("Rebuilt stats for 2 quizzes", stdout.getvalue())
+
+    @patch("quiz.management.commands.rebuild_quiz_stats.transaction")
+    @patch("quiz.domain.quiz.quiz.Quiz.objects")
+    def test_rebuilds_only_given_quizzes(self, mock_quiz_objects, mock_transaction):
+        stdout = StringIO()
+
+        call_command(self.command, "--quiz-id", str(self.quiz_id_2), stdout=stdout)
+
+        self.quiz_stats_repository_mock.rebuild.assert_called_once_with(self.quiz_id_2)
+        mock_quiz_objects.order_by.assert_not_called()
+        self.assertIn("Rebuilt stats for 1 quizzes", stdout.getvalue())
@@ -0,0 +1,38 @@
+import unittest
+from io import StringIO
+from unittest.mock import Mock
+from uuid import UUID
+
+from django.core.management import CommandError, call_command
+
+from quiz.application.rescore_quiz.rescore_quiz_command import RescoreQuizCommand
+from quiz.application.rescore_quiz.rescore_quiz_command_handler import RescoreQuizCommandHandler
+from quiz.application.rescore_quiz.rescore_quiz_response import RescoreQuizResponse
+from quiz.domain.quiz.quiz_not_found_exception import QuizNotFoundException
+from quiz.management.commands.rescore_quiz import Command
+
+
+class TestRescoreQuizCommand(unittest.TestCase):
+    def setUp(self):
+        self.command_handler_mock = Mock(spec=RescoreQuizCommandHandler)
+        self.command = Command(command_handler=self.command_handler_mock)
+        self.quiz_id = UUID("12345678-1234-5678-9abc-123456789abc")
+
+    def test_rescores_given_quiz(self):
+        self.command_handler_mock.handle.return_value = RescoreQuizResponse(
+            quiz_id=self.quiz_id, rescored_participations=10, changed_scores=4
+        )
+        stdout = StringIO()
+
+        call_command(self.command, "--quiz-id", str(self.quiz_id), "--batch-size", "200", stdout=stdout)
+
+        self.command_handler_mock.handle.assert_called_once_with(
+            RescoreQuizCommand(quiz_id=self.quiz_id, batch_size=200)
+        )
+        self.assertIn(f"Rescored 10 participations of quiz {self.quiz_id} (4 scores changed)", stdout.getvalue())
+
+    def test_fails_when_quiz_does_not_exist(self):
+        self.command_handler_mock.handle.side_effect = QuizNotFoundException(str(self.quiz_id))
+
+        with self.assertRaises(CommandError):
+            call_command(self.command, "--quiz-id", str(self.quiz_id), stdout=StringIO())
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class UserConfig(AppConfig):
+    name = "user"
+
+    def ready(self) -> None:
+        from user.infrastructure import authenticated_user_signals  # noqa: F401
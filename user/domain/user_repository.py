@@ -12,3 +12,7 @@ class UserRepository(ABC):
     @abstractmethod
     def find_or_fail_by_email(self, email: str) -> User:
         pass
+
+    @abstractmethod
+    def find_by_emails(self, emails: list[str]) -> list[User]:
+        pass
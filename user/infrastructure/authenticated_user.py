@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """Request user built from a validated access token, without loading the full user row."""
+
+    id: UUID
+    email: str
+    is_active: bool = True
+    is_authenticated: bool = True
+    is_anonymous: bool = False
+    is_staff: bool = False
+    is_superuser: bool = False
+
+    @property
+    def pk(self) -> UUID:
+        return self.id
+
+    def __str__(self):
+        return self.email
@@ -0,0 +1,12 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from user.domain.user import User
+from user.infrastructure.cached_jwt_authentication import CachedJWTAuthentication
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_authenticated_user_cache(sender, instance: User, **kwargs) -> None:
+    cache.delete(CachedJWTAuthentication.build_cache_key(instance.id))
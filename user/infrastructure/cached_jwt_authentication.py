@@ -0,0 +1,64 @@
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import BaseCache, cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from user.domain.user import User
+from user.infrastructure.authenticated_user import AuthenticatedUser
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWT authentication that resolves the request user without loading the whole user row.
+
+    Only the email and active flag of the token's user are read, and they are kept in the cache for
+    JWT_USER_CACHE_TIMEOUT seconds (0 disables caching). The entry is dropped whenever the user is saved or deleted.
+    """
+
+    __KEY_PREFIX = "jwt_user"
+
+    def __init__(self, *args, backend: BaseCache | None = None, timeout: int | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__backend = backend or cache
+        self.__timeout = timeout if timeout is not None else settings.JWT_USER_CACHE_TIMEOUT
+
+    @classmethod
+    def build_cache_key(cls, user_id: UUID | str) -> str:
+        return f"{cls.__KEY_PREFIX}:{user_id}"
+
+    def get_user(self, validated_token: Token) -> AuthenticatedUser | User:
+        if api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+
+        try:
+            user_id = UUID(str(validated_token[api_settings.USER_ID_CLAIM]))
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+        except ValueError:
+            raise InvalidToken(_("Token contained an invalid user identification"))
+
+        user_state = self.__find_user_state(user_id)
+        if user_state is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not user_state["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return AuthenticatedUser(id=user_id, email=user_state["email"])
+
+    def __find_user_state(self, user_id: UUID) -> dict | None:
+        if self.__timeout <= 0:
+            return User.objects.filter(id=user_id).values("email", "is_active").first()
+
+        cache_key = self.build_cache_key(user_id)
+        user_state = self.__backend.get(cache_key)
+        if user_state is None:
+            user_state = User.objects.filter(id=user_id).values("email", "is_active").first()
+            if user_state is not None:
+                self.__backend.set(cache_key, user_state, timeout=self.__timeout)
+
+        return user_state
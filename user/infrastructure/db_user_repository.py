@@ -20,3 +20,6 @@ class DbUserRepository(UserRepository):
             return User.objects.get(email=email)
         except ObjectDoesNotExist as e:
             raise UserNotFoundException(user_email=email) from e
+
+    def find_by_emails(self, emails: list[str]) -> list[User]:
+        return list(User.objects.filter(email__in=emails))
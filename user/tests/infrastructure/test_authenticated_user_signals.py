@@ -0,0 +1,17 @@
+import unittest
+from unittest.mock import Mock, patch
+from uuid import UUID
+
+from user.domain.user import User
+from user.infrastructure.authenticated_user_signals import invalidate_authenticated_user_cache
+
+
+class TestAuthenticatedUserSignals(unittest.TestCase):
+    @patch("user.infrastructure.authenticated_user_signals.cache")
+    def test_invalidate_authenticated_user_cache_deletes_user_entry(self, mock_cache):
+        user = Mock(spec=User)
+        user.id = UUID("12345678-1234-5678-9abc-123456789abc")
+
+        invalidate_authenticated_user_cache(sender=User, instance=user)
+
+        mock_cache.delete.assert_called_once_with("jwt_user:12345678-1234-5678-9abc-123456789abc")
@@ -0,0 +1,89 @@
+import unittest
+from unittest.mock import patch
+from uuid import UUID
+
+from django.core.cache.backends.locmem import LocMemCache
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+
+from user.infrastructure.authenticated_user import AuthenticatedUser
+from user.infrastructure.cached_jwt_authentication import CachedJWTAuthentication
+
+
+class TestCachedJWTAuthentication(unittest.TestCase):
+    def setUp(self):
+        self.backend = LocMemCache("test-jwt-user-cache", {})
+        self.backend.clear()
+        self.authentication = CachedJWTAuthentication(backend=self.backend, timeout=60)
+        self.user_id = UUID("12345678-1234-5678-9abc-123456789abc")
+        self.validated_token = {"user_id": str(self.user_id)}
+
+    @patch("user.domain.user.User.objects")
+    def test_get_user_builds_lightweight_user_and_caches_its_state(self, mock_objects):
+        mock_objects.filter.return_value.values.return_value.first.return_value = {
+            "email": "alice@example.com",
+            "is_active": True,
+        }
+
+        first = self.authentication.get_user(self.validated_token)
+        second = self.authentication.get_user(self.validated_token)
+
+        expected_user = AuthenticatedUser(id=self.user_id, email="alice@example.com")
+        self.assertEqual(first, expected_user)
+        self.assertEqual(second, expected_user)
+        self.assertTrue(first.is_authenticated)
+        mock_objects.filter.assert_called_once_with(id=self.user_id)
+        mock_objects.filter.return_value.values.assert_called_once_with("email", "is_active")
+
+    @patch("user.domain.user.User.objects")
+    def test_get_user_reads_state_on_every_call_when_cache_is_disabled(self, mock_objects):
+        authentication = CachedJWTAuthentication(backend=self.backend, timeout=0)
+        mock_objects.filter.return_value.values.return_value.first.return_value = {
+            "email": "alice@example.com",
+            "is_active": True,
+        }
+
+        authentication.get_user(self.validated_token)
+        authentication.get_user(self.validated_token)
+
+        self.assertEqual(mock_objects.filter.call_count, 2)
+        self.assertIsNone(self.backend.get(CachedJWTAuthentication.build_cache_key(self.user_id)))
+
+    @patch("user.domain.user.User.objects")
+    def test_get_user_rejects_inactive_user(self, mock_objects):
+        mock_objects.filter.return_value.values.return_value.first.return_value = {
+            "email": "alice@example.com",
+            "is_active": False,
+        }
+
+        with self.assertRaises(AuthenticationFailed) as context:
+            self.authentication.get_user(self.validated_token)
+
+        self.assertEqual(context.exception.detail["code"], "user_inactive")
+
+    @patch("user.domain.user.User.objects")
+    def test_get_user_rejects_missing_user_without_caching_it(self, mock_objects):
+        mock_objects.filter.return_value.values.return_value.first.return_value = None
+
+        with self.assertRaises(AuthenticationFailed) as context:
+            self.authentication.get_user(self.validated_token)
+
+        self.assertEqual(context.exception.detail["code"], "user_not_found")
+        self.assertIsNone(self.backend.get(CachedJWTAuthentication.build_cache_key(self.user_id)))
+
+    def test_get_user_rejects_token_without_user_id_claim(self):
+        with self.assertRaises(InvalidToken):
+            self.authentication.get_user({})
+
+    def test_get_user_rejects_token_with_malformed_user_id_claim(self):
+        with self.assertRaises(InvalidToken):
+            self.authentication.get_user({"user_id": "not-a-uuid"})
+
+    @patch("user.infrastructure.cached_jwt_authentication.api_settings")
+    @patch("rest_framework_simplejwt.authentication.JWTAuthentication.get_user")
+    def test_get_user_loads_full_user_when_revoke_token_check_is_enabled(self, mock_super_get_user, mock_api_settings):
+        mock_api_settings.CHECK_REVOKE_TOKEN = True
+
+        user = self.authentication.get_user(self.validated_token)
+
+        self.assertEqual(user, mock_super_get_user.return_value)
+        mock_super_get_user.assert_called_once_with(self.validated_token)
@@ -88,3 +88,14 @@ class TestDbUserRepository(unittest.TestCase):
 
         self.assertEqual(result, expected_user)
         mock_objects.get.assert_called_once_with(id=different_user_id)
+
+    @patch("user.domain.user.User.objects")
+    def test_find_by_emails_uses_a_single_query(self, mock_objects):
+        expected_user = Mock(spec=User)
+        expected_user.email = self.user_email
+        mock_objects.filter.return_value = [expected_user]
+
+        result = self.repository.find_by_emails([self.user_email, "missing@example.com"])
+
+        self.assertEqual(result, [expected_user])
+        mock_objects.filter.assert_called_once_with(email__in=[self.user_email, "missing@example.com"])
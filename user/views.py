@@ -83,7 +83,7 @@ def logout_view(request):
 @api_view(["GET"])
 def user_profile_view(request):
     if request.user.is_authenticated:
-        serializer = UserSerializer(request.user)
+        serializer = UserSerializer(User.objects.get(id=request.user.id))
         return Response(serializer.data)
     else:
         return Response({"error": "Authentication required"}, status=status.HTTP_401_UNAUTHORIZED)